@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# $Id$
+
+"""many solutions"""
+
+import puzzler
+from puzzler.puzzles.pentominoes import Pentominoes10x14Sonnet
+
+puzzler.run(Pentominoes10x14Sonnet)
@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+An 8x10 octave stacked on a 6x10 sestet: many trillions of combinations (use
+--poem, --part-limit, --sample, or -n).
+"""
+
+from puzzler import product
+from puzzler.puzzles.products import Polyominoes45Sonnet10x14
+
+product.run(Polyominoes45Sonnet10x14)
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+Front end for Arrow & Parquet export: convert solver output (solution
+records) to typed columns.
+"""
+
+if __file__.startswith('bin/') or __file__.startswith('bin\\'):
+    import os
+    import sys
+    # enable access to the puzzle package via the parent directory:
+    sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+from puzzler import arrow_export
+
+arrow_export.main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+Front end for the batch solver: solve many puzzles as one job.
+"""
+
+if __file__.startswith('bin/') or __file__.startswith('bin\\'):
+    import os
+    import sys
+    # enable access to the puzzle package via the parent directory:
+    sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+from puzzler import batch
+
+batch.main()
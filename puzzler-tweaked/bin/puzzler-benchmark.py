@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+Front end for the benchmark suite: solve a curated set of puzzles with every
+algorithm, check the solution counts, and compare against a baseline.
+"""
+
+if __file__.startswith('bin/') or __file__.startswith('bin\\'):
+    import os
+    import sys
+    # enable access to the puzzle package via the parent directory:
+    sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+from puzzler import benchmark
+
+benchmark.main()
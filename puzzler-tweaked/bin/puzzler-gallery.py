@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+Front end for gallery rendering: render many solutions from solver output
+to SVG or X3D files, with an index file.
+"""
+
+if __file__.startswith('bin/') or __file__.startswith('bin\\'):
+    import os
+    import sys
+    # enable access to the puzzle package via the parent directory:
+    sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+from puzzler import gallery
+
+gallery.main()
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+Front end for the poem matcher: match the octaves & sestets of many sonnets
+against a bead index in one pass.
+"""
+
+if __file__.startswith('bin/') or __file__.startswith('bin\\'):
+    import os
+    import sys
+    # enable access to the puzzle package via the parent directory:
+    sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+from puzzler import poem_match
+
+poem_match.main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# $Id$
+
+"""
+Front end for the puzzle registry: solve a puzzle by class name, importing
+only the module that defines it (``puzzler-solve.py Pentominoes6x10``).
+"""
+
+if __file__.startswith('bin/') or __file__.startswith('bin\\'):
+    import os
+    import sys
+    # enable access to the puzzle package via the parent directory:
+    sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+import sys
+from puzzler import registry
+
+registry.main(['solve'] + sys.argv[1:])
@@ -39,8 +39,14 @@ from datetime import datetime, timedelta
 from puzzler import exact_cover_dlx
 from puzzler import exact_cover_x2
 from puzzler import info
+from puzzler import matrix_stream
+from puzzler import puzzles
 from puzzler.utils import thousands, plural_s
 
+# Optional features (arrow_export, beads, dedupe, matrix_cache,
+# matrix_reduction, objectives, sampler, search_profile, solution_stats) are
+# imported where they are used, so that solving pays only for what it uses.
+
 try:
     import locale
     locale.setlocale(locale.LC_ALL, '')
@@ -92,6 +98,19 @@ def run(puzzle_class, output_stream=sys.stdout, settings=None):
 
 def process_command_line():
     """Process command-line options & return a settings object."""
+    parser = option_parser()
+    settings, args = parser.parse_args()
+    if args:
+        print >>sys.stderr, (
+            '%s takes no command-line arguments; "%s" ignored.'
+            % (sys.argv[0], ' '.join(args)))
+    return settings
+
+def option_parser(search_state=True):
+    """
+    Return an `optparse.OptionParser` for the solver command-line options.
+    The search state options are omitted if `search_state` is false.
+    """
     parser = optparse.OptionParser(
         formatter=optparse.TitledHelpFormatter(width=78),
         add_help_option=None)
@@ -120,25 +139,132 @@ def process_command_line():
     parser.add_option(
         '-t', '--thin-svg', action='store_true',
         help=('Combined with -s/--svg, format the SVG for laser cutting '
-              '(thin simple lines, not solid shapes).'))
+              '(thin simple lines, not solid shapes): each edge once, in an '
+              'order that reduces travel between cuts.  The cut & travel '
+              'lengths are reported.  Square-grid 2-D puzzles only.'))
     parser.add_option(
         '-x', '--x3d', metavar='FILE',
         help='Format the first solution found (or supplied via -r) as X3D '
         'and write it to FILE ("-" for STDOUT).')
-    default = search_state_default()
     parser.add_option(
-        '-S', '--search-state-file', metavar='FILE', default=default,
-        help=('Use FILE for automatic search state save & restore.  '
-              'Default: "%s".' % default))
+        '--beads', metavar='FILE',
+        help=('Write the hyphen signature ("beads") of each solution to FILE '
+              '("-" for STDOUT): a bit mask of same-piece horizontal '
+              'adjacencies per line, as tab-separated values.'))
+    parser.add_option(
+        '--beads-only', action='store_true',
+        help=('Combined with --beads, omit the regular solution records.'))
+    parser.add_option(
+        '--arrow', metavar='FILE',
+        help=('Write each solution to FILE as typed columns (solution '
+              'number, packed grid, hyphen masks, placement ids): an Arrow '
+              'IPC file, or Parquet if FILE ends with ".parquet".  Requires '
+              'the "pyarrow" package.  Not available when resuming a '
+              'session.'))
+    parser.add_option(
+        '--statistics', metavar='PATH',
+        help=('Collect statistics over the solutions: how often each piece '
+              'covers each cell, and how often each pair of pieces is '
+              'adjacent.  Written at the end and periodically, as CSV files '
+              '(PATH-heatmap.csv & PATH-adjacency.csv), or as a NumPy archive '
+              'if PATH ends with ".npz".'))
+    parser.add_option(
+        '--profile', metavar='FILE',
+        help=('Profile the search: per search level, count the nodes, '
+              'candidate rows and dead ends, and the columns (cells or '
+              'pieces) chosen.  Snapshots are appended to FILE (JSON lines) '
+              'periodically and at the end of each puzzle component; '
+              'summarize them with "python -m puzzler.search_profile FILE".  '
+              'Requires the "x2" or "dlx" algorithm.'))
+    parser.add_option(
+        '--profile-sample', type='int', metavar='N', default=1,
+        help=('With --profile, count only every Nth search node, to reduce '
+              'the overhead (the counts are then estimates).  '
+              'Default: %default (every node).'))
+    parser.add_option(
+        '--dedupe-store', metavar='FILE',
+        help=('For puzzles with duplicate checking, keep the solution '
+              'hashes in a disk-backed hash table in FILE (scratch space, '
+              'removed at the end) instead of in memory.'))
+    parser.add_option(
+        '--dedupe-bloom', type='int', metavar='N',
+        help=('For puzzles with duplicate checking, keep the solution '
+              'hashes in a Bloom filter sized for N hashes (bounded memory; '
+              'a unique solution may very rarely be taken for a duplicate).'))
+    parser.add_option(
+        '--poem', metavar='BEADS',
+        help=('Find only solutions compatible with a beaded poem, e.g. '
+              '"oooooooo-o-o oo-oo-oooo-oo ...": lines top to bottom, "o" for '
+              'each cell, "-" joining cells that must belong to the same '
+              'piece.  The puzzle\'s symmetry restrictions are dropped, so '
+              'all compatible solutions are found.  2-D puzzles only.'))
+    parser.add_option(
+        '--reduce', action='store_true',
+        help=('Reduce the puzzle matrix before solving, removing rows which '
+              'cannot be part of any solution, and report the results.  '
+              'Works with -d/--dry-run.  Use consistently when resuming a '
+              'saved search state.'))
+    parser.add_option(
+        '--optimize', metavar='OBJECTIVE', choices=('variety', 'score'),
+        help=('Search for solutions of increasing score, by branch and '
+              'bound, reporting each improvement (the last is optimal).  '
+              'OBJECTIVE: "variety" (the number of distinct pieces used) or '
+              '"score" (the sum of the placement scores; see '
+              '--score-function).  Requires the "x2" algorithm.  The search '
+              'state is not saved.'))
     parser.add_option(
-        '-N', '--no-search-state', dest='search_state_file',
-        action='store_const', const=None,
-        help='Disable automatic search state save & restore.')
+        '--score-function', metavar='MODULE:FUNCTION',
+        help=('For "--optimize score", score each piece placement with '
+              'FUNCTION (importable from MODULE), given the matrix row: a '
+              'list of column names (cells & piece name).  Default: the '
+              'puzzle\'s own "placement_score" method, if it has one.'))
     parser.add_option(
-        '-R', '--report-search-state', action='store_true',
-        help=('Report on the current search state (partial solution), '
-              'useful for long-running puzzles. Use -S/--search-state-file '
-              'to read a search state file other than the default.'))
+        '--sample', type='int', metavar='N',
+        help=('Find N random solutions (without full enumeration), '
+              'uniformly distributed (approximately, unless '
+              '"--sample-probes 0"; see --sample-pool) unless '
+              '--sample-weighted is given.  Requires the "x2" algorithm.  '
+              'The search state is not saved.'))
+    parser.add_option(
+        '--seed', metavar='SEED',
+        help='Seed the random number generator for --sample.')
+    # (default None: `sampler.default_probes` & `sampler.default_pool`)
+    parser.add_option(
+        '--sample-probes', type='int', metavar='K',
+        help=('Estimate the number of solutions of each branch from K '
+              'random probes (default: 4).  0 counts them exactly '
+              '(exactly uniform samples; smaller puzzles only).'))
+    parser.add_option(
+        '--sample-pool', type='int', metavar='M',
+        help=('With estimates (--sample-probes above 0), draw each sample '
+              'from a pool of M weighted samples, resampled in proportion '
+              'to their weights (default: 10).  The samples are only '
+              'approximately uniform; the bias shrinks roughly as 1/M, and '
+              'the time per sample grows as M.'))
+    parser.add_option(
+        '--sample-weighted', action='store_true',
+        help=('Report each sample with its importance weight (the inverse '
+              'of its probability) instead of resampling to uniform.'))
+    parser.add_option(
+        '-C', '--matrix-cache', metavar='DIR',
+        help=('Cache compiled puzzle matrices in DIR, and memory-map them '
+              'from there on later runs instead of rebuilding them.'))
+    if search_state:
+        default = search_state_default()
+        parser.add_option(
+            '-S', '--search-state-file', metavar='FILE', default=default,
+            help=('Use FILE for automatic search state save & restore.  '
+                  'Default: "%s".' % default))
+        parser.add_option(
+            '-N', '--no-search-state', dest='search_state_file',
+            action='store_const', const=None,
+            help='Disable automatic search state save & restore.')
+        parser.add_option(
+            '-R', '--report-search-state', action='store_true',
+            help=('Report on the current search state (partial solution), '
+                  'useful for long-running puzzles. Use '
+                  '-S/--search-state-file to read a search state file other '
+                  'than the default.'))
     parser.add_option(
         '-V', '--version',
         help="Show Polyform Puzzler's version information and exit.",
@@ -146,12 +272,7 @@ def process_command_line():
     parser.version = version_template
     parser.add_option(
         '-h', '--help', help='Show this help message and exit.', action='help')
-    settings, args = parser.parse_args()
-    if args:
-        print >>sys.stderr, (
-            '%s takes no command-line arguments; "%s" ignored.'
-            % (sys.argv[0], ' '.join(args)))
-    return settings
+    return parser
 
 def search_state_default():
     """Return the default name for the search state file."""
@@ -175,8 +296,8 @@ def read_solution(puzzle_class, settings):
 def report_search_state(puzzle_class, output_stream, settings):
     state = SessionState.restore(settings.search_state_file, read_only=True)
     solver = exact_cover_modules[settings.algorithm].ExactCover(state=state)
-    puzzle = puzzle_class.components()[0]()
-    solver.load_matrix(puzzle.matrix, puzzle.secondary_columns)
+    puzzle = puzzle_class.components()[0](init_puzzle=False)
+    load_puzzle_matrix(puzzle, solver, settings, output_stream)
     solution = solver.full_solution()
     if state.num_searches:
         print >>output_stream, (
@@ -192,11 +313,45 @@ def report_search_state(puzzle_class, output_stream, settings):
     if settings.x3d:
         puzzle.write_x3d(settings.x3d, solution)
 
-def solve(puzzle_class, output_stream, settings):
-    """Find and record all solutions to a puzzle.  Report on `output_stream`."""
+def solve(puzzle_class, output_stream, settings, stats=None):
+    """
+    Find and record all solutions to a puzzle.  Report on `output_stream`.
+    If `stats` (a dictionary) is supplied, store the total number of
+    solutions & searches and the duration there.
+    """
     start = datetime.now()
+    optimize = getattr(settings, 'optimize', None)
+    sample = getattr(settings, 'sample', None)
+    if (optimize or sample) and settings.algorithm != 'x2':
+        print >>sys.stderr, ('The --%s option requires the "x2" algorithm.'
+                             % (optimize and 'optimize' or 'sample'))
+        sys.exit(1)
+    if settings.algorithm not in ('x2', 'dlx') and [
+          component for component in puzzle_class.components()
+          if component.piece_multiplicities]:
+        print >>sys.stderr, ('%s has piece multiplicities, which require the '
+                             '"x2" or "dlx" algorithm.'
+                             % puzzle_class.__name__)
+        sys.exit(1)
+    profile_path = getattr(settings, 'profile', None)
+    if profile_path and (optimize or sample
+                         or settings.algorithm not in ('x2', 'dlx')):
+        print >>sys.stderr, ('The --profile option requires the "x2" or '
+                             '"dlx" algorithm, and cannot be combined with '
+                             '--optimize or --sample.')
+        sys.exit(1)
+    score_function = None
+    if optimize == 'score':
+        try:
+            score_function = placement_score_function(puzzle_class, settings)
+        except ApplicationError, error:
+            print >>sys.stderr, 'Error: %s' % error
+            sys.exit(1)
+    stop_after = sample or settings.stop_after
     try:
-        state = SessionState.restore(settings.search_state_file)
+        state = SessionState.restore(
+            (not (optimize or sample) and settings.search_state_file)
+            or None)
     except IOError, error:
         print >>sys.stderr, 'Unable to initialize the search state file:'
         print >>sys.stderr, '%s: %s' % (error.__class__.__name__, error)
@@ -210,34 +365,119 @@ def solve(puzzle_class, output_stream, settings):
                thousands(state.num_searches)))
         output_stream.flush()
     starting_solutions = state.num_solutions
-    matrices = []
-    stats = []
-    puzzles = []
+    record_stream = output_stream
+    bead_writer = None
+    if getattr(settings, 'beads', None):
+        from puzzler import beads
+        bead_writer = beads.BeadWriter(
+            settings.beads, append=bool(state.num_searches))
+        if settings.beads_only:
+            record_stream = None
+    arrow_writer = None
+    if getattr(settings, 'arrow', None):
+        if state.num_searches:
+            print >>sys.stderr, (
+                'The --arrow option cannot be used when resuming a session.')
+            sys.exit(1)
+        from puzzler import arrow_export
+        try:
+            arrow_writer = arrow_export.ArrowWriter(
+                settings.arrow, puzzle_class.components()[0],
+                restricted=not getattr(settings, 'poem', None))
+        except ApplicationError, error:
+            print >>sys.stderr, 'Error: %s' % error
+            sys.exit(1)
+    statistics = None
+    if getattr(settings, 'statistics', None):
+        statistics = getattr(state, 'statistics', None)
+        if statistics is None:
+            from puzzler import solution_stats
+            try:
+                statistics = solution_stats.SolutionStatistics(
+                    settings.statistics)
+            except ApplicationError, error:
+                print >>sys.stderr, 'Error: %s' % error
+                sys.exit(1)
+        statistics.path = settings.statistics
+        # the statistics are saved & restored with the search state:
+        state.statistics = statistics
+    profile = None
+    if profile_path:
+        profile = state.profile
+        if profile is None:
+            from puzzler import search_profile
+            profile = search_profile.SearchProfile(
+                profile_path, max(settings.profile_sample, 1))
+        profile.path = profile_path
+        # the profile is saved & restored with the search state:
+        state.profile = profile
+        solver.profile = profile
+    component_stats = []
+    names = []
     try:
         try:
-            for component in puzzle_class.components():
-                if component.__name__ not in state.completed_components:
-                    # !!! instantiate inside the loop instead?  will save time
-                    # initially (and memory) with multi-part puzzles
-                    puzzles.append(component())
-            for puzzle in puzzles:
-                check_matrix_for_duplicate_rows(puzzle)
-                matrices.append((puzzle.matrix, puzzle.secondary_columns))
-            if settings.dry_run:
-                return
-            state.init_periodic_save(solver)
+            if getattr(settings, 'poem', None):
+                # Components divide a puzzle by symmetry restrictions, which
+                # a poem drops (see `puzzles.Puzzle2D.set_poem`):
+                all_components = (puzzle_class,)
+            else:
+                all_components = puzzle_class.components()
+            components = [component for component in all_components
+                          if component.__name__
+                          not in state.completed_components]
+            if not settings.dry_run:
+                state.init_periodic_save(solver)
             last_solutions = state.last_solutions
             last_searches = state.last_searches
-            for i, puzzle in enumerate(puzzles):
+            for component in components:
+                # Each component is built just before it is solved; loading
+                # its matrix releases the previous component's matrix.
+                puzzle = component(init_puzzle=False)
+                load_puzzle_matrix(puzzle, solver, settings, output_stream)
+                if settings.dry_run:
+                    continue
+                if statistics:
+                    statistics.start(puzzle)
+                if profile:
+                    profile.start(component.__name__, solver)
+                if puzzle.check_for_duplicates:
+                    puzzle.dedupe = state.deduplicator(component, settings)
                 #print >>output_stream, ('solving %s:\n'
                 #                        % puzzle.__class__.__name__)
                 output_stream.flush()
-                solver.load_matrix(*matrices[i])
-                for solution in solver.solve():
+                if optimize:
+                    solutions = optimized_solutions(
+                        puzzle, solver, optimize, output_stream,
+                        score_function)
+                elif sample:
+                    solutions = sampled_solutions(
+                        solver, settings, output_stream)
+                else:
+                    solutions = solver.solve()
+                for solution in solutions:
                     state.save(solver)
-                    if not puzzle.record_solution(solution, solver,
-                                                  stream=output_stream):
+                    # the duplicate check must not overlap a state save:
+                    state.lock.acquire()
+                    try:
+                        recorded = puzzle.record_solution(
+                            solution, solver, stream=record_stream)
+                    finally:
+                        state.lock.release()
+                    if not recorded:
                         continue
+                    if bead_writer:
+                        bead_writer.write(solver.num_solutions,
+                                          puzzle.hyphen_masks(solution))
+                    if arrow_writer:
+                        arrow_writer.write(solver.num_solutions, solution,
+                                           component)
+                    if statistics:
+                        state.lock.acquire()
+                        try:
+                            statistics.add(solution)
+                        finally:
+                            state.lock.release()
+                        statistics.checkpoint()
                     if settings.svg:
                         puzzle.write_svg(
                             settings.svg, solution, thin=settings.thin_svg)
@@ -245,20 +485,28 @@ def solve(puzzle_class, output_stream, settings):
                     if settings.x3d:
                         puzzle.write_x3d(settings.x3d, solution)
                         settings.x3d = False
-                    if ( settings.stop_after
+                    if ( stop_after
                          and ((solver.num_solutions - starting_solutions)
-                              >= settings.stop_after)):
+                              >= stop_after)):
                         break
-                stats.append((solver.num_solutions - last_solutions,
-                              solver.num_searches - last_searches))
-                if ( settings.stop_after
-                     and solver.num_solutions == settings.stop_after):
+                component_stats.append(
+                    (solver.num_solutions - last_solutions,
+                     solver.num_searches - last_searches))
+                names.append(puzzle.__class__.__name__)
+                if profile:
+                    stopped = (stop_after
+                               and ((solver.num_solutions - starting_solutions)
+                                    >= stop_after))
+                    profile.write(solver, final=not stopped)
+                if ( stop_after
+                     and solver.num_solutions == stop_after):
                     print >>output_stream, (
                         'User-requested solution limit reached.')
                     break
                 state.last_solutions = last_solutions = solver.num_solutions
                 state.last_searches = last_searches = solver.num_searches
                 state.completed_components.add(puzzle.__class__.__name__)
+                state.release_deduplicator(component)
         except KeyboardInterrupt:
             print >>output_stream, 'Session interrupted by user.'
             state.save(solver, final=True)
@@ -273,38 +521,162 @@ def solve(puzzle_class, output_stream, settings):
                plural_s(solver.num_solutions),
                thousands(solver.num_searches),
                duration))
-        if len(stats) > 1:
-            for i, (solutions, searches) in enumerate(stats):
+        if stats is not None:
+            stats.update(solutions=solver.num_solutions,
+                         searches=solver.num_searches, duration=duration)
+        if len(component_stats) > 1:
+            for i, (solutions, searches) in enumerate(component_stats):
                 print >>output_stream, (
                     '(%s: %s solution%s, %s searches)'
-                    % (puzzles[i].__class__.__name__,
+                    % (names[i],
                        thousands(solutions),
                        plural_s(solutions),
                        thousands(searches)))
         output_stream.flush()
+        if bead_writer:
+            bead_writer.close()
+        if arrow_writer:
+            arrow_writer.close()
+        if statistics and not settings.dry_run:
+            statistics.write()
+        if profile and profile.component not in names + [None]:
+            # interrupted:
+            profile.write(solver)
         state.cleanup()
     return solver.num_solutions
 
+def placement_score_function(puzzle_class, settings):
+    """
+    Return the placement score function given by the "score_function"
+    setting ("MODULE:FUNCTION"), or None if `puzzle_class` has its own
+    `placement_score` method.  Raise `ApplicationError` if there is neither.
+    """
+    spec = getattr(settings, 'score_function', None)
+    if not spec:
+        if ( puzzle_class.placement_score.im_func
+             is puzzles.Puzzle.placement_score.im_func):
+            raise ApplicationError(
+                '%s has no placement scores; use --score-function '
+                'MODULE:FUNCTION.' % puzzle_class.__name__)
+        return None
+    module_name, sep, function_name = spec.partition(':')
+    if not (module_name and sep and function_name):
+        raise ApplicationError(
+            'Bad score function "%s"; use MODULE:FUNCTION.' % spec)
+    try:
+        module = __import__(module_name, {}, {}, [function_name])
+        function = getattr(module, function_name)
+    except (ImportError, AttributeError), error:
+        raise ApplicationError(
+            'Unable to load score function "%s" (%s).' % (spec, error))
+    if not callable(function):
+        raise ApplicationError('"%s" is not callable.' % spec)
+    return function
+
+def optimized_solutions(puzzle, solver, objective_name, output_stream,
+                        score_function=None):
+    """
+    A generator that produces solutions of increasing score (see
+    `exact_cover_x2.ExactCover.optimize`), reporting each score on
+    `output_stream`.  The "score" objective uses `score_function`, or the
+    puzzle's `placement_score` method.
+    """
+    from puzzler import objectives
+    if objective_name == 'variety':
+        objective = objectives.PieceVariety(puzzle.piece_data.keys())
+    else:
+        objective = objectives.PlacementScore(
+            score_function or puzzle.placement_score)
+    for solution, score in solver.optimize(objective):
+        print >>output_stream, 'score %s:' % score
+        yield solution
+
+def sampled_solutions(solver, settings, output_stream):
+    """
+    A generator that produces random solutions (see `puzzler.sampler`),
+    reporting importance weights on `output_stream` if the
+    "sample_weighted" setting is true.
+    """
+    import random
+    from puzzler import sampler
+    probes = settings.sample_probes
+    if probes is None:
+        probes = sampler.default_probes
+    pool = settings.sample_pool or sampler.default_pool
+    try:
+        solution_sampler = sampler.Sampler(
+            solver, random.Random(settings.seed), probes)
+    except ValueError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    if settings.sample_weighted:
+        for solution, weight in solution_sampler.weighted_samples():
+            print >>output_stream, 'weight %s:' % weight
+            yield solution
+    else:
+        for solution in solution_sampler.uniform_samples(max(pool, 1)):
+            yield solution
+
+def load_puzzle_matrix(puzzle, solver, settings, output_stream=sys.stdout):
+    """
+    Initialize the matrix of `puzzle` (an uninitialized puzzle object) and
+    load it into `solver`.  The matrix rows are streamed directly into the
+    solver as they are built (they are not accumulated in `puzzle.matrix`),
+    unless the matrix is loaded from (or compiled into) the matrix cache.
+    The "poem" setting constrains the matrix.  With the "reduce" setting,
+    the matrix is reduced first, and the results are reported on
+    `output_stream`.  Cached piece placements are released once the matrix
+    is loaded.
+    """
+    if getattr(settings, 'poem', None):
+        puzzle.set_poem(settings.poem)
+    consumer = solver
+    if getattr(settings, 'reduce', None):
+        from puzzler import matrix_reduction
+        consumer = matrix_reduction.MatrixReducer(solver)
+    cache_dir = getattr(settings, 'matrix_cache', None)
+    if cache_dir:
+        from puzzler import matrix_cache
+        compiled = matrix_cache.get_compiled_matrix(
+            puzzle, cache_dir, check=check_matrix_for_duplicate_rows)
+        consumer.load_rows(
+            compiled.columns, compiled.rows(), compiled.secondary,
+            puzzle.piece_multiplicities)
+    else:
+        stream = matrix_stream.MatrixStream(puzzle, consumer)
+        puzzle.matrix = stream
+        puzzle.init_puzzle()
+        stream.close()
+        if stream.duplicates:
+            report_duplicate_rows(puzzle, stream.duplicates, len(stream))
+    puzzles.clear_placement_cache()
+    if consumer is not solver:
+        print >>output_stream, '%s: %s' % (
+            puzzle.__class__.__name__, consumer.stats)
+        output_stream.flush()
+
 def check_matrix_for_duplicate_rows(puzzle):
     matrix_set = set(puzzle.matrix)
     if len(puzzle.matrix) == len(matrix_set):
         return
-    num_duplicates = len(puzzle.matrix) - len(matrix_set)
     matrix_set = set()
-    duplicates = set()
+    duplicates = []
     for row in puzzle.matrix:
         if row in matrix_set:
-            duplicates.add(row)
+            duplicates.append(row)
         else:
             matrix_set.add(row)
-    duplicate_rows = '\n'.join(sorted(str(row) for row in duplicates))
+    report_duplicate_rows(puzzle, duplicates, len(puzzle.matrix))
+
+def report_duplicate_rows(puzzle, duplicates, num_rows):
+    num_duplicates = len(duplicates)
+    duplicate_rows = '\n'.join(sorted(set(str(row) for row in duplicates)))
     raise ApplicationError(
         '{} duplicate row{} ({} total) found in puzzle matrix of {}.{}:\n{}'
-        .format(num_duplicates, plural_s(num_duplicates), len(puzzle.matrix),
+        .format(num_duplicates, plural_s(num_duplicates), num_rows,
                 puzzle.__class__.__module__, puzzle.__class__.__name__,
                 duplicate_rows))
 
-
 class SessionState(object):
 
     """Saves & restores the state of the session."""
@@ -318,6 +690,13 @@ class SessionState(object):
         self.last_solutions = 0
         self.last_searches = 0
         self.completed_components = set()
+        self.deduplicators = {}
+        """Mapping of puzzle component names to `dedupe.Deduplicator`
+        objects."""
+
+        self.profile = None
+        """A `search_profile.SearchProfile` object (optional)."""
+
         self.lock = threading.Lock()
         self.state_file = None
         self.init_state_file(path)
@@ -332,7 +711,7 @@ class SessionState(object):
             self.state_file = None
 
     def init_periodic_save(self, solver):
-        if self.state_file:
+        if self.state_file or self.profile:
             t = threading.Thread(target=self.save_periodically, args=(solver,))
             t.setDaemon(True)
             t.start()
@@ -344,6 +723,15 @@ class SessionState(object):
         del odict['state_file'], odict['lock']
         return odict
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # restore runtime state:
+        self.lock = threading.Lock()
+        self.state_file = None
+        # states saved by earlier versions:
+        self.__dict__.setdefault('deduplicators', {})
+        self.__dict__.setdefault('profile', None)
+
     def save(self, solver, final=False):
         if self.state_file and self.lock.acquire(final):
             # GIL check interval hack (r512, to prevent corrupted state
@@ -365,17 +753,58 @@ class SessionState(object):
         while True:
             time.sleep(self.save_interval)
             self.save(solver)
+            if self.profile:
+                self.profile.write(solver)
 
     def close(self):
+        """Close the state file, keeping it for a later session."""
         if self.state_file:
             self.state_file.close()
+            # not to be removed by `cleanup`:
+            self.state_file = None
+        for deduplicator in self.deduplicators.values():
+            deduplicator.close()
+        self.deduplicators = {}
 
     def cleanup(self):
+        """
+        Remove the state file (& duplicate journals) of a finished session.
+        """
+        for deduplicator in self.deduplicators.values():
+            deduplicator.cleanup()
         if self.state_file:
             path = self.state_file.name
             self.state_file.close()
             os.unlink(path)
 
+    def deduplicator(self, component, settings):
+        """
+        Return the (saved or new) `dedupe.Deduplicator` for `component` (a
+        puzzle class).  With a state file, its hashes are journaled in
+        "FILE.COMPONENT.dedupe".
+        """
+        name = component.__name__
+        if name not in self.deduplicators:
+            from puzzler import dedupe
+            journal_path = None
+            if self.state_file:
+                journal_path = '%s.%s.dedupe' % (self.state_file.name, name)
+            self.deduplicators[name] = dedupe.Deduplicator(
+                name, journal_path,
+                store_path=getattr(settings, 'dedupe_store', None),
+                bloom_capacity=getattr(settings, 'dedupe_bloom', None))
+        return self.deduplicators[name]
+
+    def release_deduplicator(self, component):
+        """Discard the hashes of `component` (a completed puzzle class)."""
+        self.lock.acquire()
+        try:
+            deduplicator = self.deduplicators.pop(component.__name__, None)
+        finally:
+            self.lock.release()
+        if deduplicator:
+            deduplicator.cleanup()
+
     @classmethod
     def restore(cls, path, read_only=False):
         """
@@ -0,0 +1,14 @@
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Command-line entry point: ``python -m puzzler COMMAND ...``.  See
+`puzzler.registry`.
+"""
+
+from puzzler import registry
+
+registry.main(prog='python -m puzzler')
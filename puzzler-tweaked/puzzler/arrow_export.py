@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Export of solutions as Apache Arrow IPC files or Parquet files, for
+zero-copy reading with R's "arrow" package or pandas (e.g.
+``arrow::read_feather(path, mmap=TRUE)`` or ``pandas.read_parquet(path)``).
+
+Each solution is a row of a record batch, with typed columns:
+
+``solution`` (uint64)
+    The solution number.
+
+``grid`` (binary)
+    The packed cell-piece grid: one byte per cell of the solution matrix
+    (see `Puzzle.build_solution_matrix`), in the order of the text records
+    (for 2-D puzzles, top line first, left to right).  A byte is the index
+    of the piece in the "pieces" schema metadata plus 1; 0 for empty cells.
+
+``masks`` (list of uint64)
+    The hyphen signature (see `puzzler.beads`), top line first; null for
+    puzzles without hyphen signatures.
+
+``placements`` (list of uint32)
+    The placement ids of the pieces, sorted: the indexes of the solution's
+    rows among the data rows of the puzzle's (unconstrained) matrix.
+
+The schema metadata records the puzzle class ("puzzle"), the "pieces" (space
+separated), and the grid "shape" (e.g. "10x6", outermost dimension last).
+
+Requires the "pyarrow" package.  `ArrowWriter` is used live by the solver
+("--arrow FILE"), and `convert` converts existing solver output (text
+records of 2-D puzzles) offline::
+
+    python -m puzzler.arrow_export pentominoes.Pentominoes6x10 6x10.txt \\
+        6x10.parquet
+"""
+
+import sys
+import optparse
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+import puzzler
+from puzzler import matrix_stream
+from puzzler.utils import thousands, plural_s
+
+
+default_batch_size = 65536
+"""The number of solutions per record batch."""
+
+
+def check_pyarrow():
+    if pyarrow is None:
+        raise puzzler.ApplicationError(
+            'The "pyarrow" package is required for Arrow & Parquet export.')
+
+def is_parquet(path):
+    return path.lower().endswith('.parquet')
+
+
+class SolutionEncoder(object):
+
+    """
+    Encodes the solutions of one puzzle class as column values (see
+    `encode`).  If `restricted` is false, the placements are those of the
+    puzzle without its symmetry restrictions (as when solving with a poem).
+    """
+
+    def __init__(self, puzzle_class, restricted=True):
+        self.puzzle_class = puzzle_class
+        # The matrix rows are streamed into the placement index, not
+        # accumulated in `puzzle.matrix`:
+        self.puzzle = puzzle = puzzle_class(init_puzzle=False)
+        if not restricted:
+            puzzle.drop_restrictions()
+        index = PlacementIndex()
+        stream = matrix_stream.MatrixStream(puzzle, index)
+        puzzle.matrix = stream
+        puzzle.init_puzzle()
+        stream.close()
+        self.pieces = sorted(puzzle.piece_data.keys())
+        if len(self.pieces) > 255:
+            raise puzzler.ApplicationError(
+                '%s has too many pieces to pack into a grid.'
+                % puzzle_class.__name__)
+        self.piece_codes = dict(
+            (name, chr(i + 1)) for (i, name) in enumerate(self.pieces))
+        self.piece_codes[puzzle.empty_cell] = chr(0)
+        self.placement_ids = index.placement_ids
+        """A mapping of placement keys (frozensets of column names) to
+        (placement id, matrix row) pairs."""
+
+        self.shape = self.grid_shape(puzzle.empty_solution_matrix())
+        self.has_masks = True
+
+    def grid_shape(self, s_matrix):
+        shape = []
+        while isinstance(s_matrix, list):
+            shape.append(len(s_matrix))
+            s_matrix = s_matrix[0]
+        shape.reverse()
+        return shape
+
+    def metadata(self):
+        return {
+            'puzzle': '%s.%s' % (self.puzzle_class.__module__,
+                                 self.puzzle_class.__name__),
+            'pieces': ' '.join(self.pieces),
+            'shape': 'x'.join(str(n) for n in self.shape)}
+
+    def encode(self, solution):
+        """
+        Return the (grid, masks, placements) column values of `solution`, a
+        list of rows (lists of column names).
+        """
+        s_matrix = self.puzzle.build_solution_matrix(solution)
+        if len(self.shape) == 2:
+            # text record order: top line first
+            s_matrix = list(reversed(s_matrix))
+        codes = self.piece_codes
+        grid = ''.join(codes.get(name, chr(0)) for name in flatten(s_matrix))
+        masks = None
+        if self.has_masks:
+            try:
+                masks = self.puzzle.hyphen_masks(solution)
+            except NotImplementedError:
+                self.has_masks = False
+        placements = sorted(
+            self.placement_ids[frozenset(row)][0] for row in solution
+            if frozenset(row) in self.placement_ids)
+        return grid, masks, placements
+
+    def parse_record(self, record):
+        """
+        Return the solution (a list of matrix rows) of `record`, the text
+        record of a 2-D puzzle with single-character piece names.
+        """
+        if len(self.shape) != 2 or max(len(name) for name in self.pieces) > 1:
+            raise puzzler.ApplicationError(
+                'Only records of 2-D puzzles with single-character piece '
+                'names can be converted.')
+        puzzle = self.puzzle
+        lines = record.split()
+        if len(lines) != puzzle.height:
+            raise puzzler.ApplicationError(
+                'Record has %s line%s; %s requires %s: %r'
+                % (len(lines), plural_s(len(lines)),
+                   self.puzzle_class.__name__, puzzle.height, record))
+        line_xs = {}
+        for coord in puzzle.solution_coords:
+            line_xs.setdefault(coord[1], []).append(coord[0])
+        piece_cells = {}
+        for line, y in zip(lines, reversed(range(puzzle.height))):
+            xs = sorted(line_xs.get(y, ()))
+            if len(line) != len(xs):
+                raise puzzler.ApplicationError(
+                    'Record line %r does not fit the %s puzzle.'
+                    % (line, self.puzzle_class.__name__))
+            for x, name in zip(xs, line):
+                piece_cells.setdefault(name, []).append(
+                    '%0*i,%0*i' % (puzzle.x_width, x, puzzle.y_width, y))
+        solution = []
+        for name, cells in sorted(piece_cells.items()):
+            key = frozenset(cells + [name])
+            if key not in self.placement_ids:
+                raise puzzler.ApplicationError(
+                    'Piece %s of record %r is not a placement of %s.'
+                    % (name, record, self.puzzle_class.__name__))
+            solution.append(self.placement_ids[key][1])
+        return solution
+
+
+class PlacementIndex(object):
+
+    """
+    A matrix consumer (see `puzzler.matrix_stream.MatrixStream`) that keeps
+    only the placement ids of the rows.
+    """
+
+    def __init__(self):
+        self.column_names = None
+        self.placement_ids = {}
+        """A mapping of placement keys (frozensets of column names) to
+        (placement id, matrix row) pairs."""
+
+    def start_rows(self, column_names, secondary=0, multiplicities=None):
+        self.column_names = column_names
+
+    def add_row(self, row):
+        names = [self.column_names[j] for j in row]
+        # solver row order: the piece name (the first column) last
+        names.append(names.pop(0))
+        self.placement_ids[frozenset(names)] = (len(self.placement_ids), names)
+
+    def finish_rows(self):
+        self.column_names = None
+
+
+def flatten(s_matrix):
+    for item in s_matrix:
+        if isinstance(item, list):
+            for name in flatten(item):
+                yield name
+        else:
+            yield item
+
+
+class ArrowWriter(object):
+
+    """
+    Writes solutions to an Arrow IPC file, or to a Parquet file (if the path
+    ends with ".parquet"), in record batches.  For `restricted`, see
+    `SolutionEncoder`.
+    """
+
+    def __init__(self, path, puzzle_class, batch_size=default_batch_size,
+                 restricted=True):
+        check_pyarrow()
+        self.path = path
+        self.batch_size = batch_size
+        self.restricted = restricted
+        self.encoder = SolutionEncoder(puzzle_class, restricted)
+        self.encoders = {puzzle_class: self.encoder}
+        self.schema = pyarrow.schema(
+            [pyarrow.field('solution', pyarrow.uint64()),
+             pyarrow.field('grid', pyarrow.binary()),
+             pyarrow.field('masks', pyarrow.list_(pyarrow.uint64())),
+             pyarrow.field('placements', pyarrow.list_(pyarrow.uint32()))],
+            metadata=self.encoder.metadata())
+        if is_parquet(path):
+            self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        else:
+            self.sink = pyarrow.OSFile(path, 'wb')
+            self.writer = pyarrow.RecordBatchFileWriter(self.sink, self.schema)
+        self.columns = ([], [], [], [])
+        self.count = 0
+
+    def write(self, number, solution, puzzle_class=None):
+        """
+        Add solution number `number` (a list of rows) of `puzzle_class`
+        (default: the writer's puzzle class; components of one puzzle share
+        the grid & pieces, but not placement ids).
+        """
+        encoder = self.encoder
+        if puzzle_class is not None:
+            try:
+                encoder = self.encoders[puzzle_class]
+            except KeyError:
+                encoder = self.encoders[puzzle_class] = SolutionEncoder(
+                    puzzle_class, self.restricted)
+        self.append(number, *encoder.encode(solution))
+
+    def append(self, number, grid, masks, placements):
+        numbers, grids, masks_column, placements_column = self.columns
+        numbers.append(number)
+        grids.append(grid)
+        masks_column.append(masks)
+        placements_column.append(placements)
+        self.count += 1
+        if len(numbers) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write the pending solutions as a record batch."""
+        if not self.columns[0]:
+            return
+        arrays = [pyarrow.array(values, type=field.type)
+                  for values, field in zip(self.columns, self.schema)]
+        batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+        if is_parquet(self.path):
+            self.writer.write_table(pyarrow.Table.from_batches([batch]))
+        else:
+            self.writer.write_batch(batch)
+        for values in self.columns:
+            del values[:]
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+        if not is_parquet(self.path):
+            self.sink.close()
+
+
+def convert(puzzle_class, input_path, output_path,
+            batch_size=default_batch_size):
+    """
+    Convert the solution records of `puzzle_class` in solver output file
+    `input_path` to an Arrow or Parquet file at `output_path`.  Solutions
+    are numbered in order of appearance.  Records are read & written
+    incrementally (one record batch at a time in memory).  Return the
+    number of solutions.
+    """
+    from puzzler import bead_index
+    writer = ArrowWriter(output_path, puzzle_class, batch_size)
+    encoder = writer.encoder
+    try:
+        records = bead_index.read_records(input_path, encoder.puzzle.height)
+        for number, record in enumerate(records, 1):
+            writer.write(number, encoder.parse_record(record))
+    finally:
+        writer.close()
+    return writer.count
+
+def process_command_line(argv=None):
+    """Process command-line options; return (settings, args)."""
+    parser = optparse.OptionParser(
+        usage='%prog [options] PUZZLE INPUT OUTPUT',
+        description=(
+            'Convert the solution records of PUZZLE (a puzzle class, e.g. '
+            '"pentominoes.Pentominoes6x10") in solver output file INPUT to '
+            'an Arrow IPC file OUTPUT, or a Parquet file if OUTPUT ends with '
+            '".parquet".'))
+    parser.add_option(
+        '-b', '--batch-size', type='int', metavar='N',
+        default=default_batch_size,
+        help='Write N solutions per record batch.  Default: %default.')
+    settings, args = parser.parse_args(argv)
+    if len(args) != 3:
+        parser.error('a puzzle class, an input path, and an output path are '
+                     'required')
+    return settings, args
+
+def main(argv=None, output_stream=sys.stdout):
+    from puzzler import batch
+    settings, (puzzle_name, input_path, output_path) = process_command_line(
+        argv)
+    try:
+        items = batch.resolve_items([puzzle_name])
+        if len(items) != 1:
+            raise puzzler.ApplicationError(
+                '%s: a single puzzle class is required.' % puzzle_name)
+        count = convert(items[0].load(), input_path, output_path,
+                        settings.batch_size)
+        print >>output_stream, '%s solution%s converted.' % (
+            thousands(count), plural_s(count))
+    except puzzler.ApplicationError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
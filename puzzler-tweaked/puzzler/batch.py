@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Batch solver: solve many puzzles as one job, in a pool of worker processes.
+
+Each batch item (a puzzle class) gets its own output file and search state
+file in the batch directory, named after the item ("module.ClassName",
+relative to `puzzler.puzzles`).  Items are scheduled largest first by
+estimated cost (longest processing time first), so the longest-running
+puzzles don't end up running alone at the end of the job.  Estimated times
+come from, in order of preference:
+
+* an estimates file (``--estimates``): a JSON object mapping item names (or
+  bare puzzle class names) to times in seconds;
+* the durations of previous runs of the batch, from the results file.
+
+Items without an estimated time are scheduled after those with one,
+largest first by the solution count in the puzzle class (or script)
+docstring, e.g. "2,339 solutions" (a rough proxy for cost; it is not
+comparable to times).
+
+Finished items are recorded in the results file (one JSON object per line),
+and are skipped when the batch is restarted.  A summary table of solution
+counts, search counts, and durations is written to the summary file.
+
+Usage::
+
+    python -m puzzler.batch [options] ITEM ...
+
+where each ITEM is a puzzle class (``puzzler.puzzles.pentominoes.
+Pentominoes6x10`` or just ``pentominoes.Pentominoes6x10``), a puzzle module
+(all solvable puzzles defined in the module), or a front-end script (such as
+``bin/ominoes/pentominoes-6x10.py``).
+"""
+
+import sys
+import os
+import re
+import ast
+import copy
+import json
+import inspect
+import optparse
+import multiprocessing
+from datetime import datetime, timedelta
+
+import puzzler
+from puzzler import puzzles
+from puzzler.utils import thousands, plural_s
+
+
+results_file_name = 'results.jsonl'
+summary_file_name = 'summary.txt'
+
+
+class BatchItem(object):
+
+    """A puzzle class to be solved in a batch."""
+
+    def __init__(self, module_name, class_name, docstring=None):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.docstring = docstring
+        """The docstring of the front-end script, if any (overrides the
+        puzzle class docstring for estimates)."""
+
+        self.estimate = 0
+        """The estimated time (seconds) or, if `self.timed` is false, the
+        docstring solution count."""
+
+        self.timed = False
+        """True if `self.estimate` is a time."""
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, self.name)
+
+    @property
+    def name(self):
+        """The qualified class name, relative to `puzzler.puzzles`."""
+        module_name = self.module_name
+        prefix = puzzles.__name__ + '.'
+        if module_name.startswith(prefix):
+            module_name = module_name[len(prefix):]
+        return '%s.%s' % (module_name, self.class_name)
+
+    def load(self):
+        """Import & return the puzzle class."""
+        module = __import__(self.module_name, {}, {}, [self.class_name])
+        return getattr(module, self.class_name)
+
+    def docstring_estimate(self):
+        """Return the solution count from the item's docstring, or 0."""
+        docstring = self.docstring or self.load().__doc__ or ''
+        match = solutions_pattern.search(docstring)
+        if match:
+            return int(match.group(1).replace(',', ''))
+        return 0
+
+solutions_pattern = re.compile(r'([0-9][0-9,]*) solutions?\b')
+
+
+def resolve_items(specs):
+    """
+    Return a list of `BatchItem` objects from `specs`, a list of puzzle
+    class names, module names, and front-end script paths.  Puzzles
+    specified more than once are included once.
+    """
+    items = []
+    for spec in specs:
+        if spec.endswith('.py') or os.path.isfile(spec):
+            items.extend(script_items(spec))
+            continue
+        module_name, class_name = qualify(spec)
+        if class_name is None:
+            items.extend(module_items(module_name))
+        else:
+            items.append(BatchItem(module_name, class_name))
+    unique = []
+    names = set()
+    for item in items:
+        if item.name not in names:
+            names.add(item.name)
+            unique.append(item)
+    return unique
+
+def qualify(spec):
+    """
+    Return a 2-tuple, (module name, class name or None), for `spec`, a
+    dotted module or class name.  Names relative to `puzzler.puzzles` are
+    accepted.
+    """
+    candidates = [(spec, None)]
+    if '.' in spec:
+        candidates.append(tuple(spec.rsplit('.', 1)))
+    for module_name, class_name in candidates:
+        for prefix in ('', puzzles.__name__ + '.'):
+            try:
+                module = __import__(prefix + module_name, {}, {}, ['__name__'])
+            except ImportError:
+                continue
+            if class_name is None or hasattr(module, class_name):
+                return module.__name__, class_name
+    raise puzzler.ApplicationError('Unknown puzzle or module: "%s"' % spec)
+
+def module_items(module_name):
+    """Return a list of batch items for all solvable puzzles in a module."""
+    module = __import__(module_name, {}, {}, ['__name__'])
+    items = []
+    for name, value in sorted(vars(module).items()):
+        if ( inspect.isclass(value)
+             and issubclass(value, puzzles.Puzzle)
+             and value.__module__ == module_name
+             and is_solvable(value)):
+            items.append(BatchItem(module_name, name))
+    return items
+
+def is_solvable(puzzle_class):
+    """
+    Return True if `puzzle_class` looks like a concrete puzzle (not an
+    abstract base class): all its components have a solution space.
+    """
+    try:
+        for component in puzzle_class.components():
+            if not component(init_puzzle=False).solution_coords:
+                return False
+    except Exception:
+        return False
+    return True
+
+def script_items(path):
+    """
+    Return a list of batch items for the puzzles solved by a front-end
+    script, which contains code like this::
+
+        from puzzler.puzzles.pentominoes import Pentominoes6x10
+        puzzler.run(Pentominoes6x10)
+    """
+    source = open(path, 'rU').read()
+    tree = ast.parse(source, path)
+    imported = {}
+    items = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                imported[alias.asname or alias.name] = (
+                    node.module, alias.name)
+    for node in ast.walk(tree):
+        if ( isinstance(node, ast.Call)
+             and isinstance(node.func, ast.Attribute)
+             and node.func.attr == 'run'
+             and node.args
+             and isinstance(node.args[0], ast.Name)
+             and node.args[0].id in imported):
+            module_name, class_name = imported[node.args[0].id]
+            items.append(BatchItem(module_name, class_name,
+                                   docstring=ast.get_docstring(tree)))
+    if not items:
+        raise puzzler.ApplicationError(
+            'No puzzler.run() call found in "%s".' % path)
+    return items
+
+def schedule(items, estimates=None, previous=None):
+    """
+    Set the `estimate` & `timed` attributes of each item in `items` and
+    return a new list, largest estimate first (longest processing time
+    first): items with estimated times, then items ranked by docstring
+    solution counts.  `estimates` maps item names (or class names) to times
+    in seconds; `previous` maps item names to previous results (dictionaries
+    with a "duration" in seconds).
+    """
+    estimates = estimates or {}
+    previous = previous or {}
+    for item in items:
+        item.timed = True
+        if item.name in estimates:
+            item.estimate = estimates[item.name]
+        elif item.class_name in estimates:
+            item.estimate = estimates[item.class_name]
+        elif item.name in previous and 'duration' in previous[item.name]:
+            item.estimate = previous[item.name]['duration']
+        else:
+            item.timed = False
+            item.estimate = item.docstring_estimate()
+    return sorted(items,
+                  key=lambda item: (not item.timed, -item.estimate, item.name))
+
+def read_results(path):
+    """Return a mapping of item names to results from a results file."""
+    results = {}
+    if os.path.exists(path):
+        results_file = open(path, 'r')
+        try:
+            for line in results_file:
+                line = line.strip()
+                if line:
+                    result = json.loads(line)
+                    results[result['name']] = result
+        finally:
+            results_file.close()
+    return results
+
+def solve_item(args):
+    """
+    Solve one batch item, in a worker process.  `args` is a 3-tuple: the
+    item, the batch directory, and the solver settings.  Return a result
+    dictionary.
+    """
+    item, directory, settings = args
+    settings = copy.copy(settings)
+    base = os.path.join(directory, item.name)
+    settings.search_state_file = base + '.state'
+    result = {'name': item.name,
+              'puzzle': '%s.%s' % (item.module_name, item.class_name)}
+    stats = {}
+    start = datetime.now()
+    output_stream = open(base + '.txt', 'a')
+    try:
+        try:
+            puzzler.solve(item.load(), output_stream, settings, stats=stats)
+            result['status'] = 'done'
+        except (Exception, SystemExit), error:
+            result['status'] = 'error'
+            result['error'] = '%s: %s' % (error.__class__.__name__, error)
+    finally:
+        output_stream.close()
+    duration = stats.get('duration', datetime.now() - start)
+    result['solutions'] = stats.get('solutions', 0)
+    result['searches'] = stats.get('searches', 0)
+    result['duration'] = total_seconds(duration)
+    return result
+
+def total_seconds(duration):
+    return (duration.days * 86400 + duration.seconds
+            + duration.microseconds / 1e6)
+
+def run_batch(items, directory, settings, processes=None, estimates=None,
+              output_stream=sys.stdout):
+    """
+    Solve the puzzles of `items` (a list of `BatchItem` objects), skipping
+    those already finished.  Return a list of result dictionaries, in
+    schedule order.
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    results_path = os.path.join(directory, results_file_name)
+    previous = read_results(results_path)
+    finished = dict((name, result) for (name, result) in previous.items()
+                    if result.get('status') == 'done')
+    items = schedule(items, estimates, previous)
+    pending = [item for item in items if item.name not in finished]
+    if len(pending) < len(items):
+        print >>output_stream, (
+            'Skipping %s finished item%s.'
+            % (len(items) - len(pending), plural_s(len(items) - len(pending))))
+    results = dict(finished)
+    if pending:
+        pool = multiprocessing.Pool(processes)
+        results_file = open(results_path, 'a')
+        try:
+            try:
+                for result in pool.imap_unordered(
+                    solve_item,
+                    [(item, directory, settings) for item in pending], 1):
+                    results[result['name']] = result
+                    results_file.write(json.dumps(result, sort_keys=True))
+                    results_file.write('\n')
+                    results_file.flush()
+                    print >>output_stream, format_result(result)
+                    output_stream.flush()
+                pool.close()
+            except KeyboardInterrupt:
+                pool.terminate()
+                print >>output_stream, 'Batch interrupted by user.'
+                raise
+        finally:
+            pool.join()
+            results_file.close()
+    ordered = [results[item.name] for item in items if item.name in results]
+    summary = format_summary(ordered)
+    summary_file = open(os.path.join(directory, summary_file_name), 'w')
+    try:
+        summary_file.write(summary)
+    finally:
+        summary_file.close()
+    print >>output_stream, summary,
+    return ordered
+
+def format_result(result):
+    text = ('%s: %s solution%s, %s searches, duration %s'
+            % (result['name'], thousands(result['solutions']),
+               plural_s(result['solutions']), thousands(result['searches']),
+               timedelta(seconds=result['duration'])))
+    if result['status'] != 'done':
+        text += ' (%s)' % result.get('error', result['status'])
+    return text
+
+def format_summary(results):
+    """Return a table of results, as a string."""
+    header = ('Puzzle', 'Solutions', 'Searches', 'Duration', 'Status')
+    rows = [header]
+    total_solutions = total_searches = total_duration = 0
+    for result in results:
+        rows.append((result['name'], thousands(result['solutions']),
+                     thousands(result['searches']),
+                     str(timedelta(seconds=round(result['duration']))),
+                     result['status']))
+        total_solutions += result['solutions']
+        total_searches += result['searches']
+        total_duration += result['duration']
+    rows.append(('Total (%s)' % len(results), thousands(total_solutions),
+                 thousands(total_searches),
+                 str(timedelta(seconds=round(total_duration))), ''))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for i, row in enumerate(rows):
+        if i in (1, len(rows) - 1):
+            lines.append('  '.join('-' * width for width in widths))
+        lines.append('  '.join(
+            [row[0].ljust(widths[0])]
+            + [cell.rjust(width) for (cell, width) in zip(row[1:], widths[1:])]
+            ).rstrip())
+    return '\n'.join(lines) + '\n'
+
+def process_command_line(argv=None):
+    """Process command-line options; return (settings, batch options, args)."""
+    parser = puzzler.option_parser(search_state=False)
+    parser.set_usage('%prog [options] ITEM ...')
+    group = optparse.OptionGroup(parser, 'Batch Options')
+    group.add_option(
+        '-D', '--batch-directory', metavar='DIR', default='batch',
+        help=('Write per-puzzle output & search state files, results, and '
+              'the summary table to DIR.  Default: "%default".'))
+    group.add_option(
+        '-j', '--processes', type='int', metavar='N',
+        help='Run N worker processes.  Default: the number of CPUs.')
+    group.add_option(
+        '-e', '--estimates', metavar='FILE',
+        help=('Read estimated times from FILE, a JSON object mapping item '
+              'names ("module.ClassName") or puzzle class names to '
+              'seconds.'))
+    parser.add_option_group(group)
+    settings, args = parser.parse_args(argv)
+    if not args:
+        parser.error('no batch items specified')
+    return settings, args
+
+def main(argv=None):
+    settings, args = process_command_line(argv)
+    estimates = None
+    if settings.estimates:
+        estimates_file = open(settings.estimates, 'r')
+        try:
+            estimates = json.load(estimates_file)
+        finally:
+            estimates_file.close()
+    try:
+        items = resolve_items(args)
+        run_batch(items, settings.batch_directory, settings,
+                  processes=settings.processes, estimates=estimates)
+    except puzzler.ApplicationError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
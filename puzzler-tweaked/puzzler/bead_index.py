@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+A bit-sliced index of solution hyphen signatures (see `puzzler.beads`),
+answering superset queries: which solutions have hyphens in (at least) all
+of the positions where a poem has them?
+
+Each hyphen position (a line and a bit of its mask) has a bit slice: a
+bitset with one bit per solution, set when the solution has a hyphen there.
+A query ANDs together the slices of the poem's hyphen positions.  The
+solutions are divided into blocks; each block holds one slice per position,
+so a query reads the index one block at a time.
+
+Index file layout: a fixed-size header (magic, version, and the offset &
+length of the metadata), the block data, and the pickled metadata.  Within
+a block, solution j is bit ``j & 7`` of byte ``j >> 3`` of each slice.  The
+index is memory-mapped for queries.
+"""
+
+import sys
+import bisect
+import binascii
+import itertools
+import cPickle as pickle
+import mmap
+import optparse
+import re
+import struct
+
+import puzzler
+from puzzler import beads
+from puzzler.utils import thousands, plural_s, bits
+
+
+magic = 'PZBI'
+version = 1
+header_format = '<4sIQQ'
+header_size = struct.calcsize(header_format)
+
+default_block_size = 1 << 16
+"""The default number of solutions per block.  Must be a multiple of 8."""
+
+
+def build_index(path, bead_paths, block_size=default_block_size):
+    """
+    Write an index of the solutions in the bead files `bead_paths` (written
+    with the "--beads" option) to `path`.  Return the number of solutions.
+    """
+    if block_size <= 0 or block_size % 8:
+        raise puzzler.ApplicationError(
+            'The block size must be a positive multiple of 8.')
+    # first pass: the number of lines & the extent of each line's hyphens
+    line_bits = None
+    for bead_path in bead_paths:
+        for number, masks in beads.read_masks(bead_path):
+            if line_bits is None:
+                line_bits = [0] * len(masks)
+            elif len(masks) != len(line_bits):
+                raise puzzler.ApplicationError(
+                    '%s: solution %s has %s lines; expected %s.'
+                    % (bead_path, number, len(masks), len(line_bits)))
+            for i, mask in enumerate(masks):
+                line_bits[i] = max(line_bits[i], mask.bit_length())
+    if line_bits is None:
+        raise puzzler.ApplicationError('No solutions found in the bead files.')
+    offsets = []
+    num_positions = 0
+    for n in line_bits:
+        offsets.append(num_positions)
+        num_positions += n
+    slice_bytes = block_size >> 3
+    popcounts = [0] * num_positions
+    sources = []
+    runs = []
+    ordinal = 0
+    index_file = open(path, 'wb')
+    try:
+        index_file.write('\0' * header_size)
+        slices = [bytearray(slice_bytes) for p in range(num_positions)]
+        j = 0
+        for bead_path in bead_paths:
+            sources.append((ordinal, bead_path))
+            previous = None
+            for number, masks in beads.read_masks(bead_path):
+                if previous is None or number != previous + 1:
+                    runs.append((ordinal, number))
+                previous = number
+                byte = j >> 3
+                bit = 1 << (j & 7)
+                for i, mask in enumerate(masks):
+                    offset = offsets[i]
+                    for k in bits(mask):
+                        slices[offset + k][byte] |= bit
+                        popcounts[offset + k] += 1
+                ordinal += 1
+                j += 1
+                if j == block_size:
+                    for block_slice in slices:
+                        index_file.write(block_slice)
+                    slices = [bytearray(slice_bytes)
+                              for p in range(num_positions)]
+                    j = 0
+        if j:
+            for block_slice in slices:
+                index_file.write(block_slice)
+        metadata = dict(
+            line_bits=line_bits, block_size=block_size,
+            num_solutions=ordinal, popcounts=popcounts, sources=sources,
+            runs=runs)
+        meta_offset = index_file.tell()
+        meta_data = pickle.dumps(metadata, pickle.HIGHEST_PROTOCOL)
+        index_file.write(meta_data)
+        index_file.seek(0)
+        index_file.write(struct.pack(
+            header_format, magic, version, meta_offset, len(meta_data)))
+    finally:
+        index_file.close()
+    return ordinal
+
+
+class BeadIndex(object):
+
+    """A memory-mapped bead index, for superset queries."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        header = self.file.read(header_size)
+        if len(header) < header_size:
+            raise puzzler.ApplicationError('%s: not a bead index.' % path)
+        file_magic, file_version, meta_offset, meta_length = struct.unpack(
+            header_format, header)
+        if file_magic != magic:
+            raise puzzler.ApplicationError('%s: not a bead index.' % path)
+        if file_version != version:
+            raise puzzler.ApplicationError(
+                '%s: unsupported bead index version (%s).'
+                % (path, file_version))
+        self.file.seek(meta_offset)
+        metadata = pickle.loads(self.file.read(meta_length))
+        self.line_bits = metadata['line_bits']
+        """The number of hyphen positions indexed in each line."""
+
+        self.block_size = metadata['block_size']
+        self.num_solutions = metadata['num_solutions']
+
+        self.popcounts = metadata['popcounts']
+        """The number of solutions with a hyphen, per position."""
+
+        self.sources = metadata['sources']
+        """A list of (first ordinal, bead file path) pairs."""
+
+        self.runs = metadata['runs']
+        """A list of (first ordinal, first solution number) pairs, one per
+        run of consecutively numbered solutions."""
+
+        self.run_starts = [start for start, number in self.runs]
+        self.source_starts = [start for start, path in self.sources]
+
+        self.offsets = []
+        num_positions = 0
+        for n in self.line_bits:
+            self.offsets.append(num_positions)
+            num_positions += n
+        self.num_positions = num_positions
+        self.slice_bytes = self.block_size >> 3
+        self.num_blocks = ((self.num_solutions + self.block_size - 1)
+                           // self.block_size)
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def positions(self, masks):
+        """
+        Return a list of the index positions of the hyphens in `masks` (top
+        line first), rarest first, or None if no indexed solution can match.
+        """
+        if len(masks) > len(self.line_bits):
+            raise puzzler.ApplicationError(
+                'The query has %s lines; the index has only %s.'
+                % (len(masks), len(self.line_bits)))
+        positions = []
+        for i, mask in enumerate(masks):
+            if mask.bit_length() > self.line_bits[i]:
+                return None
+            offset = self.offsets[i]
+            positions.extend(offset + k for k in bits(mask))
+        positions.sort(key=self.popcounts.__getitem__)
+        if positions and not self.popcounts[positions[0]]:
+            return None
+        return positions
+
+    def block_slice(self, block, position):
+        """Return the bit slice of `position` in `block`, as an integer."""
+        start = (header_size
+                 + (block * self.num_positions + position) * self.slice_bytes)
+        chunk = self.data[start:start + self.slice_bytes]
+        return long(binascii.hexlify(chunk[::-1]), 16)
+
+    def block_matches(self, masks):
+        """
+        A generator that produces (first ordinal, bitset) pairs for the
+        blocks with solutions whose hyphens are a superset of those in
+        `masks`.  Bit j of a bitset is the block's solution j.
+        """
+        positions = self.positions(masks)
+        if positions is None:
+            return
+        for block in range(self.num_blocks):
+            base = block * self.block_size
+            count = min(self.block_size, self.num_solutions - base)
+            matches = (1 << count) - 1
+            for position in positions:
+                matches &= self.block_slice(block, position)
+                if not matches:
+                    break
+            else:
+                yield base, matches
+
+    def query(self, masks):
+        """
+        A generator that produces the ordinals (0-based index order) of the
+        solutions whose hyphens are a superset of those in `masks`.
+        """
+        for base, matches in self.block_matches(masks):
+            for j in bits(matches):
+                yield base + j
+
+    def count(self, masks):
+        """Return the number of solutions matching `masks`."""
+        return sum(bin(matches).count('1')
+                   for base, matches in self.block_matches(masks))
+
+    def solution_number(self, ordinal):
+        """Return the solution number (from the bead file) of `ordinal`."""
+        i = bisect.bisect_right(self.run_starts, ordinal) - 1
+        start, number = self.runs[i]
+        return number + ordinal - start
+
+    def source(self, ordinal):
+        """Return the bead file path of `ordinal`."""
+        i = bisect.bisect_right(self.source_starts, ordinal) - 1
+        return self.sources[i][1]
+
+
+def parse_query(args):
+    """
+    Return a list of line masks from the query arguments: either bead
+    notation (one argument per line) or integer masks.
+    """
+    try:
+        if all(arg.isdigit() for arg in args):
+            return [int(arg) for arg in args]
+        return beads.parse_beads(' '.join(args))
+    except ValueError, error:
+        raise puzzler.ApplicationError(str(error))
+
+record_pattern = re.compile(r'\w+$')
+
+def read_records(path, num_lines):
+    """
+    A generator that produces the solution records in solver output file
+    `path`, in order: the lines consisting of `num_lines` space-separated
+    puzzle rows (summaries and status messages are skipped).
+    """
+    records_file = open(path, 'r')
+    try:
+        for line in records_file:
+            fields = line.split()
+            if ( len(fields) == num_lines
+                 and all(record_pattern.match(field) for field in fields)):
+                yield line.rstrip()
+    finally:
+        records_file.close()
+
+def select_records(records, numbers):
+    """
+    A generator that produces the records (from `read_records`) with the
+    given solution `numbers` (ascending, counting from 1), reading only as
+    far as needed.
+    """
+    records = iter(records)
+    current = 0
+    record = None
+    for number in numbers:
+        if number < current:
+            raise puzzler.ApplicationError(
+                'Solution numbers out of order (%s after %s).'
+                % (number, current))
+        while current < number:
+            try:
+                record = records.next()
+            except StopIteration:
+                raise puzzler.ApplicationError(
+                    'Solution %s not found in the records file.' % number)
+            current += 1
+        yield record
+
+def process_command_line(argv=None):
+    """Process command-line options; return (command, settings, args)."""
+    parser = optparse.OptionParser(
+        usage=('%prog build [options] INDEX BEADS_FILE ...\n'
+               '       %prog query [options] INDEX LINE ...'),
+        description=(
+            'Build a superset-query index over the hyphen signatures in '
+            'bead files (written with "--beads"), or query it.  A query '
+            'lists the solutions with hyphens in all the positions of the '
+            'query lines, given in bead notation (e.g. "o-ooo oo-oo-o") or '
+            'as integer masks, top line first.'))
+    parser.add_option(
+        '-b', '--block-size', type='int', metavar='N',
+        default=default_block_size,
+        help=('(build) Index N solutions per block (a multiple of 8).  '
+              'Default: %default.'))
+    parser.add_option(
+        '-c', '--count', action='store_true',
+        help='(query) Output only the number of matching solutions.')
+    parser.add_option(
+        '-n', '--limit', type='int', metavar='N',
+        help='(query) Output at most N matching solutions.')
+    parser.add_option(
+        '-r', '--records', metavar='FILE',
+        help=('(query) Output the solution records from solver output FILE '
+              'instead of solution numbers (single-source indexes only).'))
+    settings, args = parser.parse_args(argv)
+    if len(args) < 3 or args[0] not in ('build', 'query'):
+        parser.error('a command ("build" or "query"), an index file path, '
+                     'and arguments are required')
+    return args[0], settings, args[1:]
+
+def main(argv=None, output_stream=sys.stdout):
+    command, settings, args = process_command_line(argv)
+    try:
+        if command == 'build':
+            count = build_index(args[0], args[1:], settings.block_size)
+            print >>output_stream, '%s solution%s indexed.' % (
+                thousands(count), plural_s(count))
+            return
+        index = BeadIndex(args[0])
+        try:
+            masks = parse_query(args[1:])
+            if settings.count:
+                print >>output_stream, index.count(masks)
+                return
+            multiple = len(index.sources) > 1
+            if settings.records and multiple:
+                raise puzzler.ApplicationError(
+                    'The index has multiple sources; '
+                    '"--records" cannot be used.')
+            ordinals = index.query(masks)
+            if settings.limit is not None:
+                ordinals = itertools.islice(ordinals, settings.limit)
+            if settings.records:
+                numbers = (index.solution_number(ordinal)
+                           for ordinal in ordinals)
+                records = read_records(settings.records, len(index.line_bits))
+                for record in select_records(records, numbers):
+                    print >>output_stream, record
+                return
+            for ordinal in ordinals:
+                number = index.solution_number(ordinal)
+                if multiple:
+                    print >>output_stream, '%s\t%s' % (
+                        index.source(ordinal), number)
+                else:
+                    print >>output_stream, number
+        finally:
+            index.close()
+    except puzzler.ApplicationError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Hyphen signatures ("beads") of 2-D puzzle solutions.
+
+A solution's hyphen signature records, for each line of the solution (top
+line first), which horizontally adjacent cells belong to the same piece.
+Each line is represented by an integer bit mask: bit k is set when the cells
+at x=k and x=k+1 (counting from 0 at the left) belong to the same piece.
+
+In bead notation, each cell is an "o" and same-piece adjacencies are
+hyphens.  For example, the line "LLZVUTUWWt" has the mask 0b10000001 (129)
+and the beads "o-ooooooo-oo".
+
+The masks are written as tab-separated values, one solution per line: the
+solution number followed by one column per puzzle line.
+"""
+
+import sys
+
+
+def hyphen_positions(mask):
+    """
+    Return a list of the hyphen positions in a line's `mask`, numbered as
+    the gaps before, between, and after the cells: 1 is before the first
+    cell, so the gap after cell k (counting from 0) is position k + 2.
+    """
+    positions = []
+    k = 0
+    while mask:
+        if mask & 1:
+            positions.append(k + 2)
+        mask >>= 1
+        k += 1
+    return positions
+
+def format_beads(masks, width):
+    """Return the bead notation of a solution's `masks`, for `width` cells."""
+    lines = []
+    for mask in masks:
+        beads = []
+        for x in range(width):
+            beads.append('o')
+            if mask & (1 << x):
+                beads.append('-')
+        lines.append(''.join(beads))
+    return ' '.join(lines)
+
+def parse_beads(beads):
+    """
+    Return a list of line masks from bead notation (the inverse of
+    `format_beads`).
+    """
+    masks = []
+    for line in beads.split():
+        mask = 0
+        k = -1
+        for char in line:
+            if char == 'o':
+                k += 1
+            elif char == '-' and k >= 0:
+                mask |= 1 << k
+            else:
+                raise ValueError('Invalid bead notation: "%s"' % line)
+        masks.append(mask)
+    return masks
+
+def read_masks(path):
+    """
+    A generator that produces (solution number, list of line masks) pairs
+    from a file written by `BeadWriter` ("-" for STDIN).
+    """
+    if path == '-':
+        stream = sys.stdin
+    else:
+        stream = open(path, 'r')
+    try:
+        for line in stream:
+            fields = line.split()
+            if not fields or not fields[0].isdigit():
+                continue                # header or blank line
+            yield int(fields[0]), [int(field) for field in fields[1:]]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+class BeadWriter(object):
+
+    """Writes solution hyphen masks as tab-separated values."""
+
+    def __init__(self, path, append=False):
+        """
+        `path` is the output file path ("-" for STDOUT).  If `append` is
+        true (resuming a session), add to an existing file.
+        """
+        if path == '-':
+            self.stream = sys.stdout
+        else:
+            self.stream = open(path, ('w', 'a')[bool(append)])
+        self.header_written = append and self.stream.tell() > 0
+
+    def write(self, number, masks):
+        """Write the `masks` of solution number `number`."""
+        if not self.header_written:
+            print >>self.stream, '\t'.join(
+                ['solution'] + ['line%i' % (i + 1) for i in range(len(masks))])
+            self.header_written = True
+        print >>self.stream, '%i\t%s' % (
+            number, '\t'.join([str(mask) for mask in masks]))
+
+    def close(self):
+        if self.stream is sys.stdout:
+            self.stream.flush()
+        else:
+            self.stream.close()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Benchmark suite: solve a curated set of puzzles with every exact cover
+algorithm, check the solution counts, and compare against a baseline.
+
+Each benchmark run (a case solved by one algorithm) is done in a fresh
+worker process, and measures the matrix build time, the search time, the
+search nodes (``num_searches``) and solutions per second, and the peak
+memory use (resident set size).  Solution counts are checked against the
+counts in the puzzle docstrings ("2,339 solutions").  The startup time of
+a solver process is checked against `puzzler.registry.startup_budget`.
+
+The results may be saved as JSON, and compared with a previous (baseline)
+results file; slowdowns beyond a tolerance, and changed search node or
+solution counts, are flagged as regressions::
+
+    python -m puzzler.benchmark -o baseline.json
+    python -m puzzler.benchmark -b baseline.json
+    python -m puzzler.benchmark -a x2 --cap 100 Pentominoes6x10
+"""
+
+import sys
+import time
+import json
+import optparse
+import multiprocessing
+
+import puzzler
+from puzzler import batch
+from puzzler import registry
+from puzzler import sudoku
+from puzzler.utils import thousands, plural_s
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+class PuzzleCase(object):
+
+    """A polyform puzzle class, solved completely or up to `cap` solutions."""
+
+    def __init__(self, name, cap=None):
+        self.name = name
+        """The puzzle class name (see `puzzler.registry`)."""
+
+        self.cap = cap
+        """The maximum number of solutions to find (None: all)."""
+
+    def run(self, algorithm, cap=None):
+        """
+        Solve the puzzle with `algorithm` (stopping at `cap` solutions, if
+        set), and return a dictionary of measurements.
+        """
+        puzzle_class = registry.load(self.name)
+        solver = puzzler.exact_cover_modules[algorithm].ExactCover()
+        settings = optparse.Values()
+        build = search = 0.0
+        for component in puzzle_class.components():
+            # as in `puzzler.solve`:
+            puzzle = component(init_puzzle=False)
+            start = time.time()
+            puzzler.load_puzzle_matrix(puzzle, solver, settings)
+            build += time.time() - start
+            start = time.time()
+            try:
+                for solution in solver.solve():
+                    if ( puzzle.record_solution(solution, solver, stream=None)
+                         and cap and solver.num_solutions >= cap):
+                        break
+            finally:
+                search += time.time() - start
+                if puzzle.dedupe:
+                    puzzle.dedupe.cleanup()
+                    puzzle.dedupe = None
+            if cap and solver.num_solutions >= cap:
+                break
+        return dict(build=build, search=search, nodes=solver.num_searches,
+                    solutions=solver.num_solutions,
+                    expected=self.expected(puzzle_class.__doc__, cap))
+
+    def expected(self, docstring, cap=None):
+        """
+        Return the expected solution count from `docstring` (limited to
+        `cap`), or None if unknown.  When the count is unknown ("many
+        solutions"), a capped run is expected to reach the cap.
+        """
+        match = batch.solutions_pattern.search(docstring or '')
+        if match:
+            count = int(match.group(1).replace(',', ''))
+            if cap:
+                return min(count, cap)
+            return count
+        return cap
+
+
+class SudokuCase(object):
+
+    """
+    A set of Sudoku puzzles (start positions, one per line), each with a
+    unique solution.  A `cap` limits the number of puzzles solved.
+    """
+
+    def __init__(self, name, puzzle_class, positions, cap=None):
+        self.name = name
+        self.puzzle_class = puzzle_class
+        self.positions = positions.splitlines()
+        self.cap = cap
+
+    def run(self, algorithm, cap=None):
+        positions = self.positions[:cap or None]
+        build = search = 0.0
+        nodes = solutions = 0
+        for position in positions:
+            start = time.time()
+            puzzle = self.puzzle_class(position)
+            solver = puzzler.exact_cover_modules[algorithm].ExactCover()
+            solver.load_rows(puzzle.matrix_header, puzzle.matrix_rows)
+            build += time.time() - start
+            start = time.time()
+            for solution in solver.solve():
+                solutions += 1
+            search += time.time() - start
+            nodes += solver.num_searches
+        return dict(build=build, search=search, nodes=nodes,
+                    solutions=solutions, expected=len(positions))
+
+
+cases = [
+    PuzzleCase('Pentominoes6x10'),
+    PuzzleCase('Polyominoes45_8x10', cap=1000),
+    SudokuCase('Sudoku9x9-magictour', sudoku.Sudoku9x9,
+               sudoku.SudokuTest.magictour),
+    PuzzleCase('Soma3x3x3'),
+    PuzzleCase('Polysticks123_4x4ClippedCorners2'),
+    PuzzleCase('Polyhexes1234HexagonRing2'),]
+"""The curated benchmark cases."""
+
+cases_by_name = dict((case.name, case) for case in cases)
+
+default_tolerance = 0.1
+"""The default fraction by which a measurement may worsen before it is
+flagged as a regression."""
+
+def peak_memory():
+    """Return the peak resident set size of this process in MB, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # bytes, not kilobytes
+        peak /= 1024.0
+    return peak / 1024.0
+
+def run_case(name, algorithm, cap=None):
+    """
+    Run benchmark case `name` with `algorithm`, and return a dictionary
+    of measurements.  `cap` (if set) overrides the case's solution cap.
+    """
+    case = cases_by_name[name]
+    cap = cap or case.cap
+    try:
+        result = case.run(algorithm, cap)
+    except SystemExit:
+        # some puzzle errors exit; that would strand a worker process
+        raise puzzler.ApplicationError(
+            'Benchmark case "%s" (%s) failed.' % (name, algorithm))
+    result.update(
+        case=name, algorithm=algorithm, cap=cap, peak_memory=peak_memory(),
+        nodes_per_second=rate(result['nodes'], result['search']),
+        solutions_per_second=rate(result['solutions'], result['search']))
+    return result
+
+def rate(count, seconds):
+    if seconds > 0:
+        return count / seconds
+    return None
+
+def run_isolated(name, algorithm, cap=None):
+    """`run_case` in a fresh worker process (for the peak memory use)."""
+    pool = multiprocessing.Pool(1)
+    try:
+        return pool.apply(run_case, (name, algorithm, cap))
+    finally:
+        pool.close()
+        pool.join()
+
+def run_benchmarks(names=None, algorithms=None, cap=None, startup=True,
+                   isolate=True, output_stream=sys.stdout):
+    """
+    Run the benchmark cases `names` (default: all) with `algorithms`
+    (default: all available), reporting on `output_stream` as they finish.
+    Return a results dictionary: "runs" (a list of `run_case` results) and
+    "startup" (case names mapped to startup times).
+    """
+    names = names or [case.name for case in cases]
+    algorithms = algorithms or puzzler.algorithm_choices
+    results = {'runs': [], 'startup': {}}
+    print >>output_stream, format_header()
+    for name in names:
+        for algorithm in algorithms:
+            if isolate:
+                result = run_isolated(name, algorithm, cap)
+            else:
+                result = run_case(name, algorithm, cap)
+            results['runs'].append(result)
+            print >>output_stream, format_result(result)
+            output_stream.flush()
+        if startup and isinstance(cases_by_name[name], PuzzleCase):
+            results['startup'][name] = registry.startup_time(name)
+    if results['startup']:
+        print >>output_stream
+        for name in names:
+            if name in results['startup']:
+                print >>output_stream, (
+                    'startup %-34s %6.3fs (budget %.3fs)'
+                    % (name, results['startup'][name],
+                       registry.startup_budget))
+    return results
+
+def format_header():
+    return ('%-34s %-4s %8s %9s %10s %9s %7s %s' % (
+        'case', 'alg', 'build', 'search', 'nodes/s', 'solns/s', 'MB',
+        'solutions'))
+
+def format_result(result):
+    status = ''
+    if result['expected'] is not None:
+        status = (' (expected %s)' % thousands(result['expected']),
+                  ' ok')[result['solutions'] == result['expected']]
+    return '%-34s %-4s %7.2fs %8.2fs %10s %9s %7s %s%s' % (
+        result['case'], result['algorithm'], result['build'],
+        result['search'], format_rate(result['nodes_per_second']),
+        format_rate(result['solutions_per_second']),
+        format_memory(result['peak_memory']), thousands(result['solutions']),
+        status)
+
+def format_rate(value):
+    if value is None:
+        return '-'
+    return thousands(int(round(value)))
+
+def format_memory(value):
+    if value is None:
+        return '-'
+    return '%.1f' % value
+
+def compare(results, baseline=None, tolerance=default_tolerance):
+    """
+    Return a list of problems with `results`: wrong solution counts,
+    startup times over budget, and (if a `baseline` results dictionary is
+    given) regressions: changed solution or search node counts, and rates,
+    times, or memory use worse by more than `tolerance` (a fraction).
+    """
+    problems = []
+    for result in results['runs']:
+        label = '%s %s' % (result['case'], result['algorithm'])
+        if ( result['expected'] is not None
+             and result['solutions'] != result['expected']):
+            problems.append('%s: %s solutions, expected %s' % (
+                label, thousands(result['solutions']),
+                thousands(result['expected'])))
+    for name, seconds in sorted(results['startup'].items()):
+        if seconds > registry.startup_budget:
+            problems.append('%s: startup %.3fs, over budget (%.3fs)' % (
+                name, seconds, registry.startup_budget))
+    if not baseline:
+        return problems
+    baseline_runs = dict(((result['case'], result['algorithm']), result)
+                         for result in baseline['runs'])
+    for result in results['runs']:
+        label = '%s %s' % (result['case'], result['algorithm'])
+        old = baseline_runs.get((result['case'], result['algorithm']))
+        if old is None or old.get('cap') != result['cap']:
+            continue
+        for key in ('solutions', 'nodes'):
+            if result[key] != old[key]:
+                problems.append('%s: %s changed, %s -> %s' % (
+                    label, key, thousands(old[key]), thousands(result[key])))
+        for key in ('nodes_per_second', 'solutions_per_second'):
+            if worse(old[key], result[key], tolerance, lower=True):
+                problems.append('%s: %s regressed, %s -> %s' % (
+                    label, key.replace('_', ' '), format_rate(old[key]),
+                    format_rate(result[key])))
+        for key in ('build', 'peak_memory'):
+            if worse(old[key], result[key], tolerance):
+                problems.append('%s: %s regressed, %.2f -> %.2f' % (
+                    label, key.replace('_', ' '), old[key], result[key]))
+    for name, seconds in sorted(results['startup'].items()):
+        old = baseline.get('startup', {}).get(name)
+        if worse(old, seconds, tolerance):
+            problems.append('%s: startup regressed, %.3fs -> %.3fs' % (
+                name, old, seconds))
+    return problems
+
+def worse(old, new, tolerance, lower=False):
+    """
+    Return True if `new` is worse than `old` by more than `tolerance`: lower
+    if `lower` is set, otherwise higher.
+    """
+    if old is None or new is None:
+        return False
+    if lower:
+        return new < old * (1 - tolerance)
+    return new > old * (1 + tolerance)
+
+def process_command_line(argv=None):
+    """Process command-line options; return (settings, args)."""
+    parser = optparse.OptionParser(
+        usage='%prog [options] [CASE ...]',
+        description=(
+            'Run the benchmark CASEs (default: all) with every exact cover '
+            'algorithm, check the solution counts, and compare against a '
+            'baseline.  Cases: %s.'
+            % ', '.join(case.name for case in cases)))
+    parser.add_option(
+        '-a', '--algorithm', action='append', dest='algorithms',
+        choices=puzzler.algorithm_choices, metavar='NAME',
+        help=('Run only with algorithm NAME (one of: %s); may be repeated.  '
+              'Default: all.' % ', '.join(puzzler.algorithm_choices)))
+    parser.add_option(
+        '-c', '--cap', type='int', metavar='N',
+        help='Stop each case after N solutions (for a quick run).')
+    parser.add_option(
+        '-b', '--baseline', metavar='FILE',
+        help='Compare the results with the baseline results in FILE.')
+    parser.add_option(
+        '-o', '--output', metavar='FILE',
+        help='Write the results (JSON) to FILE, for use as a baseline.')
+    parser.add_option(
+        '-t', '--tolerance', type='float', metavar='FRACTION',
+        default=default_tolerance,
+        help=('Flag measurements worse than the baseline by more than '
+              'FRACTION as regressions.  Default: %s.' % default_tolerance))
+    parser.add_option(
+        '--no-startup', dest='startup', action='store_false', default=True,
+        help='Skip the startup time measurements.')
+    parser.add_option(
+        '--inline', dest='isolate', action='store_false', default=True,
+        help=('Run the cases in this process, not in fresh worker processes '
+              '(the peak memory use accumulates).'))
+    settings, args = parser.parse_args(argv)
+    unknown = [name for name in args if name not in cases_by_name]
+    if unknown:
+        parser.error('unknown case%s: %s' % (
+            plural_s(len(unknown)), ', '.join(unknown)))
+    return settings, args
+
+def main(argv=None, output_stream=sys.stdout):
+    settings, names = process_command_line(argv)
+    try:
+        baseline = None
+        if settings.baseline:
+            baseline_file = open(settings.baseline)
+            try:
+                baseline = json.load(baseline_file)
+            finally:
+                baseline_file.close()
+        results = run_benchmarks(
+            names, settings.algorithms, settings.cap, settings.startup,
+            settings.isolate, output_stream)
+        if settings.output:
+            output_file = open(settings.output, 'w')
+            try:
+                json.dump(results, output_file, indent=1, sort_keys=True)
+            finally:
+                output_file.close()
+    except (puzzler.ApplicationError, IOError, ValueError), error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print >>sys.stderr, 'Benchmarks interrupted by user.'
+        sys.exit(1)
+    problems = compare(results, baseline, settings.tolerance)
+    print >>output_stream
+    for problem in problems:
+        print >>output_stream, 'REGRESSION: %s' % problem
+    print >>output_stream, '%s problem%s found' % (
+        thousands(len(problems)), plural_s(len(problems)))
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Laser-cutting plans: the unique edges of a tiling, merged into polylines
+and ordered to reduce the travel of the cutting head between them.
+
+Segments are merged into maximal polylines: a polyline continues straight
+on wherever it can (so collinear segments become one line), otherwise it
+turns onto any remaining edge.  The polylines are ordered by a
+nearest-neighbour tour from the origin (each polyline may be cut in either
+direction; closed polylines may start at any corner), improved by 2-opt
+moves.
+"""
+
+import math
+
+
+max_2opt_passes = 20
+"""The maximum number of 2-opt improvement passes."""
+
+
+class CutPlan(object):
+
+    """
+    The polylines to cut, in order, from a collection of segments (pairs of
+    (x,y) points with exact, e.g. integer, coordinates).
+    """
+
+    def __init__(self, segments, origin=(0, 0)):
+        self.origin = origin
+        """The starting point of the cutting head."""
+
+        self.polylines = order_polylines(merge_segments(segments), origin)
+        """The polylines to cut, in order: lists of points, closed polylines
+        ending with their first point."""
+
+        self.cut_length = sum(polyline_length(points)
+                              for points in self.polylines)
+        """The total length of the polylines."""
+
+        self.travel_length = travel_length(self.polylines, origin)
+        """The total distance travelled between the polylines (from the
+        origin, but not back)."""
+
+
+def distance(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+def polyline_length(points):
+    return sum(distance(a, b) for (a, b) in zip(points, points[1:]))
+
+def travel_length(polylines, origin):
+    total = 0.0
+    position = origin
+    for points in polylines:
+        total += distance(position, points[0])
+        position = points[-1]
+    return total
+
+def merge_segments(segments):
+    """
+    Return a list of polylines (lists of corner points) covering each
+    unique segment of `segments` once.
+    """
+    edges = {}
+    for a, b in segments:
+        if a != b:
+            edges.setdefault(a, set()).add(b)
+            edges.setdefault(b, set()).add(a)
+    # start at odd-degree points first (polyline ends), then anywhere:
+    starts = sorted(edges, key=lambda point: (len(edges[point]) % 2 == 0,
+                                              point))
+    polylines = []
+    for start in starts:
+        while edges.get(start):
+            polylines.append(simplify(trace(edges, start)))
+    return polylines
+
+def trace(edges, start):
+    """
+    Return a list of points from `start` along unused `edges` (removing
+    them), straight on where possible.
+    """
+    points = [start]
+    previous = None
+    current = start
+    while edges.get(current):
+        following = None
+        if previous is not None:
+            straight = (2 * current[0] - previous[0],
+                        2 * current[1] - previous[1])
+            if straight in edges[current]:
+                following = straight
+        if following is None:
+            following = min(edges[current])
+        edges[current].remove(following)
+        edges[following].remove(current)
+        points.append(following)
+        previous, current = current, following
+    return points
+
+def simplify(points):
+    """Remove the points of `points` in the middle of straight runs."""
+    simplified = points[:2]
+    for point in points[2:]:
+        a, b = simplified[-2:]
+        if ( (b[0] - a[0]) * (point[1] - b[1])
+             == (b[1] - a[1]) * (point[0] - b[0])
+             and (b[0] - a[0]) * (point[0] - b[0]) >= 0
+             and (b[1] - a[1]) * (point[1] - b[1]) >= 0):
+            simplified[-1] = point
+        else:
+            simplified.append(point)
+    return simplified
+
+def is_closed(points):
+    return len(points) > 2 and points[0] == points[-1]
+
+def reversed_polyline(points):
+    return points[::-1]
+
+def rotated_polyline(points, start):
+    """
+    Return closed polyline `points` starting (& ending) at corner index
+    `start`.
+    """
+    corners = points[:-1]
+    corners = corners[start:] + corners[:start]
+    return corners + corners[:1]
+
+def nearest_entry(points, position):
+    """
+    Return polyline `points` oriented to start as close to `position` as
+    possible, and that distance.
+    """
+    if is_closed(points):
+        corners = points[:-1]
+        best = min(range(len(corners)),
+                   key=lambda i: distance(position, corners[i]))
+        return (rotated_polyline(points, best),
+                distance(position, corners[best]))
+    forward = distance(position, points[0])
+    backward = distance(position, points[-1])
+    if backward < forward:
+        return reversed_polyline(points), backward
+    return points, forward
+
+def order_polylines(polylines, origin):
+    """
+    Return `polylines` ordered & oriented for a short tour from `origin`:
+    nearest neighbour first, then 2-opt.
+    """
+    remaining = list(polylines)
+    ordered = []
+    position = origin
+    while remaining:
+        best = None
+        for i, points in enumerate(remaining):
+            oriented, gap = nearest_entry(points, position)
+            if best is None or gap < best[0]:
+                best = (gap, i, oriented)
+        gap, i, oriented = best
+        del remaining[i]
+        ordered.append(oriented)
+        position = oriented[-1]
+    return two_opt(ordered, origin)
+
+def two_opt(polylines, origin):
+    """
+    Improve the tour of `polylines` by reversing subsequences (each
+    polyline reversed too) while that shortens the travel.
+    """
+    polylines = list(polylines)
+    count = len(polylines)
+    for passes in range(max_2opt_passes):
+        improved = False
+        for i in range(count - 1):
+            if i:
+                before = polylines[i - 1][-1]
+            else:
+                before = origin
+            for j in range(i + 1, count):
+                old = distance(before, polylines[i][0])
+                new = distance(before, polylines[j][-1])
+                if j + 1 < count:
+                    after = polylines[j + 1][0]
+                    old += distance(polylines[j][-1], after)
+                    new += distance(polylines[i][0], after)
+                if new < old - 1e-9:
+                    polylines[i:j + 1] = [
+                        reversed_polyline(points)
+                        for points in reversed(polylines[i:j + 1])]
+                    improved = True
+        if not improved:
+            break
+    return polylines
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Duplicate solution detection (for puzzles with `check_for_duplicates`),
+keeping only a 128-bit hash per solution.
+
+Where possible, each solution is reduced to a canonical form: the minimum,
+over the puzzle's symmetries (its `duplicate_conditions`), of the solution's
+cell-to-piece assignment.  The symmetries are found once, as permutations of
+the cells, by formatting a probe solution with a unique label in every cell,
+with & without each set of conditions.  A solution is then canonicalized
+directly from its matrix rows, without formatting it at all.  Puzzles whose
+conditions are not simple cell permutations (e.g. "standardize" conditions,
+or piece renamings), or which have secondary columns, fall back to hashing
+the formatted solution variants.
+
+The hashes are kept in memory (`MemoryHashSet`), in a disk-backed hash table
+(`DiskHashSet`), or in a Bloom filter (`BloomFilter`; bounded memory, with a
+small chance of wrongly rejecting a unique solution).  With a search state
+file, the hashes are also appended to a journal, so that a resumed session
+recovers the hashes recorded up to the last saved state, and doesn't
+re-emit duplicates.
+"""
+
+import os
+import re
+import math
+import mmap
+import struct
+import hashlib
+
+
+hash_size = 16
+"""The size of a solution hash, in bytes."""
+
+default_error_rate = 1e-6
+"""The default false-positive rate of a `BloomFilter`."""
+
+
+class CanonicalForm(object):
+
+    """Computes the duplicate-detection hashes of a puzzle's solutions."""
+
+    token_pattern = re.compile(r'<(\d+)>')
+
+    def __init__(self, puzzle):
+        self.puzzle = puzzle
+        self.canonical = None
+        """True if solutions are canonicalized directly; False if the
+        formatted solution variants are hashed; None until the first
+        solution is seen."""
+
+        self.cells = []
+        """The cell names (matrix columns) of the canonical form, sorted."""
+
+        self.cell_index = {}
+        """Mapping of cell names to `self.cells` indices."""
+
+        self.permutations = []
+        """A list of symmetries (including the identity): lists of `self.cells`
+        indices, such that cell j of the transformed solution is cell
+        permutation[j] of the original."""
+
+        self.placements = {}
+        """Mapping of matrix rows (tuples) to (normalized piece name, cell
+        indices) pairs."""
+
+    def keys(self, solution):
+        """
+        Return a list of hashes of `solution`: one (canonical) hash, or the
+        hashes of the normalized formatted solution and of its variants.
+        """
+        if self.canonical is None:
+            self.probe(solution)
+        if self.canonical:
+            return [self.canonical_key(solution)]
+        puzzle = self.puzzle
+        keys = [digest(puzzle.format_solution(solution, normalized=True))]
+        for conditions in puzzle.duplicate_conditions:
+            keys.append(digest(puzzle.format_solution(solution, **conditions)))
+        return keys
+
+    def probe(self, solution):
+        """
+        Find the symmetries of the puzzle as cell permutations, using the
+        cells of `solution`.  Sets `self.canonical`.
+        """
+        self.canonical = False
+        puzzle = self.puzzle
+        if puzzle.secondary_columns:
+            return
+        cells = sorted(name for row in solution if row[0] != '!'
+                       for name in row[:-1] if not name.endswith('i'))
+        probe = [[cell, '<%06i>' % i] for (i, cell) in enumerate(cells)]
+        identity = range(len(cells))
+        permutations = [identity]
+        try:
+            original = self.token_order(puzzle.format_solution(probe),
+                                        len(cells))
+            for conditions in puzzle.duplicate_conditions:
+                variant = self.token_order(
+                    puzzle.format_solution(probe, **conditions), len(cells))
+                permutation = [None] * len(cells)
+                for i, j in zip(original, variant):
+                    permutation[i] = j
+                if permutation == identity:
+                    # the conditions do more than move cells (e.g. rename
+                    # pieces)
+                    return
+                permutations.append(permutation)
+        except Exception:
+            # the conditions can't be applied to the probe
+            return
+        self.cells = cells
+        self.cell_index = dict((cell, i) for (i, cell) in enumerate(cells))
+        self.permutations = permutations
+        self.canonical = True
+
+    def token_order(self, formatted, num_cells):
+        """
+        Return the list of probe cell indices in the order of `formatted`.
+        Raise ValueError unless each of the `num_cells` probe cells occurs
+        once.
+        """
+        order = [int(token) for token in self.token_pattern.findall(formatted)]
+        if sorted(order) != range(num_cells):
+            raise ValueError('probe cells lost in formatting')
+        return order
+
+    def placement(self, row):
+        key = tuple(row)
+        try:
+            return self.placements[key]
+        except KeyError:
+            pass
+        name = self.puzzle.normalize_piece_name(row[-1])
+        if row[0] == '!':
+            indices = None
+        else:
+            # columns other than cells are ignored:
+            indices = tuple(self.cell_index[cell] for cell in row[:-1]
+                            if cell in self.cell_index)
+        placement = self.placements[key] = (name, indices)
+        return placement
+
+    def canonical_key(self, solution):
+        grid = [''] * len(self.cells)
+        omitted = []
+        for row in solution:
+            name, indices = self.placement(row)
+            if indices is None:
+                omitted.append(name)
+            else:
+                for i in indices:
+                    grid[i] = name
+        canonical = min(tuple([grid[j] for j in permutation])
+                        for permutation in self.permutations)
+        omitted.sort()
+        return digest(repr((canonical, omitted)))
+
+
+def digest(text):
+    """Return the hash of `text`."""
+    return hashlib.md5(text).digest()
+
+
+class MemoryHashSet(object):
+
+    """A set of hashes in memory."""
+
+    def __init__(self):
+        self.hashes = set()
+
+    def __contains__(self, key):
+        return key in self.hashes
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def add(self, key):
+        self.hashes.add(key)
+
+    def close(self):
+        self.hashes = set()
+
+
+class DiskHashSet(object):
+
+    """
+    A set of hashes in a memory-mapped file: an open-addressing hash table
+    (linear probing) of `hash_size`-byte slots, an all-zero slot being
+    empty.  The table doubles in size when half full.  The file is scratch
+    space, replaced when opened.
+    """
+
+    initial_slots = 1 << 16
+    empty = '\0' * hash_size
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.file = None
+        self.map = None
+        self.create(self.initial_slots)
+
+    def create(self, num_slots):
+        self.close()
+        self.num_slots = num_slots
+        self.file = open(self.path, 'w+b')
+        self.file.truncate(num_slots * hash_size)
+        self.map = mmap.mmap(self.file.fileno(), num_slots * hash_size)
+        self.count = 0
+
+    def slot(self, key):
+        """Return the slot offset of `key`, or of the empty slot for it."""
+        mask = self.num_slots - 1
+        i = struct.unpack('<Q', key[:8])[0] & mask
+        data = self.map
+        while True:
+            offset = i * hash_size
+            stored = data[offset:offset + hash_size]
+            if stored == key or stored == self.empty:
+                return offset
+            i = (i + 1) & mask
+
+    def __contains__(self, key):
+        key = self.non_empty(key)
+        offset = self.slot(key)
+        return self.map[offset:offset + hash_size] == key
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        key = self.non_empty(key)
+        offset = self.slot(key)
+        if self.map[offset:offset + hash_size] == key:
+            return
+        self.map[offset:offset + hash_size] = key
+        self.count += 1
+        if self.count * 2 > self.num_slots:
+            self.grow()
+
+    def non_empty(self, key):
+        if key == self.empty:
+            return '\1' + key[1:]
+        return key
+
+    def grow(self):
+        old_path = self.path + '.old'
+        self.map.close()
+        self.file.close()
+        self.map = self.file = None
+        os.rename(self.path, old_path)
+        self.create(self.num_slots * 2)
+        old = open(old_path, 'rb')
+        try:
+            while True:
+                data = old.read(hash_size * 4096)
+                if not data:
+                    break
+                for offset in range(0, len(data), hash_size):
+                    key = data[offset:offset + hash_size]
+                    if key != self.empty:
+                        self.add(key)
+        finally:
+            old.close()
+            os.unlink(old_path)
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.file.close()
+            self.map = self.file = None
+
+    def remove(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class BloomFilter(object):
+
+    """
+    A Bloom filter of hashes, sized for `capacity` entries with a false
+    positive rate of `error_rate` (a unique solution wrongly taken for a
+    duplicate).
+    """
+
+    def __init__(self, capacity, error_rate=default_error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        num_bits = int(math.ceil(-capacity * math.log(error_rate)
+                                 / math.log(2) ** 2))
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(
+            1, int(round(self.num_bits * math.log(2) / max(capacity, 1))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def positions(self, key):
+        h1, h2 = struct.unpack('<QQ', key[:16])
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key):
+        bits = self.bits
+        for position in self.positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        bits = self.bits
+        for position in self.positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def close(self):
+        self.bits = bytearray()
+
+
+class Deduplicator(object):
+
+    """
+    Detects duplicate solutions of one puzzle (component), by their hashes
+    (see `CanonicalForm`).  Part of the session state, if there is one: the
+    hashes themselves are recovered from the journal file.
+    """
+
+    def __init__(self, component=None, journal_path=None, store_path=None,
+                 bloom_capacity=None):
+        """
+        `component` is the name of the puzzle (component) class.  If
+        `journal_path` is given, hashes are appended to that file.  With
+        `store_path`, a `DiskHashSet` is used; with `bloom_capacity`, a
+        `BloomFilter`; otherwise a `MemoryHashSet`.
+        """
+        self.component = component
+        self.journal_path = journal_path
+        self.store_path = store_path
+        self.bloom_capacity = bloom_capacity
+        self.count = 0
+        """The number of hashes recorded."""
+
+        self.recover = False
+        """True if restored from a saved state (the journal holds at least
+        `count` hashes)."""
+
+        self.init_runtime()
+
+    def init_runtime(self):
+        self.form = None
+        self.store = None
+        self.journal = None
+
+    def __getstate__(self):
+        # the journal must hold every hash counted:
+        if self.journal:
+            self.journal.flush()
+        odict = self.__dict__.copy()
+        for name in ('form', 'store', 'journal'):
+            del odict[name]
+        return odict
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.init_runtime()
+        self.recover = True
+
+    def start(self, puzzle):
+        """Prepare to check the solutions of `puzzle` (a puzzle object)."""
+        self.form = CanonicalForm(puzzle)
+        if self.store is None:
+            self.open()
+
+    def open(self):
+        if self.store_path:
+            self.store = DiskHashSet(self.store_path)
+        elif self.bloom_capacity:
+            self.store = BloomFilter(self.bloom_capacity)
+        else:
+            self.store = MemoryHashSet()
+        if not self.journal_path:
+            return
+        if self.recover and os.path.exists(self.journal_path):
+            # keep the hashes recorded up to the saved state:
+            self.journal = open(self.journal_path, 'r+b')
+            for i in range(self.count):
+                key = self.journal.read(hash_size)
+                if len(key) < hash_size:
+                    self.count = i
+                    break
+                self.store.add(key)
+            self.journal.seek(self.count * hash_size)
+            self.journal.truncate()
+        else:
+            self.journal = open(self.journal_path, 'wb')
+            self.count = 0
+        self.recover = False
+
+    def is_duplicate(self, solution):
+        """
+        Return True if `solution` is a duplicate of (a variant of) an earlier
+        solution; otherwise record it and return False.
+        """
+        if self.form is None:
+            raise RuntimeError('Deduplicator.start() must be called first.')
+        keys = self.form.keys(solution)
+        store = self.store
+        if keys[0] in store:
+            return True
+        # variants of this solution may be identical to each other:
+        own = set([keys[0]])
+        for key in keys[1:]:
+            if key not in own:
+                if key in store:
+                    return True
+                own.add(key)
+        for key in own:
+            store.add(key)
+            if self.journal:
+                self.journal.write(key)
+            self.count += 1
+        return False
+
+    def close(self):
+        """Close the journal, and remove the disk store (scratch space)."""
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+        if self.store_path and os.path.exists(self.store_path):
+            os.unlink(self.store_path)
+
+    def cleanup(self):
+        """Close, and remove the journal."""
+        self.close()
+        if self.journal_path and os.path.exists(self.journal_path):
+            os.unlink(self.journal_path)
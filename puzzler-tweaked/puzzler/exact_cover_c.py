@@ -31,11 +31,12 @@ class ExactCover(object):
     approach to Knuth's Algorithm X.
     """
 
-    def __init__(self, matrix=None, secondary=0, state=None):
+    def __init__(self, matrix=None, secondary=0, state=None,
+                 multiplicities=None):
         """
         Parameters:
 
-        * `matrix` & `secondary`: see `self.load_matrix`.
+        * `matrix`, `secondary`, & `multiplicities`: see `self.load_matrix`.
 
         * `state`: a `puzzler.SessionState` object which stores the runtime
           state of this puzzle (we're resuming a previously interrupted
@@ -52,6 +53,10 @@ class ExactCover(object):
         """Keeps track of the total number of searches in previous
         sub-puzzles, since the C extension doesn't."""
 
+        self._pending = None
+        """Column names, number of secondary columns, and rows, during an
+        incremental load (see `self.start_rows`)."""
+
         if state:
             # does nothing for now; requires support in exactcover C extension
             pass
@@ -59,9 +64,9 @@ class ExactCover(object):
             #self.num_solutions = state.num_solutions
             #self.num_searches = state.num_searches
         if matrix:
-            self.load_matrix(matrix, secondary)
+            self.load_matrix(matrix, secondary, multiplicities)
 
-    def load_matrix(self, matrix, secondary=0):
+    def load_matrix(self, matrix, secondary=0, multiplicities=None):
         """
         Convert the input `matrix` into a form compatible with the
         `exactcover` C extension and load it into an `exactcover.Coverings`
@@ -84,14 +89,60 @@ class ExactCover(object):
         The `secondary` parameter is the number of secondary (rightmost)
         columns: columns which may, but need not, participate in the solution.
 
+        The `multiplicities` parameter (counted columns) is not supported by
+        the C extension; it must be empty.
+
         The converted data structure consists of a list of lists of column
         names.
         """
+        self.load_rows(matrix[0],
+                       ([i for (i, item) in enumerate(row) if item]
+                        for row in matrix[1:]),
+                       secondary, multiplicities)
+
+    def load_rows(self, column_names, rows, secondary=0, multiplicities=None):
+        """
+        Load a sparse matrix into an `exactcover.Coverings` object.
+
+        `column_names` is a sequence of column names (see `load_matrix`),
+        `rows` is an iterable of sequences of column indices (the columns
+        containing a 1/True), and `secondary` is the number of secondary
+        (rightmost) columns.  `multiplicities` must be empty.
+        """
+        self.start_rows(column_names, secondary, multiplicities)
+        for row in rows:
+            self.add_row(row)
+        self.finish_rows()
+
+    def start_rows(self, column_names, secondary=0, multiplicities=None):
+        """
+        Begin loading a sparse matrix incrementally, releasing any previously
+        loaded matrix.  Parameters as for `load_rows`.  Add rows with
+        `self.add_row`, then call `self.finish_rows`.
+        """
+        if multiplicities:
+            raise NotImplementedError(
+                'The exactcover C extension does not support counted columns '
+                '(piece multiplicities); use the "dlx" or "x2" algorithm.')
         if self.solver:
             self._num_previous_searches += self.solver.num_searches
-        rows = [sorted(item for item in row if item) for row in matrix[1:]]
+        self.solver = None
+        self._pending = (column_names, secondary, [])
+
+    def add_row(self, row):
+        """Add one `row`, a sequence of column indices (see `start_rows`)."""
+        column_names = self._pending[0]
+        self._pending[2].append(sorted(column_names[i] for i in row))
+
+    def finish_rows(self):
+        """
+        Complete an incremental load (see `start_rows`): the C extension
+        requires all rows at once.
+        """
+        column_names, secondary, rows = self._pending
+        self._pending = None
         self.solver = exactcover.Coverings(
-            rows, headers=matrix[0], secondary=secondary)
+            rows, headers=column_names, secondary=secondary)
 
     def solve(self, level=0):
         """
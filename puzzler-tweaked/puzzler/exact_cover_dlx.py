@@ -29,15 +29,22 @@ class ExactCover(object):
     exactly one 1 in each primary column (and at most one 1 in each secondary
     column).  See `load_matrix` for a description of the data structure.
     Uses the Dancing Links approach to Knuth's Algorithm X.
+
+    Columns may also be given multiplicity bounds (counted columns; see
+    `load_matrix`), used by more than one row of a solution.  The rows of a
+    counted column are interchangeable: each combination of them is found
+    only once.
     """
 
-    __slots__ = ('root', 'solution', 'num_solutions', 'num_searches')
+    __slots__ = ('root', 'columns', 'counted', 'solution', 'num_solutions',
+                 'num_searches', 'profile')
 
-    def __init__(self, matrix=None, secondary=0, state=None):
+    def __init__(self, matrix=None, secondary=0, state=None,
+                 multiplicities=None):
         """
         Parameters:
 
-        * `matrix` & `secondary`: see `self.load_matrix`.
+        * `matrix`, `secondary`, & `multiplicities`: see `self.load_matrix`.
 
         * `state`: a `puzzler.SessionState` object which stores the runtime
           state of this puzzle (we're resuming a previously interrupted
@@ -46,6 +53,18 @@ class ExactCover(object):
         self.root = None
         """A `Root` object, set in `self.load_matrix()`."""
 
+        self.columns = None
+        """A list of `Column` objects, during an incremental load (see
+        `self.start_rows`)."""
+
+        self.counted = []
+        """A list of `CountedColumn` objects.  Like secondary columns, they
+        are not linked to the root."""
+
+        self.profile = None
+        """A `puzzler.search_profile.SearchProfile` object, to which search
+        nodes are reported (optional)."""
+
         self.solution = []
         self.num_solutions = 0
         self.num_searches = 0
@@ -55,9 +74,9 @@ class ExactCover(object):
             self.num_solutions = state.num_solutions
             self.num_searches = state.num_searches
         if matrix:
-            self.load_matrix(matrix, secondary)
+            self.load_matrix(matrix, secondary, multiplicities)
 
-    def load_matrix(self, matrix, secondary=0):
+    def load_matrix(self, matrix, secondary=0, multiplicities=None):
         """
         Convert and store (into `self.root`) the input `matrix` as a four-way
         linked representation of a sparse matrix.
@@ -79,6 +98,12 @@ class ExactCover(object):
         The `secondary` parameter is the number of secondary (rightmost)
         columns: columns which may, but need not, participate in the solution.
 
+        The `multiplicities` parameter is a dictionary mapping the names of
+        counted columns to 2-tuples: the minimum & maximum number of rows of
+        a solution with a 1 in the column.  Each row may contain at most one
+        counted column (`ValueError` is raised otherwise), and must also
+        contain at least one ordinary primary column.
+
         The converted data structure consists of a sparse matrix
         representation starting at `self.roo`, a `Root` node, the leftmost
         node in a circular doubly-linked list of `Column` header nodes.  The
@@ -100,11 +125,38 @@ class ExactCover(object):
         to its column header, and each column header contains the column name
         and a count of the number of active nodes in that column.
         """
+        self.load_rows(matrix[0],
+                       ([i for (i, item) in enumerate(row) if item]
+                        for row in matrix[1:]),
+                       secondary, multiplicities)
+
+    def load_rows(self, column_names, rows, secondary=0, multiplicities=None):
+        """
+        Convert and store (into `self.root`) a sparse matrix as a four-way
+        linked representation (see `load_matrix`).
+
+        `column_names` is a sequence of column names, `rows` is an iterable
+        of sequences of column indices (the columns containing a 1/True),
+        `secondary` is the number of secondary (rightmost) columns, and
+        `multiplicities` maps counted column names to bounds (see
+        `load_matrix`).
+        """
+        self.start_rows(column_names, secondary, multiplicities)
+        for row in rows:
+            self.add_row(row)
+        self.finish_rows()
+
+    def start_rows(self, column_names, secondary=0, multiplicities=None):
+        """
+        Begin loading a sparse matrix incrementally, releasing any previously
+        loaded matrix.  Parameters as for `load_rows`.  Add rows with
+        `self.add_row`, then call `self.finish_rows`.
+        """
         self.root = root = Root()
         root.left = root.right = root
-        columns = []
+        self.columns = columns = []
         prev = root
-        for name in matrix[0]:
+        for name in column_names:
             column = Column(name=name, left=prev, right=root)
             prev.right = column
             root.left = column
@@ -116,32 +168,73 @@ class ExactCover(object):
             root.left = column.left
             root.left.right = root
             column.left = column.right = column
-        for row in matrix[1:]:
-            first = None
-            last = None
-            for i, item in enumerate(row):
-                if item:
-                    column = columns[i]
-                    datum = Datum(column=column, up=column.up, down=column)
-                    if first is None:
-                        first = datum
-                        last = datum
-                    column.up.down = datum
-                    column.up = datum
-                    datum.left = last
-                    datum.right = first
-                    last.right = datum
-                    first.left = datum
-                    column.size += 1
-                    last = datum
+        self.counted = []
+        if multiplicities:
+            for i, name in enumerate(column_names):
+                if name not in multiplicities:
+                    continue
+                column = columns[i]
+                column.left.right = column.right
+                column.right.left = column.left
+                counted = CountedColumn(name=name)
+                counted.left = counted.right = counted
+                counted.up = counted.down = counted
+                counted.minimum, counted.maximum = multiplicities[name]
+                columns[i] = counted
+                self.counted.append(counted)
+
+    def add_row(self, row):
+        """Add one `row`, a sequence of column indices (see `start_rows`)."""
+        columns = self.columns
+        first = None
+        last = None
+        for i in row:
+            column = columns[i]
+            datum = Datum(column=column, up=column.up, down=column)
+            if first is None:
+                first = datum
+                last = datum
+            column.up.down = datum
+            column.up = datum
+            datum.left = last
+            datum.right = first
+            last.right = datum
+            first.left = datum
+            column.size += 1
+            last = datum
+
+    def finish_rows(self):
+        """Complete an incremental load (see `start_rows`)."""
+        self.columns = None
+        if self.counted:
+            counted = set(self.counted)
+            for column in self.counted:
+                for r in column.down_siblings():
+                    row = r.row_data()
+                    if len([j for j in row if j.column in counted]) > 1:
+                        raise ValueError(
+                            'matrix row %r has more than one counted column'
+                            % [j.column.name for j in row])
+            ordinary = set(self.root.right_siblings())
+            for column in self.counted:
+                column.min_cover = min(
+                    [len([j for j in r.row_data() if j.column in ordinary])
+                     for r in column.down_siblings()] or [0])
 
     def solve(self, level=0):
         """A generator that produces all solutions: Algorithm X.."""
+        if self.counted:
+            for solution in self.solve_counted(level):
+                yield solution
+            return
         if self.root.right is self.root:
             yield list(self.solution)
             return
         self.num_searches += 1
         c = self.root.choose_column()
+        profile = self.profile
+        if profile is not None and not self.num_searches % profile.sample:
+            profile.node(level, c.name, c.size)
         c.cover()
         for r in c.down_siblings():
             row = sorted(d.column.name for d in r.row_data())
@@ -159,6 +252,75 @@ class ExactCover(object):
                 j.column.uncover()
         c.uncover()
 
+    def solve_counted(self, level=0):
+        """
+        A generator that produces all solutions, with counted columns
+        (Algorithm X, extended with multiplicities).
+        """
+        candidates = self.root.right_siblings()
+        open_columns = len(candidates)
+        demand = 0
+        for column in self.counted:
+            needed = column.minimum - column.count
+            if needed > 0:
+                if column.size < needed:
+                    return
+                # no row has two counted columns (see finish_rows), so
+                # the counted columns' demands are disjoint:
+                demand += needed * column.min_cover
+                candidates.append(column)
+        if demand > open_columns:
+            # the rows still needed by counted columns cannot fit
+            return
+        if not candidates:
+            yield list(self.solution)
+            return
+        self.num_searches += 1
+        c = candidates[0]
+        for column in candidates:
+            if column.size < c.size:
+                c = column
+        profile = self.profile
+        if profile is not None and not self.num_searches % profile.sample:
+            profile.node(level, c.name, c.size)
+        counted = isinstance(c, CountedColumn)
+        if counted:
+            # A counted column may be covered by several rows, so its
+            # branches overlap.  Each row tried is hidden from the later
+            # branches, so each combination of rows is found only once.
+            hidden = []
+        else:
+            c.cover()
+        for r in c.down_siblings():
+            row = sorted(d.column.name for d in r.row_data())
+            if len(self.solution) > level:
+                if self.solution[level] != row:
+                    # skip rows already fully explored
+                    if counted:
+                        r.hide()
+                        hidden.append(r)
+                    continue
+            else:
+                self.solution.append(row)
+            if counted:
+                r.hide()
+                hidden.append(r)
+                c.select()
+            for j in r.right_siblings():
+                j.column.select()
+            for solution in self.solve_counted(level+1):
+                yield solution
+            self.solution.pop()
+            for j in r.left_siblings():
+                j.column.deselect()
+            if counted:
+                c.deselect()
+        if counted:
+            for r in reversed(hidden):
+                r.unhide()
+        else:
+            c.uncover()
+
     def format_solution(self):
         """Return a simple formatted string representation of the solution."""
         self.num_solutions += 1
@@ -228,6 +390,19 @@ class Datum(object):
             next = next.up
         return sibs
 
+    def hide(self):
+        """Remove this node's row from its columns."""
+        for j in self.row_data():
+            j.down.up = j.up
+            j.up.down = j.down
+            j.column.size -= 1
+
+    def unhide(self):
+        for j in reversed(self.row_data()):
+            j.column.size += 1
+            j.down.up = j
+            j.up.down = j
+
 
 class Column(Datum):
 
@@ -261,6 +436,40 @@ class Column(Datum):
         self.right.left = self
         self.left.right = self
 
+    # Row selection, with counted columns:
+    select = cover
+    deselect = uncover
+
+
+class CountedColumn(Column):
+
+    """
+    A column header node for a counted column, which is covered only when
+    its maximum number of rows have been selected.
+    """
+
+    __slots__ = ('minimum', 'maximum', 'count', 'min_cover')
+
+    def __init__(self, up=None, down=None, left=None, right=None, column=None,
+                 name=None, size=0, minimum=1, maximum=1):
+        Column.__init__(self, up, down, left, right, column, name, size)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.count = 0
+        self.min_cover = 0
+        """The minimum number of ordinary primary columns in this column's
+        rows, for pruning."""
+
+    def select(self):
+        self.count += 1
+        if self.count == self.maximum:
+            self.cover()
+
+    def deselect(self):
+        if self.count == self.maximum:
+            self.uncover()
+        self.count -= 1
+
 
 class Root(Datum):
 
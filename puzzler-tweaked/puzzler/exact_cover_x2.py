@@ -33,13 +33,19 @@ class ExactCover(object):
     exactly one 1 in each primary column (and at most one 1 in each secondary
     column).  See `load_matrix` for a description of the data structure.
     Uses the native approach to Knuth's Algorithm X.
+
+    Columns may also be given multiplicity bounds (counted columns; see
+    `load_matrix`), used by more than one row of a solution.  The rows of a
+    counted column are interchangeable: each combination of them is found
+    only once.
     """
 
-    def __init__(self, matrix=None, secondary=0, state=None):
+    def __init__(self, matrix=None, secondary=0, state=None,
+                 multiplicities=None):
         """
         Parameters:
 
-        * `matrix` & `secondary`: see `self.load_matrix`.
+        * `matrix`, `secondary`, & `multiplicities`: see `self.load_matrix`.
 
         * `state`: a `puzzler.SessionState` object which stores the runtime
           state of this puzzle (we're resuming a previously interrupted
@@ -56,6 +62,29 @@ class ExactCover(object):
         """A list of lists of column names.  Each list represents one row of
         the exact cover matrix: all the columns containing a 1/True."""
 
+        self.column_names = None
+        """The sequence of column names, during an incremental load (see
+        `self.start_rows`)."""
+
+        self.multiplicities = {}
+        """A dictionary mapping counted column names to (minimum, maximum)
+        numbers of rows."""
+
+        self.counts = {}
+        """A dictionary mapping counted column names to the number of rows
+        in the current partial solution."""
+
+        self.min_cover = {}
+        """A dictionary mapping counted column names to the minimum number
+        of ordinary primary columns in their rows, for pruning."""
+
+        self.best_score = None
+        """The best score found so far, in `self.optimize`."""
+
+        self.profile = None
+        """A `puzzler.search_profile.SearchProfile` object, to which search
+        nodes are reported (optional)."""
+
         self.solution = []
         self.num_solutions = 0
         self.num_searches = 0
@@ -65,9 +94,9 @@ class ExactCover(object):
             self.num_solutions = state.num_solutions
             self.num_searches = state.num_searches
         if matrix:
-            self.load_matrix(matrix, secondary)
+            self.load_matrix(matrix, secondary, multiplicities)
 
-    def load_matrix(self, matrix, secondary=0):
+    def load_matrix(self, matrix, secondary=0, multiplicities=None):
         """
         Convert and store the input `matrix` into `self.columns`,
         `self.secondary_columns`, and `self.rows`.
@@ -88,28 +117,96 @@ class ExactCover(object):
 
         The `secondary` parameter is the number of secondary (rightmost)
         columns: columns which may, but need not, participate in the solution.
+
+        The `multiplicities` parameter is a dictionary mapping the names of
+        counted columns to 2-tuples: the minimum & maximum number of rows of
+        a solution with a 1 in the column.  Each row may contain at most one
+        counted column (`ValueError` is raised otherwise), and must also
+        contain at least one ordinary primary column.
         """
         matrix_iter = iter(matrix)
         column_names = matrix_iter.next()
+        self.load_rows(
+            column_names,
+            ([j for j in range(len(column_names)) if row[j]]
+             for row in matrix_iter),
+            secondary, multiplicities)
+
+    def load_rows(self, column_names, rows, secondary=0, multiplicities=None):
+        """
+        Convert and store a sparse matrix into `self.columns`,
+        `self.secondary_columns`, and `self.rows`.
+
+        `column_names` is a sequence of column names (see `load_matrix`),
+        `rows` is an iterable of sequences of column indices (the columns
+        containing a 1/True), `secondary` is the number of secondary
+        (rightmost) columns, and `multiplicities` maps counted column names to
+        bounds (see `load_matrix`).
+        """
+        self.start_rows(column_names, secondary, multiplicities)
+        for row in rows:
+            self.add_row(row)
+        self.finish_rows()
+
+    def start_rows(self, column_names, secondary=0, multiplicities=None):
+        """
+        Begin loading a sparse matrix incrementally, releasing any previously
+        loaded matrix.  Parameters as for `load_rows`.  Add rows with
+        `self.add_row`, then call `self.finish_rows`.
+        """
+        self.column_names = column_names
         self.secondary_columns = set(
             column_names[(len(column_names) - secondary):])
         self.columns = dict((j, set()) for j in column_names)
-        self.rows = [
-            [column_names[j] for j in range(len(column_names)) if row[j]]
-            for row in matrix_iter]
-        for (r, row) in enumerate(self.rows):
-            for c in row:
-                self.columns[c].add(r)
+        self.rows = []
+        self.multiplicities = dict(multiplicities or {})
+        self.counts = dict((j, 0) for j in self.multiplicities)
+
+    def add_row(self, row):
+        """Add one `row`, a sequence of column indices (see `start_rows`)."""
+        column_names = self.column_names
+        r = len(self.rows)
+        names = [column_names[j] for j in row]
+        self.rows.append(names)
+        columns = self.columns
+        for c in names:
+            columns[c].add(r)
+
+    def finish_rows(self):
+        """Complete an incremental load (see `start_rows`)."""
+        self.column_names = None
+        self.min_cover = {}
+        if self.multiplicities:
+            counted = set(self.multiplicities)
+            for j in counted:
+                for r in self.columns[j]:
+                    if len(counted.intersection(self.rows[r])) > 1:
+                        raise ValueError(
+                            'matrix row %r has more than one counted column'
+                            % self.rows[r])
+            ordinary = (set(self.columns) - self.secondary_columns
+                        - counted)
+            for j in self.multiplicities:
+                self.min_cover[j] = min(
+                    [len([k for k in self.rows[r] if k in ordinary])
+                     for r in self.columns[j]] or [0])
 
     def solve(self, level=0):
         """A generator that produces all solutions: Algorithm X."""
+        if self.multiplicities:
+            for solution in self.solve_counted(level):
+                yield solution
+            return
         if not (set(self.columns) - self.secondary_columns):
             yield self.full_solution()
             return
         self.num_searches += 1
-        _size, c = min((len(self.columns[column]), column)
-                       for column in self.columns
-                       if column not in self.secondary_columns)
+        size, c = min((len(self.columns[column]), column)
+                      for column in self.columns
+                      if column not in self.secondary_columns)
+        profile = self.profile
+        if profile is not None and not self.num_searches % profile.sample:
+            profile.node(level, c, size)
         # Since `self.columns` is being modified, a copy must be made here.
         # `sorted()` is used instead of `list()` to get reproducible output.
         for r in sorted(self.columns[c]):
@@ -147,6 +244,186 @@ class ExactCover(object):
                     if k != j:
                         columns[k].add(i)
 
+    def solve_counted(self, level=0):
+        """
+        A generator that produces all solutions, with counted columns
+        (Algorithm X, extended with multiplicities).
+        """
+        complete, c, open_columns = self.choose_counted()
+        if complete:
+            yield self.full_solution()
+            return
+        if c is None:
+            return
+        self.num_searches += 1
+        profile = self.profile
+        if profile is not None and not self.num_searches % profile.sample:
+            profile.node(level, c, len(self.columns[c]))
+        # A counted column may be covered by several rows, so its branches
+        # overlap.  Each row tried is hidden from the later branches, so
+        # each combination of rows is found only once.
+        counted = c in self.multiplicities
+        hidden = []
+        for r in sorted(self.columns[c]):
+            if len(self.solution) > level:
+                if self.solution[level] != r:
+                    # skip rows already fully explored
+                    if counted:
+                        hidden.append((r, self.hide(r)))
+                    continue
+            else:
+                self.solution.append(r)
+            covered = self.cover_counted(r)
+            for s in self.solve_counted(level+1):
+                yield s
+            self.uncover_counted(r, covered)
+            self.solution.pop()
+            if counted:
+                hidden.append((r, self.hide(r)))
+        for r, names in reversed(hidden):
+            self.unhide(r, names)
+
+    def choose_counted(self):
+        """
+        Choose the column to branch on, with counted columns.  Return a
+        3-tuple: a flag (true if the partial solution is complete), the
+        column name (None if the partial solution is complete or cannot be
+        completed), and the number of ordinary primary columns remaining.
+        """
+        columns = self.columns
+        multiplicities = self.multiplicities
+        counts = self.counts
+        secondary_columns = self.secondary_columns
+        best = None
+        open_columns = 0
+        demand = 0
+        for column in columns:
+            if column in secondary_columns:
+                continue
+            if column in multiplicities:
+                needed = multiplicities[column][0] - counts[column]
+                if needed <= 0:
+                    # satisfied: more rows are optional, like a secondary
+                    # column
+                    continue
+                if len(columns[column]) < needed:
+                    return False, None, open_columns
+                # no row has two counted columns (see finish_rows), so
+                # the counted columns' demands are disjoint:
+                demand += needed * self.min_cover[column]
+            else:
+                open_columns += 1
+            candidate = (len(columns[column]), column)
+            if best is None or candidate < best:
+                best = candidate
+        if demand > open_columns:
+            # the rows still needed by counted columns cannot fit
+            return False, None, open_columns
+        if best is None:
+            return True, None, 0
+        return False, best[1], open_columns
+
+    def optimize(self, objective):
+        """
+        A generator that produces solutions of increasing score, found by
+        branch and bound: (solution, score) pairs.  Each solution produced
+        scores higher than the previous one; the last is optimal.
+
+        `objective` is a `puzzler.objectives.Objective` object, which scores
+        rows and bounds the score obtainable from the remaining columns.
+        Subtrees which cannot beat the best score found so far are pruned.
+        Resuming a previous session is not supported.
+        """
+        self.solution = []
+        self.best_score = None
+        objective.start(self)
+        for result in self.optimize_level(objective, 0):
+            yield result
+
+    def optimize_level(self, objective, score):
+        complete, c, open_columns = self.choose_counted()
+        if complete:
+            if self.best_score is None or score > self.best_score:
+                self.best_score = score
+                yield self.full_solution(), score
+            return
+        if c is None:
+            return
+        if ( self.best_score is not None
+             and score + objective.bound(self, open_columns)
+             <= self.best_score):
+            return
+        self.num_searches += 1
+        counted = c in self.multiplicities
+        hidden = []
+        for r in sorted(self.columns[c]):
+            gain = objective.select(r)
+            self.solution.append(r)
+            covered = self.cover_counted(r)
+            for result in self.optimize_level(objective, score + gain):
+                yield result
+            self.uncover_counted(r, covered)
+            self.solution.pop()
+            objective.deselect(r)
+            if counted:
+                hidden.append((r, self.hide(r)))
+        for r, names in reversed(hidden):
+            self.unhide(r, names)
+
+    def cover_counted(self, r):
+        """
+        Like `self.cover`, but a counted column is only covered when its
+        maximum is reached.
+        """
+        columns = self.columns
+        rows = self.rows
+        multiplicities = self.multiplicities
+        counts = self.counts
+        covered = []
+        for j in rows[r]:
+            if j in multiplicities:
+                counts[j] += 1
+                if counts[j] < multiplicities[j][1]:
+                    # row r is removed from column j along with its other
+                    # columns
+                    covered.append(None)
+                    continue
+            for i in columns[j]:
+                for k in rows[i]:
+                    if k != j:
+                        columns[k].remove(i)
+            covered.append(columns.pop(j))
+        return covered
+
+    def uncover_counted(self, r, covered):
+        columns = self.columns
+        rows = self.rows
+        counts = self.counts
+        for j in reversed(rows[r]):
+            column = covered.pop()
+            if column is not None:
+                columns[j] = column
+                for i in column:
+                    for k in rows[i]:
+                        if k != j:
+                            columns[k].add(i)
+            if j in counts:
+                counts[j] -= 1
+
+    def hide(self, r):
+        """
+        Remove row `r` from its active columns; return a list of their names.
+        """
+        columns = self.columns
+        names = [j for j in self.rows[r] if j in columns]
+        for j in names:
+            columns[j].remove(r)
+        return names
+
+    def unhide(self, r, names):
+        for j in names:
+            self.columns[j].add(r)
+
     def full_solution(self):
         """
         Return an expanded representation (full row details) of a solution,
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Gallery rendering: many solutions of one puzzle, from a solver output file,
+to SVG or X3D files, in one process launch.
+
+The solutions are rendered across a pool of worker processes; each worker
+instantiates the puzzle once.  Both kinds of solution records are read:
+"solution N:" records (matrix rows, as read by the "-r" option), and the
+solver's one-line records of 2-D puzzles with single-character piece names
+(numbered in order of appearance).  An "index.html" file lists the
+rendered solutions::
+
+    python -m puzzler.gallery -n 1-500 pentominoes.Pentominoes6x10 \\
+        6x10.txt gallery/
+"""
+
+import os
+import sys
+import cgi
+import optparse
+import itertools
+import multiprocessing
+from datetime import datetime
+
+import puzzler
+from puzzler import bead_index
+from puzzler.utils import thousands, plural_s
+
+
+index_file_name = 'index.html'
+
+formats = ('svg', 'x3d')
+
+
+def parse_numbers(spec):
+    """
+    Return a list of (first, last) solution number ranges from `spec`, e.g.
+    "1-100,250,300-" ("300-": 300 onwards; `last` is None).
+    """
+    ranges = []
+    try:
+        for part in spec.split(','):
+            part = part.strip()
+            if '-' in part:
+                first, last = part.split('-')
+                first = int(first)
+                last = (last.strip() and int(last)) or None
+            else:
+                first = last = int(part)
+            if first < 1 or (last is not None and last < first):
+                raise ValueError
+            ranges.append((first, last))
+    except ValueError:
+        raise puzzler.ApplicationError(
+            'Invalid solution numbers: "%s" (use e.g. "1-100,250,300-").'
+            % spec)
+    return ranges
+
+def selected(number, ranges):
+    """Return True if `number` is in `ranges` (all numbers if None)."""
+    if ranges is None:
+        return True
+    for first, last in ranges:
+        if first <= number and (last is None or number <= last):
+            return True
+    return False
+
+def read_records(puzzle, path):
+    """
+    A generator that produces (solution number, record) pairs from solver
+    output file `path`.  A record is a list of matrix row strings (cell
+    coordinates and the piece name), as read by `Puzzle.read_solution`.
+    """
+    record_pattern = bead_index.record_pattern
+    input_file = open(path, 'rU')
+    try:
+        count = 0
+        for line in input_file:
+            match = puzzle.solution_header.match(line)
+            if match:
+                record = []
+                for line in input_file:
+                    line = line.strip()
+                    if not line:
+                        break
+                    record.append(line)
+                yield int(match.group(1)), record
+                continue
+            fields = line.split()
+            if ( len(fields) == puzzle.height
+                 and all(record_pattern.match(field) for field in fields)):
+                count += 1
+                yield count, line_record(puzzle, fields)
+    finally:
+        input_file.close()
+
+def line_record(puzzle, lines):
+    """
+    Return the record (matrix row strings) of `lines`, a one-line solver
+    record of a 2-D puzzle split into lines (top line first), with one
+    character per cell.
+    """
+    line_xs = {}
+    for coord in puzzle.solution_coords:
+        if len(coord) != 2:
+            raise puzzler.ApplicationError(
+                'One-line records are only supported for 2-D puzzles.')
+        line_xs.setdefault(coord[1], []).append(coord[0])
+    piece_cells = {}
+    for line, y in zip(lines, reversed(range(puzzle.height))):
+        xs = sorted(line_xs.get(y, ()))
+        if len(line) != len(xs):
+            raise puzzler.ApplicationError(
+                'Record line %r does not fit the %s puzzle.'
+                % (line, puzzle.__class__.__name__))
+        for x, name in zip(xs, line):
+            piece_cells.setdefault(name, []).append('%i,%i' % (x, y))
+    return ['%s %s' % (' '.join(cells), name)
+            for name, cells in sorted(piece_cells.items())]
+
+def render_gallery(puzzle_class, input_path, directory, numbers=None,
+                   output_format='svg', thin=False, processes=1,
+                   output_stream=sys.stdout):
+    """
+    Render the solutions of `puzzle_class` in solver output file
+    `input_path` whose numbers are in `numbers` (see `parse_numbers`; all
+    if None) to `output_format` ("svg" or "x3d") files in `directory`, with
+    an index file, using `processes` worker processes (0: one per CPU).
+    `thin` selects laser-cutting SVG output.  Return the list of
+    (solution number, file name, error message) results, in input order.
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if processes == 0:
+        processes = multiprocessing.cpu_count()
+    puzzle = puzzle_class(init_puzzle=False)
+    records = ((number, record)
+               for (number, record) in read_records(puzzle, input_path)
+               if selected(number, numbers))
+    worker_args = (puzzle_class, directory, output_format, thin)
+    results = []
+    pool = None
+    try:
+        if processes > 1:
+            pool = multiprocessing.Pool(
+                processes, init_gallery_worker, worker_args)
+            rendered = pool.imap(render_record, records, chunksize=16)
+        else:
+            init_gallery_worker(*worker_args)
+            rendered = itertools.imap(render_record, records)
+        for result in rendered:
+            results.append(result)
+            if result[2]:
+                print >>output_stream, 'solution %s: %s' % (
+                    result[0], result[2])
+        if pool:
+            pool.close()
+    except KeyboardInterrupt:
+        if pool:
+            pool.terminate()
+        raise
+    finally:
+        if pool:
+            pool.join()
+    write_index(puzzle_class, directory, output_format, results)
+    return results
+
+gallery_puzzle = None
+"""The puzzle object of a gallery worker process."""
+
+gallery_settings = None
+
+def init_gallery_worker(puzzle_class, directory, output_format, thin):
+    global gallery_puzzle, gallery_settings
+    gallery_puzzle = puzzle_class(init_puzzle=False)
+    gallery_settings = (directory, output_format, thin)
+
+def render_record(args):
+    """
+    Render one solution in a gallery worker process.  `args` is a
+    (solution number, record) pair.  Return a (solution number, file name,
+    error message) 3-tuple; the file name is None if the rendering failed.
+    """
+    number, record = args
+    directory, output_format, thin = gallery_settings
+    puzzle = gallery_puzzle
+    file_name = '%s-%06i.%s' % (
+        puzzle.__class__.__name__, number, output_format)
+    try:
+        s_matrix = puzzle.convert_record_to_solution_matrix(record)
+        if output_format == 'x3d':
+            text = puzzle.format_x3d(s_matrix=s_matrix)
+        elif thin:
+            text = puzzle.format_thin_svg(s_matrix=s_matrix)
+        else:
+            text = puzzle.format_svg(s_matrix=s_matrix)
+    except NotImplementedError:
+        return number, None, ('%s output not supported by this puzzle.'
+                              % output_format.upper())
+    except Exception, error:
+        return number, None, '%s: %s' % (error.__class__.__name__, error)
+    output_file = open(os.path.join(directory, file_name), 'w')
+    try:
+        output_file.write(text)
+    finally:
+        output_file.close()
+    return number, file_name, None
+
+def write_index(puzzle_class, directory, output_format, results):
+    """Write the gallery index file, listing the rendered solutions."""
+    title = cgi.escape('%s solutions' % puzzle_class.__name__)
+    lines = ['<!DOCTYPE html>', '<html>', '<head>',
+             '<meta charset="utf-8">', '<title>%s</title>' % title,
+             '</head>', '<body>', '<h1>%s</h1>' % title]
+    for number, file_name, error in results:
+        if not file_name:
+            continue
+        link = cgi.escape(file_name, quote=True)
+        if output_format == 'svg':
+            content = '<img src="%s" alt="solution %s">' % (link, number)
+        else:
+            content = 'solution %s' % number
+        lines.append('<p id="solution-%s"><a href="%s">%s</a></p>'
+                     % (number, link, content))
+    lines.extend(['</body>', '</html>', ''])
+    index_file = open(os.path.join(directory, index_file_name), 'w')
+    try:
+        index_file.write('\n'.join(lines))
+    finally:
+        index_file.close()
+
+def process_command_line(argv=None):
+    """Process command-line options; return (settings, args)."""
+    parser = optparse.OptionParser(
+        usage='%prog [options] PUZZLE INPUT DIRECTORY',
+        description=(
+            'Render the solutions of PUZZLE (a puzzle class, e.g. '
+            '"pentominoes.Pentominoes6x10") in solver output file INPUT to '
+            'SVG or X3D files in DIRECTORY, with an index file ("%s").'
+            % index_file_name))
+    parser.add_option(
+        '-n', '--numbers', metavar='LIST',
+        help=('Render only the solutions numbered in LIST, e.g. '
+              '"1-100,250,300-".  Default: all.'))
+    parser.add_option(
+        '-f', '--format', choices=formats, default=formats[0],
+        help='Output format: "svg" (default) or "x3d".')
+    parser.add_option(
+        '-t', '--thin-svg', action='store_true',
+        help='Format the SVG for laser cutting (thin simple lines).')
+    parser.add_option(
+        '-j', '--processes', type='int', metavar='N', default=0,
+        help=('Render in N worker processes.  Default: one per CPU.'))
+    settings, args = parser.parse_args(argv)
+    if len(args) != 3:
+        parser.error('a puzzle class, an input path, and an output directory '
+                     'are required')
+    return settings, args
+
+def main(argv=None, output_stream=sys.stdout):
+    from puzzler import batch
+    settings, (puzzle_name, input_path, directory) = process_command_line(
+        argv)
+    start = datetime.now()
+    try:
+        items = batch.resolve_items([puzzle_name])
+        if len(items) != 1:
+            raise puzzler.ApplicationError(
+                '%s: a single puzzle class is required.' % puzzle_name)
+        numbers = None
+        if settings.numbers:
+            numbers = parse_numbers(settings.numbers)
+        results = render_gallery(
+            items[0].load(), input_path, directory, numbers,
+            settings.format, settings.thin_svg, settings.processes,
+            output_stream)
+    except (puzzler.ApplicationError, IOError), error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print >>sys.stderr, 'Gallery interrupted by user.'
+        sys.exit(1)
+    count = len([result for result in results if result[1]])
+    print >>output_stream, '%s solution%s rendered, duration %s' % (
+        thousands(count), plural_s(count), datetime.now() - start)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+A persistent cache of compiled puzzle matrices.
+
+A puzzle's exact cover matrix is compiled into a compact binary form (sparse
+rows of column indices, the column table, and piece/aspect metadata) and
+written to a cache file.  Later runs (and every worker process of a parallel
+job) memory-map the file read-only instead of rebuilding the matrix from
+`piece_data`, so the pages are shared between processes.
+"""
+
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import cPickle as pickle
+from array import array
+
+from puzzler import coordsys
+
+
+def sparse_rows(matrix):
+    """
+    A generator that converts the data rows of a conventional (dense) puzzle
+    matrix (see `puzzler.exact_cover_x2.ExactCover.load_matrix`) into tuples
+    of column indices.
+    """
+    for row in matrix[1:]:
+        yield tuple(i for (i, item) in enumerate(row) if item)
+
+
+class CompiledMatrix(object):
+
+    """
+    An exact cover matrix compiled to sparse rows of column indices.
+
+    The binary layout (all integers are little-endian unsigned 32-bit) is:
+
+    * the magic string "PZMC", the format version, and the length of the
+      pickled metadata;
+    * the pickled metadata (a dictionary: column names, number of secondary
+      columns, number of rows, cache key, and piece aspect coordinates),
+      padded to a multiple of 8 bytes;
+    * the row offset table (number of rows + 1 entries);
+    * the column indices of all rows, concatenated.
+
+    The data is accessed in place (via `struct.unpack_from`) from either a
+    string or a read-only `mmap`.
+    """
+
+    magic = 'PZMC'
+    version = 1
+    prefix = struct.Struct('<4sII')
+
+    def __init__(self, data, mapped_file=None):
+        """
+        `data` is a string or buffer (e.g. an `mmap` object) containing a
+        compiled matrix in the binary layout described above.
+        """
+        self.data = data
+        """The compiled matrix data."""
+
+        self.mapped_file = mapped_file
+        """The path of the memory-mapped file, if any."""
+
+        magic, version, meta_length = self.prefix.unpack_from(data, 0)
+        if magic != self.magic or version != self.version:
+            raise ValueError('Not a compiled puzzle matrix (version %s).'
+                             % self.version)
+        start = self.prefix.size
+        self.metadata = pickle.loads(data[start:start + meta_length])
+        self.columns = self.metadata['columns']
+        """A tuple of column names (the matrix header)."""
+
+        self.secondary = self.metadata['secondary']
+        """The number of secondary (rightmost) columns."""
+
+        self.num_rows = self.metadata['num_rows']
+        self.offsets_start = start + _padded(meta_length)
+        self.rows_start = self.offsets_start + 4 * (self.num_rows + 1)
+
+    def __len__(self):
+        return self.num_rows
+
+    @property
+    def pieces(self):
+        """Mapping of piece names to tuples of aspect coordinates."""
+        return self.metadata['pieces']
+
+    @property
+    def key(self):
+        """The cache key the matrix was compiled under."""
+        return self.metadata['key']
+
+    def row(self, index):
+        """Return row number `index` as a tuple of column indices."""
+        start, end = struct.unpack_from(
+            '<2I', self.data, self.offsets_start + 4 * index)
+        return struct.unpack_from(
+            '<%iI' % (end - start), self.data, self.rows_start + 4 * start)
+
+    def rows(self):
+        """A generator that produces every row (see `self.row`)."""
+        for index in xrange(self.num_rows):
+            yield self.row(index)
+
+    def row_names(self, index):
+        """Return row number `index` as a tuple of column names."""
+        columns = self.columns
+        return tuple(columns[i] for i in self.row(index))
+
+    @classmethod
+    def compile(cls, columns, rows, secondary=0, key=None, pieces=None):
+        """
+        Return a new in-memory `CompiledMatrix`.
+
+        `columns` is the sequence of column names; `rows` is an iterable of
+        sequences of column indices; `pieces` maps piece names to sequences of
+        aspect coordinates.
+        """
+        offsets = array('I', [0])
+        indices = array('I')
+        for row in rows:
+            indices.extend(row)
+            offsets.append(len(indices))
+        metadata = {
+            'columns': tuple(columns),
+            'secondary': secondary,
+            'num_rows': len(offsets) - 1,
+            'key': key,
+            'pieces': pieces or {},}
+        pickled = pickle.dumps(metadata, 2)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+            indices.byteswap()
+        parts = [cls.prefix.pack(cls.magic, cls.version, len(pickled)),
+                 pickled, '\0' * (_padded(len(pickled)) - len(pickled)),
+                 offsets.tostring(), indices.tostring()]
+        return cls(''.join(parts))
+
+    @classmethod
+    def from_puzzle(cls, puzzle, key=None):
+        """Compile the matrix of an initialized `puzzle`."""
+        pieces = dict(
+            (name, tuple(tuple(tuple(coord) for coord in coords)
+                         for (coords, aspect) in aspects))
+            for (name, aspects) in puzzle.pieces.items())
+        return cls.compile(puzzle.matrix[0], sparse_rows(puzzle.matrix),
+                           puzzle.secondary_columns, key=key, pieces=pieces)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map the compiled matrix file at `path` (read-only)."""
+        matrix_file = open(path, 'rb')
+        try:
+            data = mmap.mmap(matrix_file.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            matrix_file.close()
+        return cls(data, mapped_file=path)
+
+    def write(self, path):
+        """
+        Write the compiled matrix to `path`.  The file is written under a
+        temporary name and renamed, so concurrent readers & writers (parallel
+        workers) never see a partial file.
+        """
+        temp_path = '%s.%s.tmp' % (path, os.getpid())
+        matrix_file = open(temp_path, 'wb')
+        try:
+            matrix_file.write(self.data[:])
+        finally:
+            matrix_file.close()
+        try:
+            os.rename(temp_path, path)
+        except OSError:
+            # Windows won't rename over an existing file; another process
+            # has already written an identical matrix.
+            os.remove(temp_path)
+
+
+def _padded(length):
+    return (length + 7) // 8 * 8
+
+def matrix_key(puzzle):
+    """
+    Return a cache key for the matrix of `puzzle` (which need not be
+    initialized): a hash of the puzzle class, the source of every module
+    defining the class & its bases, and the customized piece data.
+    """
+    puzzle_class = puzzle.__class__
+    digest = hashlib.sha1()
+    digest.update('%s.%s\n' % (puzzle_class.__module__, puzzle_class.__name__))
+    module_names = set(base.__module__ for base in puzzle_class.__mro__)
+    module_names.add(coordsys.__name__)
+    for name in sorted(module_names):
+        module = sys.modules.get(name)
+        path = getattr(module, '__file__', None)
+        if not path:
+            continue
+        if path.endswith('.pyc') or path.endswith('.pyo'):
+            path = path[:-1]
+        try:
+            source_file = open(path, 'rb')
+        except IOError:
+            continue
+        try:
+            digest.update(source_file.read())
+        finally:
+            source_file.close()
+    digest.update(puzzle.matrix_signature())
+    return digest.hexdigest()
+
+def cache_path(cache_dir, puzzle, key):
+    return os.path.join(
+        cache_dir, '%s-%s.matrix' % (puzzle.__class__.__name__, key[:16]))
+
+def get_compiled_matrix(puzzle, cache_dir, check=None):
+    """
+    Return a `CompiledMatrix` for `puzzle` (an uninitialized puzzle object),
+    memory-mapped from `cache_dir` if possible.  Otherwise initialize the
+    puzzle, call `check(puzzle)` if supplied, and compile & cache its matrix.
+    """
+    key = matrix_key(puzzle)
+    path = cache_path(cache_dir, puzzle, key)
+    if os.path.exists(path):
+        compiled = CompiledMatrix.load(path)
+        if compiled.key == key:
+            puzzle.secondary_columns = compiled.secondary
+            return compiled
+    puzzle.init_puzzle()
+    if check:
+        check(puzzle)
+    compiled = CompiledMatrix.from_puzzle(puzzle, key=key)
+    if not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            # another worker process may have just created it
+            if not os.path.isdir(cache_dir):
+                raise
+    compiled.write(path)
+    return CompiledMatrix.load(path)
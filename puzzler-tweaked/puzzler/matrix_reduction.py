@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Exact cover matrix reduction: removal of rows which cannot be part of any
+solution, before the search begins.
+
+Two rules are applied repeatedly, until neither removes any rows:
+
+* Column dominance: if every row covering primary column C also covers
+  column D, then column D must be covered by the same row as column C, so
+  the other rows covering D can be removed.  This includes forced columns:
+  when primary column C is covered by only one row, every row conflicting
+  with that row is removed.
+
+* Blocking rows: a row which conflicts with every row covering some primary
+  column (which it doesn't cover itself) would leave that column uncoverable,
+  so the row is removed.  For example, a piece placement which isolates a
+  corner cell that no other placement can cover.
+
+Sets of rows are represented as integer bit masks.
+"""
+
+from puzzler.utils import thousands, plural_s, bits
+
+
+class MatrixReducer(object):
+
+    """
+    A matrix consumer which reduces the matrix before loading it into an
+    exact cover solver.  Supports the solvers' matrix loading interface:
+    `load_rows` and incremental loading (`start_rows`, `add_row`, and
+    `finish_rows`).
+    """
+
+    def __init__(self, solver):
+        self.solver = solver
+        """The exact cover solver object which will receive the rows."""
+
+        self.column_names = None
+        self.secondary = 0
+        self.multiplicities = None
+        self.rows = None
+        """A list of tuples of column indices, during loading."""
+
+        self.stats = None
+        """A `ReductionStats` object, set in `self.finish_rows()`."""
+
+    def load_rows(self, column_names, rows, secondary=0, multiplicities=None):
+        self.start_rows(column_names, secondary, multiplicities)
+        for row in rows:
+            self.add_row(row)
+        self.finish_rows()
+
+    def start_rows(self, column_names, secondary=0, multiplicities=None):
+        self.column_names = column_names
+        self.secondary = secondary
+        self.multiplicities = multiplicities
+        self.rows = []
+
+    def add_row(self, row):
+        self.rows.append(tuple(row))
+
+    def finish_rows(self):
+        """Reduce the matrix and load the remaining rows into the solver."""
+        rows = self.rows
+        self.rows = None
+        counted = ()
+        if self.multiplicities:
+            counted = [c for (c, name) in enumerate(self.column_names)
+                       if name in self.multiplicities]
+        kept, self.stats = reduce_rows(
+            len(self.column_names), rows, self.secondary, counted)
+        self.solver.load_rows(
+            self.column_names, (rows[r] for r in kept), self.secondary,
+            self.multiplicities)
+
+
+class ReductionStats(object):
+
+    """Statistics from `reduce_rows`."""
+
+    def __init__(self, num_rows):
+        self.num_rows = num_rows
+        """The number of rows before reduction."""
+
+        self.rows_removed = 0
+        self.passes = 0
+
+        self.forced_rows = 0
+        """The number of rows remaining which are the only row covering
+        some primary column (they must be part of every solution)."""
+
+        self.columns_eliminated = 0
+        """The number of columns covered by forced rows."""
+
+        self.empty_columns = 0
+        """The number of primary columns without any rows (the puzzle has no
+        solutions)."""
+
+    def __str__(self):
+        parts = ['Matrix reduction: %s of %s row%s removed'
+                 % (thousands(self.rows_removed), thousands(self.num_rows),
+                    plural_s(self.num_rows)),
+                 '%s column%s eliminated by %s forced row%s'
+                 % (thousands(self.columns_eliminated),
+                    plural_s(self.columns_eliminated),
+                    thousands(self.forced_rows), plural_s(self.forced_rows)),
+                 '%s pass%s' % (self.passes, ('es', '')[self.passes == 1])]
+        text = ', '.join(parts) + '.'
+        if self.empty_columns:
+            text += ('\n%s primary column%s cannot be covered: '
+                     'no solutions are possible.'
+                     % (self.empty_columns, plural_s(self.empty_columns)))
+        return text
+
+
+def reduce_rows(num_columns, rows, secondary=0, counted=()):
+    """
+    Reduce a sparse exact cover matrix: `rows` is a sequence of tuples of
+    column indices, and the rightmost `secondary` of the `num_columns`
+    columns are secondary.  Return a 2-tuple: a list of the indices of the
+    rows remaining (in order), and a `ReductionStats` object.
+
+    The columns listed in `counted` (with multiplicities; see
+    `puzzler.exact_cover_x2.ExactCover.load_matrix`) are left out of the
+    reduction: the rules are applied to the rest of the matrix, which every
+    solution also covers exactly.
+    """
+    stats = ReductionStats(len(rows))
+    if counted:
+        counted = frozenset(counted)
+        rows = [tuple(c for c in row if c not in counted) for row in rows]
+    primary = [c for c in range(num_columns - secondary)
+               if c not in counted]
+    column_rows = [0] * num_columns
+    for (r, row) in enumerate(rows):
+        bit = 1 << r
+        for c in row:
+            column_rows[c] |= bit
+    row_sets = [frozenset(row) for row in rows]
+    active = (1 << len(rows)) - 1
+
+    def remove(mask):
+        for r in bits(mask):
+            inverse = ~(1 << r)
+            for c in rows[r]:
+                column_rows[c] &= inverse
+
+    while True:
+        stats.passes += 1
+        if not all(column_rows[c] for c in primary):
+            break
+        # column dominance:
+        removed = 0
+        for c in primary:
+            c_rows = column_rows[c]
+            common = None
+            for r in bits(c_rows):
+                if common is None:
+                    common = set(row_sets[r])
+                else:
+                    common &= row_sets[r]
+                if len(common) == 1:
+                    break
+            for d in common:
+                if d != c:
+                    removed |= column_rows[d] & ~c_rows
+        remove(removed)
+        active &= ~removed
+        # blocking rows:
+        blocking = 0
+        for r in bits(active):
+            row = row_sets[r]
+            conflicts = 0
+            for c in row:
+                conflicts |= column_rows[c]
+            for c in primary:
+                if c not in row and not (column_rows[c] & ~conflicts):
+                    blocking |= 1 << r
+                    break
+        remove(blocking)
+        active &= ~blocking
+        if not (removed or blocking):
+            break
+    kept = list(bits(active))
+    stats.rows_removed = len(rows) - len(kept)
+    stats.empty_columns = len([c for c in primary if not column_rows[c]])
+    forced = set()
+    for c in primary:
+        c_rows = column_rows[c]
+        if c_rows and not (c_rows & (c_rows - 1)):
+            forced.add(c_rows.bit_length() - 1)
+    stats.forced_rows = len(forced)
+    stats.columns_eliminated = len(
+        set(c for r in forced for c in rows[r]))
+    return kept, stats
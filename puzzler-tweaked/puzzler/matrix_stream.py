@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Streaming construction of puzzle matrices.
+
+A `MatrixStream` stands in for a puzzle's `matrix` list while the puzzle is
+being initialized.  Instead of accumulating the dense matrix rows, it converts
+each row to sparse form and passes it directly to a consumer (an exact cover
+solver's incremental loading interface: `start_rows`, `add_row`, and
+`finish_rows`), detecting duplicate rows along the way.
+"""
+
+
+class MatrixStream(object):
+
+    """
+    A write-only replacement for `puzzler.puzzles.Puzzle.matrix`.  The first
+    row appended is the matrix header (the column names); the header alone is
+    retained.
+    """
+
+    def __init__(self, puzzle, consumer):
+        self.puzzle = puzzle
+        """The puzzle object whose matrix is being built."""
+
+        self.consumer = consumer
+        """An object supporting incremental matrix loading, such as
+        `puzzler.exact_cover_x2.ExactCover`."""
+
+        self.header = None
+        """The tuple of column names."""
+
+        self.num_rows = 0
+        """The number of data rows appended, including any duplicates."""
+
+        self.rows_seen = set()
+        """The sparse rows seen so far.  The rows themselves are kept (not
+        just their hashes), so a hash collision can't be mistaken for a
+        duplicate row."""
+
+        self.duplicates = []
+        """A list of duplicate rows found, as tuples of column names."""
+
+    def __len__(self):
+        if self.header is None:
+            return 0
+        return self.num_rows + 1
+
+    def __getitem__(self, index):
+        if index == 0 and self.header is not None:
+            return self.header
+        raise IndexError('%s: only the header row (0) is retained'
+                         % self.__class__.__name__)
+
+    def append(self, row):
+        """
+        Append `row`, a dense matrix row (a sequence of column names or 1s
+        and 0s), converting it to a sparse row of column indices and passing
+        it on to the consumer.  The first row appended is the header.
+        """
+        if self.header is None:
+            self.header = tuple(row)
+            return
+        if not self.num_rows:
+            self.start()
+        self.num_rows += 1
+        sparse = tuple(i for (i, item) in enumerate(row) if item)
+        if sparse in self.rows_seen:
+            header = self.header
+            self.duplicates.append(tuple(header[i] for i in sparse))
+            return
+        self.rows_seen.add(sparse)
+        self.consumer.add_row(sparse)
+
+    def start(self):
+        """
+        Start the consumer's matrix.  This is deferred until the first data
+        row, as some puzzles adjust `secondary_columns` in `build_matrix`,
+        after the header is built.
+        """
+        self.consumer.start_rows(
+            self.header, self.puzzle.secondary_columns,
+            self.puzzle.piece_multiplicities)
+
+    def close(self):
+        """Complete the matrix and release the rows seen."""
+        if not self.num_rows:
+            self.start()
+        self.rows_seen = None
+        self.consumer.finish_rows()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Objectives for optimization searches (branch and bound; see
+`puzzler.exact_cover_x2.ExactCover.optimize`): scores over the rows
+(placements) of solutions.
+"""
+
+
+class Objective(object):
+
+    """
+    Abstract base class for objectives.  An objective scores the rows of a
+    partial solution as they are selected, and bounds the additional score
+    obtainable from the remaining (uncovered) columns.
+    """
+
+    def start(self, solver):
+        """
+        Prepare for a search by `solver`, an `ExactCover` object with a
+        loaded matrix.
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
+    def select(self, r):
+        """
+        Add row `r` to the partial solution, and return the score it adds.
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
+    def deselect(self, r):
+        """
+        Remove row `r` from the partial solution (the inverse of
+        `self.select`).
+        """
+        pass
+
+    def bound(self, solver, open_columns):
+        """
+        Return an upper bound on the score the remaining rows of a solution
+        can add.  `open_columns` is the number of ordinary primary columns
+        remaining, which every solution must cover.
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
+    def row_cells(self, solver):
+        """
+        Return a list of the number of ordinary primary columns in each of
+        the rows of `solver`.
+        """
+        ordinary = (set(solver.columns) - solver.secondary_columns
+                    - set(solver.multiplicities))
+        return [len([j for j in row if j in ordinary]) for row in solver.rows]
+
+
+class PlacementScore(Objective):
+
+    """
+    The sum of the scores of the rows (piece placements) of a solution.
+    """
+
+    def __init__(self, score):
+        """`score` is a function of a row (a list of column names)."""
+        self.score = score
+        self.weights = None
+        """A list of row scores."""
+
+        self.column_bounds = None
+        """A mapping of ordinary primary column names to the highest score
+        per column of their rows."""
+
+    def start(self, solver):
+        self.weights = [self.score(row) for row in solver.rows]
+        cells = self.row_cells(solver)
+        self.column_bounds = {}
+        for r, row in enumerate(solver.rows):
+            if not cells[r]:
+                continue
+            density = float(self.weights[r]) / cells[r]
+            for j in row:
+                if j in solver.secondary_columns or j in solver.multiplicities:
+                    continue
+                if ( j not in self.column_bounds
+                     or density > self.column_bounds[j]):
+                    self.column_bounds[j] = density
+
+    def select(self, r):
+        return self.weights[r]
+
+    def bound(self, solver, open_columns):
+        # Each remaining column is covered by one row, which contributes its
+        # score in proportion to the columns it covers.
+        column_bounds = self.column_bounds
+        return sum(column_bounds[j] for j in solver.columns
+                   if j in column_bounds)
+
+
+class PieceVariety(Objective):
+
+    """
+    The number of distinct pieces used in a solution.  Useful with piece
+    multiplicities, or with optional (secondary) pieces.
+    """
+
+    def __init__(self, pieces):
+        """`pieces` is a sequence of piece (column) names."""
+        self.pieces = frozenset(pieces)
+        self.row_pieces = None
+        """A list of lists of the piece names in each row."""
+
+        self.used = None
+        """A mapping of piece names to their number of rows in the partial
+        solution."""
+
+        self.min_cells = 1
+        """The minimum number of ordinary primary columns in a piece's
+        rows."""
+
+    def start(self, solver):
+        pieces = self.pieces
+        self.row_pieces = [[j for j in row if j in pieces]
+                           for row in solver.rows]
+        self.used = dict((piece, 0) for piece in pieces)
+        cells = [n for (r, n) in enumerate(self.row_cells(solver))
+                 if self.row_pieces[r]]
+        self.min_cells = max(1, min(cells or [1]))
+
+    def select(self, r):
+        gain = 0
+        used = self.used
+        for piece in self.row_pieces[r]:
+            if not used[piece]:
+                gain += 1
+            used[piece] += 1
+        return gain
+
+    def deselect(self, r):
+        for piece in self.row_pieces[r]:
+            self.used[piece] -= 1
+
+    def bound(self, solver, open_columns):
+        columns = solver.columns
+        available = len([piece for piece in self.pieces
+                         if not self.used[piece] and columns.get(piece)])
+        return min(available, open_columns // self.min_cells)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Bulk matching of poems against a bead index (see `puzzler.bead_index`).
+
+All of the poems are tested in one pass over the index: for each block of
+solutions, the bit slices of every poem's hyphen positions are ANDed.  The
+blocks are divided into shards, which are processed in parallel.
+
+Poems are read from a sonnets file: numbered sonnets (a line with just the
+number, then the lines of verse), with syllable breaks within words marked
+by "ø" (e.g. "From fairøest creaøtures we deøsire inøcrease,").  Each word
+becomes a run of beads joined by hyphens, so each sonnet yields two poems:
+the octave (lines 1-8) and the sestet (lines 9-14).
+"""
+
+import sys
+import codecs
+import multiprocessing
+import optparse
+import re
+
+import puzzler
+from puzzler import beads
+from puzzler import bead_index
+from puzzler.utils import thousands, plural_s, bits
+
+
+syllable_break = u'ø'
+word_pattern = re.compile(u"[^\\W\\d_](?:[\\w'\u2019%s-]*\\w)?"
+                          % syllable_break, re.UNICODE)
+syllable_pattern = re.compile(u'[%s-]+' % syllable_break)
+
+default_first = 10
+"""The default number of matches to report per poem."""
+
+
+def line_beads(line):
+    """
+    Return the bead notation of a line of verse, with `syllable_break`
+    marking the syllable breaks within words.  Hyphenated words are treated
+    as single words.
+    """
+    beads_list = []
+    for word in word_pattern.findall(line):
+        syllables = len(syllable_pattern.split(word))
+        beads_list.append('-'.join(['o'] * syllables))
+    return ''.join(beads_list)
+
+def read_sonnets(path):
+    """
+    Return a list of (sonnet number, list of line bead notations) pairs
+    from sonnets file `path`.
+    """
+    sonnets = []
+    sonnets_file = codecs.open(path, 'r', 'utf-8')
+    try:
+        for line in sonnets_file:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.isdigit():
+                sonnets.append((int(stripped), []))
+            elif sonnets:
+                sonnets[-1][1].append(line_beads(stripped))
+            else:
+                raise puzzler.ApplicationError(
+                    '%s: verse found before the first sonnet number.' % path)
+    finally:
+        sonnets_file.close()
+    return sonnets
+
+def sonnet_poems(sonnets):
+    """
+    Return a list of (name, list of line masks) pairs: the octave and sestet
+    of each of `sonnets`.
+    """
+    poems = []
+    for number, lines in sonnets:
+        poems.append(('%s octave' % number, beads.parse_beads(
+            ' '.join(lines[:8]))))
+        poems.append(('%s sestet' % number, beads.parse_beads(
+            ' '.join(lines[8:14]))))
+    return poems
+
+
+def match_blocks(args):
+    """
+    Match poems against a range of index blocks.  `args` is a tuple: (index
+    path, list of poem query positions (see `BeadIndex.positions`), first
+    block, end block, number of matches to keep per poem).  Return a list
+    of (match count, list of first matching ordinals) pairs, one per poem.
+
+    This is a worker process function; `args` is one shard.
+    """
+    path, poem_positions, start, end, first = args
+    index = bead_index.BeadIndex(path)
+    try:
+        results = [[0, []] for positions in poem_positions]
+        for block in range(start, end):
+            base = block * index.block_size
+            count = min(index.block_size, index.num_solutions - base)
+            all_solutions = (1 << count) - 1
+            slices = {}
+            for i, positions in enumerate(poem_positions):
+                if positions is None:
+                    continue
+                matches = all_solutions
+                for position in positions:
+                    try:
+                        block_slice = slices[position]
+                    except KeyError:
+                        block_slice = slices[position] = index.block_slice(
+                            block, position)
+                    matches &= block_slice
+                    if not matches:
+                        break
+                if not matches:
+                    continue
+                result = results[i]
+                result[0] += bin(matches).count('1')
+                if len(result[1]) < first:
+                    for j in bits(matches):
+                        result[1].append(base + j)
+                        if len(result[1]) == first:
+                            break
+    finally:
+        index.close()
+    return results
+
+def match_poems(path, poems, processes=None, first=default_first,
+                shards_per_process=4):
+    """
+    Match `poems` (a list of (name, list of line masks) pairs) against the
+    bead index at `path`, in one pass over the index by `processes` worker
+    processes (default: the number of CPUs; 1 for no subprocesses).  Return
+    a list of (match count, list of the first `first` matching solution
+    numbers) pairs, one per poem.  Poems which don't have the same number of
+    lines as the index have None instead.
+    """
+    index = bead_index.BeadIndex(path)
+    try:
+        num_lines = len(index.line_bits)
+        poem_positions = []
+        for name, masks in poems:
+            if len(masks) == num_lines:
+                poem_positions.append(index.positions(masks))
+            else:
+                poem_positions.append(None)
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        num_shards = max(1, min(index.num_blocks,
+                                processes * shards_per_process))
+        bounds = [index.num_blocks * n // num_shards
+                  for n in range(num_shards + 1)]
+        shards = [(path, poem_positions, bounds[n], bounds[n + 1], first)
+                  for n in range(num_shards)]
+        if processes > 1 and num_shards > 1:
+            pool = multiprocessing.Pool(processes)
+            try:
+                try:
+                    shard_results = pool.map(match_blocks, shards)
+                    pool.close()
+                except KeyboardInterrupt:
+                    pool.terminate()
+                    raise
+            finally:
+                pool.join()
+        else:
+            shard_results = [match_blocks(shard) for shard in shards]
+        results = []
+        for i, (name, masks) in enumerate(poems):
+            if len(masks) != num_lines:
+                results.append(None)
+                continue
+            count = 0
+            matches = []
+            for shard_result in shard_results:
+                shard_count, shard_matches = shard_result[i]
+                count += shard_count
+                matches.extend(shard_matches[:first - len(matches)])
+            results.append(
+                (count, [index.solution_number(ordinal)
+                         for ordinal in matches]))
+        return results
+    finally:
+        index.close()
+
+def format_results(poems, results, records=None):
+    """
+    Return a report of the poem match `results`.  If `records` (a mapping of
+    solution numbers to records) is supplied, list the records of the first
+    matches.
+    """
+    lines = []
+    for (name, masks), result in zip(poems, results):
+        if result is None:
+            lines.append('%s: not matched (%s line%s)'
+                         % (name, len(masks), plural_s(len(masks))))
+            continue
+        count, matches = result
+        lines.append('%s: %s match%s%s'
+                     % (name, thousands(count), ('es', '')[count == 1],
+                        (matches and ' (first: %s)'
+                         % ', '.join(str(number) for number in matches)
+                         or '')))
+        if records is not None:
+            for number in matches:
+                lines.append('    %s' % records[number])
+    return '\n'.join(lines) + '\n'
+
+def process_command_line(argv=None):
+    """Process command-line options; return (settings, args)."""
+    parser = optparse.OptionParser(
+        usage='%prog [options] INDEX SONNETS_FILE',
+        description=(
+            'Match the octave and sestet of every sonnet in SONNETS_FILE '
+            'against the solutions in a bead index (see '
+            '"puzzler-bead-index.py"), in one pass.  Poems are matched '
+            'against indexes with the same number of lines.'))
+    parser.add_option(
+        '-j', '--processes', type='int', metavar='N',
+        help='Run N worker processes.  Default: the number of CPUs.')
+    parser.add_option(
+        '-k', '--first', type='int', metavar='K', default=default_first,
+        help='Report the first K matches of each poem.  Default: %default.')
+    parser.add_option(
+        '-r', '--records', metavar='FILE',
+        help=('List the solution records of the first matches, from solver '
+              'output FILE.'))
+    settings, args = parser.parse_args(argv)
+    if len(args) != 2:
+        parser.error('an index file path and a sonnets file path are '
+                     'required')
+    return settings, args
+
+def main(argv=None, output_stream=sys.stdout):
+    settings, (path, sonnets_path) = process_command_line(argv)
+    try:
+        poems = sonnet_poems(read_sonnets(sonnets_path))
+        results = match_poems(path, poems, processes=settings.processes,
+                              first=settings.first)
+        records = None
+        if settings.records:
+            index = bead_index.BeadIndex(path)
+            try:
+                num_lines = len(index.line_bits)
+                if len(index.sources) > 1:
+                    raise puzzler.ApplicationError(
+                        'The index has multiple sources; '
+                        '"--records" cannot be used.')
+            finally:
+                index.close()
+            # only the records of the first matches are kept:
+            numbers = sorted(set(number for result in results if result
+                                 for number in result[1]))
+            records = dict(zip(numbers, bead_index.select_records(
+                bead_index.read_records(settings.records, num_lines),
+                numbers)))
+        output_stream.write(format_results(poems, results, records))
+    except puzzler.ApplicationError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
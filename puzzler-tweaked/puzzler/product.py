@@ -0,0 +1,423 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Product puzzles: composites of independent parts, such as a sonnet grid (an
+octave puzzle stacked on a sestet puzzle).  Every combination of part
+solutions is a solution of the whole.
+
+Each part (one of the puzzle classes returned by `PuzzleProduct.components`)
+is solved once, with its own constraints, and its solutions are stored
+compactly (`PartSolutions`).  The cross product is enumerated or sampled
+lazily, one combination at a time, optionally filtered by a joint constraint
+spanning the parts (`PuzzleProduct.joint_constraint`); it is never
+materialized.
+"""
+
+import sys
+import copy
+import optparse
+import random
+from array import array
+from datetime import datetime
+
+import puzzler
+from puzzler import beads
+from puzzler.utils import thousands, plural_s
+
+
+class PartSolutions(object):
+
+    """
+    The solutions of one part of a product puzzle.  Matrix rows are interned
+    (each distinct row is stored once), and each solution is stored as a run
+    of row numbers in one flat array.
+    """
+
+    def __init__(self, puzzle):
+        self.puzzle = puzzle
+        """The (initialized) part puzzle object."""
+
+        self.rows = []
+        """A list of the distinct rows (tuples of column names) used."""
+
+        self.row_numbers = {}
+        """A mapping of rows to indexes into `self.rows`."""
+
+        self.data = array('I')
+        """The row numbers of all solutions, end to end."""
+
+        self.offsets = array('L', [0])
+        """The start of each solution in `self.data`, plus the end."""
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        """Return solution `i`, a list of rows (lists of column names)."""
+        if not 0 <= i < len(self):
+            raise IndexError('solution index out of range')
+        rows = self.rows
+        return [list(rows[r])
+                for r in self.data[self.offsets[i]:self.offsets[i + 1]]]
+
+    def append(self, solution):
+        row_numbers = self.row_numbers
+        for row in solution:
+            row = tuple(row)
+            try:
+                r = row_numbers[row]
+            except KeyError:
+                r = row_numbers[row] = len(self.rows)
+                self.rows.append(row)
+            self.data.append(r)
+        self.offsets.append(len(self.data))
+
+    def record(self, i):
+        """Return the formatted record of solution `i`."""
+        return self.puzzle.format_solution(self[i], normalized=False)
+
+    def hyphen_masks(self, i):
+        """Return the hyphen signature of solution `i`."""
+        return self.puzzle.hyphen_masks(self[i])
+
+
+class PuzzleProduct(object):
+
+    """
+    Abstract base class for product puzzles.  Subclasses define `parts`; the
+    solutions of the whole are all combinations of part solutions (the first
+    part's solution first) which satisfy `self.joint_constraint`.
+    """
+
+    parts = ()
+    """A sequence of part puzzle classes (for 2-D parts, top to bottom)."""
+
+    @classmethod
+    def components(cls):
+        """Return a tuple of the part puzzle classes."""
+        return tuple(cls.parts)
+
+    def split_poem(self, poem):
+        """
+        Return a list of part poems: `poem`, a beaded poem string for the
+        whole (see `puzzler.beads`), divided by the part heights.
+        """
+        lines = poem.split()
+        heights = [part.height for part in self.components()]
+        if len(lines) != sum(heights):
+            raise puzzler.ApplicationError(
+                'The poem has %s line%s; %s requires %s.'
+                % (len(lines), plural_s(len(lines)),
+                   self.__class__.__name__, sum(heights)))
+        poems = []
+        for height in heights:
+            poems.append(' '.join(lines[:height]))
+            del lines[:height]
+        return poems
+
+    def solve_parts(self, settings, output_stream=sys.stdout):
+        """
+        Solve each part once; return a list of `PartSolutions`.  The
+        "algorithm", "poem", "reduce", "matrix_cache", and "part_limit"
+        settings apply to each part.
+        """
+        poem = getattr(settings, 'poem', None)
+        if poem:
+            poems = self.split_poem(poem)
+        else:
+            poems = [None] * len(self.components())
+        part_solutions = []
+        for part_class, part_poem in zip(self.components(), poems):
+            part_settings = copy.copy(settings)
+            part_settings.poem = part_poem
+            part = solve_part(part_class, part_settings, output_stream)
+            print >>output_stream, (
+                '%s: %s solution%s' % (part_class.__name__,
+                                       thousands(len(part)),
+                                       plural_s(len(part))))
+            output_stream.flush()
+            part_solutions.append(part)
+        return part_solutions
+
+    def joint_constraint(self, solutions):
+        """
+        Return True if `solutions` (a list of part solutions: lists of rows)
+        may be combined.  All combinations are allowed by default; override
+        in subclasses.
+        """
+        return True
+
+    def has_joint_constraint(self):
+        return (self.__class__.joint_constraint.im_func
+                is not PuzzleProduct.joint_constraint.im_func)
+
+    def size(self, part_solutions):
+        """
+        Return the number of combinations of `part_solutions`, before the
+        joint constraint is applied.
+        """
+        total = 1
+        for part in part_solutions:
+            total *= len(part)
+        return total
+
+    def combination(self, part_solutions, index):
+        """
+        Return combination number `index` of `part_solutions`: a tuple of
+        part solution indexes (the last part varies fastest).
+        """
+        indexes = []
+        for part in reversed(part_solutions):
+            index, i = divmod(index, len(part))
+            indexes.append(i)
+        indexes.reverse()
+        return tuple(indexes)
+
+    def combination_index(self, part_solutions, indexes):
+        """The inverse of `self.combination`."""
+        index = 0
+        for part, i in zip(part_solutions, indexes):
+            index = index * len(part) + i
+        return index
+
+    def accept(self, part_solutions, indexes):
+        if not self.has_joint_constraint():
+            return True
+        return self.joint_constraint(
+            [part[i] for part, i in zip(part_solutions, indexes)])
+
+    def enumerate(self, part_solutions, start=0):
+        """
+        A generator that produces the combinations (tuples of part solution
+        indexes) of `part_solutions` satisfying the joint constraint, in
+        order, beginning with combination number `start`.
+        """
+        total = self.size(part_solutions)
+        if start >= total:
+            return
+        indexes = list(self.combination(part_solutions, start))
+        lengths = [len(part) for part in part_solutions]
+        while True:
+            if self.accept(part_solutions, indexes):
+                yield tuple(indexes)
+            # odometer increment, last part fastest:
+            p = len(indexes) - 1
+            while p >= 0:
+                indexes[p] += 1
+                if indexes[p] < lengths[p]:
+                    break
+                indexes[p] = 0
+                p -= 1
+            if p < 0:
+                return
+
+    def sample(self, part_solutions, rng=random, attempts=None):
+        """
+        A generator that produces distinct random combinations of
+        `part_solutions` satisfying the joint constraint, uniformly.  Stop
+        when the product is exhausted, or after `attempts` consecutive
+        rejections by the joint constraint (None: never).
+        """
+        total = self.size(part_solutions)
+        seen = set()
+        rejected = 0
+        while len(seen) < total:
+            index = rng.randrange(total)
+            if index in seen:
+                continue
+            seen.add(index)
+            indexes = self.combination(part_solutions, index)
+            if self.accept(part_solutions, indexes):
+                rejected = 0
+                yield indexes
+            else:
+                rejected += 1
+                if attempts is not None and rejected >= attempts:
+                    return
+
+    def format_solution(self, part_solutions, indexes):
+        """
+        Return the record of a combination: the part records, separated by
+        spaces (for 2-D parts, the lines of the whole, top to bottom).
+        """
+        return ' '.join(part.record(i)
+                        for part, i in zip(part_solutions, indexes))
+
+    def hyphen_masks(self, part_solutions, indexes):
+        """Return the hyphen signature of a combination."""
+        masks = []
+        for part, i in zip(part_solutions, indexes):
+            masks.extend(part.hyphen_masks(i))
+        return masks
+
+
+def solve_part(part_class, settings, output_stream=sys.stdout):
+    """
+    Solve `part_class` (a puzzle class); return a `PartSolutions` object.
+    With the "part_limit" setting, stop after that many solutions.
+    """
+    solver = puzzler.exact_cover_modules[settings.algorithm].ExactCover()
+    puzzle = part_class(init_puzzle=False)
+    puzzler.load_puzzle_matrix(puzzle, solver, settings, output_stream)
+    part = PartSolutions(puzzle)
+    limit = getattr(settings, 'part_limit', None)
+    for solution in solver.solve():
+        if not puzzle.record_solution(solution, solver, stream=None):
+            continue
+        part.append(solution)
+        if limit and len(part) >= limit:
+            break
+    # The duplicate-check hashes are not needed any more; drop them.
+    if puzzle.dedupe:
+        puzzle.dedupe.cleanup()
+        puzzle.dedupe = None
+    return part
+
+def run(product_class, output_stream=sys.stdout, settings=None):
+    """
+    Given a `PuzzleProduct` subclass, process the command line, solve the
+    parts, and output combinations.
+    """
+    if settings is None:
+        settings = process_command_line()
+    try:
+        return solve(product_class, output_stream, settings)
+    except puzzler.ApplicationError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+
+def solve(product_class, output_stream, settings):
+    """
+    Solve the parts of `product_class` and record the combinations of their
+    solutions (all, the first "stop_after", or a random "sample") on
+    `output_stream`.  Return the number of combinations recorded.
+    """
+    start = datetime.now()
+    product = product_class()
+    part_solutions = product.solve_parts(settings, output_stream)
+    total = product.size(part_solutions)
+    print >>output_stream, '%s combination%s%s' % (
+        thousands(total), plural_s(total),
+        (product.has_joint_constraint() and ' before the joint constraint'
+         or ''))
+    output_stream.flush()
+    if getattr(settings, 'dry_run', None):
+        return 0
+    if settings.sample:
+        combinations = product.sample(
+            part_solutions, random.Random(settings.seed),
+            attempts=settings.attempts)
+        limit = settings.sample
+    else:
+        combinations = product.enumerate(part_solutions)
+        limit = settings.stop_after
+    record_stream = output_stream
+    bead_writer = None
+    if getattr(settings, 'beads', None):
+        bead_writer = beads.BeadWriter(settings.beads)
+        if settings.beads_only:
+            record_stream = None
+    count = 0
+    try:
+        try:
+            for indexes in combinations:
+                count += 1
+                if record_stream:
+                    print >>record_stream, product.format_solution(
+                        part_solutions, indexes)
+                if bead_writer:
+                    bead_writer.write(
+                        product.combination_index(part_solutions, indexes) + 1,
+                        product.hyphen_masks(part_solutions, indexes))
+                if limit and count >= limit:
+                    break
+        except KeyboardInterrupt:
+            print >>output_stream, 'Session interrupted by user.'
+    finally:
+        print >>output_stream, '%s combination%s recorded, duration %s' % (
+            thousands(count), plural_s(count), datetime.now() - start)
+        output_stream.flush()
+        if bead_writer:
+            bead_writer.close()
+    return count
+
+def process_command_line(argv=None):
+    """Process command-line options & return a settings object."""
+    parser = option_parser()
+    settings, args = parser.parse_args(argv)
+    if args:
+        print >>sys.stderr, (
+            '%s takes no command-line arguments; "%s" ignored.'
+            % (sys.argv[0], ' '.join(args)))
+    return settings
+
+def option_parser():
+    """Return an `optparse.OptionParser` for product puzzles."""
+    parser = optparse.OptionParser(
+        formatter=optparse.TitledHelpFormatter(width=78),
+        add_help_option=None,
+        description=(
+            'Solve each part of a product puzzle once, then output the '
+            'combinations of part solutions, one record per line.  The '
+            'product is enumerated (or sampled) lazily.'))
+    parser.add_option(
+        '-a', '--algorithm', metavar='NAME',
+        choices=puzzler.algorithm_choices,
+        default=puzzler.algorithm_choices[0],
+        help=('Choice of exact cover algorithm for the parts.  Choices: %s.'
+              % ('"%s" (default), "%s"'
+                 % (puzzler.algorithm_choices[0],
+                    '", "'.join(puzzler.algorithm_choices[1:])))))
+    parser.add_option(
+        '-d', '--dry-run', action='store_true',
+        help=("Solve the parts and report the number of combinations, but "
+              "don't output any."))
+    parser.add_option(
+        '-n', '--stop-after', type='int', metavar='N',
+        help='Stop after outputting N combination(s).')
+    parser.add_option(
+        '--sample', type='int', metavar='N',
+        help=('Output N distinct random combinations (uniformly sampled) '
+              'instead of enumerating them in order.'))
+    parser.add_option(
+        '--seed', metavar='SEED',
+        help='Seed the random number generator for --sample.')
+    parser.add_option(
+        '--attempts', type='int', metavar='N', default=100000,
+        help=('Combined with --sample, give up after N consecutive '
+              'combinations are rejected by the joint constraint.  '
+              'Default: %default.'))
+    parser.add_option(
+        '--part-limit', type='int', metavar='N',
+        help='Keep at most N solutions of each part.')
+    parser.add_option(
+        '--poem', metavar='BEADS',
+        help=('Constrain the parts by a beaded poem for the whole (see '
+              'the solvers\' --poem option); its lines are divided among '
+              'the parts, top to bottom.'))
+    parser.add_option(
+        '--beads', metavar='FILE',
+        help=('Write the hyphen signature of each combination to FILE '
+              '("-" for STDOUT), numbered by position in the product.'))
+    parser.add_option(
+        '--beads-only', action='store_true',
+        help=('Combined with --beads, omit the regular records.'))
+    parser.add_option(
+        '--reduce', action='store_true',
+        help='Reduce each part matrix before solving.')
+    parser.add_option(
+        '-C', '--matrix-cache', metavar='DIR',
+        help='Cache compiled part matrices in DIR.')
+    parser.add_option(
+        '-V', '--version',
+        help="Show Polyform Puzzler's version information and exit.",
+        action='version')
+    parser.version = puzzler.version_template
+    parser.add_option(
+        '-h', '--help', help='Show this help message and exit.', action='help')
+    return parser
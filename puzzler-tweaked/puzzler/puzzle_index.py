@@ -0,0 +1,1346 @@
+# $Id$
+# Generated by "python -m puzzler index"; do not edit.
+
+"""Puzzle class names mapped to the names of their modules."""
+
+modules = {
+    'Cornucopia': 'puzzler.puzzles.polyominoes',
+    'Cornucopia17x6': 'puzzler.puzzles.hexominoes',
+    'DiabolicalCube': 'puzzler.puzzles.polycubes_misc',
+    'Diamond': 'puzzler.puzzles.polyiamonds',
+    'Dicube': 'puzzler.puzzles.polycubes',
+    'DigitCubes': 'puzzler.puzzles.polycubes',
+    'DigitCubes5x5x5': 'puzzler.puzzles.polycubes_misc',
+    'Dihex': 'puzzler.puzzles.polyhexes',
+    'Domino': 'puzzler.puzzles.polyominoes',
+    'DorianCube': 'puzzler.puzzles.pentacubes',
+    'DorianCube5Towers': 'puzzler.puzzles.pentacubes',
+    'DorianCube5TowersExploded': 'puzzler.puzzles.pentacubes',
+    'Heptiamonds': 'puzzler.puzzles.polyiamonds',
+    'Heptiamonds10x12ShortHexagon': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds11x8Stack': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds12x13Trapezoid': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds12x7Chevron': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds14x6Chevron': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds28x3Chevron': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds3x28': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds4x21': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds4x21Chevron': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds4x22LongHexagon': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds4x23Trapezoid': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds4x24Stack': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds6x14': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds6x14Chevron': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds6x17Trapezoid': 'puzzler.puzzles.heptiamonds',
+    'Heptiamonds7x12': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsButterfly10x6': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsChevron': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsDiamondRing': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsDiamondWindow': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsElongatedHexagonRing11x5': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon10': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon11': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon12': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon13': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon14': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon15': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon16': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon17': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon5': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon6': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon7': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon8': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagon9': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagonHexagramDiamondRing': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagonHexagramGasket1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagonHexagramGasket2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagonHexagramGasket3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagonHexagramGasket_x1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_5': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_6': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagons2x3_7': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagram': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagram2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagram3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexagram4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexedTriangle': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid14x2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Bone': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Dumbbell': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Offsets': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Spiral1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Trapezoid4x2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Trefoil1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2Trefoil2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid2_7x1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgrid7x4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridBumpyTriangle': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridElongatedHexagon5x3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridElongatedHexagon9x2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridFlower1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridFlower2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon_x1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon_x2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridHexagon_x3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridRosettes1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridRosettes2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridRosettes_x1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridStaggeredRectangle7x4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTrefoil1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTrefoil2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTrefoil3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTrefoil4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTrefoil_x1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTriangleHexagramRing': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTwoDiamonds1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTwoDiamonds2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTwoDiamonds3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsHexgridTwoDiamonds4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsJaggedHexagon1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsJaggedHexagon2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsJaggedHexagon3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsJaggedHexagon_x1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsJaggedHexagon_x2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsJaggedHexagon_x3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsParallelogramHexagon': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsQuintupleC7': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsQuintupleJewel': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsQuintupleM7': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsQuintupleTrapezoid': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsQuintupleTrefoil': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsQuintupleV7': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSawtoothTriangle': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSemiregularHexagon7x4Ring': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSemiregularHexagon8x3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSemiregularHexagons6x2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsShortHexRing': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSnowflake1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSnowflake1Exploded': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSnowflake2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSnowflake3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsStack': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsSteppedObtuseTriangle': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrapezoidTriangle': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil1': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil3': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil4': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil5': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil6': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil7': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil8': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTrefoil9': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTriangle': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTriangleHexRing': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTriangleHexRing2': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTriangleRing': 'puzzler.puzzles.heptiamonds',
+    'HeptiamondsTriangleRing2': 'puzzler.puzzles.heptiamonds',
+    'Hexacubes': 'puzzler.puzzles.polycubes',
+    'Hexacubes10x10x10_1': 'puzzler.puzzles.hexacubes',
+    'Hexacubes83x4x3': 'puzzler.puzzles.hexacubes',
+    'HexacubesHouse': 'puzzler.puzzles.hexacubes',
+    'HexacubesSteppedPyramid': 'puzzler.puzzles.hexacubes',
+    'Hexahexes': 'puzzler.puzzles.polyhexes',
+    'HexahexesHexagonRing1': 'puzzler.puzzles.hexahexes',
+    'HexahexesHexagonRing_x1': 'puzzler.puzzles.hexahexes',
+    'HexahexesTriangle': 'puzzler.puzzles.hexahexes',
+    'HexahexesTriangle1': 'puzzler.puzzles.hexahexes',
+    'HexahexesTriangle2': 'puzzler.puzzles.hexahexes',
+    'HexahexesTriangle3': 'puzzler.puzzles.hexahexes',
+    'Hexatwigs': 'puzzler.puzzles.polytwigs',
+    'HexatwigsElongatedHexagon14x2': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsElongatedHexagonRing': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsHexagonRing1': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsHexagonRing2': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsHexagonRing3': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsHexagonRing4': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsKnobbedHexagon': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsSemiregularHexagon6x3': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil1': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil10': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil11': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil12': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil13': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil2': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil3': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil4': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil5': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil6': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil7': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil8': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTrefoil9': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTriangle': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTriangleRing1': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsTriangleRing2': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsX1': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsX2': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsX3': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsX4': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsX5': 'puzzler.puzzles.hexatwigs',
+    'HexatwigsX6': 'puzzler.puzzles.hexatwigs',
+    'Hexiamonds': 'puzzler.puzzles.polyiamonds',
+    'Hexiamonds3Hexagons': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds3x12': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x10LongButterfly': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x10LongHexagon': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x11Trapezoid': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x12StackedButterflies': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x12StackedHexagons': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x3SemiregularHexagon': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds4x9': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x10Trapezoid1': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x10Trapezoid2': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x10Trapezoid3': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x2SemiregularHexagon1': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x2SemiregularHexagon2': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x8StackedLongButterflies': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds5x8StackedLongHexagons': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds6x6': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds6x9Trapezoid': 'puzzler.puzzles.hexiamonds',
+    'Hexiamonds7x1SemiregularHexagonRing_x': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsBumpyTrefoil': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChevron': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChevron_12x3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChevron_4x9': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChevron_6x6': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChoose9Hexagon': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChoose9Hexagon2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsChoose9Hexagon3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsCoin': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsCrescent': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsCrescent2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsDelta1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsDelta2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsDelta3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsGyroscope': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHeart': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexagon3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexagon4': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexagon5': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexagon6': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgrid4x3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgrid6x2_x': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgridHexagonRing_x': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgridHexagramRing_x': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgridSemiregularHexagon3x2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgridTrapezoid5x3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgridTriangleRing_x1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexgridTriangleRing_x2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsHexicator': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsIamondHexJoinedColors': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsIamondHexSeparatedColors': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsInfinity': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsInfinity2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsIrregularHexagon7x8': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsKnobbyBone': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsNearHexagram1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsNearHexagram_x2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsNotchedHexagon1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsNotchedHexagon_x2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsRing': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsRing2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSnowflake': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpikedHexagon1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpikedHexagon2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpikedHexagon3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpikedHexagon_x1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpikedHexagon_x2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner4': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner5': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner6': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner_x1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner_x2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsSpinner_x3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsStackedChevrons_12x3_1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsStackedChevrons_12x3_2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsStackedChevrons_12x3_3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsStackedChevrons_6x6': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTenyo': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTrefoil': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTrefoil2': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTrefoil3': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTriLevel': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTriangleRing_x': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTriangle_x1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsTwoTriangles': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsV_9x9': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsX1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsX_x1': 'puzzler.puzzles.hexiamonds',
+    'HexiamondsX_x2': 'puzzler.puzzles.hexiamonds',
+    'Hexominoes': 'puzzler.puzzles.polyominoes',
+    'HexominoesCross1': 'puzzler.puzzles.hexominoes',
+    'HexominoesHoleyRectangle1': 'puzzler.puzzles.hexominoes',
+    'HexominoesHoleyRectangle2': 'puzzler.puzzles.hexominoes',
+    'HexominoesHoleyRectangle3': 'puzzler.puzzles.hexominoes',
+    'HexominoesParallelogram15x14': 'puzzler.puzzles.hexominoes',
+    'HexominoesParallelogram21x10': 'puzzler.puzzles.hexominoes',
+    'HexominoesParallelogram35x6': 'puzzler.puzzles.hexominoes',
+    'HexominoesPlus': 'puzzler.puzzles.polyominoes',
+    'HexominoesPlus18x12': 'puzzler.puzzles.hexominoes',
+    'HexominoesPlus24x9': 'puzzler.puzzles.hexominoes',
+    'HexominoesPlus27x8': 'puzzler.puzzles.hexominoes',
+    'HexominoesPlus36x6': 'puzzler.puzzles.hexominoes',
+    'HexominoesPlusSquare': 'puzzler.puzzles.hexominoes',
+    'HexominoesRectanglePlusNub1': 'puzzler.puzzles.hexominoes',
+    'HexominoesRectanglePlusNub2': 'puzzler.puzzles.hexominoes',
+    'HexominoesRhombus': 'puzzler.puzzles.hexominoes',
+    'HexominoesSquare': 'puzzler.puzzles.hexominoes',
+    'HexominoesTriangle': 'puzzler.puzzles.hexominoes',
+    'Moniamond': 'puzzler.puzzles.polyiamonds',
+    'Monocube': 'puzzler.puzzles.polycubes',
+    'Monohex': 'puzzler.puzzles.polyhexes',
+    'Monomino': 'puzzler.puzzles.polyominoes',
+    'NonConvexPentacubes': 'puzzler.puzzles.polycubes',
+    'NonConvexPentacubes2x5x14': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubes2x7x10': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubes4x4x14Steps': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubes4x5x7': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubes5x5x8CrystalTower': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubes7x7x5Steps': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesAztecPyramid': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesDiagonalWall': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesDiagonalWall2': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesDiagonalWall3': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesDiagonalWall4': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesDiagonalWall5': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesDiamondPyramid1': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesOpenBox10x3x6': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesOpenBox12x3x5': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesRingWall': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesRingWall1': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesRingWall3': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesRingWall8x4x7': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesStackedSquares': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesSteppedPyramid13x6': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesSteppedPyramid9x8': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesZigZag1': 'puzzler.puzzles.pentacubes',
+    'NonConvexPentacubesZigZag2': 'puzzler.puzzles.pentacubes',
+    'OneSidedHeptiamonds': 'puzzler.puzzles.polyiamonds',
+    'OneSidedHeptiamondsElongatedHexagon13x5_1': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsSemiregularHexagon11x4_1': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle1': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle2': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle3': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle4': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle5': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle6': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle7': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle8': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHeptiamondsTriangle9': 'puzzler.puzzles.heptiamonds',
+    'OneSidedHexahexes': 'puzzler.puzzles.polyhexes',
+    'OneSidedHexatwigs': 'puzzler.puzzles.polytwigs',
+    'OneSidedHexatwigsElongatedHexagon26x2': 'puzzler.puzzles.hexatwigs',
+    'OneSidedHexatwigsHexagonRing': 'puzzler.puzzles.hexatwigs',
+    'OneSidedHexiamonds': 'puzzler.puzzles.polyiamonds',
+    'OneSidedHexiamonds19x3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsBumpyTriangle': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsButterfly11x3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsCompoundTriangle_x1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexagram': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexagramHexagon1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexagramHexagon2': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexagramHexagon3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexagramHexagon_x4': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexgridButterfly4x4': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexgridElongatedHexagon6x2': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexgridTrapezoid10x2': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexgridTriangle1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsHexgridTwoTriangles': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsKnobbedHexagon1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsKnobbedHexagon_x1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsLongHexagon8x3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsNotchedHexagonRing': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_A': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_B': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_C': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_D': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_E': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_F': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsOBeirnesHexagon_G': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTabbedHexagon': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil10': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil11': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil2': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil4': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil5': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil6': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil7': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil8': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil9': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x2': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x4': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x5': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x6': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTrefoil_x7': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTriangle12_x1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTriangle12_x2': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTriangle12_x3': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTriangle12_x4': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTriangleRing1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTriangle_x1': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamondsTruncatedHexagramRing': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamonds_TestHexagon': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamonds_TestHexagon_A': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexiamonds_TestHexagon_B': 'puzzler.puzzles.hexiamonds',
+    'OneSidedHexominoes': 'puzzler.puzzles.polyominoes',
+    'OneSidedHexominoes20x18': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes24x15': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes30x12': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes36x10': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes40x9': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes45x8': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes60x6': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoes72x5': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoesDiamond1': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoesDiamond2': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoesHoleyRectangle1': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoesSixCrosses': 'puzzler.puzzles.hexominoes',
+    'OneSidedHexominoesSquareFort': 'puzzler.puzzles.hexominoes',
+    'OneSidedPentahexes': 'puzzler.puzzles.polyhexes',
+    'OneSidedPentahexesTrapezoid18x15': 'puzzler.puzzles.pentahexes',
+    'OneSidedPentahexesTrapezoid20x11': 'puzzler.puzzles.pentahexes',
+    'OneSidedPentahexesTrapezoid21x10': 'puzzler.puzzles.pentahexes',
+    'OneSidedPentahexesTrapezoid30x6': 'puzzler.puzzles.pentahexes',
+    'OneSidedPentahexesTriangle1': 'puzzler.puzzles.pentahexes',
+    'OneSidedPentatwigs': 'puzzler.puzzles.polytwigs',
+    'OneSidedPentatwigsCross1': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsElongatedHexagon3x4_1': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsElongatedHexagon3x4_2': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsElongatedHexagon8x2_1': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsElongatedHexagon8x2_2': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsInsetRectangle7x4_1': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsInsetRectangle7x4_2': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsInsetRectangle7x4_3': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsInsetRectangle7x4_4': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsPeanut1': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsPeanut2': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsPeanut3': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsPeanut4': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsRosettes1': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentatwigsTrapezoid12x2': 'puzzler.puzzles.pentatwigs',
+    'OneSidedPentiamonds': 'puzzler.puzzles.polyiamonds',
+    'OneSidedPentominoes': 'puzzler.puzzles.polyominoes',
+    'OneSidedPentominoes3x30': 'puzzler.puzzles.pentominoes',
+    'OneSidedPentominoes5x18': 'puzzler.puzzles.pentominoes',
+    'OneSidedPentominoes6x15': 'puzzler.puzzles.pentominoes',
+    'OneSidedPentominoes9x10': 'puzzler.puzzles.pentominoes',
+    'OneSidedPolyhexes1234': 'puzzler.puzzles.polyhexes',
+    'OneSidedPolyhexes12345': 'puzzler.puzzles.polyhexes',
+    'OneSidedPolyhexes123456': 'puzzler.puzzles.polyhexes',
+    'OneSidedPolyhexes12345Hexagon': 'puzzler.puzzles.polyhexes12345',
+    'OneSidedPolyhexes12345Trapezoid22x14': 'puzzler.puzzles.polyhexes12345',
+    'OneSidedPolyhexes12345_31x7': 'puzzler.puzzles.polyhexes12345',
+    'OneSidedPolyhexes1234X1': 'puzzler.puzzles.polyhexes1234',
+    'OneSidedPolyhexes34': 'puzzler.puzzles.polyhexes',
+    'OneSidedPolyiamonds1234': 'puzzler.puzzles.polyiamonds',
+    'OneSidedPolyiamonds12345': 'puzzler.puzzles.polyiamonds',
+    'OneSidedPolyiamonds123456': 'puzzler.puzzles.polyiamonds',
+    'OneSidedPolyiamonds1234567': 'puzzler.puzzles.polyiamonds',
+    'OneSidedPolyiamonds123456SemiRegularHexagon11x1': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle1': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle10': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle2': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle3': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle4': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle5': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle6': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle7': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle8': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds123456Triangle9': 'puzzler.puzzles.polyiamonds123456',
+    'OneSidedPolyiamonds12345Hexagon1': 'puzzler.puzzles.polyiamonds12345',
+    'OneSidedPolyiamonds12345Hexagon2': 'puzzler.puzzles.polyiamonds12345',
+    'OneSidedPolyiamonds12345SemiRegularHexagon4x2': 'puzzler.puzzles.polyiamonds12345',
+    'OneSidedPolyiamonds12345X1': 'puzzler.puzzles.polyiamonds12345',
+    'OneSidedPolyominoes1234': 'puzzler.puzzles.polyominoes',
+    'OneSidedPolyominoes12345': 'puzzler.puzzles.polyominoes',
+    'OneSidedPolyominoes123456': 'puzzler.puzzles.polyominoes',
+    'OneSidedPolyominoes1234Octagon': 'puzzler.puzzles.polyominoes1234',
+    'OneSidedPolyominoes234': 'puzzler.puzzles.polyominoes',
+    'OneSidedPolyominoes2345': 'puzzler.puzzles.polyominoes',
+    'OneSidedPolyominoes234Octagon': 'puzzler.puzzles.polyominoes234',
+    'OneSidedPolyominoes234Square': 'puzzler.puzzles.polyominoes234',
+    'OneSidedPolyominoes45': 'puzzler.puzzles.polyominoes',
+    'OneSidedPolysticks1234': 'puzzler.puzzles.polysticks',
+    'OneSidedPolytrigs123': 'puzzler.puzzles.polytrigs',
+    'OneSidedPolytrigs123Butterfly6x2': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Chevron9x1': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_1': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_10': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_11': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_2': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_3': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_4': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_5': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_6': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_7': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_8': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123ElongatedHex4x2_9': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Parallelogram5x4': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Parallelogram9x2': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Trapezoid10x2': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Trapezoid7x4': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Trapezoid8x3_1': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Trapezoid8x3_2': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Trapezoid8x3_3': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123Trapezoid8x3_4': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs123X1': 'puzzler.puzzles.polytrigs123',
+    'OneSidedPolytrigs23': 'puzzler.puzzles.polytrigs',
+    'OneSidedPolytwigs123': 'puzzler.puzzles.polytwigs',
+    'OneSidedPolytwigs1234': 'puzzler.puzzles.polytwigs',
+    'OneSidedPolytwigs12345': 'puzzler.puzzles.polytwigs',
+    'OneSidedPolytwigs123456': 'puzzler.puzzles.polytwigs',
+    'OneSidedPolytwigs12345Butterfly12x2': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345Trapezoid13x3_1': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345Trapezoid13x3_2': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345Trapezoid13x3_3': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345Trapezoid13x3_4': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345Trapezoid13x3_5': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345Trapezoid13x3_6': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345_12x3_1': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345_12x3_2': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345_12x3_3': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345_12x3_4': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345_12x3_5': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs12345_12x3_6': 'puzzler.puzzles.polytwigs12345',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_1': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_2': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_3': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_4': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_5': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_6': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_7': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234ElongatedHexagon3x2_8': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234Trapezoid5x2': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234Triangle1': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234Triangle2': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234Triangle3': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs1234Triangle4': 'puzzler.puzzles.polytwigs1234',
+    'OneSidedPolytwigs123Triangle': 'puzzler.puzzles.polytwigs123',
+    'OneSidedPolytwigs45': 'puzzler.puzzles.polytwigs',
+    'OneSidedQuasiDitrigs': 'puzzler.puzzles.polytrigs',
+    'OneSidedQuasiPolytrigs12': 'puzzler.puzzles.polytrigs',
+    'OneSidedQuasiPolytwigs123': 'puzzler.puzzles.polytwigs',
+    'OneSidedQuasiTritwigs': 'puzzler.puzzles.polytwigs',
+    'OneSidedTetrasticks': 'puzzler.puzzles.polysticks',
+    'OneSidedTetrasticks5x5DiamondLattice': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks5x5DiamondLattice_A': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks5x5DiamondLattice_B': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks5x5DiamondLattice_C': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks5x5DiamondLattice_D': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks5x5DiamondLattice_E': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks5x5DiamondLattice_F': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks6x10CenterHole': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks6x10ClippedCorners1': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks6x10ClippedCorners2': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks6x10ClippedCorners3': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks6x10SideHoles': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks6x10Slot': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks8x8CenterHole': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks8x8ClippedCorner': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks8x8ClippedCorners1': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticks8x8ClippedCorners2': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticksParallelogram5x8': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticksTrapezoid10x5': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticksX1': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetrasticksX2': 'puzzler.puzzles.tetrasticks',
+    'OneSidedTetratwigs': 'puzzler.puzzles.polytwigs',
+    'OneSidedTetratwigs3x2_1': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigs3x2_2': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsArch': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsArch_1': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsArch_2': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsArch_3': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsArch_4': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsArch_5': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsButterfly': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsTriangle': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsTriangle_1': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsTriangle_2': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsTriangle_3': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsTriangle_4': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetratwigsTriangle_5': 'puzzler.puzzles.tetratwigs',
+    'OneSidedTetriamonds': 'puzzler.puzzles.polyiamonds',
+    'OneSidedTetrominoes': 'puzzler.puzzles.polyominoes',
+    'OneSidedTritrigs': 'puzzler.puzzles.polytrigs',
+    'OneSidedTritrigsButterfly5x2': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsChevron2x4_1': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsChevron2x4_2': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsChevron3x3': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsChevron8x1': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsSemiRegularHexagon4x1': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTrapezoid7x3_1': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTrapezoid7x3_2': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTrapezoid9x2_1': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTrapezoid9x2_2': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTriangle6': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTrilobedCuboid': 'puzzler.puzzles.tritrigs',
+    'OneSidedTritrigsTrilobedCuboid_x': 'puzzler.puzzles.tritrigs',
+    'OneSidedTrominoes': 'puzzler.puzzles.polyominoes',
+    'OneSidedWeldedTetrasticks5x2DiamondLattice': 'puzzler.puzzles.tetrasticks',
+    'OneSidedWeldedTetrasticks5x5': 'puzzler.puzzles.tetrasticks',
+    'OneSidedWeldedTetrasticks6x6Unbordered': 'puzzler.puzzles.tetrasticks',
+    'OneSidedWeldedTetrasticksTrapezoid': 'puzzler.puzzles.tetrasticks',
+    'OneSidedWeldedTetrasticksTriangle': 'puzzler.puzzles.tetrasticks',
+    'Pentacubes': 'puzzler.puzzles.polycubes',
+    'Pentacubes11x11x5Pyramid': 'puzzler.puzzles.pentacubes',
+    'Pentacubes11x11x6Pyramid': 'puzzler.puzzles.pentacubes',
+    'Pentacubes18x3x3OpenBox': 'puzzler.puzzles.pentacubes',
+    'Pentacubes2x11x11Frame': 'puzzler.puzzles.pentacubes',
+    'Pentacubes2x13x13DiamondFrame': 'puzzler.puzzles.pentacubes',
+    'Pentacubes2x3x2Chair': 'puzzler.puzzles.pentacubes',
+    'Pentacubes2x7x15OpenBox': 'puzzler.puzzles.pentacubes',
+    'Pentacubes3x3x17Tower': 'puzzler.puzzles.pentacubes',
+    'Pentacubes3x3x19CrystalTower': 'puzzler.puzzles.pentacubes',
+    'Pentacubes3x3x20Tower1': 'puzzler.puzzles.pentacubes',
+    'Pentacubes3x3x20Tower2': 'puzzler.puzzles.pentacubes',
+    'Pentacubes3x3x3': 'puzzler.puzzles.polycubes',
+    'Pentacubes3x9x9Mound': 'puzzler.puzzles.pentacubes',
+    'Pentacubes3x9x9OpenBox': 'puzzler.puzzles.pentacubes',
+    'Pentacubes4Cubes1': 'puzzler.puzzles.pentacubes',
+    'Pentacubes4Cubes2': 'puzzler.puzzles.pentacubes',
+    'Pentacubes4Cubes3': 'puzzler.puzzles.pentacubes',
+    'Pentacubes5x5x6Tower1': 'puzzler.puzzles.pentacubes',
+    'Pentacubes5x5x6Tower2': 'puzzler.puzzles.pentacubes',
+    'Pentacubes5x5x6Tower3': 'puzzler.puzzles.pentacubes',
+    'Pentacubes5x7x5Cubbyholes': 'puzzler.puzzles.pentacubes',
+    'Pentacubes5x7x7OpenBox': 'puzzler.puzzles.pentacubes',
+    'Pentacubes5x9x9Fortress': 'puzzler.puzzles.pentacubes',
+    'Pentacubes7x7x5Block': 'puzzler.puzzles.pentacubes',
+    'Pentacubes9x9x5Cubbyholes': 'puzzler.puzzles.pentacubes',
+    'Pentacubes9x9x9OctahedralPlanes': 'puzzler.puzzles.pentacubes',
+    'PentacubesAstroidBlock': 'puzzler.puzzles.pentacubes',
+    'PentacubesCastle': 'puzzler.puzzles.pentacubes',
+    'PentacubesCompoundCross1': 'puzzler.puzzles.pentacubes',
+    'PentacubesCompoundCross2': 'puzzler.puzzles.pentacubes',
+    'PentacubesCoolingFins': 'puzzler.puzzles.pentacubes',
+    'PentacubesCornerCrystal': 'puzzler.puzzles.pentacubes',
+    'PentacubesCornerSlant': 'puzzler.puzzles.pentacubes',
+    'PentacubesDiamondPanel': 'puzzler.puzzles.pentacubes',
+    'PentacubesDiamondTower': 'puzzler.puzzles.pentacubes',
+    'PentacubesDiamondWall': 'puzzler.puzzles.pentacubes',
+    'PentacubesGrandPlatform': 'puzzler.puzzles.pentacubes',
+    'PentacubesGreatWall': 'puzzler.puzzles.pentacubes',
+    'PentacubesHollowTetrahedron': 'puzzler.puzzles.pentacubes',
+    'PentacubesNineSlices': 'puzzler.puzzles.pentacubes',
+    'PentacubesOctagonalFrame1': 'puzzler.puzzles.pentacubes',
+    'PentacubesOctagonalFrame2': 'puzzler.puzzles.pentacubes',
+    'PentacubesPanorama': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus': 'puzzler.puzzles.polycubes',
+    'PentacubesPlus11x11x11OctahedralPlanes': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus2x3x25': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus2x5x15': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus3x5x10': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus5x5x10Steps': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus5x5x6': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlus9x5x6Steps': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalBlock1': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall1': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall2': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall3': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall4': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall5': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall6': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall7': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiagonalWall8': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusDiamondPrism': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusSteppedPyramid1': 'puzzler.puzzles.pentacubes',
+    'PentacubesPlusSteppedPyramid2': 'puzzler.puzzles.pentacubes',
+    'PentacubesPyramidSpire': 'puzzler.puzzles.pentacubes',
+    'PentacubesRibbedWall': 'puzzler.puzzles.pentacubes',
+    'PentacubesStackedTriangles1': 'puzzler.puzzles.pentacubes',
+    'PentacubesStackedTriangles2': 'puzzler.puzzles.pentacubes',
+    'PentacubesStackedTriangles3': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid1': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid11x7_1': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid11x7_2': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid2': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid3': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid4': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid5': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid6': 'puzzler.puzzles.pentacubes',
+    'PentacubesSteppedPyramid_x1': 'puzzler.puzzles.pentacubes',
+    'PentacubesTruncatedTetrahedron': 'puzzler.puzzles.pentacubes',
+    'PentacubesX1': 'puzzler.puzzles.pentacubes',
+    'Pentahexes': 'puzzler.puzzles.polyhexes',
+    'Pentahexes10x11': 'puzzler.puzzles.pentahexes',
+    'Pentahexes15x11Trapezoid': 'puzzler.puzzles.pentahexes',
+    'Pentahexes5x22': 'puzzler.puzzles.pentahexes',
+    'Pentahexes5x24Trapezoid': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagon1': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagon2': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagon3': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagon4': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram1': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram2': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram3': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram4': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram5': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram6': 'puzzler.puzzles.pentahexes',
+    'PentahexesHexagram7': 'puzzler.puzzles.pentahexes',
+    'PentahexesTriangle1': 'puzzler.puzzles.pentahexes',
+    'PentahexesTriangle2': 'puzzler.puzzles.pentahexes',
+    'PentahexesTriangle3': 'puzzler.puzzles.pentahexes',
+    'PentahexesTriangle4': 'puzzler.puzzles.pentahexes',
+    'PentahexesTriangle5': 'puzzler.puzzles.pentahexes',
+    'PentahexesTriangle6': 'puzzler.puzzles.pentahexes',
+    'PentahexesTwoTriangles': 'puzzler.puzzles.pentahexes',
+    'Pentatwigs': 'puzzler.puzzles.polytwigs',
+    'Pentatwigs3Congruent1': 'puzzler.puzzles.pentatwigs',
+    'Pentatwigs4x4_1': 'puzzler.puzzles.pentatwigs',
+    'Pentatwigs4x4_2': 'puzzler.puzzles.pentatwigs',
+    'Pentatwigs5x3': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsButterfly1': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsButterfly_X': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsChevron3x3': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsChevron5x2': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsElongatedHexagon5x2_1': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsElongatedHexagonRing_x': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsElongatedRoundedRectangle1': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsHexagonRing': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsHexagram_x': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsMobiusStrip1': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsRosetteCluster1': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsRosetteCluster2': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsSemiregularHexagonRing_x': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsSnowflake': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsStaggeredRectangle5x3': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTrapezoid6x3': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTrefoil': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTrefoilRing_x': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTrefoil_x1': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTrefoil_x2': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTriangle': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTriangle2': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTriangle3': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsTwoHexagons': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsWaveStaggeredRectangle5x3': 'puzzler.puzzles.pentatwigs',
+    'PentatwigsX1': 'puzzler.puzzles.pentatwigs',
+    'Pentiamonds': 'puzzler.puzzles.polyiamonds',
+    'Pentominoes': 'puzzler.puzzles.polyominoes',
+    'Pentominoes10x14Sonnet': 'puzzler.puzzles.pentominoes',
+    'Pentominoes3x20': 'puzzler.puzzles.pentominoes',
+    'Pentominoes3x20Loop': 'puzzler.puzzles.pentominoes',
+    'Pentominoes3x20Tube': 'puzzler.puzzles.pentominoes',
+    'Pentominoes4x15': 'puzzler.puzzles.pentominoes',
+    'Pentominoes4x15A': 'puzzler.puzzles.pentominoes',
+    'Pentominoes4x15B': 'puzzler.puzzles.pentominoes',
+    'Pentominoes5x12': 'puzzler.puzzles.pentominoes',
+    'Pentominoes5x12A': 'puzzler.puzzles.pentominoes',
+    'Pentominoes5x12B': 'puzzler.puzzles.pentominoes',
+    'Pentominoes6x10': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8CenterHole': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8CenterHoleA': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8CenterHoleB': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8FourHoles1': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8FourHoles2': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8FourHoles3': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8FourHoles4': 'puzzler.puzzles.pentominoes',
+    'Pentominoes8x8WithoutCorners': 'puzzler.puzzles.pentominoes',
+    'PentominoesArch1': 'puzzler.puzzles.pentominoes',
+    'PentominoesArch2': 'puzzler.puzzles.pentominoes',
+    'PentominoesArch3': 'puzzler.puzzles.pentominoes',
+    'PentominoesAztecDiamond_x': 'puzzler.puzzles.pentominoes',
+    'PentominoesChevron1': 'puzzler.puzzles.pentominoes',
+    'PentominoesChevron2': 'puzzler.puzzles.pentominoes',
+    'PentominoesChevron_X': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross1': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross2': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross3': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross4': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross5': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross6': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross_X1': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross_X2': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross_X3': 'puzzler.puzzles.pentominoes',
+    'PentominoesCross_X4': 'puzzler.puzzles.pentominoes',
+    'PentominoesDiamond': 'puzzler.puzzles.pentominoes',
+    'PentominoesDiamondV_x': 'puzzler.puzzles.pentominoes',
+    'PentominoesEye': 'puzzler.puzzles.pentominoes',
+    'PentominoesFlower1': 'puzzler.puzzles.pentominoes',
+    'PentominoesFlower2': 'puzzler.puzzles.pentominoes',
+    'PentominoesFlower3': 'puzzler.puzzles.pentominoes',
+    'PentominoesFlower4': 'puzzler.puzzles.pentominoes',
+    'PentominoesFlower5': 'puzzler.puzzles.pentominoes',
+    'PentominoesHoleyOval': 'puzzler.puzzles.pentominoes',
+    'PentominoesHoleySpinner': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusMonomino': 'puzzler.puzzles.polyominoes',
+    'PentominoesPlusMonominoCross1': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusMonominoDiamond': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetromino': 'puzzler.puzzles.polyominoes',
+    'PentominoesPlusSquareTetromino8x8': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoCross1': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoCross2': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoCross3': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoCross4': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoDiamond1': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoDiamond_x1': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoDiamond_x2': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusSquareTetrominoTriangle': 'puzzler.puzzles.pentominoes',
+    'PentominoesPlusTetrominoes': 'puzzler.puzzles.polyominoes',
+    'PentominoesPuzzleArt': 'puzzler.puzzles.pentominoes',
+    'PentominoesSkewed10x6': 'puzzler.puzzles.pentominoes',
+    'PentominoesSkewed12x5': 'puzzler.puzzles.pentominoes',
+    'PentominoesSkewed15x4': 'puzzler.puzzles.pentominoes',
+    'PentominoesSkewed20x3': 'puzzler.puzzles.pentominoes',
+    'PentominoesSkewed_x1': 'puzzler.puzzles.pentominoes',
+    'PentominoesSpinner1': 'puzzler.puzzles.pentominoes',
+    'PentominoesTrapezoid': 'puzzler.puzzles.pentominoes',
+    'PentominoesTrapezoid_X1': 'puzzler.puzzles.pentominoes',
+    'PentominoesTriangle': 'puzzler.puzzles.pentominoes',
+    'PentominoesTriangle2': 'puzzler.puzzles.pentominoes',
+    'PentominoesTruncatedTriangle': 'puzzler.puzzles.pentominoes',
+    'PentominoesYinYang': 'puzzler.puzzles.pentominoes',
+    'Polycubes': 'puzzler.puzzles.polycubes',
+    'Polycubes12': 'puzzler.puzzles.polycubes',
+    'Polycubes123': 'puzzler.puzzles.polycubes',
+    'Polycubes1234': 'puzzler.puzzles.polycubes',
+    'Polycubes12345': 'puzzler.puzzles.polycubes',
+    'Polycubes123456': 'puzzler.puzzles.polycubes',
+    'Polycubes12345CrossBlock1': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345CrossBlock2': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345CrossBlock3': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345CubeCluster': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345CubeCluster2': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345CubeCluster3': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345DiamondWall': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345OverlappingBlocks1': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345OverlappingBlocks2': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345OverlappingBlocks3': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345OverlappingBlocks4': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345OverlappingBlocks5': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345Pyramid1': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345X1': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345X2': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345X3': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345X4': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345X5': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345_11x3x6_1': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345_11x3x6_2': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345_2x3x31': 'puzzler.puzzles.polycubes12345',
+    'Polycubes12345p6': 'puzzler.puzzles.polycubes',
+    'Polycubes12345p6Cubes345': 'puzzler.puzzles.polycubes12345p6',
+    'Polycubes12345p6_6x6x6': 'puzzler.puzzles.polycubes12345p6',
+    'Polycubes1234CrossTower1': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234DiamondCheckerboard_x': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234DiamondMound_x': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234OpenBox3x3x5': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234OpenBox5x5x2': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234Solid': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234StackedSquares1': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234StackedSquares2': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234_3x3x5_1': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234_3x3x5_2': 'puzzler.puzzles.polycubes1234',
+    'Polycubes1234_7x3x2_1': 'puzzler.puzzles.polycubes1234',
+    'Polycubes234': 'puzzler.puzzles.polycubes',
+    'Polycubes2345': 'puzzler.puzzles.polycubes',
+    'Polycubes234AztecPyramid': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Cross1': 'puzzler.puzzles.polycubes234',
+    'Polycubes234CrossTower1': 'puzzler.puzzles.polycubes234',
+    'Polycubes234CrossTower2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234CrossTower_x': 'puzzler.puzzles.polycubes234',
+    'Polycubes234OpenBox4x4x3': 'puzzler.puzzles.polycubes234',
+    'Polycubes234OpenBox6x4x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234RingWall3x3x5': 'puzzler.puzzles.polycubes234',
+    'Polycubes234RingWall4x3x4': 'puzzler.puzzles.polycubes234',
+    'Polycubes234RingWall6x6x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234RingWall7x5x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234RingWall8x4x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234RingWall9x3x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Solid': 'puzzler.puzzles.polycubes234',
+    'Polycubes234StackedSquares1': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Steps10x3x2_x': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Steps4x4x4': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Steps6x5x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Tower1': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Tower2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234Tower3': 'puzzler.puzzles.polycubes234',
+    'Polycubes234_10x2x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234_2x5x2x2': 'puzzler.puzzles.polycubes234',
+    'Polycubes234_5x4x2': 'puzzler.puzzles.polycubes234',
+    'Polyhexes': 'puzzler.puzzles.polyhexes',
+    'Polyhexes1234': 'puzzler.puzzles.polyhexes',
+    'Polyhexes12345': 'puzzler.puzzles.polyhexes',
+    'Polyhexes123456': 'puzzler.puzzles.polyhexes',
+    'Polyhexes12345HexagonRing1': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345HexagonRing_X1': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345HexagonRing_X2': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345SemiRegularHexagon15x2': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345Trapezoid17x15': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345Trapezoid18x12': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345Trapezoid32x5': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345Triangle': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345_10x15': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345_3x50': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345_5x30': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes12345_6x25': 'puzzler.puzzles.polyhexes12345',
+    'Polyhexes1234DiamondRing': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234ElongatedHexagon13x2': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234ElongatedHexagon2x6Ring': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234ElongatedHexagon3x5': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234HexagonRing1': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234HexagonRing2': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234IrregularHexagon1': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234IrregularHexagon2': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234IrregularHexagon3': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234IrregularHexagon4': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234IrregularHexagon5': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234JaggedHexagon1': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234JaggedHexagon2': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234JaggedHexagon3': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234KnobbedHexagon1': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234KnobbedHexagon2': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234KnobbedHexagon3': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234KnobbedHexagon4': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234KnobbedHexagon5': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234StaggeredRectangle10x4': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234StaggeredRectangle4x10': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234StaggeredRectangle5x8': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234StaggeredRectangle8x5': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234Trapezoid9x8': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234Triangle': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234Triangle2': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234TrilobedCrown': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234_4x10': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234_5x8': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes1234_6x7': 'puzzler.puzzles.polyhexes1234',
+    'Polyhexes34': 'puzzler.puzzles.polyhexes',
+    'Polyhexes34Hexagon': 'puzzler.puzzles.polyhexes34',
+    'Polyhexes34Hexagram': 'puzzler.puzzles.polyhexes34',
+    'Polyhexes34TrilobedCrown1': 'puzzler.puzzles.polyhexes34',
+    'Polyhexes34TrilobedCrown2': 'puzzler.puzzles.polyhexes34',
+    'Polyiamonds': 'puzzler.puzzles.polyiamonds',
+    'Polyiamonds123': 'puzzler.puzzles.polyiamonds',
+    'Polyiamonds1234': 'puzzler.puzzles.polyiamonds',
+    'Polyiamonds12345': 'puzzler.puzzles.polyiamonds',
+    'Polyiamonds123456': 'puzzler.puzzles.polyiamonds',
+    'Polyiamonds1234567': 'puzzler.puzzles.polyiamonds',
+    'Polyiamonds1234567Butterfly12x10_1': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds1234567ElongatedHexagon2x10_1': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds1234567Hexagon1': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds1234567Hexagon2': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds1234567Hexagon3': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds1234567Hexagon4': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds1234567Hexagon5': 'puzzler.puzzles.polyiamonds1234567',
+    'Polyiamonds123456Butterfly8x5': 'puzzler.puzzles.polyiamonds123456',
+    'Polyiamonds123456ElongatedHexagon3x5': 'puzzler.puzzles.polyiamonds123456',
+    'Polyiamonds123456_11x5': 'puzzler.puzzles.polyiamonds123456',
+    'Polyiamonds12345Bat': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Bird1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Butterfly10x1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Crab': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Dog1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345ElongatedHexOnHex1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345ElongatedHexOnHex2': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345ElongatedHexagon5x2Ring': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345ElongatedHexagon9x1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345IrregularHexagon1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Peanut': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Snake': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Snowflake1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Snowflake2': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Snowflake3': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Snowflake_x1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345StackedElongatedHexagons5x1_1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345StackedElongatedHexagons5x1_2': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345Trapezoid1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds12345X1': 'puzzler.puzzles.polyiamonds12345',
+    'Polyiamonds56': 'puzzler.puzzles.polyiamonds',
+    'Polyominoes': 'puzzler.puzzles.polyominoes',
+    'Polyominoes12': 'puzzler.puzzles.polyominoes',
+    'Polyominoes123': 'puzzler.puzzles.polyominoes',
+    'Polyominoes1234': 'puzzler.puzzles.polyominoes',
+    'Polyominoes12345': 'puzzler.puzzles.polyominoes',
+    'Polyominoes123456': 'puzzler.puzzles.polyominoes',
+    'Polyominoes123456Star': 'puzzler.puzzles.polyominoes123456',
+    'Polyominoes123456_23x13': 'puzzler.puzzles.polyominoes123456',
+    'Polyominoes12345Cross1': 'puzzler.puzzles.polyominoes12345',
+    'Polyominoes12345Cross2': 'puzzler.puzzles.polyominoes12345',
+    'Polyominoes12345Diamond': 'puzzler.puzzles.polyominoes12345',
+    'Polyominoes12345Diamond2': 'puzzler.puzzles.polyominoes12345',
+    'Polyominoes1234Astroid': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234Cross_x': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234Skewered7x3': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234Skewered9x3': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234SkeweredSquare': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234SquarePlus': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234_7x3Plus': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234_7x4PlusOne': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes1234_7x5CrossHole': 'puzzler.puzzles.polyominoes1234',
+    'Polyominoes123Square': 'puzzler.puzzles.polyominoes123',
+    'Polyominoes234': 'puzzler.puzzles.polyominoes',
+    'Polyominoes2345': 'puzzler.puzzles.polyominoes',
+    'Polyominoes2345X1': 'puzzler.puzzles.polyominoes2345',
+    'Polyominoes45': 'puzzler.puzzles.polyominoes',
+    'Polyominoes45AztecDiamond': 'puzzler.puzzles.polyominoes45',
+    'Polyominoes45Diamond': 'puzzler.puzzles.polyominoes45',
+    'Polyominoes45Square': 'puzzler.puzzles.polyominoes45',
+    'Polyominoes45X_x1': 'puzzler.puzzles.polyominoes45',
+    'Polyominoes45_4x20': 'puzzler.puzzles.polyominoes45',
+    'Polyominoes45_5x16': 'puzzler.puzzles.polyominoes45',
+    'Polyominoes45_8x10': 'puzzler.puzzles.polyominoes45',
+    'PolyominoesPuzzleArt': 'puzzler.puzzles.polyominoes_misc',
+    'PolyominoesPuzzleArtFixed': 'puzzler.puzzles.polyominoes_misc',
+    'Polysticks': 'puzzler.puzzles.polysticks',
+    'Polysticks123': 'puzzler.puzzles.polysticks',
+    'Polysticks1234': 'puzzler.puzzles.polysticks',
+    'Polysticks1234FourSquares1': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234Octagon1': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234Octagon2': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234ThreeSquares1': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234TruncatedDiamondLattice12x2': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234TruncatedDiamondLattice6x4': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234TruncatedDiamondLattice8x3': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234_10x5': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234_3x7DiamondLattice': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234_5x5DiamondLatticeRing': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234_7x7': 'puzzler.puzzles.polysticks1234',
+    'Polysticks1234_8x8Unbordered': 'puzzler.puzzles.polysticks1234',
+    'Polysticks123_4x4ClippedCorners1': 'puzzler.puzzles.polysticks123',
+    'Polysticks123_4x4ClippedCorners2': 'puzzler.puzzles.polysticks123',
+    'Polytrigs': 'puzzler.puzzles.polytrigs',
+    'Polytrigs12': 'puzzler.puzzles.polytrigs',
+    'Polytrigs123': 'puzzler.puzzles.polytrigs',
+    'Polytrigs1234': 'puzzler.puzzles.polytrigs',
+    'Polytrigs1234Trapezoid15x8': 'puzzler.puzzles.polytrigs1234',
+    'Polytrigs123Butterfly4x2': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Chevron3x2': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Trapezoid5x4': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Trapezoid7x2_1': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Trapezoid7x2_2': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_1': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_2': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_3': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_4': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_5': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_6': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_7': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123Triangle5_8': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs123_4x3': 'puzzler.puzzles.polytrigs123',
+    'Polytrigs23': 'puzzler.puzzles.polytrigs',
+    'Polytrigs23Hexagon': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent1': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent1Combined1': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent1Combined2': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent1Combined3': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent1Combined4': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x1': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x10': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x11': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x12': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x13': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x14': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x15': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x2': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x3': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x4': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x5': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x6': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x7': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x8': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23ThreeCongruent_x9': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23Trefoil1': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23Trefoil2': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23Trefoil3': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23Trefoil_x1': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23TriangleRing': 'puzzler.puzzles.polytrigs23',
+    'Polytrigs23TriangleStack_x': 'puzzler.puzzles.polytrigs23',
+    'Polytwigs': 'puzzler.puzzles.polytwigs',
+    'Polytwigs12': 'puzzler.puzzles.polytwigs',
+    'Polytwigs123': 'puzzler.puzzles.polytwigs',
+    'Polytwigs1234': 'puzzler.puzzles.polytwigs',
+    'Polytwigs12345': 'puzzler.puzzles.polytwigs',
+    'Polytwigs123456': 'puzzler.puzzles.polytwigs',
+    'Polytwigs123456ElongatedHexagon22x2': 'puzzler.puzzles.polytwigs123456',
+    'Polytwigs12345Butterfly8x2_1': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345Butterfly8x2_2': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345Butterfly8x2_3': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345Butterfly8x2_4': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345ElongatedHexagon4x3': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345InsetRectangle5x5': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345TrapezoidRing9x3': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_1': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_10': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_11': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_12': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_13': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_14': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_15': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_2': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_3': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_4': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_5': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_6': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_7': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_8': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs12345_6x4_9': 'puzzler.puzzles.polytwigs12345',
+    'Polytwigs1234Hex1': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234Hex2': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234Hex3': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234Hex4': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234Hex5': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234Hex6': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234InsetRectangle4x2': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs1234UnborderedTrapezoid5x4': 'puzzler.puzzles.polytwigs1234',
+    'Polytwigs45': 'puzzler.puzzles.polytwigs',
+    'Polytwigs45Butterfly5x3Ring': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45DiamondRing': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45ElongatedHexagon4x3Ring': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent1': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent2': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent3': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent3Combined': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent_x1': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent_x2': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent_x3': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent_x4': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent_x5': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45FourCongruent_x6': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45InsetRectangle5x5Ring': 'puzzler.puzzles.polytwigs45',
+    'Polytwigs45Triangle1': 'puzzler.puzzles.polytwigs45',
+    'Puzzle': 'puzzler.puzzles',
+    'Puzzle2D': 'puzzler.puzzles',
+    'Puzzle3D': 'puzzler.puzzles',
+    'PuzzleBits25': 'puzzler.puzzles.polyominoes_misc',
+    'PuzzleBits56': 'puzzler.puzzles.polyominoes_misc',
+    'PuzzleBits9': 'puzzler.puzzles.polyominoes_misc',
+    'PuzzleBitsA': 'puzzler.puzzles.polyominoes_misc',
+    'PuzzlePseudo3D': 'puzzler.puzzles',
+    'QuasiDitrigs': 'puzzler.puzzles.polytrigs',
+    'QuasiDitrigsHexagram': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsJaggedTriangle': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsSatellite': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsStarburst': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsTriangle': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsTriangleStack': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsTwoTriangles1': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsTwoTriangles2': 'puzzler.puzzles.quasiditrigs',
+    'QuasiDitrigsTwoTriangles3': 'puzzler.puzzles.quasiditrigs',
+    'QuasiPolytrigs12': 'puzzler.puzzles.polytrigs',
+    'QuasiPolytrigs12ElongatedHexagon2x1': 'puzzler.puzzles.quasipolytrigs12',
+    'QuasiPolytrigs12Trapezoid5x1': 'puzzler.puzzles.quasipolytrigs12',
+    'QuasiPolytwigs123': 'puzzler.puzzles.polytwigs',
+    'QuasiPolytwigs123HexagonRing1': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiPolytwigs123HexagonRing2': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiPolytwigs123HexagonRing3': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiPolytwigs123HexagonRing4': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiPolytwigs123RoundedRectangle9x2': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiPolytwigs123_5x3ParallelogramRing': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiPolytwigs123_6x3TrapezoidRing': 'puzzler.puzzles.quasipolytwigs123',
+    'QuasiTritwigs': 'puzzler.puzzles.polytwigs',
+    'QuasiTritwigs10x1': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigs6x2': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsElongatedHexagon2x3_1': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsElongatedHexagon2x3_2': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsElongatedHexagon2x3_3': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsElongatedHexagon2x3_4': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsElongatedHexagon2x3_5': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsElongatedHexagon2x3_6': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsSnowflake1': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsSnowflake2': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsSnowflake3': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil1': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil2': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil3': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil4': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil5': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil6': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil7': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTrefoil8': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTriangle1': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTriangle2': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTriangle3': 'puzzler.puzzles.quasitritwigs',
+    'QuasiTritwigsTriangle4': 'puzzler.puzzles.quasitritwigs',
+    'SevenSegmentDigits': 'puzzler.puzzles.polysticks',
+    'SevenSegmentDigits6x5': 'puzzler.puzzles.seven_segment_digits',
+    'SheldonsCube': 'puzzler.puzzles.polycubes_misc',
+    'SheldonsCube1': 'puzzler.puzzles.polycubes_misc',
+    'SheldonsCube2': 'puzzler.puzzles.polycubes_misc',
+    'SheldonsCube3': 'puzzler.puzzles.polycubes_misc',
+    'SolidHexominoes': 'puzzler.puzzles.polycubes',
+    'SolidHexominoes9x9x3_1': 'puzzler.puzzles.solid_hexominoes',
+    'SolidHexominoes9x9x3_2': 'puzzler.puzzles.solid_hexominoes',
+    'SolidHexominoesPlus': 'puzzler.puzzles.polycubes',
+    'SolidHexominoesPlus6x6x6': 'puzzler.puzzles.solid_hexominoes',
+    'SolidHexominoesPlusSteps11x6x6': 'puzzler.puzzles.solid_hexominoes',
+    'SolidHexominoesSteppedBlock13x5x4': 'puzzler.puzzles.solid_hexominoes',
+    'SolidHexominoesSteppedBlock9x5x8': 'puzzler.puzzles.solid_hexominoes',
+    'SolidPentominoes': 'puzzler.puzzles.polycubes',
+    'SolidPentominoes2x3x10': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes2x5x6': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes2x5x6A': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes2x5x6B': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x3x10Steps': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x3x12Tower': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x3x9Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x4x5': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x4x8Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x5x7Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x5x7Slope': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes3x6x6Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes4x4x6Steps': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes4x4x8Crystal': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes5x3x5Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes5x4x4Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes5x5x4SteppedPyramid': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes5x5x4Steps': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes5x5x5QuarterPyramid': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x3x4Ring': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6Crystal1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6Crystal2': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6Crystal3': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6Crystal4': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6Crystal5': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6CrystalX1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6CrystalX2': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6CrystalX3': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes6x6x6CrystalX4': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoes7x7x7Crystal': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCondominiumB': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCornerPiece': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCornerWalls': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock1A': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock1B': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock2': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock2A': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock2B': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock2C': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock3': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossBlock_x1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesCrossTower': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesEmptyBottle': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesInfinityTower': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesOhnosBlock': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesOpenBox6x3x4': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesOpenBox8x3x3': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesRing': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSpinnerBlock': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSquareTower1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSquareTower2': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSquareTower3': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSquareTower4': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSquareTower5': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesSquareTower6': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesStairstepWalls1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesStairstepWalls2': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesStairstepWalls_x3': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesThreeWalls': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesTower1': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesTower2': 'puzzler.puzzles.solid_pentominoes',
+    'SolidPentominoesTower3': 'puzzler.puzzles.solid_pentominoes',
+    'Soma3x3x3': 'puzzler.puzzles.somacubes',
+    'SomaBathtub': 'puzzler.puzzles.somacubes',
+    'SomaBench': 'puzzler.puzzles.somacubes',
+    'SomaCastle1': 'puzzler.puzzles.somacubes',
+    'SomaCastle2': 'puzzler.puzzles.somacubes',
+    'SomaClip': 'puzzler.puzzles.somacubes',
+    'SomaCornerstone': 'puzzler.puzzles.somacubes',
+    'SomaCrystal': 'puzzler.puzzles.somacubes',
+    'SomaCubes': 'puzzler.puzzles.polycubes',
+    'SomaCurvedWall': 'puzzler.puzzles.somacubes',
+    'SomaHighWall': 'puzzler.puzzles.somacubes',
+    'SomaLongWall': 'puzzler.puzzles.somacubes',
+    'SomaPyramid': 'puzzler.puzzles.somacubes',
+    'SomaScrew': 'puzzler.puzzles.somacubes',
+    'SomaSkew1': 'puzzler.puzzles.somacubes',
+    'SomaSkew2': 'puzzler.puzzles.somacubes',
+    'SomaSofa': 'puzzler.puzzles.somacubes',
+    'SomaSquareWall': 'puzzler.puzzles.somacubes',
+    'SomaSteamer': 'puzzler.puzzles.somacubes',
+    'SomaSteps': 'puzzler.puzzles.somacubes',
+    'SomaTunnel': 'puzzler.puzzles.somacubes',
+    'Soma_W': 'puzzler.puzzles.somacubes',
+    'Tetracubes': 'puzzler.puzzles.polycubes',
+    'Tetracubes2x2x2x4': 'puzzler.puzzles.tetracubes',
+    'Tetracubes2x2x8': 'puzzler.puzzles.tetracubes',
+    'Tetracubes2x4x4': 'puzzler.puzzles.tetracubes',
+    'Tetrahexes': 'puzzler.puzzles.polyhexes',
+    'Tetrahexes4x7': 'puzzler.puzzles.tetrahexes',
+    'Tetrahexes7x7Triangle': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesBumpyTriangle': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesCoin': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesElongatedHexagon3x4_1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesElongatedHexagon3x4_2': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesElongatedHexagon3x4_3': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesElongatedHexagon3x4_4': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesElongatedHexagon9x2': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesFlower1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesFlower2': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesFlower3': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesHexagon_x1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesHoleyStar1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesRosettes_x1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesStaggeredRectangle7x4': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTrefoil_x1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTrefoil_x2': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTrefoil_x3': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTrefoil_x4': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTwoDiamonds1': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTwoDiamonds2': 'puzzler.puzzles.tetrahexes',
+    'TetrahexesTwoDiamonds_x1': 'puzzler.puzzles.tetrahexes',
+    'Tetrasticks': 'puzzler.puzzles.polysticks',
+    'Tetrasticks3x5DiamondLattice': 'puzzler.puzzles.tetrasticks',
+    'Tetrasticks6x6': 'puzzler.puzzles.tetrasticks',
+    'Tetrasticks7x7Unbordered': 'puzzler.puzzles.tetrasticks',
+    'TetrasticksAztecDiamond': 'puzzler.puzzles.tetrasticks',
+    'TetrasticksParallelogram5x5': 'puzzler.puzzles.tetrasticks',
+    'Tetratrigs': 'puzzler.puzzles.polytrigs',
+    'TetratrigsElongatedHex11x3': 'puzzler.puzzles.tetratrigs',
+    'Tetratwigs': 'puzzler.puzzles.polytwigs',
+    'Tetratwigs3x1': 'puzzler.puzzles.tetratwigs',
+    'TetratwigsArch': 'puzzler.puzzles.tetratwigs',
+    'Tetriamonds': 'puzzler.puzzles.polyiamonds',
+    'Tetrominoes': 'puzzler.puzzles.polyominoes',
+    'Tetrominoes5x4Tube': 'puzzler.puzzles.tetrominoes',
+    'Triamond': 'puzzler.puzzles.polyiamonds',
+    'Tricubes': 'puzzler.puzzles.polycubes',
+    'Trihexes': 'puzzler.puzzles.polyhexes',
+    'Tritrigs': 'puzzler.puzzles.polytrigs',
+    'TritrigsHeart1': 'puzzler.puzzles.tritrigs',
+    'TritrigsHeart2': 'puzzler.puzzles.tritrigs',
+    'TritrigsHex2Ring': 'puzzler.puzzles.tritrigs',
+    'TritrigsHex3x1Ring': 'puzzler.puzzles.tritrigs',
+    'TritrigsHexagon1': 'puzzler.puzzles.tritrigs',
+    'TritrigsHexagon2': 'puzzler.puzzles.tritrigs',
+    'TritrigsHexagon3': 'puzzler.puzzles.tritrigs',
+    'TritrigsJaggedTrapezoid5x3': 'puzzler.puzzles.tritrigs',
+    'TritrigsParallelogram5x2': 'puzzler.puzzles.tritrigs',
+    'TritrigsSpikedTriangle1': 'puzzler.puzzles.tritrigs',
+    'TritrigsSpikedTriangle2': 'puzzler.puzzles.tritrigs',
+    'TritrigsSpinner': 'puzzler.puzzles.tritrigs',
+    'TritrigsStackedElongatedHexagons2x2x1': 'puzzler.puzzles.tritrigs',
+    'TritrigsTrapezoid5x3Ring': 'puzzler.puzzles.tritrigs',
+    'TritrigsTrapezoid6x2': 'puzzler.puzzles.tritrigs',
+    'TritrigsTrefoil1': 'puzzler.puzzles.tritrigs',
+    'TritrigsTrefoil2': 'puzzler.puzzles.tritrigs',
+    'TritrigsTriangle1': 'puzzler.puzzles.tritrigs',
+    'TritrigsTriangle2': 'puzzler.puzzles.tritrigs',
+    'TritrigsTriangle3': 'puzzler.puzzles.tritrigs',
+    'TritrigsTriangle4': 'puzzler.puzzles.tritrigs',
+    'TritrigsTriangle_x': 'puzzler.puzzles.tritrigs',
+    'TritrigsWhorl': 'puzzler.puzzles.tritrigs',
+    'Trominoes': 'puzzler.puzzles.polyominoes',
+    'UnflippedSevenSegmentDigits6x5': 'puzzler.puzzles.seven_segment_digits',
+}
@@ -27,11 +27,36 @@ from pprint import pprint, pformat
 
 from puzzler import coordsys
 from puzzler import colors
+from puzzler.utils import plural_s
 
 
 class DataError(RuntimeError): pass
 
 
+aspect_cache = {}
+"""Process-wide mapping of piece aspect parameters to frozensets of aspects;
+see `Puzzle.cached_aspects`."""
+
+placement_cache = {}
+"""Mapping of aspect & board parameters to lists of translated aspects; see
+`Puzzle.placements`.  Cleared by `clear_placement_cache` once a puzzle
+matrix is loaded, so it is not kept alive during the search."""
+
+placement_cache_limit = 500000
+"""Maximum number of placement coordinates (a measure of memory use) held in
+`placement_cache` before it is cleared."""
+
+placement_cache_size = 0
+"""The number of placement coordinates held in `placement_cache`."""
+
+
+def clear_placement_cache():
+    """Release all cached placements."""
+    global placement_cache_size
+    placement_cache.clear()
+    placement_cache_size = 0
+
+
 class Puzzle(object):
 
     """
@@ -62,8 +87,21 @@ class Puzzle(object):
       customized in `customize_piece_data`
     """
 
+    piece_multiplicities = {}
+    """Mapping of piece names to 2-tuples: the minimum & maximum number of
+    times the piece is used (pieces not listed are used exactly once).
+    Copies of a piece are interchangeable, so they are never permuted; the
+    "dlx" or "x2" algorithm is required."""
+
     implied_0 = True
 
+    poem = None
+    """A beaded poem constraining the solutions (see `set_poem`), or None."""
+
+    restricted = True
+    """False once the puzzle's symmetry restrictions have been dropped (see
+    `drop_restrictions`)."""
+
     piece_colors = None
     """Mapping of piece names to colors.  The '0' name is reserved for
     formatting solution coordinates."""
@@ -98,12 +136,26 @@ class Puzzle(object):
 </path>
 '''
 
+    svg_cut_path = '''\
+<path fill="none" stroke="%(stroke)s" stroke-width="%(stroke_width)s"
+    d="%(path_data)s"/>
+'''
+
     svg_stroke = 'white'
     """Polygon outline color."""
 
     svg_stroke_width = '1'
     """Width of polygon outline."""
 
+    svg_cut_stroke = 'black'
+    """Laser-cutting line color."""
+
+    svg_cut_stroke_width = '0.1'
+    """Width of laser-cutting lines."""
+
+    cut_plan = None
+    """The `cutting.CutPlan` of the last laser-cutting SVG formatted."""
+
     svg_unit_length = 10
     """Unit side length in pixels."""
 
@@ -134,14 +186,34 @@ class Puzzle(object):
         """Return a tuple of puzzle component classes (sub-puzzles)."""
         return (cls,)
 
+    @classmethod
+    def unrestricted_base(cls):
+        """
+        Return the class whose `customize_piece_data` & `build_matrix` build
+        this puzzle without its symmetry restrictions: the nearest base class
+        of the class defining the puzzle's dimensions.  (Concrete puzzles &
+        their components add the restrictions; the generic puzzle classes
+        they derive from define the pieces.)
+        """
+        board_class = None
+        for base in cls.__mro__:
+            sized = 'width' in vars(base) or 'height' in vars(base)
+            if board_class is None:
+                if sized:
+                    board_class = base
+            elif not sized and issubclass(base, Puzzle):
+                return base
+        return cls
+
     def __init__(self, init_puzzle=True):
         """
         Use `init_puzzle` to speed up initialization when not actually solving
         the puzzle.
         """
 
-        self.solutions = set()
-        """Set of all permutations of solutions, for duplicate checking."""
+        self.dedupe = None
+        """A `puzzler.dedupe.Deduplicator`, for duplicate checking (created
+        at the first solution unless set beforehand)."""
 
         self.solution_coords = set(self.coordinates())
         """A set of all coordinates that make up the solution area/space."""
@@ -182,7 +254,10 @@ class Puzzle(object):
         """Initialize the puzzle pieces and matrix."""
         self.build_aspects()
         self.build_matrix_header()
-        self.build_matrix()
+        if self.restricted:
+            self.build_matrix()
+        else:
+            self.unrestricted_base().build_matrix(self)
 
     def coordinates(self):
         """
@@ -201,6 +276,40 @@ class Puzzle(object):
         """
         pass
 
+    def matrix_signature(self):
+        """
+        Return a string identifying the instance-specific inputs to the matrix
+        (the results of `customize_piece_data`), for the matrix cache.
+        """
+        signature = pformat(self.piece_data)
+        if self.poem:
+            signature += '\npoem: %s' % self.poem
+        return signature
+
+    def set_poem(self, poem):
+        """
+        Constrain the puzzle matrix by `poem`, a beaded poem string (see
+        `puzzler.beads`).  Call before initializing the puzzle.
+
+        Implement in subclasses.
+        """
+        raise DataError('%s puzzles do not support poem constraints.'
+                        % self.__class__.__name__)
+
+    def drop_restrictions(self):
+        """
+        Drop the puzzle's symmetry restrictions, so that every solution is
+        found, including the symmetric images of other solutions.  The piece
+        data is customized and the matrix is built by `unrestricted_base`,
+        and duplicate checking is turned off.  Call before initializing the
+        puzzle.
+        """
+        base = self.unrestricted_base()
+        self.piece_data = copy.deepcopy(self.__class__.piece_data)
+        base.customize_piece_data(self)
+        self.check_for_duplicates = False
+        self.restricted = False
+
     def build_aspects(self):
         """Populate `self.aspects` and `self.pieces`."""
         self.build_regular_aspects(sorted(self.piece_data.keys()))
@@ -212,7 +321,7 @@ class Puzzle(object):
         """
         for name in names:
             data, kwargs = self.piece_data[name]
-            self.aspects[name] = self.make_aspects(data, **kwargs)
+            self.aspects[name] = self.cached_aspects(data, kwargs)
         for name, aspects in self.aspects.items():
             self.pieces[name] = tuple(
                 sorted((tuple(sorted(aspect)), aspect) for aspect in aspects))
@@ -227,6 +336,26 @@ class Puzzle(object):
         """
         raise NotImplementedError
 
+    def cached_aspects(self, data, kwargs):
+        """
+        Return a new set of the aspects of a puzzle piece (see
+        `make_aspects`).  Aspects are computed once per process for each
+        combination of `make_aspects` implementation, `implied_0`, piece
+        `data`, and aspect restrictions (`kwargs`), and are shared between
+        puzzle instances.
+        """
+        try:
+            key = (self.make_aspects.im_func, self.implied_0, data,
+                   tuple(sorted(kwargs.items())))
+            aspects = aspect_cache.get(key)
+        except TypeError:
+            # unhashable data; don't cache
+            return self.make_aspects(data, **kwargs)
+        if aspects is None:
+            aspects = aspect_cache[key] = frozenset(
+                self.make_aspects(data, **kwargs))
+        return set(aspects)
+
     def matrix_header_pieces(self):
         """Return an ordered list of piece names for build_matrix_header."""
         return sorted(self.pieces.keys())
@@ -263,6 +392,38 @@ class Puzzle(object):
         """
         raise NotImplementedError
 
+    def translations(self, aspect):
+        """
+        A generator that yields all translations of `aspect` within the
+        bounds of the puzzle, for `build_regular_matrix`.
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
+    def placements(self, coords, aspect, board):
+        """
+        Return a list of the translations of `aspect` (whose sorted
+        coordinates are `coords`) which fit within `board`, a frozenset of
+        solution coordinates.  The result is cached until the matrix is
+        loaded (see `clear_placement_cache`), so puzzles with the same pieces
+        and board whose matrices are built together share placements.
+        """
+        global placement_cache_size
+        key = (self.translations.im_func, type(aspect), coords,
+               self.width, self.height, self.depth, board)
+        placements = placement_cache.get(key)
+        if placements is None:
+            placements = [
+                translated for translated in self.translations(aspect)
+                if translated.issubset(board)]
+            size = len(placements) * len(coords)
+            if placement_cache_size + size > placement_cache_limit:
+                clear_placement_cache()
+            placement_cache[key] = placements
+            placement_cache_size += size
+        return placements
+
     def build_restricted_matrix(self):
         """
         Builds `self.matrix` based first on a set of restrictions.  Once the
@@ -283,12 +444,15 @@ class Puzzle(object):
 
     def record_solution(self, solution, solver, stream=sys.stdout, dated=False):
         """
-        Output a formatted solution to `stream`. Return True for valid solution.
+        Output a formatted solution to `stream` (unless it is None). Return
+        True for valid solution.
         """
-        formatted = self.format_solution(solution, normalized=True)
         if self.check_for_duplicates:
-            if self.store_solutions(solution, formatted):
+            if self.store_solutions(solution):
                 return False
+        solver.num_solutions += 1
+        if stream is None:
+            return True
         if dated:
             print >>stream, 'at %s,' % datetime.datetime.now(),
         #print >>stream, solver.format_solution() # this is the line that gives gridded solution
@@ -317,6 +481,23 @@ class Puzzle(object):
         """
         raise NotImplementedError
 
+    def hyphen_masks(self, solution):
+        """
+        Return the hyphen signature of `solution` (see `puzzler.beads`).
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
+    def placement_score(self, row):
+        """
+        Return the score of a piece placement: `row` is a matrix row, a list
+        of column names.  Used by the "--optimize score" option.
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
     def format_svg(self, solution=None, s_matrix=None, thin=False):
         """
         Return a puzzle-specific SVG formatting of a solution.
@@ -325,6 +506,16 @@ class Puzzle(object):
         """
         raise NotImplementedError
 
+    def format_thin_svg(self, solution=None, s_matrix=None):
+        """
+        Return a puzzle-specific SVG formatting of a solution for laser
+        cutting (thin lines), and store its `cutting.CutPlan` in
+        `self.cut_plan`.
+
+        Implement in subclasses.
+        """
+        raise NotImplementedError
+
     def write_svg(self, output_path, solution=None, s_matrix=None, thin=False):
         try:
             if thin:
@@ -333,8 +524,11 @@ class Puzzle(object):
                 svg = self.format_svg(solution, s_matrix)
         except NotImplementedError:
             print >>sys.stderr, (
-                'Warning: SVG output not supported by this puzzle.\n')
+                'Warning: %sSVG output not supported by this puzzle.\n'
+                % (thin and 'Laser-cutting ' or ''))
         else:
+            if thin:
+                print >>sys.stderr, self.cut_plan_summary()
             svg_file = None
             try:
                 if output_path == '-':
@@ -350,6 +544,14 @@ class Puzzle(object):
                                or hasattr(output_path, 'write'))):
                     svg_file.close()
 
+    def cut_plan_summary(self):
+        """Return a summary of `self.cut_plan`, in SVG units."""
+        plan = self.cut_plan
+        return ('%s cut path%s, cut length %.3f, travel %.3f'
+                % (len(plan.polylines), plural_s(len(plan.polylines)),
+                   plan.cut_length * self.svg_unit_length,
+                   plan.travel_length * self.svg_unit_length))
+
     def format_x3d(self, solution=None, s_matrix=None):
         """
         Return a puzzle-specific X3D formatting of a solution.
@@ -420,30 +622,28 @@ class Puzzle(object):
         """
         raise NotImplementedError
 
-    def store_solutions(self, solution, formatted):
+    def store_solutions(self, solution):
         """
         Return True if the solution is a duplicate, False if unique.
 
-        Store the formatted solution along with puzzle-specific variants
-        (reflections, rotations) in `self.solutions`, to check for duplicates.
+        Store a hash of the solution's canonical form (or of the formatted
+        solution along with puzzle-specific variants: reflections, rotations)
+        in `self.dedupe`, to check for duplicates.
         """
-        if formatted in self.solutions:
-            return True
-        self.solutions.add(formatted)
-        # keep track of formatted variants of *this* solution, to
-        # differentiate from previous solutions:
-        solutions = set([formatted])
-        for conditions in self.duplicate_conditions:
-            formatted = self.format_solution(solution, **conditions)
-            if formatted in self.solutions:
-                # applying duplicate conditions may result in variant
-                # solutions identical to `formatted`
-                if formatted not in solutions:
-                    return True
-            else:
-                self.solutions.add(formatted)
-                solutions.add(formatted)
-        return False
+        if self.dedupe is None:
+            from puzzler import dedupe
+            self.dedupe = dedupe.Deduplicator(self.__class__.__name__)
+        if self.dedupe.form is None:
+            self.dedupe.start(self)
+        return self.dedupe.is_duplicate(solution)
+
+    def normalize_piece_name(self, name):
+        """
+        Return the piece name used for duplicate detection, consistent with
+        `self.format_solution(normalized=True)` (such as renaming identical
+        pieces).  Override in subclasses.
+        """
+        return name
 
 
 class Puzzle2D(Puzzle):
@@ -538,15 +738,81 @@ class Puzzle2D(Puzzle):
     def build_regular_matrix(self, keys, solution_coords=None):
         if solution_coords is None:
             solution_coords = self.solution_coords
+        board = frozenset(solution_coords)
         for key in keys:
             for coords, aspect in self.pieces[key]:
-                for y in range(self.height - aspect.bounds[1]):
-                    for x in range(self.width - aspect.bounds[0]):
-                        translated = aspect.translate((x, y))
-                        if translated.issubset(solution_coords):
-                            self.build_matrix_row(key, translated)
+                for translated in self.placements(coords, aspect, board):
+                    self.build_matrix_row(key, translated)
+
+    def translations(self, aspect):
+        for y in range(self.height - aspect.bounds[1]):
+            for x in range(self.width - aspect.bounds[0]):
+                yield aspect.translate((x, y))
+
+    def set_poem(self, poem):
+        """
+        Constrain the puzzle matrix by `poem`, a beaded poem string: lines
+        separated by spaces, top line first, with an "o" for each cell of the
+        puzzle row (left to right, skipping holes) and a "-" between cells
+        which must belong to the same piece.  For example::
+
+            oooooooo-o-o oo-oo-oooo-oo ...
+
+        Placements covering one cell of a linked pair but not the other are
+        left out of the matrix, so only solutions compatible with the poem
+        are found.  The puzzle's symmetry restrictions are dropped (see
+        `drop_restrictions`): they keep one solution of each symmetry class,
+        which need not be the one compatible with the poem.
+        """
+        lines = poem.split()
+        rows = {}
+        for coord in self.solution_coords:
+            rows.setdefault(coord[1], []).append(coord)
+        ys = sorted(rows, reverse=True)
+        if len(lines) != len(ys):
+            raise DataError(
+                'The poem has %i lines; %s has %i rows.'
+                % (len(lines), self.__class__.__name__, len(ys)))
+        links = {}
+        for i, (line, y) in enumerate(zip(lines, ys)):
+            cells = sorted(rows[y])
+            if ( line.replace('-', '').strip('o')
+                 or line.count('o') != len(cells)
+                 or line.startswith('-') or line.endswith('-')
+                 or '--' in line):
+                raise DataError(
+                    'Poem line %i ("%s") does not match the %i cells of '
+                    'puzzle row %i.' % (i + 1, line, len(cells), y))
+            k = -1
+            for char in line:
+                if char == 'o':
+                    k += 1
+                else:
+                    links.setdefault(cells[k], set()).add(cells[k + 1])
+                    links.setdefault(cells[k + 1], set()).add(cells[k])
+        self.poem = poem
+        # mapping of coordinates to sets of coordinates in the same piece:
+        self.poem_links = links
+        self.drop_restrictions()
+
+    def poem_compatible(self, coords):
+        """
+        Return True if the placement `coords` (a set of coordinates) keeps
+        every pair of cells linked by the poem together.
+        """
+        links = self.poem_links
+        for coord in coords:
+            linked = links.get(coord)
+            if linked and not linked.issubset(coords):
+                return False
+        return True
 
     def build_matrix_row(self, name, coords):
+        if self.poem:
+            if not isinstance(coords, (set, frozenset)):
+                coords = set(coords)
+            if not self.poem_compatible(coords):
+                return
         row = [0] * len(self.matrix[0])
         row[self.matrix_columns[name]] = name
         for coord in coords:
@@ -578,6 +844,46 @@ class Puzzle2D(Puzzle):
             for y in y_reversed_fn(range(self.height)))
         return formatted.replace(' ','').replace('\n',' ')
 
+    def hyphen_masks(self, solution):
+        """
+        Return the hyphen signature of `solution` (see `puzzler.beads`): a
+        list of bit masks of the horizontal same-piece adjacencies of each
+        line, top line first.  Bit k of a line's mask is set when the cells
+        at x=k and x=k+1 belong to the same piece.
+        """
+        try:
+            edge_masks = self.edge_masks
+        except AttributeError:
+            edge_masks = self.edge_masks = {}
+        masks = [0] * self.height
+        for row in solution:
+            key = tuple(row)
+            try:
+                edges = edge_masks[key]
+            except KeyError:
+                edges = edge_masks[key] = self.placement_edge_masks(row)
+            for y, mask in edges:
+                masks[y] |= mask
+        masks.reverse()
+        return masks
+
+    def placement_edge_masks(self, row):
+        """
+        Return a tuple of (y, mask) pairs: the horizontal same-piece
+        adjacencies of the placement matrix `row`, per line.
+        """
+        cells = set()
+        for cell_name in row[:-1]:
+            if cell_name.endswith('i') or cell_name == '!':
+                continue
+            x, y = [int(d.strip()) for d in cell_name.split(',')]
+            cells.add((x, y))
+        lines = {}
+        for x, y in cells:
+            if (x + 1, y) in cells:
+                lines[y] = lines.get(y, 0) | (1 << x)
+        return tuple(sorted(lines.items()))
+
     def empty_solution_matrix(self, margin=0):
         s_matrix = [[self.empty_cell] * (self.width + 2 * margin)
                     for y in range(self.height + 2 * margin)]
@@ -598,9 +904,16 @@ class Puzzle2D(Puzzle):
         if s_matrix:
             assert solution is None, (
                 'Provide only one of solution & s_matrix arguments, not both.')
+            shapes = self.format_svg_shapes(s_matrix)
         else:
-            s_matrix = self.build_solution_matrix(solution, margin=1)
-        shapes = self.format_svg_shapes(s_matrix)
+            shapes = self.format_svg_placements(solution)
+        return self.format_svg_document(shapes)
+
+    def format_svg_document(self, shapes, comment=''):
+        """
+        Return an SVG document containing `shapes` (a list of SVG element
+        strings), transformed as per `self.svg_flip` & `self.svg_rotation`.
+        """
         height, width = self.calculate_svg_dimensions()
         if self.svg_flip:
             g_flip_matrix = self.svg_flip_matrix % {'dy': height} + ' '
@@ -621,8 +934,79 @@ class Puzzle2D(Puzzle):
             else:
                 g_start = self.svg_g_start
         header = self.svg_header % {'height': height, 'width': width}
-        return '%s%s%s%s%s' % (
-            header, g_start, ''.join(shapes), self.svg_g_end, self.svg_footer)
+        return '%s%s%s%s%s%s' % (
+            header, comment, g_start, ''.join(shapes), self.svg_g_end,
+            self.svg_footer)
+
+    def format_thin_svg(self, solution=None, s_matrix=None):
+        """
+        Return an SVG formatting of a solution for laser cutting: each edge
+        between pieces (or between a piece and the outside) once, merged
+        into polylines, in a travel-optimized order (see `puzzler.cutting`).
+        Pieces are separated by placement, so adjacent copies of a piece
+        are cut apart; given only `s_matrix`, pieces are separated by name.
+        """
+        if s_matrix:
+            assert solution is None, (
+                'Provide only one of solution & s_matrix arguments, not both.')
+        else:
+            s_matrix = self.build_placement_matrix(solution, margin=1)
+        from puzzler import cutting
+        unit = self.svg_unit_length
+        height = self.height + 2
+        # the cutting head starts at the top left-hand corner:
+        self.cut_plan = plan = cutting.CutPlan(
+            self.cut_segments(s_matrix), origin=(0, height))
+        paths = []
+        for points in plan.polylines:
+            path_data = ' '.join(
+                '%s %.3f,%.3f' % ((i and 'L') or 'M', x * unit,
+                                  (height - y) * unit)
+                for (i, (x, y)) in enumerate(points))
+            paths.append(self.svg_cut_path % {
+                'stroke': self.svg_cut_stroke,
+                'stroke_width': self.svg_cut_stroke_width,
+                'path_data': path_data})
+        comment = '<!-- %s -->\n' % self.cut_plan_summary()
+        return self.format_svg_document(paths, comment)
+
+    def build_placement_matrix(self, solution, margin=0):
+        """
+        Return a solution matrix (as from `self.build_solution_matrix`)
+        whose cells contain the index of their placement (row) in
+        `solution` instead of the piece name.
+        """
+        empty = self.empty_cell
+        p_matrix = self.empty_solution_matrix(margin)
+        for i, row in enumerate(solution):
+            s_matrix = self.build_solution_matrix([row], margin)
+            for y, line in enumerate(s_matrix):
+                for x, cell in enumerate(line):
+                    if cell != empty:
+                        p_matrix[y][x] = i
+        return p_matrix
+
+    def cut_segments(self, s_matrix):
+        """
+        Return a list of the unit segments (pairs of corner points) between
+        differing cells of `s_matrix` (margin=1; piece names or placement
+        indexes), other than between two empty cells.  Cells containing "0"
+        are all separate.
+        """
+        empty = self.empty_cell
+        segments = []
+        for y in range(1, len(s_matrix)):
+            for x in range(1, len(s_matrix[y])):
+                cell = s_matrix[y][x]
+                left = s_matrix[y][x - 1]
+                below = s_matrix[y - 1][x]
+                if cell != left or cell == '0':
+                    if not (cell == empty and left == empty):
+                        segments.append(((x, y), (x, y + 1)))
+                if cell != below or cell == '0':
+                    if not (cell == empty and below == empty):
+                        segments.append(((x, y), (x + 1, y)))
+        return segments
 
     def format_svg_shapes(self, s_matrix):
         shapes = []
@@ -633,6 +1017,28 @@ class Puzzle2D(Puzzle):
                 shapes.append(self.build_svg_shape(s_matrix, x, y))
         return shapes
 
+    def format_svg_placements(self, solution):
+        """
+        Return a list of SVG shape definitions for the pieces of `solution`
+        (a list of matrix rows), from the cached outlines of their cells.
+        Shapes are ordered as by `self.format_svg_shapes`.
+        """
+        placements = []
+        for row in solution:
+            cells = []
+            for cell_name in row[:-1]:
+                if cell_name.endswith('i') or cell_name == '!':
+                    continue            # skip intersections & omitted pieces
+                x, y = [int(d.strip()) for d in cell_name.split(',')]
+                # as in the margin=1 solution matrix:
+                cells.append((x + 1, y + 1))
+            if cells:
+                start = min(cells, key=lambda (x, y): (y, x))
+                placements.append(((start[1], start[0]), row[-1], cells))
+        placements.sort()
+        return [self.format_svg_outline(name, cells)
+                for (start, name, cells) in placements]
+
     def calculate_svg_dimensions(self):
         height = (self.height + 2) * self.svg_unit_length
         width = (self.width + 2) * self.svg_unit_length
@@ -643,77 +1049,117 @@ class Puzzle2D(Puzzle):
         Return an SVG shape definition for the shape at (x,y), and erase the
         shape from s_matrix.
         """
-        points = self.get_polygon_points(s_matrix, x, y)
         name = s_matrix[y][x]
-        color = self.piece_colors[name]
+        cells = self.get_piece_cells(s_matrix, x, y)
         # Erase cells of this piece:
-        for x, y in self.get_piece_cells(s_matrix, x, y):
+        for x, y in cells:
             s_matrix[y][x] = self.empty_cell
-        points_str = ' '.join('%.3f,%.3f' % (x, y) for (x, y) in points)
-        return self.svg_polygon % {'color': color,
-                                   'stroke': self.svg_stroke,
-                                   'stroke_width': self.svg_stroke_width,
-                                   'points': points_str,
-                                   'name': name}
-
-    edge_trace = {(+1,  0): ((( 0, -1), ( 0, -1)), # right
-                             (( 0,  0), (+1,  0)),
-                             (None,     ( 0, +1))),
-                  (-1,  0): (((-1,  0), ( 0, +1)), # left
-                             ((-1, -1), (-1,  0)),
-                             (None,     ( 0, -1))),
-                  ( 0, +1): ((( 0,  0), (+1,  0)), # up
-                             ((-1,  0), ( 0, +1)),
-                             (None,     (-1,  0))),
-                  ( 0, -1): (((-1, -1), (-1,  0)), # down
-                             (( 0, -1), ( 0, -1)),
-                             (None,     (+1,  0))),}
-    """Mapping of counterclockwise (x,y)-direction vector to list (ordered by
-    test) of 2-tuples: examination cell coordinate delta & new direction
-    vector."""
-
-    # !!! This will not work for shapes with holes.
-    # See polyhexes.py for another approach.
-    def get_polygon_points(self, s_matrix, x, y):
-        """
-        Return a list of coordinate tuples, the corner points of the polygon
-        for the piece at (x,y).
+        return self.format_svg_outline(name, cells)
+
+    def format_svg_outline(self, name, cells):
+        """
+        Return an SVG shape definition for piece `name` covering `cells` (a
+        collection of (x,y) solution matrix coordinates, margin=1): a polygon,
+        or a path if the shape has holes.
         """
-        cell_content = s_matrix[y][x]
         unit = self.svg_unit_length
         height = (self.height + 2) * unit
-        points = [(x * unit, height - y * unit)]
-        direction = (+1, 0)             # to the right
-        start = (x, y)
-        x += 1
-        while (x, y) != start:
-            for delta, new_direction in self.edge_trace[direction]:
-                if ( delta is None
-                     or cell_content != '0'
-                     and s_matrix[y + delta[1]][x + delta[0]] == cell_content):
+        loops = [[(x * unit, height - y * unit) for (x, y) in loop]
+                 for loop in self.get_outline(cells)]
+        details = {'color': self.piece_colors[name],
+                   'stroke': self.svg_stroke,
+                   'stroke_width': self.svg_stroke_width,
+                   'name': name}
+        if len(loops) == 1:
+            details['points'] = ' '.join(
+                '%.3f,%.3f' % (x, y) for (x, y) in loops[0])
+            return self.svg_polygon % details
+        details['path_data'] = ' '.join(
+            ('M %.3f,%.3f %s Z'
+             % (points[0][0], points[0][1],
+                ' '.join(('L %.3f,%.3f' % coord) for coord in points[1:])))
+            for points in loops)
+        return self.svg_path % details
+
+    def get_outline(self, cells):
+        """
+        Return the outline of `cells` (a collection of (x,y) coordinates): a
+        list of closed loops of corner points (x,y), the outer boundary
+        first (counterclockwise from the lower left-hand corner of the lowest
+        cell), then any holes.
+
+        Outlines are traced once per shape (i.e. per piece aspect) and cached;
+        other placements of the same shape are translated.
+        """
+        try:
+            outlines = self.svg_outlines
+        except AttributeError:
+            outlines = self.svg_outlines = {}
+        x0, y0 = min(cells, key=lambda (x, y): (y, x))
+        shape = frozenset((x - x0, y - y0) for (x, y) in cells)
+        try:
+            outline = outlines[shape]
+        except KeyError:
+            outline = outlines[shape] = self.trace_outline(shape)
+        return [[(x + x0, y + y0) for (x, y) in loop] for loop in outline]
+
+    def trace_outline(self, cells):
+        """
+        Return the outline loops of `cells` (a set of (x,y) coordinates; see
+        `self.get_outline`).  Cell (x,y) spans corners (x,y) to (x+1,y+1).
+        """
+        # boundary edges, directed counterclockwise around the cells (cells
+        # on the left), keyed by start corner:
+        edges = {}
+        for x, y in cells:
+            if (x, y - 1) not in cells:
+                edges.setdefault((x, y), []).append((+1, 0))
+            if (x + 1, y) not in cells:
+                edges.setdefault((x + 1, y), []).append((0, +1))
+            if (x, y + 1) not in cells:
+                edges.setdefault((x + 1, y + 1), []).append((-1, 0))
+            if (x - 1, y) not in cells:
+                edges.setdefault((x, y + 1), []).append((0, -1))
+        loops = []
+        while edges:
+            # the lowest, leftmost corner remaining is a loop corner:
+            start = min(edges, key=lambda (x, y): (y, x))
+            direction = edges[start][0]
+            points = [start]
+            corner = start
+            while True:
+                edges[corner].remove(direction)
+                if not edges[corner]:
+                    del edges[corner]
+                corner = (corner[0] + direction[0], corner[1] + direction[1])
+                if corner == start:
                     break
-            if new_direction != direction:
-                direction = new_direction
-                points.append((x * unit, height - y * unit))
-            x += direction[0]
-            y += direction[1]
-        return points
+                # prefer a right turn, then straight on, then a left turn:
+                dx, dy = direction
+                for new_direction in ((dy, -dx), (dx, dy), (-dy, dx)):
+                    if new_direction in edges.get(corner, ()):
+                        break
+                if new_direction != direction:
+                    direction = new_direction
+                    points.append(corner)
+            loops.append(points)
+        return loops
 
     def get_piece_cells(self, s_matrix, x, y):
         cell_content = s_matrix[y][x]
         coord = self.coord_class((x, y))
         cells = set([coord])
         if cell_content != '0':
-            self._get_piece_cells(cells, coord, s_matrix, cell_content)
+            unexplored = [coord]
+            while unexplored:
+                for neighbor in unexplored.pop().neighbors():
+                    x, y = neighbor
+                    if ( neighbor not in cells
+                         and s_matrix[y][x] == cell_content):
+                        cells.add(neighbor)
+                        unexplored.append(neighbor)
         return cells
 
-    def _get_piece_cells(self, cells, coord, s_matrix, cell_content):
-        for neighbor in coord.neighbors():
-            x, y = neighbor
-            if neighbor not in cells and s_matrix[y][x] == cell_content:
-                cells.add(neighbor)
-                self._get_piece_cells(cells, neighbor, s_matrix, cell_content)
-
     def format_coords_svg(self, piece_name='0'):
         s_matrix = self.empty_solution_matrix(margin=self.margin)
         for x, y in self.solution_coords:
@@ -864,14 +1310,17 @@ class Puzzle3D(Puzzle):
     def build_regular_matrix(self, keys, solution_coords=None):
         if solution_coords is None:
             solution_coords = self.solution_coords
+        board = frozenset(solution_coords)
         for key in keys:
             for coords, aspect in self.pieces[key]:
-                for z in range(self.depth - aspect.bounds[2]):
-                    for y in range(self.height - aspect.bounds[1]):
-                        for x in range(self.width - aspect.bounds[0]):
-                            translated = aspect.translate((x, y, z))
-                            if translated.issubset(solution_coords):
-                                self.build_matrix_row(key, translated)
+                for translated in self.placements(coords, aspect, board):
+                    self.build_matrix_row(key, translated)
+
+    def translations(self, aspect):
+        for z in range(self.depth - aspect.bounds[2]):
+            for y in range(self.height - aspect.bounds[1]):
+                for x in range(self.width - aspect.bounds[0]):
+                    yield aspect.translate((x, y, z))
 
     def build_matrix_row(self, name, coords):
         row = [0] * len(self.matrix[0])
@@ -1038,16 +1487,10 @@ class PuzzlePseudo3D(Puzzle3D, Puzzle2D):
 
     """The Z dimension is used for direction/orientation."""
 
-    def build_regular_matrix(self, keys, solution_coords=None):
-        if solution_coords is None:
-            solution_coords = self.solution_coords
-        for key in keys:
-            for coords, aspect in self.pieces[key]:
-                for x in range(self.width - aspect.bounds[0]):
-                    for y in range(self.height - aspect.bounds[1]):
-                        translated = aspect.translate((x, y, 0))
-                        if translated.issubset(solution_coords):
-                            self.build_matrix_row(key, translated)
+    def translations(self, aspect):
+        for x in range(self.width - aspect.bounds[0]):
+            for y in range(self.height - aspect.bounds[1]):
+                yield aspect.translate((x, y, 0))
 
     def empty_solution_matrix(self, margin=0):
         s_matrix = [[[self.empty_cell] * (self.width + 2 * margin)
@@ -1072,6 +1515,12 @@ class PuzzlePseudo3D(Puzzle3D, Puzzle2D):
 
     format_svg = Puzzle2D.format_svg
 
+    format_thin_svg = Puzzle.format_thin_svg
+
+    def format_svg_placements(self, solution):
+        return self.format_svg_shapes(
+            self.build_solution_matrix(solution, margin=1))
+
     def format_x3d(self, solution=None, s_matrix=None):
         raise NotImplementedError
 
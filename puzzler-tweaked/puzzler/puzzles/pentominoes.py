@@ -181,6 +181,8 @@ class Pentominoes3x20Tube(Pentominoes):
         self.piece_data['F'][-1]['flips'] = None
 
     def build_matrix(self):
+        # build into a temporary list, to eliminate duplicate rows:
+        matrix, self.matrix = self.matrix, [self.matrix[0]]
         keys = sorted(self.pieces.keys())
         x_coords, x_aspect = self.pieces['X'][0]
         for x in (1, 6):
@@ -194,7 +196,25 @@ class Pentominoes3x20Tube(Pentominoes):
                         translated = aspect.translate((x, y), (0, self.height))
                         self.build_matrix_row(key, translated)
         # eliminate duplicate rows (due to wrapping):
-        self.matrix[1:] = sorted(set(self.matrix[1:]))
+        rows = sorted(set(self.matrix[1:]))
+        self.matrix = matrix
+        for row in rows:
+            self.matrix.append(row)
+
+
+class Pentominoes10x14Sonnet(Pentominoes):
+
+    """
+    A sonnet grid (14 lines of 10 syllables) filled with 28 pentominoes:
+    each pentomino is used two or three times.
+    Many solutions; no symmetry restrictions.
+    """
+
+    height = 14
+    width = 10
+
+    piece_multiplicities = dict(
+        (name, (2, 3)) for name in Pentominoes.piece_data)
 
 
 class Pentominoes8x8CenterHole(Pentominoes):
@@ -231,6 +231,9 @@ class PentacubesPlus(Pentacubes):
         else:
             return formatted
 
+    def normalize_piece_name(self, name):
+        return name.replace('J35', 'L35')
+
 
 class NonConvexPentacubes(Pentacubes):
 
@@ -14,7 +14,7 @@ import math
 import collections
 
 from puzzler import coordsys
-from puzzler.puzzles import Puzzle2D, OneSidedLowercaseMixin
+from puzzler.puzzles import Puzzle, Puzzle2D, OneSidedLowercaseMixin
 
 
 class Polyhexes(Puzzle2D):
@@ -240,6 +240,12 @@ class Polyhexes(Puzzle2D):
         width = (self.width + self.height / 2.0 + 2) * self.svg_unit_width
         return height, width
 
+    def format_svg_placements(self, solution):
+        return self.format_svg_shapes(
+            self.build_solution_matrix(solution, margin=1))
+
+    format_thin_svg = Puzzle.format_thin_svg
+
     def build_svg_shape(self, s_matrix, x, y):
         """
         Return an SVG shape definition for the shape at (x,y), and erase the
@@ -34,6 +34,9 @@ class Polyominoes(Puzzle2D):
         else:
             return formatted
 
+    def normalize_piece_name(self, name):
+        return name.upper()
+
     def format_coords(self):
         s_matrix = self.empty_solution_matrix()
         for x, y in self.solution_coords:
@@ -316,6 +319,10 @@ class HexominoesPlus(Hexominoes):
         else:
             return formatted
 
+    def normalize_piece_name(self, name):
+        return Hexominoes.normalize_piece_name(self, name).replace(
+            'S16', 'N06')
+
 
 class Cornucopia(Hexominoes):
 
@@ -234,6 +234,9 @@ class Polysticks(PuzzlePseudo3D):
         else:
             return formatted
 
+    def normalize_piece_name(self, name):
+        return name.upper()
+
     def build_solution_matrices(self, solution,
                                 xy_swapped=False, rotation=False, margin=0):
         h_matrix = [[' '] * (self.width + 2 * margin)
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Concrete product puzzles: puzzles stacked from parts solved separately (see
+`puzzler.product`).
+"""
+
+from puzzler.product import PuzzleProduct
+from puzzler.puzzles.pentominoes import Pentominoes6x10
+from puzzler.puzzles.polyominoes45 import Polyominoes45_8x10
+
+
+class Polyominoes45Sonnet10x14(PuzzleProduct):
+
+    """
+    A sonnet grid: an 8x10 octave (pentominoes & tetrominoes) stacked on a
+    6x10 sestet (pentominoes).
+    """
+
+    parts = (Polyominoes45_8x10, Pentominoes6x10)
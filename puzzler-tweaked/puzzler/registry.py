@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Lazy registry of puzzle classes by name.
+
+Puzzle classes are looked up in a precomputed index (the generated
+`puzzler.puzzle_index` module, mapping class names to module names), so
+that only the module defining a puzzle (and the modules it imports) need be
+imported to solve it::
+
+    python -m puzzler solve Pentominoes6x10 -n 1
+
+The index is built from the source of the `puzzler.puzzles` modules
+(without importing them).  Rebuild it after adding or renaming puzzle
+classes::
+
+    python -m puzzler index
+
+Until it is rebuilt, classes missing from the index are found by scanning
+the source (slower).
+"""
+
+import os
+import sys
+import fnmatch
+import optparse
+
+import puzzler
+from puzzler.utils import thousands
+
+
+package_name = 'puzzler.puzzles'
+"""The package containing the puzzle modules."""
+
+index_module_name = 'puzzler.puzzle_index'
+"""The generated index module."""
+
+root_class_name = 'Puzzle'
+"""The name of the base class of all puzzles (in `package_name`)."""
+
+startup_budget = 0.25
+"""The startup time budget (seconds) of a solver process: interpreter
+startup, plus importing & instantiating a puzzle class (matrix not
+built).  Checked by the benchmark suite."""
+
+_index = None
+
+
+def package_directory():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'puzzles')
+
+def index_path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        index_module_name.split('.')[-1] + '.py')
+
+def build_index(directory=None):
+    """
+    Return a dictionary mapping puzzle class names to module names, from
+    the source of the modules in `directory` (default: the `package_name`
+    package directory).  Abstract puzzle base classes are included.
+    """
+    # imported here, only needed when the index is missing or stale:
+    import ast
+    directory = directory or package_directory()
+    bases = {}
+    modules = {}
+    for file_name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(file_name)
+        if ext != '.py':
+            continue
+        if stem == '__init__':
+            module_name = package_name
+        else:
+            module_name = '%s.%s' % (package_name, stem)
+        path = os.path.join(directory, file_name)
+        tree = ast.parse(open(path, 'rU').read(), path)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                modules[node.name] = module_name
+                bases[node.name] = [base_name(base) for base in node.bases]
+    # a puzzle class is a (direct or indirect) subclass of the root class:
+    puzzles = set([root_class_name])
+    found = True
+    while found:
+        found = False
+        for name, names in bases.items():
+            if name not in puzzles and puzzles.intersection(names):
+                puzzles.add(name)
+                found = True
+    return dict((name, modules[name]) for name in puzzles if name in modules)
+
+def base_name(node):
+    """Return the (unqualified) class name of base class expression `node`."""
+    import ast
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+def write_index(index, path=None):
+    """Write `index` as a Python module (default: the index module)."""
+    path = path or index_path()
+    lines = [
+        '# $Id$',
+        '# Generated by "python -m puzzler index"; do not edit.',
+        '',
+        '"""Puzzle class names mapped to the names of their modules."""',
+        '',
+        'modules = {']
+    for name in sorted(index):
+        lines.append('    %r: %r,' % (name, index[name]))
+    lines.extend(['}', ''])
+    index_file = open(path, 'w')
+    try:
+        index_file.write('\n'.join(lines))
+    finally:
+        index_file.close()
+
+def load_index():
+    """
+    Return the puzzle class index (class name: module name), from the index
+    module if possible, otherwise from the source.
+    """
+    global _index
+    if _index is None:
+        try:
+            module = __import__(index_module_name, {}, {}, ['modules'])
+            _index = module.modules
+        except ImportError:
+            _index = build_index()
+    return _index
+
+def find(name):
+    """
+    Return the name of the module defining puzzle class `name`.  Raise
+    `puzzler.ApplicationError` if there's no such puzzle class.
+    """
+    global _index
+    index = load_index()
+    if name not in index:
+        # the index may be stale:
+        _index = index = build_index()
+    if name not in index:
+        import difflib
+        message = 'Unknown puzzle: "%s".' % name
+        matches = difflib.get_close_matches(name, index.keys())
+        if matches:
+            message += '  Did you mean %s?' % ', '.join(
+                '"%s"' % match for match in matches)
+        raise puzzler.ApplicationError(message)
+    return index[name]
+
+def load(name):
+    """Import & return the puzzle class `name`."""
+    global _index
+    module_name = find(name)
+    module = __import__(module_name, {}, {}, [name])
+    if not hasattr(module, name):
+        # stale index; the class has moved:
+        _index = build_index()
+        module = __import__(find(name), {}, {}, [name])
+    return getattr(module, name)
+
+def check_solvable(puzzle_class):
+    """
+    Raise `puzzler.ApplicationError` if `puzzle_class` looks like an
+    abstract base class: a component has no solution space.
+    """
+    try:
+        for component in puzzle_class.components():
+            if not component(init_puzzle=False).solution_coords:
+                raise NotImplementedError
+    except NotImplementedError:
+        raise puzzler.ApplicationError(
+            '"%s" is not a solvable puzzle (it is an abstract base class).'
+            % puzzle_class.__name__)
+
+def startup_time(name, repeat=5):
+    """
+    Return the time (in seconds; the best of `repeat` runs) taken by a new
+    Python process to import puzzle class `name` via the registry and
+    instantiate it without building its matrix.
+    """
+    import time
+    import subprocess
+    code = ('from puzzler import registry; '
+            'registry.load(%r)(init_puzzle=False)' % name)
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [directory] + filter(None, [environment.get('PYTHONPATH')]))
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        status = subprocess.call([sys.executable, '-c', code],
+                                 env=environment)
+        elapsed = time.time() - start
+        if status:
+            raise puzzler.ApplicationError(
+                'Startup of "%s" failed (exit status %s).' % (name, status))
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def solve_command(argv, output_stream, prog=None):
+    parser = puzzler.option_parser()
+    parser.prog = prog
+    parser.usage = '%prog solve [options] PUZZLE'
+    parser.description = (
+        'Solve PUZZLE (a puzzle class name, e.g. "Pentominoes6x10"), '
+        'importing only the module that defines it.')
+    # each puzzle gets its own default search state file:
+    default_state_file = object()
+    parser.set_defaults(search_state_file=default_state_file)
+    parser.get_option('-S').help = (
+        'Use FILE for automatic search state save & restore.  '
+        'Default: "PUZZLE.state".')
+    settings, args = parser.parse_args(argv)
+    if len(args) != 1:
+        parser.error('a single puzzle class name is required')
+    if settings.search_state_file is default_state_file:
+        settings.search_state_file = '%s.state' % args[0]
+    puzzle_class = load(args[0])
+    check_solvable(puzzle_class)
+    return puzzler.run(puzzle_class, output_stream, settings)
+
+def list_command(argv, output_stream, prog=None):
+    parser = optparse.OptionParser(
+        prog=prog, usage='%prog list [PATTERN ...]',
+        description=(
+            'List the puzzle classes (and their modules) whose names match '
+            'any of the shell-style wildcard PATTERNs (default: all).'))
+    settings, patterns = parser.parse_args(argv)
+    index = load_index()
+    for name in sorted(index):
+        if not patterns or [pattern for pattern in patterns
+                            if fnmatch.fnmatchcase(name, pattern)]:
+            print >>output_stream, '%s %s' % (name, index[name])
+
+def index_command(argv, output_stream, prog=None):
+    parser = optparse.OptionParser(
+        prog=prog, usage='%prog index',
+        description='Rebuild the puzzle class index module.')
+    settings, args = parser.parse_args(argv)
+    if args:
+        parser.error('no arguments are allowed')
+    index = build_index()
+    path = index_path()
+    write_index(index, path)
+    print >>output_stream, '%s puzzle class%s indexed in %s' % (
+        thousands(len(index)), ('es', '')[len(index) == 1], path)
+
+commands = {
+    'solve': solve_command,
+    'list': list_command,
+    'index': index_command,}
+"""Mapping of command names to command functions."""
+
+def main(argv=None, output_stream=sys.stdout, prog=None):
+    """
+    Run the command in `argv` (default: the command line).  `prog` is the
+    program name for usage messages.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    prog = prog or os.path.basename(sys.argv[0])
+    if not argv or argv[0] not in commands:
+        print >>sys.stderr, (
+            'Usage: %s COMMAND [options] [arguments]\n\n'
+            'Commands: %s.  Use "COMMAND --help" for details.'
+            % (prog, ', '.join(sorted(commands))))
+        sys.exit(2)
+    try:
+        return commands[argv[0]](argv[1:], output_stream, prog)
+    except puzzler.ApplicationError, error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
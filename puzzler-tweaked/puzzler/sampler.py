@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Random sampling of exact cover solutions, without full enumeration.
+
+A sample is found by a weighted random descent of the Algorithm X search
+tree: at each node, a row of the most constrained column is chosen with
+probability proportional to the (estimated) number of solutions below it.
+The probability of the whole descent is known, so each sample comes with an
+importance weight: 1/probability, an unbiased estimate of the total number of
+solutions [1]_.
+
+Subtree sizes are either estimated by random probes (Knuth's estimator), or
+counted exactly (a memoized count of every subproblem: a counting structure,
+practical for smaller puzzles).  With exact counts, the samples are exactly
+uniform and the weights are all equal to the solution count.  With
+estimates, the weighted samples can be resampled in proportion to their
+weights (sampling-importance-resampling: one sample drawn from each pool of
+weighted samples), which is only approximately uniform.  The bias shrinks
+as the pool grows (roughly in proportion to 1/pool size) and as the
+estimates improve (more probes); exact counts have none.
+
+.. [1] Donald E. Knuth, "Estimating the Efficiency of Backtrack Programs",
+   Mathematics of Computation 29 (1975).
+"""
+
+import random
+
+
+default_probes = 4
+"""The default number of random probes per subtree estimate."""
+
+default_exact_columns = 40
+"""The default size (primary columns) of subproblems counted exactly."""
+
+max_counts = 2000000
+"""The maximum number of memoized subproblem counts kept."""
+
+default_pool = 10
+"""The default number of weighted samples drawn per uniform sample."""
+
+
+class Sampler(object):
+
+    """
+    Draws random solutions from an `exact_cover_x2.ExactCover` object with
+    a loaded matrix (without counted columns).
+    """
+
+    def __init__(self, solver, rng=None, probes=default_probes,
+                 exact_columns=default_exact_columns):
+        """
+        `rng` is a `random.Random` object (for reproducible samples).
+        `probes` is the number of random probes per subtree estimate; 0 for
+        exact subtree counts throughout.  Subproblems with at most
+        `exact_columns` primary columns remaining are always counted
+        exactly.
+        """
+        if solver.multiplicities:
+            raise ValueError('Sampling does not support counted columns.')
+        self.solver = solver
+        self.rng = rng or random.Random()
+        self.probes = probes
+        self.exact_columns = exact_columns
+        self.counts = {}
+        """Memoized exact subproblem solution counts, keyed by the set of
+        remaining columns."""
+
+        self.uniform_share = 0.1
+        """The share of the uniform choice in estimated branch weights."""
+
+        self.num_dead_ends = 0
+
+    def choose_column(self):
+        """
+        Return the primary column with the fewest rows (the first in name
+        order), or None if no primary columns remain.
+        """
+        columns = self.solver.columns
+        secondary = self.solver.secondary_columns
+        best = None
+        for column in columns:
+            if column in secondary:
+                continue
+            candidate = (len(columns[column]), column)
+            if best is None or candidate < best:
+                best = candidate
+        return best and best[1]
+
+    def is_small(self):
+        """Return True if the current subproblem is to be counted exactly."""
+        if not self.probes:
+            return True
+        secondary = self.solver.secondary_columns
+        remaining = len([column for column in self.solver.columns
+                         if column not in secondary])
+        return remaining <= self.exact_columns
+
+    def count(self):
+        """Return the exact number of solutions of the current subproblem."""
+        key = frozenset(self.solver.columns)
+        try:
+            return self.counts[key]
+        except KeyError:
+            pass
+        solver = self.solver
+        c = self.choose_column()
+        if c is None:
+            total = 1
+        else:
+            total = 0
+            for r in sorted(solver.columns[c]):
+                covered = solver.cover(r)
+                total += self.count()
+                solver.uncover(r, covered)
+        if len(self.counts) >= max_counts:
+            self.counts.clear()
+        self.counts[key] = total
+        return total
+
+    def probe(self):
+        """
+        Return a Knuth estimate of the number of solutions of the current
+        subproblem, from one random descent (down to a small subproblem,
+        which is counted exactly).
+        """
+        solver = self.solver
+        stack = []
+        estimate = 1
+        while True:
+            if self.is_small():
+                estimate *= self.count()
+                break
+            c = self.choose_column()
+            rows = solver.columns[c]
+            if not rows:
+                estimate = 0
+                break
+            estimate *= len(rows)
+            r = self.rng.choice(sorted(rows))
+            stack.append((r, solver.cover(r)))
+        while stack:
+            solver.uncover(*stack.pop())
+        return estimate
+
+    def estimate(self):
+        """
+        Return a 2-tuple: the (estimated) number of solutions below this node,
+        and a flag, true if the number is exact.
+        """
+        if self.is_small():
+            return self.count(), True
+        return (float(sum(self.probe() for i in range(self.probes)))
+                / self.probes), False
+
+    def mix(self, estimates, exact):
+        """
+        Return branch weights from subtree `estimates` (with `exact` flags):
+        a defensive mixture with a uniform choice among the estimated
+        branches, so that no branch with solutions has zero probability
+        (probes often miss sparse solutions).  Exact counts are used as is.
+        """
+        uncertain = exact.count(False)
+        if not uncertain:
+            return estimates
+        total = float(sum(estimates))
+        if total:
+            share = self.uniform_share
+            weights = [(1 - share) * estimate / total
+                       for estimate in estimates]
+        else:
+            share = 1.0
+            weights = [0.0] * len(estimates)
+        for i, is_exact in enumerate(exact):
+            if not is_exact:
+                weights[i] += share / uncertain
+        return weights
+
+    def descend(self):
+        """
+        Make one weighted random descent.  Return a (solution, weight) pair,
+        or None for a dead end (not with exact counts).
+        """
+        solver = self.solver
+        stack = []
+        probability = 1.0
+        try:
+            while True:
+                c = self.choose_column()
+                if c is None:
+                    solution = [sorted(solver.rows[r]) for r, covered in stack]
+                    break
+                solver.num_searches += 1
+                rows = sorted(solver.columns[c])
+                estimates = []
+                exact = []
+                for r in rows:
+                    covered = solver.cover(r)
+                    estimate, is_exact = self.estimate()
+                    solver.uncover(r, covered)
+                    estimates.append(estimate)
+                    exact.append(is_exact)
+                weights = self.mix(estimates, exact)
+                total = sum(weights)
+                if not total:
+                    self.num_dead_ends += 1
+                    return None
+                i = weighted_choice(self.rng, weights, total)
+                probability *= weights[i] / float(total)
+                stack.append((rows[i], solver.cover(rows[i])))
+        finally:
+            while stack:
+                solver.uncover(*stack.pop())
+        if self.probes:
+            return solution, 1.0 / probability
+        else:
+            # exact counts: every solution is equally likely
+            return solution, self.count()
+
+    def weighted_samples(self, max_dead_ends=1000):
+        """
+        A generator that produces (solution, weight) pairs indefinitely.
+        Stops if there are no solutions, or after `max_dead_ends`
+        consecutive dead ends.
+        """
+        if not self.probes and not self.count():
+            return
+        dead_ends = 0
+        while dead_ends < max_dead_ends:
+            sample = self.descend()
+            if sample is None:
+                dead_ends += 1
+                continue
+            dead_ends = 0
+            yield sample
+
+    def uniform_samples(self, pool=default_pool):
+        """
+        A generator that produces solutions, uniformly distributed: exactly
+        with exact counts; approximately with estimates, by resampling
+        batches of `pool` weighted samples in proportion to their weights
+        (a larger pool reduces the bias, at proportional cost).
+        """
+        weighted = self.weighted_samples()
+        if not self.probes:
+            for solution, weight in weighted:
+                yield solution
+            return
+        while True:
+            batch = []
+            for solution, weight in weighted:
+                batch.append((solution, weight))
+                if len(batch) >= pool:
+                    break
+            if not batch:
+                return
+            weights = [weight for solution, weight in batch]
+            i = weighted_choice(self.rng, weights, sum(weights))
+            yield batch[i][0]
+
+
+def weighted_choice(rng, weights, total):
+    """
+    Return a random index into `weights` (non-negative numbers totalling
+    `total`), chosen with probability proportional to the weight.
+    """
+    point = rng.random() * total
+    last = None
+    for i, weight in enumerate(weights):
+        if weight:
+            if point < weight:
+                return i
+            point -= weight
+            last = i
+    # rounding error: the last non-zero weight
+    return last
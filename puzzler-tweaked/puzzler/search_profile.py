@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Search profiles: where an exact cover search spends its nodes.
+
+When a `SearchProfile` is attached to a solver (its ``profile`` attribute;
+the "x2" & "dlx" algorithms), the solver reports each search node: its
+depth (level), the column chosen to branch on (a cell or a piece), and the
+number of candidate rows in that column.  Per level, the profile counts the
+nodes, the candidate rows, and the dead ends (nodes without candidates),
+and how often each column was chosen.  With a `sample` interval N, only
+every Nth node is reported, reducing the overhead; the counts are then
+estimates (scaled by N).
+
+The profile is part of the session state (it survives an interrupted &
+resumed session), and a cumulative snapshot is appended to a JSON-lines
+file at each session checkpoint and at the end of each puzzle component.
+The report command summarizes the latest snapshot of each component,
+including the effective branching factor per level (the ratio of the node
+counts of successive levels)::
+
+    python -m puzzler.search_profile profile.jsonl
+"""
+
+import sys
+import json
+import time
+import optparse
+
+import puzzler
+from puzzler.utils import thousands
+
+
+class SearchProfile(object):
+
+    """Per-level search node statistics of one puzzle component at a time."""
+
+    def __init__(self, path, sample=1):
+        self.path = path
+        """The JSON-lines output file path."""
+
+        self.sample = sample
+        """The sampling interval: every Nth search node is reported."""
+
+        self.component = None
+        """The name of the puzzle component being profiled."""
+
+        self.reset()
+
+    def reset(self, solver=None):
+        self.start_searches = solver and solver.num_searches or 0
+        """The solver's search count at the start of the component."""
+
+        self.start_solutions = solver and solver.num_solutions or 0
+        """The solver's solution count at the start of the component."""
+
+        self.nodes = []
+        """The number of nodes reported at each level."""
+
+        self.candidates = []
+        """The total number of candidate rows of the nodes at each level."""
+
+        self.dead_ends = []
+        """The number of nodes without candidate rows at each level."""
+
+        self.columns = []
+        """A mapping of column names to the number of times chosen, for each
+        level."""
+
+    def start(self, component, solver):
+        """
+        Start profiling `component` (a puzzle class name) solved by `solver`.
+        The counts of a resumed component are kept.
+        """
+        if component != self.component:
+            self.component = component
+            self.reset(solver)
+
+    def node(self, level, column, candidates):
+        """
+        Count a search node at `level`, branching on `column` with
+        `candidates` candidate rows.  Called by the solvers.
+        """
+        while len(self.nodes) <= level:
+            self.nodes.append(0)
+            self.candidates.append(0)
+            self.dead_ends.append(0)
+            self.columns.append({})
+        self.nodes[level] += 1
+        self.candidates[level] += candidates
+        if not candidates:
+            self.dead_ends[level] += 1
+        choices = self.columns[level]
+        choices[column] = choices.get(column, 0) + 1
+
+    def snapshot(self, solver, final=False):
+        """Return a record (a dictionary) of the current counts."""
+        # copies first, as the solver may be running in another thread:
+        nodes = list(self.nodes)
+        candidates = list(self.candidates)
+        dead_ends = list(self.dead_ends)
+        # (JSON object keys must be strings; x2 column names may not be)
+        columns = [dict((str(column), count)
+                        for column, count in choices.items())
+                   for choices in list(self.columns)]
+        levels = []
+        for level in range(min(len(nodes), len(candidates), len(dead_ends),
+                               len(columns))):
+            levels.append({'nodes': nodes[level],
+                           'candidates': candidates[level],
+                           'dead_ends': dead_ends[level],
+                           'columns': columns[level]})
+        return {'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'component': self.component, 'final': final,
+                'sample': self.sample,
+                'searches': solver.num_searches - self.start_searches,
+                'solutions': solver.num_solutions - self.start_solutions,
+                'levels': levels}
+
+    def write(self, solver, final=False):
+        """Append a snapshot of the counts to the output file."""
+        record = self.snapshot(solver, final)
+        output = open(self.path, 'a')
+        try:
+            output.write(json.dumps(record, sort_keys=True) + '\n')
+        finally:
+            output.close()
+
+
+def read_profile(path):
+    """
+    Return a list of the latest records of each component in JSON-lines
+    profile file `path`, in order of first appearance.
+    """
+    latest = {}
+    order = []
+    input_file = open(path)
+    try:
+        for line_number, line in enumerate(input_file):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise puzzler.ApplicationError(
+                    '%s, line %s: not a profile record.'
+                    % (path, line_number + 1))
+            if record['component'] not in latest:
+                order.append(record['component'])
+            latest[record['component']] = record
+    finally:
+        input_file.close()
+    return [latest[component] for component in order]
+
+def format_report(record, top=3):
+    """
+    Return a report of profile `record` as a list of lines: per level, the
+    (estimated) nodes, dead ends, the average candidate rows of the live
+    nodes (those with candidates), the effective branching factor, and the
+    columns most often chosen.
+    """
+    sample = record['sample']
+    levels = record['levels']
+    lines = ['%s: %s solutions, %s searches%s%s' % (
+        record['component'], thousands(record['solutions']),
+        thousands(record['searches']), ('', ' (in progress)')[
+            not record['final']],
+        ('', ', sampled every %s nodes' % sample)[sample > 1])]
+    lines.append('%5s %14s %12s %9s %9s  %s' % (
+        'level', 'nodes', 'dead ends', 'rows/live', 'branching',
+        'columns chosen'))
+    for level, counts in enumerate(levels):
+        nodes = counts['nodes']
+        branching = '-'
+        if level + 1 < len(levels) and nodes:
+            branching = '%.2f' % (float(levels[level + 1]['nodes']) / nodes)
+        live = nodes - counts['dead_ends']
+        average = '-'
+        if live:
+            average = '%.2f' % (float(counts['candidates']) / live)
+        choices = sorted(counts['columns'].items(),
+                         key=lambda item: (-item[1], item[0]))
+        chosen = ', '.join(
+            '%s %.0f%%' % (column, 100.0 * count / nodes)
+            for column, count in choices[:top])
+        if len(choices) > top:
+            chosen += ', ...'
+        lines.append('%5s %14s %12s %9s %9s  %s' % (
+            level, thousands(nodes * sample),
+            thousands(counts['dead_ends'] * sample), average, branching,
+            chosen))
+    return lines
+
+def process_command_line(argv=None):
+    """Process command-line options; return (settings, args)."""
+    parser = optparse.OptionParser(
+        usage='%prog [options] PROFILE',
+        description=(
+            'Summarize a search profile (written by the solver "--profile" '
+            'option): per search level, the nodes, the dead ends, the average '
+            'candidate rows of the live nodes, the effective branching factor '
+            '(the ratio of the node counts of successive levels), and the '
+            'columns (cells or pieces) most often chosen.'))
+    parser.add_option(
+        '-c', '--component', metavar='NAME',
+        help='Report only on puzzle component NAME.  Default: all.')
+    parser.add_option(
+        '-n', '--top', type='int', metavar='N', default=3,
+        help='Show the N columns most often chosen per level.  Default: 3.')
+    settings, args = parser.parse_args(argv)
+    if len(args) != 1:
+        parser.error('a single profile file is required')
+    return settings, args
+
+def main(argv=None, output_stream=sys.stdout):
+    settings, (path,) = process_command_line(argv)
+    try:
+        records = read_profile(path)
+    except (puzzler.ApplicationError, IOError, KeyError), error:
+        print >>sys.stderr, 'Error: %s' % error
+        sys.exit(1)
+    if settings.component:
+        records = [record for record in records
+                   if record['component'] == settings.component]
+        if not records:
+            print >>sys.stderr, 'Error: component "%s" not found in %s.' % (
+                settings.component, path)
+            sys.exit(1)
+    for i, record in enumerate(records):
+        if i:
+            print >>output_stream
+        for line in format_report(record, settings.top):
+            print >>output_stream, line
+
+
+if __name__ == '__main__':
+    main()
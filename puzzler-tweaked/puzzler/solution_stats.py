@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see __init__.py)
+
+"""
+Statistics over the solution space, collected while solving: how often
+each piece covers each cell (a cell x piece heatmap), and in how many
+solutions each pair of pieces is adjacent.
+
+Per solution, only a counter per placement (matrix row id) and the
+adjacency of placement pairs (cached per pair) are updated; the heatmap is
+derived from the placement counters when the statistics are written.  The
+collector is part of the session state, so the counts survive an interrupted
+& resumed session.
+
+The statistics are written as CSV files (``PREFIX-heatmap.csv`` and
+``PREFIX-adjacency.csv``), or as a NumPy ``.npz`` archive (if the path ends
+with ".npz"; requires NumPy) with arrays "heatmap", "adjacency", "cells",
+"pieces", and "solutions".
+"""
+
+import csv
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import puzzler
+
+
+class SolutionStatistics(object):
+
+    """Collects piece/cell & adjacency statistics from solutions."""
+
+    write_interval = 60
+    """Minimum seconds between checkpoint writes."""
+
+    def __init__(self, path):
+        self.path = path
+        """The output path: a CSV file name prefix, or a ".npz" file."""
+
+        if path.lower().endswith('.npz') and numpy is None:
+            raise puzzler.ApplicationError(
+                'NumPy is required for ".npz" statistics output.')
+
+        self.row_ids = {}
+        """A mapping of placements (tuples of column names) to ids."""
+
+        self.rows = []
+        """A list of placements, indexed by id."""
+
+        self.placement_counts = []
+        """The number of solutions using each placement, indexed by id."""
+
+        self.adjacency_counts = {}
+        """A mapping of sorted (piece name, piece name) pairs to the number
+        of solutions in which the pieces are adjacent."""
+
+        self.num_solutions = 0
+        self.init_runtime()
+
+    def init_runtime(self):
+        self.pieces = set()
+        self.cells = {}
+        """A mapping of cell column names to coordinates."""
+
+        self.placement_info = {}
+        """A mapping of placement ids to (piece name, cell set, neighbor
+        set) triples, for adjacency tests."""
+
+        self.adjacent_pairs = {}
+        """A cache mapping (placement id, placement id) pairs to a flag."""
+
+        self.last_write = time.time()
+
+    def __getstate__(self):
+        # the runtime caches are rebuilt by `start`:
+        odict = self.__dict__.copy()
+        for name in ('pieces', 'cells', 'placement_info', 'adjacent_pairs',
+                     'last_write'):
+            del odict[name]
+        return odict
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.init_runtime()
+
+    def start(self, puzzle):
+        """
+        Prepare to collect the solutions of `puzzle` (an initialized puzzle
+        object): its pieces and cell coordinates.
+        """
+        self.pieces.update(puzzle.piece_data)
+        widths = (puzzle.x_width, puzzle.y_width, puzzle.z_width)
+        for coord in puzzle.solution_coords:
+            name = ','.join('%0*i' % (width, value)
+                            for width, value in zip(widths, coord))
+            self.cells[name] = coord
+        self.placement_info = {}
+        self.adjacent_pairs = {}
+
+    def add(self, solution):
+        """Count `solution`, a list of rows (lists of column names)."""
+        row_ids = self.row_ids
+        counts = self.placement_counts
+        ids = []
+        for row in solution:
+            key = tuple(sorted(row))
+            try:
+                r = row_ids[key]
+            except KeyError:
+                r = row_ids[key] = len(self.rows)
+                self.rows.append(key)
+                counts.append(0)
+            counts[r] += 1
+            ids.append(r)
+        self.num_solutions += 1
+        ids.sort()
+        adjacent_pairs = self.adjacent_pairs
+        adjacency_counts = self.adjacency_counts
+        seen = set()
+        for i, a in enumerate(ids):
+            for b in ids[i + 1:]:
+                try:
+                    pair = adjacent_pairs[a, b]
+                except KeyError:
+                    pair = adjacent_pairs[a, b] = self.adjacent_pieces(a, b)
+                if pair and pair not in seen:
+                    seen.add(pair)
+                    adjacency_counts[pair] = adjacency_counts.get(pair, 0) + 1
+
+    def placement(self, r):
+        """Return (piece name, cell set, neighbor set) of placement `r`."""
+        try:
+            return self.placement_info[r]
+        except KeyError:
+            pass
+        piece = None
+        cells = set()
+        neighbors = set()
+        for name in self.rows[r]:
+            if name in self.pieces:
+                piece = name
+            elif name in self.cells:
+                cells.add(self.cells[name])
+                neighbors.update(self.cells[name].neighbors())
+        info = self.placement_info[r] = (piece, cells, neighbors - cells)
+        return info
+
+    def adjacent_pieces(self, a, b):
+        """
+        Return the sorted piece name pair of placements `a` & `b` if they
+        are adjacent, or None.
+        """
+        piece_a, cells_a, neighbors_a = self.placement(a)
+        piece_b, cells_b, neighbors_b = self.placement(b)
+        if piece_a is None or piece_b is None or piece_a == piece_b:
+            return None
+        if neighbors_a & cells_b:
+            return tuple(sorted((piece_a, piece_b)))
+        return None
+
+    def tables(self):
+        """
+        Return (cell names, piece names, heatmap, adjacency): the heatmap is
+        a list of rows (one per cell) of solution counts per piece; the
+        adjacency is a symmetric list of rows of solution counts, one per
+        piece.
+        """
+        pieces = sorted(self.pieces)
+        piece_index = dict((name, i) for (i, name) in enumerate(pieces))
+        cells = sorted(self.cells)
+        cell_index = dict((name, i) for (i, name) in enumerate(cells))
+        heatmap = [[0] * len(pieces) for cell in cells]
+        for row, count in zip(self.rows, self.placement_counts):
+            piece = [name for name in row if name in piece_index]
+            if not piece:
+                continue
+            p = piece_index[piece[0]]
+            for name in row:
+                if name in cell_index:
+                    heatmap[cell_index[name]][p] += count
+        adjacency = [[0] * len(pieces) for piece in pieces]
+        for (a, b), count in self.adjacency_counts.items():
+            if a in piece_index and b in piece_index:
+                adjacency[piece_index[a]][piece_index[b]] = count
+                adjacency[piece_index[b]][piece_index[a]] = count
+        return cells, pieces, heatmap, adjacency
+
+    def checkpoint(self):
+        """Write the statistics if `write_interval` has passed."""
+        if time.time() - self.last_write >= self.write_interval:
+            self.write()
+
+    def write(self):
+        cells, pieces, heatmap, adjacency = self.tables()
+        if self.path.lower().endswith('.npz'):
+            numpy.savez(
+                self.path, heatmap=numpy.array(heatmap, dtype=numpy.int64),
+                adjacency=numpy.array(adjacency, dtype=numpy.int64),
+                cells=numpy.array(cells), pieces=numpy.array(pieces),
+                solutions=numpy.int64(self.num_solutions))
+        else:
+            write_csv('%s-heatmap.csv' % self.path, ['cell'] + pieces,
+                      cells, heatmap)
+            write_csv('%s-adjacency.csv' % self.path, ['piece'] + pieces,
+                      pieces, adjacency)
+        self.last_write = time.time()
+
+
+def write_csv(path, header, labels, rows):
+    output = open(path, 'wb')
+    try:
+        writer = csv.writer(output)
+        writer.writerow(header)
+        for label, row in zip(labels, rows):
+            writer.writerow([label] + row)
+    finally:
+        output.close()
@@ -12,20 +12,25 @@ Sudoku solver with support for front end applications.
 
 import sys
 import math
+import itertools
 import optparse
+import multiprocessing
 from datetime import datetime
 import puzzler
+from puzzler.utils import thousands, plural_s
 
 
 usage = '%prog [options] [<puzzle-file>]'
 
 description = """\
-9x9 Sudoku puzzle solver.  Supply a Sudoku starting position: either provide
-the name of the file containing the position (as <puzzle-file> above), or type
-in the starting position at the prompt.  Use periods (".") or zeros ("0") to
-represent empty squares in starting positions.  Starting positions must be
-either 9 lines of 9 columns, or all on one line, with or without spaces
-between digits.  See the README.txt file for details
+Sudoku puzzle solver (9x9 by default; see -s/--size).  Supply a Sudoku
+starting position: either provide the name of the file containing the
+position (as <puzzle-file> above), or type in the starting position at the
+prompt.  Use periods (".") or zeros ("0") to represent empty squares in
+starting positions.  Starting positions must be either 9 lines of 9 columns,
+or all on one line, with or without spaces between digits.  Values above 9
+are letters ("A" for 10 to "P" for 25) or numbers separated by spaces.  See
+the README.txt file for details
 (http://puzzler.sourceforge.net/README.html#sudoku).
 """
 
@@ -35,8 +40,9 @@ the starting position.  Omit the command-line argument or use "-" to read
 the starting position from standard input."""
 
 stdin_prompt = """
-Enter a 9x9 Sudoku starting position: either 9 lines of 9 columns
-or 1 big line, "." or "0" for empty squares, spaces optional.
+Enter a %(order)sx%(order)s Sudoku starting position: either %(order)s lines
+of %(order)s columns or 1 big line, "." or "0" for empty squares, spaces
+optional.
 Ctrl-D (on Linux/Mac), Ctrl-Z + Enter (on Windows) to end:
 """
 
@@ -58,35 +64,82 @@ def run_from_command_line(puzzle_class, output_stream=sys.stdout,
     """
     if settings is None:
         settings = process_command_line()
-    solve(puzzle_class, output_stream, settings)
+    if getattr(settings, 'size', None):
+        puzzle_class = puzzle_classes[settings.size]
+    if getattr(settings, 'batch', None):
+        solve_batch(puzzle_class, output_stream, settings)
+    else:
+        solve(puzzle_class, output_stream, settings)
 
 def process_command_line_options():
     """Process command-line options & return a settings object & args."""
     parser = optparse.OptionParser(
         formatter=optparse.TitledHelpFormatter(width=78),
         add_help_option=None, description=description, usage=usage)
-    choices = ('x2', 'dlx',)
+    choices = ('x2', 'dlx', 'propagation')
     parser.add_option(
         '-a', '--algorithm', metavar='NAME', choices=choices,
-        default=choices[0],
-        help=('Choice of exact cover algorithm.  Choices: %s.'
-              % ('"%s" (default), "%s"'
-                 % (choices[0], '", "'.join(choices[1:])))))
+        help=('Choice of exact cover algorithm, or "propagation" for a '
+              'search with constraint propagation at every step (much '
+              'faster for large puzzles).  Choices: "%s".  Default: "x2" '
+              'up to 9x9, "propagation" for larger puzzles.'
+              % '", "'.join(choices)))
+    parser.add_option(
+        '-s', '--size', type='choice', metavar='N',
+        choices=[str(order) for order in sorted(puzzle_classes)],
+        help=('Solve NxN Sudoku puzzles.  Choices: %s.'
+              % ', '.join(str(order) for order in sorted(puzzle_classes))))
     parser.add_option(
         '-n', '--stop-after', type='int', metavar='N',
-        help='Stop processing after generating N solutions.')
+        help=('Stop processing after generating N solutions (per puzzle, with '
+              '-b/--batch; default 1 there, 2 to check uniqueness).'))
+    parser.add_option(
+        '-u', '--unique', action='store_true',
+        help=('Check uniqueness: stop at the second solution, and report '
+              '"unique", "multiple", or "none" (with -b/--batch, in place of '
+              'the solution count; "error" for unreadable lines).'))
+    parser.add_option(
+        '-P', '--no-propagation', dest='propagate', action='store_false',
+        default=True,
+        help=('Skip the constraint propagation stage (naked & hidden '
+              'singles) before the exact cover search.'))
+    parser.add_option(
+        '-r', '--box-line', action='store_true',
+        help=('Also apply box/line reductions in the constraint propagation '
+              'stage.'))
+    parser.add_option(
+        '-b', '--batch', action='store_true',
+        help=('Batch mode: solve many puzzles, one per line (e.g. "4.....8.5'
+              '.3......" in the magictour format), from <puzzle-file> or '
+              'standard input.  Writes one result line per puzzle: the '
+              'number of solutions found, a tab, and the first solution, '
+              'all on one line.'))
+    parser.add_option(
+        '-j', '--processes', type='int', metavar='N', default=1,
+        help=('With -b/--batch, solve in N worker processes (0 for the '
+              'number of CPUs).  Default: %default.'))
     parser.add_option(
         '-h', '--help', help='Show this help message and exit.', action='help')
     settings, args = parser.parse_args()
+    if settings.size:
+        settings.size = int(settings.size)
     return settings, args
 
 def process_command_line():
     settings, args = process_command_line_options()
+    if settings.batch:
+        if len(args) > 1:
+            print >>sys.stderr, cmdline_problem_text % (sys.argv[0])
+            sys.exit(1)
+        settings.batch_input = (args or ['-'])[0]
+        return settings
     if not args:
-        settings.start_position = read_start_position_from_stdin()
+        settings.start_position = read_start_position_from_stdin(
+            settings.size)
     elif len(args) == 1:
         if args[0] == '-':
-            settings.start_position = read_start_position_from_stdin()
+            settings.start_position = read_start_position_from_stdin(
+                settings.size)
         else:
             settings.start_position = read_start_position_from_file(args[0])
     else:
@@ -94,8 +147,8 @@ def process_command_line():
         sys.exit(1)
     return settings
 
-def read_start_position_from_stdin():
-    print >>sys.stderr, stdin_prompt
+def read_start_position_from_stdin(order=None):
+    print >>sys.stderr, stdin_prompt % {'order': order or 9}
     data = sys.stdin.read()
     return data
 
@@ -119,20 +172,38 @@ def read_start_position_from_file(name):
 def solve(puzzle_class, output_stream, settings):
     """Find and record all solutions to a puzzle.  Report on `output_stream`."""
     start = datetime.now()
-    puzzle = puzzle_class(settings.start_position)
-    solver = puzzler.exact_cover_modules[settings.algorithm].ExactCover(
-        puzzle.matrix)
+    puzzle = puzzle_class(settings.start_position,
+                          propagate=settings.propagate,
+                          box_line=settings.box_line)
+    algorithm = settings.algorithm or puzzle_class.default_algorithm
+    if algorithm == 'propagation':
+        solver = PropagationSolver(puzzle, settings.box_line)
+    else:
+        solver = puzzler.exact_cover_modules[algorithm].ExactCover()
+        solver.load_rows(puzzle.matrix_header, puzzle.matrix_rows)
+    stop_after = settings.stop_after
+    if settings.unique:
+        stop_after = 2
     try:
         try:
             print >>output_stream, ('solving %s:\n'
                                     % puzzle.__class__.__name__)
             print >>output_stream, puzzle.start_position, '\n'
+            if puzzle.contradiction:
+                print >>output_stream, (
+                    'propagation: contradiction found (no solution)\n')
+            elif settings.propagate:
+                print >>output_stream, (
+                    'propagation: %s of %s empty cell%s solved\n'
+                    % (puzzle.num_propagated, puzzle.num_empty,
+                       plural_s(puzzle.num_empty)))
             for solution in solver.solve():
                 puzzle.record_solution(
                     solution, solver, stream=output_stream)
-                if ( settings.stop_after
-                     and solver.num_solutions == settings.stop_after):
+                if stop_after and solver.num_solutions == stop_after:
                     break
+            if settings.unique:
+                print >>output_stream, uniqueness(solver.num_solutions)
         except KeyboardInterrupt:
             print >>output_stream, 'Session interrupted by user.'
             sys.exit(1)
@@ -145,6 +216,118 @@ def solve(puzzle_class, output_stream, settings):
                solver.num_searches, duration))
 
 
+def solve_batch(puzzle_class, output_stream, settings):
+    """
+    Solve the puzzles (one per line) of the "batch_input" file ("-" for
+    standard input), writing one result line per puzzle (see
+    `BaseMatrix.solve_line`) to `output_stream`, in order.  Blank lines are
+    skipped.  A summary is reported on standard error.
+    """
+    start = datetime.now()
+    if settings.batch_input == '-':
+        input_file = sys.stdin
+    else:
+        try:
+            input_file = open(settings.batch_input)
+        except IOError:
+            print >>sys.stderr, (
+                'Unable to open file "%s".' % settings.batch_input)
+            sys.exit(1)
+    lines = (line for line in input_file if line.strip())
+    limit = settings.stop_after or 1
+    if settings.unique:
+        limit = 2
+    processes = settings.processes
+    if processes == 0:
+        processes = multiprocessing.cpu_count()
+    algorithm = settings.algorithm or puzzle_class.default_algorithm
+    worker_args = (puzzle_class, algorithm, limit,
+                   settings.propagate, settings.box_line, settings.unique)
+    count = num_empty = num_propagated = 0
+    pool = None
+    try:
+        try:
+            if processes > 1:
+                pool = multiprocessing.Pool(
+                    processes, init_batch_worker, worker_args)
+                results = pool.imap(solve_batch_line, lines, chunksize=64)
+            else:
+                init_batch_worker(*worker_args)
+                results = itertools.imap(solve_batch_line, lines)
+            for result, empty, propagated in results:
+                print >>output_stream, result
+                count += 1
+                num_empty += empty
+                num_propagated += propagated
+            if pool:
+                pool.close()
+        except KeyboardInterrupt:
+            if pool:
+                pool.terminate()
+            print >>sys.stderr, 'Session interrupted by user.'
+            sys.exit(1)
+    finally:
+        if pool:
+            pool.join()
+        if input_file is not sys.stdin:
+            input_file.close()
+        output_stream.flush()
+        duration = datetime.now() - start
+        seconds = (duration.days * 86400 + duration.seconds
+                   + duration.microseconds / 1e6)
+        print >>sys.stderr, (
+            '%s puzzle%s, duration %s (%.0f per second)'
+            % (thousands(count), plural_s(count), duration,
+               count / (seconds or 1e-6)))
+        if settings.propagate:
+            print >>sys.stderr, (
+                'propagation: %s of %s empty cell%s solved'
+                % (thousands(num_propagated), thousands(num_empty),
+                   plural_s(num_empty)))
+
+batch_base_matrix = None
+"""The `BaseMatrix` of a batch worker process."""
+
+batch_settings = None
+
+def init_batch_worker(puzzle_class, algorithm, limit, propagate, box_line,
+                      unique):
+    global batch_base_matrix, batch_settings
+    batch_base_matrix = BaseMatrix(puzzle_class)
+    batch_settings = (algorithm, limit, propagate, box_line, unique)
+
+def solve_batch_line(line):
+    """
+    Solve one puzzle line in a batch worker process.  Return the result line
+    and the numbers of empty cells & of cells solved by propagation.
+    """
+    base = batch_base_matrix
+    num_empty, num_propagated = base.num_empty, base.num_propagated
+    result = base.solve_line(line, *batch_settings)
+    return (result, base.num_empty - num_empty,
+            base.num_propagated - num_propagated)
+
+
+def uniqueness(num_solutions):
+    """Return "none", "unique", or "multiple", for `num_solutions` found."""
+    return ('none', 'unique', 'multiple')[min(num_solutions, 2)]
+
+def cell_value(cell):
+    """
+    Return the value of a (non-empty) start position `cell`: a decimal
+    number, or a single letter ("A" for 10 to "Z" for 35).
+    """
+    if cell.isdigit():
+        return int(cell)
+    if len(cell) == 1 and cell.isalpha():
+        return int(cell, 36)
+    raise ValueError(cell)
+
+def cell_symbol(value):
+    """Return the single-character symbol of a cell `value` (1 to 35)."""
+    return '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'[value]
+
+
 class DataError(RuntimeError): pass
 
 
@@ -152,6 +335,9 @@ class Settings(object):
 
     algorithm = 'x2'
     stop_after = 0
+    unique = False
+    propagate = True
+    box_line = False
     start_position = ''
 
     def __init__(self, **keywordargs):
@@ -162,7 +348,14 @@ class Puzzle(object):
 
     empties = set(['.', '0'])
 
-    def __init__(self, start_position, init_puzzle=True):
+    default_algorithm = 'x2'
+
+    block_width = block_height = None
+    """The shape of the blocks; default: square blocks of side sqrt(order).
+    Subclasses with irregular blocks reimplement `init_coordinate_blocks`."""
+
+    def __init__(self, start_position, init_puzzle=True, propagate=False,
+                 box_line=False):
         self.start_position = start_position
         """Text specification of the Sudoku puzzle start position, a
         multi-line string.  For example, in a 4x4 puzzle, the start position
@@ -176,21 +369,55 @@ class Puzzle(object):
         The number of lines must equal the order of the puzzle, including
         blank lines.  The number of space-separated text columns must also
         equal the order of the puzzle.  Empty cells must contain a period (".")
-        or a zero ("0").
+        or a zero ("0").  Values above 9 are letters ("A" for 10, etc.; see
+        `cell_value`), or numbers if the columns are separated by spaces.
         """
 
         self.coordinate_blocks = {}
         """Mapping of (x,y) coordinates to puzzle block."""
 
-        self.matrix = []
-        """A list of lists; see ExactCover.load_matrix()."""
+        self.matrix_header = []
+        """The matrix column names."""
+
+        self.matrix_rows = []
+        """The matrix rows: lists of column indices (a sparse matrix; see
+        ExactCover.load_rows())."""
 
         self.matrix_columns = {}
-        """Mapping of `self.matrix` column names to indices."""
+        """Mapping of `self.matrix_header` column names to indices."""
+
+        self.propagate = propagate
+        """If true, solve what cells constraint propagation can before
+        building the matrix (see `Propagator`)."""
+
+        self.box_line = box_line
+        """If true, propagation also applies box/line reductions."""
+
+        self.candidates = None
+        """A list of candidate value bitmasks per cell (row-major order)
+        after propagation, or None."""
+
+        self.num_empty = self.num_propagated = 0
+        """The numbers of empty cells in the start position, and of those
+        solved by propagation."""
+
+        self.contradiction = False
+        """True if propagation proved that there is no solution."""
 
         if init_puzzle:
             self.init_puzzle()
 
+    @property
+    def matrix(self):
+        """The dense matrix: a list of lists; see ExactCover.load_matrix()."""
+        matrix = [self.matrix_header]
+        for columns in self.matrix_rows:
+            row = [0] * len(self.matrix_header)
+            for j in columns:
+                row[j] = 1
+            matrix.append(row)
+        return matrix
+
     def init_puzzle(self):
         """Initialize the puzzle matrix and data attributes."""
         self.build_matrix_header()
@@ -206,8 +433,8 @@ class Puzzle(object):
 
     def build_matrix_header(self):
         """
-        Create and populate the first row of `self.matrix`, a list of column
-        names.  Also populate the `self.matrix_columns` mapping.
+        Create and populate `self.matrix_header`, a list of column names.
+        Also populate the `self.matrix_columns` mapping.
         """
         headers = ['%ib%i' % (i, b) for b in range(self.order)
                    for i in range(1, self.order + 1)]
@@ -223,116 +450,138 @@ class Puzzle(object):
                 % (self.order ** 2 * 4, len(headers)))
         self.matrix_columns = dict((name, i)
                                    for (i, name) in enumerate(headers))
-        self.matrix.append(headers)
+        self.matrix_header = headers
 
     def init_coordinate_blocks(self):
         """Populate the `self.coordinate_blocks` mapping."""
-        block_size = math.sqrt(self.order)
-        # reimplement in subclasses if not a whole square:
-        if int(block_size) != block_size:
-            raise RuntimeError('self.order (== %i) must be a whole square'
-                               % self.order)
-        block_size = int(block_size)
+        if self.block_width:
+            width, height = self.block_width, self.block_height
+        else:
+            block_size = math.sqrt(self.order)
+            # set the block shape in subclasses if not a whole square:
+            if int(block_size) != block_size:
+                raise RuntimeError('self.order (== %i) must be a whole square'
+                                   % self.order)
+            width = height = int(block_size)
+        if width * height != self.order:
+            raise RuntimeError('%ix%i blocks do not fit a %ix%i puzzle'
+                               % (width, height, self.order, self.order))
+        blocks_across = self.order / width
         for x in range(self.order):
             for y in range(self.order):
-                block_id = x / block_size + block_size * (y / block_size)
+                block_id = x / width + blocks_across * (y / height)
                 self.coordinate_blocks[(x,y)] = block_id
 
     def build_matrix(self):
         """
-        Create and populate the data rows of `self.matrix`, lists of 0's and
-        1's (or other true values).
+        Create and populate `self.matrix_rows`, lists of the column indices of
+        each candidate (cell, value) pair.
         """
-        filled = self.build_matrix_rows_for_givens()
+        values = self.start_values()
+        self.num_empty = values.count(0)
+        if self.propagate:
+            propagator = Propagator(self.order, self.coordinate_blocks)
+            result = propagator.propagate(values, self.box_line)
+            if result is None:
+                # no solutions; the matrix of the start position shows it
+                self.contradiction = True
+            else:
+                values, self.candidates = result
+                self.num_propagated = self.num_empty - values.count(0)
+        filled = self.build_matrix_rows_for_givens(values)
         self.build_matrix_rows_for_unknowns(filled)
 
-    def build_matrix_rows_for_givens(self):
+    def start_values(self):
+        """
+        Return a list of the cell values of the start position, in row-major
+        order (top row first), 0 for empty cells.
         """
-        Append rows to `self.matrix` from cells in starting position.
+        self.normalize_start_position()
+        values = []
+        for line in self.start_position.splitlines():
+            for cell in line.split():
+                if cell in self.empties:
+                    values.append(0)
+                else:
+                    value = cell_value(cell)
+                    if not 1 <= value <= self.order:
+                        raise DataError('value out of range: %s' % cell)
+                    values.append(value)
+        return values
+
+    def build_matrix_rows_for_givens(self, values):
+        """
+        Append rows to `self.matrix_rows` from the given cell `values` (see
+        `start_values`).
 
         Return a set of IDs for the givens.
         """
-        num_cols_in_matrix = len(self.matrix[0])
         filled = set()
-        self.normalize_start_position()
-        lines = self.start_position.splitlines()
-        for y, line in enumerate(lines):
-            cells = line.split()
-            for x, cell in enumerate(cells):
-                if cell in self.empties:
+        for y in range(self.order):
+            for x in range(self.order):
+                value = values[y * self.order + x]
+                if not value:
                     continue
-                row = [0] * num_cols_in_matrix
-                value = int(cell)
                 block_id = '%ib%i' % (value, self.coordinate_blocks[(x,y)])
-                filled.add(block_id)
-                row[self.matrix_columns[block_id]] = 1
                 column_id = '%ic%i' % (value, x)
-                filled.add(column_id)
-                row[self.matrix_columns[column_id]] = 1
                 row_id = '%ir%i' % (value, y)
-                filled.add(row_id)
-                row[self.matrix_columns[row_id]] = 1
                 coord_id = '+%i,%i' % (x, y)
-                row[self.matrix_columns[coord_id]] = 1
-                filled.add(coord_id)
-                self.matrix.append(row)
+                names = (block_id, column_id, row_id, coord_id)
+                filled.update(names)
+                self.matrix_rows.append(
+                    [self.matrix_columns[name] for name in names])
         return filled
 
     def build_matrix_rows_for_unknowns(self, filled):
         """
-        Append rows to `self.matrix` for cells not in starting position.
+        Append rows to `self.matrix_rows` for cells not in starting position.
 
         `filled` is a set of IDs for the givens.
         """
-        num_cols_in_matrix = len(self.matrix[0])
-        for block in range(self.order):
-            for x in range(self.order):
-                for y in range(self.order):
-                    if self.coordinate_blocks[(x,y)] != block:
-                        continue
-                    coord_id = '+%i,%i' % (x, y)
-                    if coord_id in filled:
-                        continue
-                    for value in range(1, self.order + 1):
-                        block_id = '%ib%i' % (value,
-                                              self.coordinate_blocks[(x,y)])
-                        if block_id in filled:
-                            continue
-                        column_id = '%ic%i' % (value, x)
-                        if column_id in filled:
-                            continue
-                        row_id = '%ir%i' % (value, y)
-                        if row_id in filled:
-                            continue
-                        row = [0] * num_cols_in_matrix
-                        row[self.matrix_columns[block_id]] = 1
-                        row[self.matrix_columns[column_id]] = 1
-                        row[self.matrix_columns[row_id]] = 1
-                        row[self.matrix_columns[coord_id]] = 1
-                        self.matrix.append(row)
+        # cells in block order (then x, then y):
+        cells = sorted((block, x, y) for ((x, y), block)
+                       in self.coordinate_blocks.items())
+        for block, x, y in cells:
+            coord_id = '+%i,%i' % (x, y)
+            if coord_id in filled:
+                continue
+            if self.candidates:
+                mask = self.candidates[y * self.order + x]
+            else:
+                mask = ~0
+            for value in range(1, self.order + 1):
+                if not mask & (1 << (value - 1)):
+                    continue
+                block_id = '%ib%i' % (value, block)
+                if block_id in filled:
+                    continue
+                column_id = '%ic%i' % (value, x)
+                if column_id in filled:
+                    continue
+                row_id = '%ir%i' % (value, y)
+                if row_id in filled:
+                    continue
+                self.matrix_rows.append(
+                    [self.matrix_columns[name] for name in
+                     (block_id, column_id, row_id, coord_id)])
 
     def normalize_start_position(self):
         pos = self.start_position
         pos = pos.replace('-', '').replace('|', '').replace('+', '')
-        pos = pos.replace('0', '.')
-        lines = [line for line in pos.splitlines() if line]
+        lines = [line for line in pos.splitlines() if line.strip()]
         if len(lines) == 1:
-            line = lines[0].strip()
-            cells = line.split()
-            cells = list(''.join(cells))
+            cells = self.split_cells(lines[0], self.order ** 2)
             if len(cells) != self.order ** 2:
                 raise DataError(
-                    '1-line starting position: %i numbers found, %i expected'
-                    % (len(lines), self.order ** 2))
+                    '1-line starting position: %i cells found, %i expected'
+                    % (len(cells), self.order ** 2))
             self.start_position = (
                 '\n'.join(' '.join(cells[n:n+self.order])
                           for n in range(0, self.order ** 2, self.order)))
         elif len(lines) == self.order:
             new_lines = []
             for i, line in enumerate(lines):
-                cells = line.split()
-                if len(cells) != self.order:
-                    cells = list(''.join(cells))
+                cells = self.split_cells(line, self.order)
                 if len(cells) == self.order:
                     new_lines.append(' '.join(cells))
                 else:
@@ -343,6 +592,17 @@ class Puzzle(object):
             raise DataError('%i rows found, 1 or %i expected'
                             % (len(lines), self.order))
 
+    def split_cells(self, text, expected):
+        """
+        Return a list of the cells in `text`: space-separated, or (if there
+        aren't `expected` space-separated cells) single characters.  Zeros
+        are normalized to periods.
+        """
+        cells = text.split()
+        if len(cells) != expected:
+            cells = list(''.join(cells))
+        return [(cell == '0' and '.' or cell) for cell in cells]
+
     def record_solution(self, solution, solver, stream=sys.stdout, dated=False):
         formatted = self.format_solution(solution)
         solver.num_solutions += 1
@@ -351,6 +611,21 @@ class Puzzle(object):
         print >>stream, formatted
         print >>stream
 
+    def solution_rows(self, values):
+        """
+        Return the solution (a list of sorted matrix rows, as produced by
+        ExactCover.solve()) of completed cell `values` (row-major order).
+        """
+        rows = []
+        for y in range(self.order):
+            for x in range(self.order):
+                value = values[y * self.order + x]
+                rows.append(sorted(
+                    ['+%i,%i' % (x, y),
+                     '%ib%i' % (value, self.coordinate_blocks[(x,y)]),
+                     '%ic%i' % (value, x), '%ir%i' % (value, y)]))
+        return rows
+
     def format_solution(self, solution):
         matrix = [[0] * self.order for i in range(self.order)]
         for row in solution:
@@ -358,20 +633,457 @@ class Puzzle(object):
             x, y = [int(part) for part in coord_id[1:].split(',')]
             value = int(block_id.split('b')[0])
             matrix[y][x] = value
-        return '\n'.join([' '.join([str(cell) for cell in row])
+        return '\n'.join([' '.join([cell_symbol(cell) for cell in row])
                           for row in matrix])
 
 
+class Contradiction(DataError): pass
+
+
+class Propagator(object):
+
+    """
+    Constraint propagation on candidate sets (bitmasks: bit v - 1 stands for
+    value v), to solve cells before the exact cover search:
+
+    * naked singles: a cell with only one candidate value;
+    * hidden singles: a value with only one candidate cell in a row, column,
+      or block;
+    * optionally, box/line reductions: if the candidates for a value in a
+      block all lie in one row or column, the value is eliminated from the
+      rest of that row or column (and vice versa).
+
+    Every deduction is forced, so the solutions are unchanged; the matrix
+    just loses the rows & columns of the solved cells and of the eliminated
+    candidates.
+    """
+
+    def __init__(self, order, coordinate_blocks):
+        """`coordinate_blocks` maps (x,y) coordinates to puzzle blocks."""
+        n = self.order = order
+        self.full = (1 << n) - 1
+        self.num_searches = 0
+        lines = ([[y * n + x for x in range(n)] for y in range(n)]
+                 + [[y * n + x for y in range(n)] for x in range(n)])
+        blocks = {}
+        for (x, y), block in coordinate_blocks.items():
+            blocks.setdefault(block, []).append(y * n + x)
+        blocks = [sorted(cells) for (block, cells) in sorted(blocks.items())]
+        self.units = lines + blocks
+        """Lists of the cells of each row, column, & block."""
+
+        peers = [set() for i in range(n * n)]
+        for unit in self.units:
+            for i in unit:
+                peers[i].update(unit)
+        self.peers = [tuple(sorted(cells - set([i])))
+                      for (i, cells) in enumerate(peers)]
+        """The cells sharing a unit with each cell."""
+
+        self.intersections = []
+        """(block-only cells, line-only cells, common cells) for each block
+        & line that intersect."""
+
+        for block in blocks:
+            for line in lines:
+                common = set(block).intersection(line)
+                if common:
+                    self.intersections.append(
+                        (tuple(set(block) - common), tuple(set(line) - common),
+                         tuple(common)))
+
+    def propagate(self, values, box_line=False):
+        """
+        Return a 2-tuple: a copy of the cell `values` (a list in row-major
+        order, 0 for empty cells) with every cell that propagation can solve
+        filled in, and a list of candidate bitmasks per cell.  Return None if
+        propagation finds a contradiction (there is no solution).
+        """
+        values = list(values)
+        masks = [self.full] * len(values)
+        queue = []
+        for i, value in enumerate(values):
+            if value:
+                masks[i] = 1 << (value - 1)
+                queue.append(i)
+        if not self.run(values, masks, queue, box_line):
+            return None
+        return values, masks
+
+    def run(self, values, masks, queue, box_line=False):
+        """
+        Propagate the solved cells in `queue` (updating `values` & `masks` in
+        place) until no more deductions can be made.  Return False if there
+        is a contradiction.
+        """
+        try:
+            while True:
+                self.eliminate_solved(values, masks, queue)
+                self.hidden_singles(values, masks, queue)
+                if queue:
+                    continue
+                if box_line:
+                    self.box_line_reductions(values, masks, queue)
+                if not queue:
+                    break
+        except Contradiction:
+            return False
+        return True
+
+    def solutions(self, values, box_line=False):
+        """
+        A generator that produces the solutions (completed cell `values`) of
+        a puzzle: a depth-first search, trying each candidate of a cell with
+        the fewest candidates, with propagation after each choice.
+        """
+        result = self.propagate(values, box_line)
+        if result is None:
+            return
+        self.num_searches = 0
+        stack = [result + (None, 0)]
+        while stack:
+            values, masks, cell, bit = stack.pop()
+            if cell is not None:
+                values = list(values)
+                masks = list(masks)
+                masks[cell] = bit
+                values[cell] = bit.bit_length()
+                if not self.run(values, masks, [cell], box_line):
+                    continue
+            cell = None
+            fewest = self.order + 1
+            for i, mask in enumerate(masks):
+                if not values[i]:
+                    count = bin(mask).count('1')
+                    if count < fewest:
+                        cell, fewest = i, count
+                        if count == 2:
+                            break
+            if cell is None:
+                yield values
+                continue
+            self.num_searches += 1
+            bits = []
+            mask = masks[cell]
+            while mask:
+                bit = mask & -mask
+                bits.append(bit)
+                mask ^= bit
+            # try the smallest value first:
+            for bit in reversed(bits):
+                stack.append((values, masks, cell, bit))
+
+    def eliminate(self, i, bits, values, masks, queue):
+        """Remove `bits` from the candidates of cell `i`."""
+        mask = masks[i] & ~bits
+        if mask == masks[i]:
+            return
+        if not mask:
+            raise Contradiction
+        masks[i] = mask
+        if not mask & (mask - 1):
+            # naked single
+            values[i] = mask.bit_length()
+            queue.append(i)
+
+    def eliminate_solved(self, values, masks, queue):
+        """Remove the values of the queued solved cells from their peers."""
+        while queue:
+            i = queue.pop()
+            bit = masks[i]
+            for peer in self.peers[i]:
+                if masks[peer] & bit:
+                    self.eliminate(peer, bit, values, masks, queue)
+
+    def hidden_singles(self, values, masks, queue):
+        full = self.full
+        for unit in self.units:
+            seen = twice = 0
+            for i in unit:
+                mask = masks[i]
+                twice |= seen & mask
+                seen |= mask
+            if seen != full:
+                # a value with no place in this unit
+                raise Contradiction
+            once = full & ~twice
+            if not once:
+                continue
+            for i in unit:
+                bit = masks[i] & once
+                if bit and not values[i]:
+                    if bit & (bit - 1):
+                        # two values with this cell as their only place
+                        raise Contradiction
+                    masks[i] = bit
+                    values[i] = bit.bit_length()
+                    queue.append(i)
+
+    def box_line_reductions(self, values, masks, queue):
+        for block_only, line_only, common in self.intersections:
+            in_common = in_block = in_line = 0
+            for i in common:
+                in_common |= masks[i]
+            for i in block_only:
+                in_block |= masks[i]
+            for i in line_only:
+                in_line |= masks[i]
+            # values confined to the common cells within the block:
+            pointing = in_common & in_line & ~in_block
+            if pointing:
+                for i in line_only:
+                    self.eliminate(i, pointing, values, masks, queue)
+            # values confined to the common cells within the line:
+            claiming = in_common & in_block & ~in_line
+            if claiming:
+                for i in block_only:
+                    self.eliminate(i, claiming, values, masks, queue)
+
+
+class PropagationSolver(object):
+
+    """
+    Solves a `Puzzle` by search with propagation (see
+    `Propagator.solutions`), in place of an ExactCover object: produces
+    solutions in the same form, and counts solutions & searches.
+    """
+
+    def __init__(self, puzzle, box_line=False):
+        self.puzzle = puzzle
+        self.box_line = box_line
+        self.propagator = Propagator(puzzle.order, puzzle.coordinate_blocks)
+        self.num_solutions = 0
+
+    @property
+    def num_searches(self):
+        return self.propagator.num_searches
+
+    def solve(self):
+        """A generator that produces all solutions (lists of matrix rows)."""
+        values = self.puzzle.start_values()
+        for values in self.propagator.solutions(values, self.box_line):
+            yield self.puzzle.solution_rows(values)
+
+
+class BaseMatrix(object):
+
+    """
+    The compiled base matrix of a Sudoku puzzle class: a candidate row for
+    every (cell, value) pair, over integer column ids, built once.  Each
+    puzzle's matrix is derived from it by deleting the rows which conflict
+    with the puzzle's givens (and the columns the givens fill).
+
+    Column ids, for order n (0-based x, y, block, & value - 1 = v):
+
+    * block b has value: b * n + v
+    * column x has value: n**2 + x * n + v
+    * row y has value: 2 * n**2 + y * n + v
+    * cell (x, y) is filled: 3 * n**2 + y * n + x
+    """
+
+    def __init__(self, puzzle_class):
+        puzzle = puzzle_class('', init_puzzle=False)
+        puzzle.init_coordinate_blocks()
+        self.order = n = puzzle.order
+        self.empties = puzzle.empties
+        self.num_columns = 4 * n * n
+        self.propagator = Propagator(n, puzzle.coordinate_blocks)
+        self.cell_columns = {}
+        """Mapping of (x, y, value) to a tuple of column ids."""
+
+        self.cell_rows = []
+        """For each row of `self.rows`, its cell (index in row-major order)
+        and value bit (see `Propagator`)."""
+
+        self.num_empty = self.num_propagated = 0
+        """Totals over the puzzles solved: empty cells, and those solved by
+        propagation."""
+
+        self.rows = []
+        """A list of column id tuples, in the order of `Puzzle` rows."""
+
+        cells = sorted((block, x, y) for ((x, y), block)
+                       in puzzle.coordinate_blocks.items())
+        for block, x, y in cells:
+            for value in range(1, n + 1):
+                v = value - 1
+                columns = (block * n + v, n * n + x * n + v,
+                           2 * n * n + y * n + v, 3 * n * n + y * n + x)
+                self.cell_columns[x, y, value] = columns
+                self.rows.append(columns)
+                self.cell_rows.append((y * n + x, 1 << v))
+
+    def parse_line(self, line):
+        """
+        Return a list of cell values (0 for empty cells), from `line`: the
+        cells, top row first, as one character each, or separated by spaces.
+        """
+        n = self.order
+        tokens = line.replace('|', ' ').replace('+', ' ').replace(
+            '-', ' ').split()
+        if len(tokens) != n * n:
+            tokens = list(''.join(tokens))
+        if len(tokens) != n * n:
+            raise DataError('%i cells found, %i expected'
+                            % (len(tokens), n * n))
+        values = []
+        for token in tokens:
+            if token in self.empties:
+                values.append(0)
+                continue
+            value = cell_value(token)
+            if not 1 <= value <= n:
+                raise DataError('value out of range: %s' % token)
+            values.append(value)
+        return values
+
+    def derive(self, values, candidates=None):
+        """
+        Return the matrix of a puzzle, given its cell `values` (see
+        `parse_line`) and optionally the `candidates` of each cell (see
+        `Propagator.propagate`): a 2-tuple of column ids (a list) and rows
+        (lists of indices into the column ids).  Return None if the givens
+        conflict.
+        """
+        n = self.order
+        filled = set()
+        for i, value in enumerate(values):
+            if value:
+                y, x = divmod(i, n)
+                columns = self.cell_columns[x, y, value]
+                if not filled.isdisjoint(columns):
+                    return None
+                filled.update(columns)
+        column_ids = [c for c in xrange(self.num_columns) if c not in filled]
+        position = dict((c, i) for (i, c) in enumerate(column_ids))
+        if candidates is None:
+            rows = [[position[c] for c in columns] for columns in self.rows
+                    if filled.isdisjoint(columns)]
+        else:
+            cell_rows = self.cell_rows
+            rows = [[position[c] for c in columns]
+                    for (columns, (cell, bit)) in zip(self.rows, cell_rows)
+                    if candidates[cell] & bit and filled.isdisjoint(columns)]
+        return column_ids, rows
+
+    def solve_line(self, line, algorithm='x2', limit=1, propagate=True,
+                   box_line=False, unique=False):
+        """
+        Solve the puzzle on `line` (see `parse_line`), finding up to `limit`
+        solutions, after constraint propagation (if `propagate` is true; see
+        `Propagator`).  Return a result line: the number of solutions found
+        (or with `unique`, stopping at 2: "none", "unique", or "multiple"), a
+        tab, and the first solution (on one line, like the input), if any.
+        If `line` cannot be parsed, the error message takes the place of the
+        solution (and with `unique`, "error" takes the place of the count).
+        """
+        if unique:
+            limit = 2
+        try:
+            values = self.parse_line(line)
+        except (DataError, ValueError), error:
+            if unique:
+                return 'error\t%s' % error
+            return self.result(0, 'error: %s' % error)
+        candidates = None
+        if propagate:
+            num_empty = values.count(0)
+            self.num_empty += num_empty
+            result = self.propagator.propagate(values, box_line)
+            if result is None:
+                return self.result(0, '', unique)
+            values, candidates = result
+            self.num_propagated += num_empty - values.count(0)
+        if algorithm == 'propagation':
+            solutions = self.propagator.solutions(values, box_line)
+        else:
+            matrix = self.derive(values, candidates)
+            if matrix is None:
+                return self.result(0, '', unique)
+            solver = puzzler.exact_cover_modules[algorithm].ExactCover()
+            solver.load_rows(*matrix)
+            solutions = (self.solution_values(values, solution)
+                         for solution in solver.solve())
+        first = None
+        count = 0
+        for solution in solutions:
+            if first is None:
+                first = solution
+            count += 1
+            if count >= limit:
+                break
+        if first is None:
+            return self.result(0, '', unique)
+        return self.result(
+            count, ''.join(cell_symbol(v) for v in first), unique)
+
+    def result(self, count, text, unique=False):
+        if unique:
+            return '%s\t%s' % (uniqueness(count), text)
+        return '%i\t%s' % (count, text)
+
+    def solution_values(self, values, solution):
+        """
+        Return a copy of cell `values` completed by `solution` (a list of
+        rows of column ids).
+        """
+        n = self.order
+        cell_base = 3 * n * n
+        values = list(values)
+        for row in solution:
+            cell = value = None
+            for c in row:
+                if c >= cell_base:
+                    cell = c - cell_base
+                elif c < n * n:
+                    value = c % n + 1
+            values[cell] = value
+        return values
+
+
 class Sudoku4x4(Puzzle):
 
     order = 4
 
 
+class Sudoku6x6(Puzzle):
+
+    order = 6
+    block_width = 3
+    block_height = 2
+
+
 class Sudoku9x9(Puzzle):
 
     order = 9
 
 
+class Sudoku12x12(Puzzle):
+
+    order = 12
+    default_algorithm = 'propagation'
+    block_width = 4
+    block_height = 3
+
+
+class Sudoku16x16(Puzzle):
+
+    order = 16
+    default_algorithm = 'propagation'
+
+
+class Sudoku25x25(Puzzle):
+
+    order = 25
+    default_algorithm = 'propagation'
+
+
+puzzle_classes = dict(
+    (cls.order, cls) for cls in
+    (Sudoku4x4, Sudoku6x6, Sudoku9x9, Sudoku12x12, Sudoku16x16, Sudoku25x25))
+"""Mapping of orders to `Puzzle` subclasses, for -s/--size."""
+
+
 class SudokuTest(object):
 
     start_positions_9x9 = [
@@ -628,6 +1340,25 @@ class SudokuTest(object):
 . 4 . 2
 2 3 . 1
 . . 2 .
+"""
+
+    start16x16 = """\
+...D E48. .79. .1F.
+E.85 .... .1.. .C.D
+3.9B 2... AC6D ..85
+.1.. ..6. .4.. 379.
+...E .... 79.. 1.G.
+.8.. .... ..G. C6..
+..B. 1.G. ..D. 48.3
+1F.A .6DE 48.3 ....
+6.E. .... 9B2. .G..
+8... ...1 FG.C .DE4
+9... F.A. 6D.4 ...7
+F..C 6DE. .53. ..2.
+DE48 5... ...F ....
+.37. .2.F ..C6 ..48
+B21. .A.. .E4. .379
+.AC6 D..8 5..9 ..1.
 """
 
     @classmethod
@@ -20,3 +20,10 @@ def plural_s(number):
         return ''
     else:
         return 's'
+
+def bits(mask):
+    """A generator that produces the indices of the 1-bits of `mask`."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
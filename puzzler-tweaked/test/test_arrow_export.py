@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import puzzler
+from puzzler import arrow_export
+from puzzler import exact_cover_x2
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class EncoderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = arrow_export.SolutionEncoder(Pentominoes3x20)
+        puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(puzzle.matrix)
+        self.solutions = [[list(row) for row in solution]
+                          for solution in solver.solve()]
+        self.records = [puzzle.format_solution(solution)
+                        for solution in self.solutions]
+        self.matrix = puzzle.matrix
+
+    def test_placement_ids(self):
+        # placement ids are the indexes of the (unconstrained) matrix rows:
+        placement_ids = self.encoder.placement_ids
+        self.assertEqual(len(placement_ids), len(self.matrix) - 1)
+        for i, row in enumerate(self.matrix[1:]):
+            key = frozenset(name for name in row if name)
+            self.assertEqual(placement_ids[key][0], i)
+
+    def test_encode(self):
+        grid, masks, placements = self.encoder.encode(self.solutions[0])
+        self.assertEqual(len(grid), 60)
+        pieces = self.encoder.pieces
+        self.assertEqual(
+            ' '.join(''.join(pieces[ord(code) - 1] for code in grid[i:i+20])
+                     for i in range(0, 60, 20)),
+            self.records[0])
+        self.assertEqual(masks,
+                         self.encoder.puzzle.hyphen_masks(self.solutions[0]))
+        self.assertEqual(len(placements), 12)
+        self.assertEqual(placements, sorted(placements))
+        self.assertEqual(self.encoder.metadata()['shape'], '20x3')
+
+    def test_parse_record(self):
+        for solution, record in zip(self.solutions, self.records):
+            parsed = self.encoder.parse_record(record)
+            self.assertEqual(self.encoder.encode(parsed),
+                             self.encoder.encode(solution))
+        self.assertRaises(puzzler.ApplicationError,
+                          self.encoder.parse_record, 'UUX PPP')
+        self.assertRaises(puzzler.ApplicationError,
+                          self.encoder.parse_record,
+                          self.records[0].replace('X', 'Y'))
+
+
+class WriterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @unittest.skipIf(arrow_export.pyarrow is None, 'pyarrow not installed')
+    def test_convert(self):
+        pyarrow = arrow_export.pyarrow
+        puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(puzzle.matrix)
+        input_path = os.path.join(self.directory, 'out.txt')
+        output = open(input_path, 'w')
+        for solution in solver.solve():
+            print >>output, puzzle.format_solution(solution)
+        print >>output, '2 solutions, 4,818 searches'
+        output.close()
+        for name in ('out.arrow', 'out.parquet'):
+            output_path = os.path.join(self.directory, name)
+            self.assertEqual(
+                arrow_export.convert(Pentominoes3x20, input_path, output_path,
+                                     batch_size=1), 2)
+            if name.endswith('.parquet'):
+                table = pyarrow.parquet.read_table(output_path)
+            else:
+                table = pyarrow.ipc.open_file(output_path).read_all()
+            self.assertEqual(table.num_rows, 2)
+            self.assertEqual(table.column('solution').to_pylist(), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
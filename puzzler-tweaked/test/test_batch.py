@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import unittest
+
+from puzzler import batch
+from puzzler.puzzles import pentominoes
+
+
+bin_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       os.pardir, 'bin')
+
+
+class Pentominoes6x10(pentominoes.Pentominoes6x10):
+
+    """2,339 solutions"""
+
+
+class BatchTests(unittest.TestCase):
+
+    def test_resolve(self):
+        items = batch.resolve_items(
+            ['pentominoes.Pentominoes6x10',
+             os.path.join(bin_dir, 'ominoes', 'pentominoes-3x20.py'),
+             'puzzler.puzzles.pentominoes.Pentominoes3x20'])
+        self.assertEquals([(item.module_name, item.class_name)
+                           for item in items],
+                          [('puzzler.puzzles.pentominoes', 'Pentominoes6x10'),
+                           ('puzzler.puzzles.pentominoes', 'Pentominoes3x20')])
+        self.assertEquals(items[1].docstring, '2 solutions')
+
+    def test_schedule(self):
+        items = batch.resolve_items(
+            ['pentominoes.Pentominoes3x20', 'pentominoes.Pentominoes6x10',
+             'pentominoes.Pentominoes5x12'])
+        scheduled = batch.schedule(items)
+        self.assertEquals([item.name for item in scheduled],
+                          ['pentominoes.Pentominoes6x10',
+                           'pentominoes.Pentominoes5x12',
+                           'pentominoes.Pentominoes3x20'])
+        # times first, then solution counts (different units):
+        scheduled = batch.schedule(
+            items, estimates={'Pentominoes3x20': 5},
+            previous={'pentominoes.Pentominoes5x12': {'duration': 0.5}})
+        self.assertEquals([(item.name, item.estimate) for item in scheduled],
+                          [('pentominoes.Pentominoes3x20', 5),
+                           ('pentominoes.Pentominoes5x12', 0.5),
+                           ('pentominoes.Pentominoes6x10', 2339)])
+
+    def test_names(self):
+        # same class name, different modules:
+        items = batch.resolve_items(
+            ['pentominoes.Pentominoes6x10', '%s.Pentominoes6x10' % __name__])
+        self.assertEquals([item.name for item in items],
+                          ['pentominoes.Pentominoes6x10',
+                           '%s.Pentominoes6x10' % __name__])
+        self.assertEquals(items[1].load(), Pentominoes6x10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import puzzler
+from puzzler import bead_index
+from puzzler import beads
+
+
+class BeadIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rng = random.Random(42)
+        self.solutions = [[rng.getrandbits(9) for i in range(3)]
+                          for n in range(100)]
+        self.bead_path = os.path.join(self.directory, 'beads.tsv')
+        writer = beads.BeadWriter(self.bead_path)
+        for n, masks in enumerate(self.solutions):
+            writer.write(n + 1, masks)
+        writer.close()
+        self.index_path = os.path.join(self.directory, 'index')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_query(self):
+        count = bead_index.build_index(
+            self.index_path, [self.bead_path], block_size=16)
+        self.assertEquals(count, 100)
+        index = bead_index.BeadIndex(self.index_path)
+        try:
+            for query in ([0, 0, 0], [1, 0, 0], [0, 5, 0], [3, 0, 256],
+                          [1 << 12, 0, 0]):
+                expected = [
+                    n for n, masks in enumerate(self.solutions)
+                    if all(q & m == q for (q, m) in zip(query, masks))]
+                self.assertEquals(list(index.query(query)), expected)
+                self.assertEquals(index.count(query), len(expected))
+            self.assertEquals(index.solution_number(41), 42)
+        finally:
+            index.close()
+
+    def test_records(self):
+        records_path = os.path.join(self.directory, 'records.txt')
+        records_file = open(records_path, 'w')
+        records_file.write('solving:\n\n')
+        for n in range(1, 6):
+            records_file.write('A%s B%s C%s\n' % (n, n, n))
+        records_file.write('5 solutions, 10 searches\n')
+        records_file.close()
+        records = bead_index.read_records(records_path, 3)
+        self.assertEquals(list(bead_index.select_records(records, [2, 2, 5])),
+                          ['A2 B2 C2', 'A2 B2 C2', 'A5 B5 C5'])
+        # reading stops at the last number requested:
+        records = bead_index.read_records(records_path, 3)
+        self.assertEquals(list(bead_index.select_records(records, [1])),
+                          ['A1 B1 C1'])
+        self.assertEquals(records.next(), 'A2 B2 C2')
+        records.close()
+        records = bead_index.read_records(records_path, 3)
+        self.assertRaises(puzzler.ApplicationError, list,
+                          bead_index.select_records(records, [6]))
+
+    def test_parse_beads(self):
+        masks = [129, 0, 1]
+        self.assertEquals(beads.parse_beads(beads.format_beads(masks, 10)),
+                          masks)
+        self.assertRaises(ValueError, beads.parse_beads, '-oo')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import unittest
+from StringIO import StringIO
+
+import puzzler
+from puzzler import beads
+from puzzler import exact_cover_x2
+from puzzler.puzzles import DataError
+from puzzler.puzzles.pentominoes import (
+    Pentominoes3x20, Pentominoes5x12, Pentominoes5x12A)
+
+
+def letter_masks(record):
+    masks = []
+    for line in record.split():
+        mask = 0
+        for x in range(len(line) - 1):
+            if line[x] == line[x + 1]:
+                mask |= 1 << x
+        masks.append(mask)
+    return masks
+
+def mirror_masks(masks, width):
+    """Return the line masks of the mirror image (left/right) of `masks`."""
+    mirrored = []
+    for mask in masks:
+        mirrored.append(sum(1 << (width - 2 - x) for x in range(width - 1)
+                            if mask & (1 << x)))
+    return mirrored
+
+
+class BeadsTests(unittest.TestCase):
+
+    def test_hyphen_masks(self):
+        puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(puzzle.matrix)
+        count = 0
+        for solution in solver.solve():
+            record = puzzle.format_solution(solution, normalized=False)
+            masks = puzzle.hyphen_masks(solution)
+            self.assertEquals(masks, letter_masks(record))
+            count += 1
+        self.assertEquals(count, 2)
+
+    def test_poem(self):
+        records = []
+        for masks in ([416217, 206486, 115577], [443289, 91350, 236153]):
+            puzzle = Pentominoes3x20(init_puzzle=False)
+            puzzle.set_poem(beads.format_beads(masks, puzzle.width))
+            puzzle.init_puzzle()
+            solver = exact_cover_x2.ExactCover(puzzle.matrix)
+            solutions = list(solver.solve())
+            self.assertEquals(len(solutions), 1)
+            self.assertEquals(puzzle.hyphen_masks(solutions[0]), masks)
+            records.append(
+                puzzle.format_solution(solutions[0], normalized=False))
+        self.assertNotEquals(records[0], records[1])
+        puzzle = Pentominoes3x20(init_puzzle=False)
+        self.assertRaises(DataError, puzzle.set_poem, 'oooo oooo')
+
+    def test_mirrored_poem(self):
+        # Symmetry restrictions keep only the original solution; they are
+        # dropped in poem mode, so the symmetric images are found too.
+        masks = [416217, 206486, 115577]
+        mirrored = mirror_masks(masks, 20)
+        self.assertNotEquals(mirrored, masks)
+        for poem_masks in (mirrored, masks[::-1], mirrored[::-1]):
+            puzzle = Pentominoes3x20(init_puzzle=False)
+            puzzle.set_poem(beads.format_beads(poem_masks, puzzle.width))
+            puzzle.init_puzzle()
+            solver = exact_cover_x2.ExactCover(puzzle.matrix)
+            solutions = list(solver.solve())
+            self.assertEquals(len(solutions), 1)
+            self.assertEquals(puzzle.hyphen_masks(solutions[0]), poem_masks)
+
+    def test_poem_components(self):
+        # components divide the puzzle by symmetry, and are replaced by the
+        # whole (unrestricted) puzzle in poem mode:
+        puzzle = Pentominoes5x12A()
+        solution = exact_cover_x2.ExactCover(puzzle.matrix).solve().next()
+        masks = puzzle.hyphen_masks(solution)
+        settings, args = puzzler.option_parser().parse_args(['-N'])
+        for poem_masks in (masks, mirror_masks(masks, 12)[::-1]):
+            settings.poem = beads.format_beads(poem_masks, puzzle.width)
+            output = StringIO()
+            puzzler.solve(Pentominoes5x12, output, settings)
+            self.assertEquals(output.getvalue().count('\n1 solution,'), 1)
+
+    def test_format(self):
+        masks = letter_masks('LLZVUTUWWt')
+        self.assertEquals(masks, [129])
+        self.assertEquals(beads.format_beads(masks, 10), 'o-ooooooo-oo')
+        self.assertEquals(beads.hyphen_positions(129), [2, 9])
+
+
+if __name__ == '__main__':
+    unittest.main()
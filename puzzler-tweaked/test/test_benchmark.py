@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import copy
+import unittest
+
+from puzzler import benchmark
+
+
+class BenchmarkTests(unittest.TestCase):
+
+    def test_run(self):
+        result = benchmark.run_case('Soma3x3x3', 'x2', 5)
+        self.assertEqual(result['solutions'], 5)
+        self.assertEqual(result['expected'], 5)
+        self.assertTrue(result['nodes'] > 0)
+        isolated = benchmark.run_isolated('Soma3x3x3', 'x2', 5)
+        self.assertEqual(isolated['nodes'], result['nodes'])
+
+    def test_sudoku(self):
+        result = benchmark.run_case('Sudoku9x9-magictour', 'dlx', 2)
+        self.assertEqual(result['solutions'], 2)
+        self.assertEqual(result['expected'], 2)
+
+    def test_expected(self):
+        case = benchmark.PuzzleCase('Test')
+        self.assertEqual(case.expected('\n    2,339 solutions\n'), 2339)
+        self.assertEqual(case.expected('2,339 solutions', 100), 100)
+        self.assertEqual(case.expected('many solutions'), None)
+        self.assertEqual(case.expected('many solutions', 100), 100)
+
+    def test_compare(self):
+        baseline = {
+            'runs': [{'case': 'A', 'algorithm': 'x2', 'cap': None,
+                      'solutions': 10, 'expected': 10, 'nodes': 1000,
+                      'build': 1.0, 'peak_memory': 20.0,
+                      'nodes_per_second': 1000.0,
+                      'solutions_per_second': 10.0}],
+            'startup': {'A': 0.1}}
+        self.assertEqual(benchmark.compare(baseline, baseline), [])
+        results = copy.deepcopy(baseline)
+        run = results['runs'][0]
+        run['nodes_per_second'] = 950.0
+        run['build'] = 1.05
+        self.assertEqual(benchmark.compare(results, baseline), [])
+        run['nodes'] = 1001
+        run['nodes_per_second'] = 800.0
+        run['solutions'] = 9
+        results['startup']['A'] = 1.0
+        problems = benchmark.compare(results, baseline)
+        self.assertEqual(len(problems), 6)
+        self.assertEqual(problems[0], 'A x2: 9 solutions, expected 10')
+
+
+if __name__ == '__main__':
+    unittest.main()
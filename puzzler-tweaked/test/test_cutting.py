@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import unittest
+
+from puzzler import cutting
+from puzzler import exact_cover_x2
+from puzzler.puzzles.pentominoes import Pentominoes, Pentominoes3x20
+
+
+def unit_segments(polylines):
+    segments = []
+    for points in polylines:
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            dx = cmp(x2, x1)
+            dy = cmp(y2, y1)
+            while (x1, y1) != (x2, y2):
+                segments.append(
+                    tuple(sorted([(x1, y1), (x1 + dx, y1 + dy)])))
+                x1 += dx
+                y1 += dy
+    return segments
+
+
+class Pentominoes2x10Doubled(Pentominoes):
+
+    height = 2
+    width = 10
+
+    piece_data = dict((name, Pentominoes.piece_data[name])
+                      for name in 'ILPU')
+    piece_multiplicities = {'I': (0, 2), 'L': (1, 2), 'P': (0, 2),
+                            'U': (0, 2)}
+
+
+class CutPlanTests(unittest.TestCase):
+
+    def test_merge(self):
+        # a 2x1 rectangle divided in two: 7 unit edges, one shared
+        segments = [((0, 0), (1, 0)), ((1, 0), (1, 1)), ((1, 1), (0, 1)),
+                    ((0, 1), (0, 0)), ((1, 0), (2, 0)), ((2, 0), (2, 1)),
+                    ((2, 1), (1, 1)), ((1, 1), (1, 0))]
+        plan = cutting.CutPlan(segments)
+        self.assertEqual(plan.cut_length, 7)
+        self.assertEqual(sorted(unit_segments(plan.polylines)),
+                         sorted(set(tuple(sorted(s)) for s in segments)))
+        # from one end of the shared edge, all in one go:
+        self.assertEqual(len(plan.polylines), 1)
+        self.assertEqual(plan.polylines[0][0], (1, 0))
+
+    def test_order(self):
+        # far-apart segments, listed out of order:
+        segments = [((10, 0), (11, 0)), ((0, 0), (1, 0)), ((5, 0), (6, 0))]
+        plan = cutting.CutPlan(segments)
+        self.assertEqual(plan.polylines,
+                         [[(0, 0), (1, 0)], [(5, 0), (6, 0)],
+                          [(10, 0), (11, 0)]])
+        self.assertEqual(plan.travel_length, 8)
+
+    def test_puzzle(self):
+        puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(puzzle.matrix)
+        solution = solver.solve().next()
+        svg = puzzle.format_thin_svg(solution)
+        plan = puzzle.cut_plan
+        segments = unit_segments(plan.polylines)
+        # each edge once: the 3x20 outline plus the interior edges
+        self.assertEqual(len(segments), len(set(segments)))
+        self.assertEqual(plan.cut_length, len(segments))
+        outline = 2 * (3 + 20)
+        # 12 pentominoes, perimeter 10 or 12 (only P has 10):
+        interior = (11 * 12 + 10 - outline) / 2
+        self.assertEqual(plan.cut_length, outline + interior)
+        self.assertEqual(svg.count('<path '), len(plan.polylines))
+
+    def test_copies(self):
+        # adjacent copies of a piece are cut apart:
+        puzzle = Pentominoes2x10Doubled()
+        solver = exact_cover_x2.ExactCover(
+            puzzle.matrix, multiplicities=puzzle.piece_multiplicities)
+        adjacent = 0
+        for solution in solver.solve():
+            puzzle.format_thin_svg(solution)
+            # 4 pentominoes, perimeter 12 (P: 10), 2x10 outline 24:
+            perimeters = sum(12 - 2 * (row[-1] == 'P') for row in solution)
+            cut_length = (perimeters + 24) / 2
+            self.assertEqual(puzzle.cut_plan.cut_length, cut_length)
+            # separated by name, adjacent copies are fused:
+            s_matrix = puzzle.build_solution_matrix(solution, margin=1)
+            if len(puzzle.cut_segments(s_matrix)) < cut_length:
+                adjacent += 1
+        self.assertTrue(adjacent)
+
+
+if __name__ == '__main__':
+    unittest.main()
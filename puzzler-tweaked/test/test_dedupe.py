@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import shutil
+import tempfile
+import unittest
+import cPickle as pickle
+
+from puzzler import dedupe
+from puzzler import exact_cover_x2
+from puzzler.puzzles.somacubes import SomaSofa
+from puzzler.puzzles.tetrasticks import OneSidedWeldedTetrasticks5x5
+
+
+def unique_solutions(puzzle, solutions):
+    return [solution for solution in solutions
+            if not puzzle.store_solutions(solution)]
+
+
+class DedupeTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.puzzle = SomaSofa()
+        solver = exact_cover_x2.ExactCover(cls.puzzle.matrix)
+        cls.solutions = list(solver.solve())
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.puzzle.dedupe = None
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_canonical(self):
+        unique = unique_solutions(self.puzzle, self.solutions)
+        self.assertTrue(self.puzzle.dedupe.form.canonical)
+        self.assertEqual(len(self.solutions), 64)
+        self.assertEqual(len(unique), 32)
+
+    def test_rendered(self):
+        # formatted as piece outlines: the cell permutations can't be probed
+        puzzle = OneSidedWeldedTetrasticks5x5()
+        solver = exact_cover_x2.ExactCover(
+            puzzle.matrix, puzzle.secondary_columns)
+        solutions = list(solver.solve())
+        unique = unique_solutions(puzzle, solutions)
+        self.assertFalse(puzzle.dedupe.form.canonical)
+        self.assertEqual(len(solutions), 16)
+        self.assertEqual(len(unique), 3)
+
+    def test_stores(self):
+        for store in ({'store_path': os.path.join(self.directory, 'hashes')},
+                      {'bloom_capacity': 100}):
+            self.puzzle.dedupe = dedupe.Deduplicator(**store)
+            unique = unique_solutions(self.puzzle, self.solutions)
+            self.assertEqual(len(unique), 32)
+            self.puzzle.dedupe.cleanup()
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_disk_hash_set_growth(self):
+        hashes = dedupe.DiskHashSet(os.path.join(self.directory, 'hashes'))
+        hashes.create(4)
+        keys = [dedupe.digest(str(i)) for i in range(100)]
+        for key in keys:
+            hashes.add(key)
+        hashes.add(keys[0])
+        self.assertEqual(len(hashes), 100)
+        self.assertEqual(hashes.num_slots, 256)
+        for key in keys:
+            self.assertTrue(key in hashes)
+        self.assertFalse(dedupe.digest('100') in hashes)
+        hashes.remove()
+
+    def test_resume(self):
+        journal = os.path.join(self.directory, 'journal')
+        self.puzzle.dedupe = dedupe.Deduplicator('SomaSofa', journal)
+        first = unique_solutions(self.puzzle, self.solutions[:20])
+        saved = pickle.dumps(self.puzzle.dedupe, 2)
+        # hashes recorded after the saved state are discarded:
+        unique_solutions(self.puzzle, self.solutions[20:40])
+        self.puzzle.dedupe.close()
+        self.puzzle.dedupe = pickle.loads(saved)
+        rest = unique_solutions(self.puzzle, self.solutions[20:])
+        self.assertEqual(len(first) + len(rest), 32)
+        self.puzzle.dedupe.close()
+        self.assertEqual(os.path.getsize(journal),
+                         self.puzzle.dedupe.count * dedupe.hash_size)
+        self.puzzle.dedupe.cleanup()
+        self.assertFalse(os.path.exists(journal))
+
+
+if __name__ == '__main__':
+    unittest.main()
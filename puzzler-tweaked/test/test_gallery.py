@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import puzzler
+from puzzler import exact_cover_x2
+from puzzler import gallery
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class GalleryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(self.puzzle.matrix)
+        self.solutions = list(solver.solve())
+        output = StringIO()
+        for solution in self.solutions:
+            self.puzzle.record_solution(solution, solver, stream=output)
+        print >>output, '2 solutions, 1 searches, duration 0:00:01'
+        self.input_path = os.path.join(self.directory, 'solutions.txt')
+        input_file = open(self.input_path, 'w')
+        input_file.write(output.getvalue())
+        input_file.close()
+        self.gallery = os.path.join(self.directory, 'gallery')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_render(self):
+        results = gallery.render_gallery(
+            Pentominoes3x20, self.input_path, self.gallery,
+            output_stream=StringIO())
+        self.assertEqual([(number, error) for (number, name, error)
+                          in results], [(1, None), (2, None)])
+        for (number, name, error), solution in zip(results, self.solutions):
+            svg_file = open(os.path.join(self.gallery, name))
+            self.assertEqual(svg_file.read(),
+                             self.puzzle.format_svg(solution))
+            svg_file.close()
+        self.assertEqual(sorted(os.listdir(self.gallery)),
+                         ['Pentominoes3x20-000001.svg',
+                          'Pentominoes3x20-000002.svg', 'index.html'])
+
+    def test_numbers(self):
+        results = gallery.render_gallery(
+            Pentominoes3x20, self.input_path, self.gallery,
+            gallery.parse_numbers('2-'), output_stream=StringIO())
+        self.assertEqual([number for (number, name, error) in results], [2])
+        index = open(os.path.join(self.gallery, gallery.index_file_name))
+        self.assertTrue('Pentominoes3x20-000002.svg' in index.read())
+        index.close()
+
+    def test_parse_numbers(self):
+        self.assertEqual(gallery.parse_numbers('1-100, 250,300-'),
+                         [(1, 100), (250, 250), (300, None)])
+        self.assertRaises(puzzler.ApplicationError,
+                          gallery.parse_numbers, '5-2')
+
+
+if __name__ == '__main__':
+    unittest.main()
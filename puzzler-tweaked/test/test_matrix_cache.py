@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from puzzler import matrix_cache
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class CompiledMatrixTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_compile(self):
+        puzzle = Pentominoes3x20()
+        compiled = matrix_cache.CompiledMatrix.from_puzzle(puzzle)
+        self.assertEquals(compiled.columns, puzzle.matrix[0])
+        self.assertEquals(len(compiled), len(puzzle.matrix) - 1)
+        self.assertEquals(list(compiled.rows()),
+                          list(matrix_cache.sparse_rows(puzzle.matrix)))
+        self.assertEquals(compiled.row_names(0),
+                          tuple(item for item in puzzle.matrix[1] if item))
+        self.assertEquals(sorted(compiled.pieces), sorted(puzzle.pieces))
+
+    def test_cache(self):
+        puzzle = Pentominoes3x20(init_puzzle=False)
+        compiled = matrix_cache.get_compiled_matrix(puzzle, self.cache_dir)
+        self.assert_(compiled.mapped_file)
+        self.assertEquals(os.listdir(self.cache_dir),
+                          [os.path.basename(compiled.mapped_file)])
+        # the second puzzle is not initialized; its matrix is memory-mapped:
+        puzzle2 = Pentominoes3x20(init_puzzle=False)
+        compiled2 = matrix_cache.get_compiled_matrix(puzzle2, self.cache_dir)
+        self.assertEquals(puzzle2.matrix, [])
+        self.assertEquals(compiled2.key, compiled.key)
+        self.assertEquals(list(compiled2.rows()), list(compiled.rows()))
+
+    def test_key(self):
+        puzzle = Pentominoes3x20(init_puzzle=False)
+        key = matrix_cache.matrix_key(puzzle)
+        self.assertEquals(key, matrix_cache.matrix_key(puzzle))
+        puzzle.piece_data['P'][-1]['flips'] = None
+        self.assertNotEquals(key, matrix_cache.matrix_key(puzzle))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import unittest
+
+from puzzler import exact_cover_x2
+from puzzler import matrix_reduction
+
+
+class ReduceRowsTests(unittest.TestCase):
+
+    def test_forced_column(self):
+        # column 0 is covered only by row 0, which conflicts with row 1:
+        rows = [(0, 1), (1, 2), (2, 3), (3,), (2,)]
+        kept, stats = matrix_reduction.reduce_rows(4, rows)
+        self.assertEquals(kept, [0, 2, 3, 4])
+        self.assertEquals(stats.rows_removed, 1)
+        self.assertEquals(stats.forced_rows, 1)
+        self.assertEquals(stats.columns_eliminated, 2)
+        self.assertEquals(stats.empty_columns, 0)
+
+    def test_blocking_row(self):
+        # row 0 conflicts with both rows covering column 2:
+        rows = [(0, 1), (0, 2), (1, 2), (0,), (1,)]
+        kept, stats = matrix_reduction.reduce_rows(3, rows)
+        self.assert_(0 not in kept)
+        # a secondary column is never blocked:
+        kept, stats = matrix_reduction.reduce_rows(3, rows, secondary=1)
+        self.assert_(0 in kept)
+
+    def test_no_solutions(self):
+        kept, stats = matrix_reduction.reduce_rows(3, [(0, 1), (1,)])
+        self.assertEquals(stats.empty_columns, 1)
+
+    def test_solutions_preserved(self):
+        names = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+        rows = [(2, 4, 5), (0, 3, 6), (1, 2, 5), (0, 3), (1, 6), (3, 4, 6),
+                (0, 1)]
+        solver = exact_cover_x2.ExactCover()
+        reducer = matrix_reduction.MatrixReducer(solver)
+        reducer.load_rows(names, rows)
+        self.assertEquals([sorted(s) for s in solver.solve()],
+                          [[['A', 'D'], ['B', 'G'], ['C', 'E', 'F']]])
+        self.assertEquals(len(solver.rows) + reducer.stats.rows_removed,
+                          len(rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
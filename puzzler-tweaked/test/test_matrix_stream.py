@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import optparse
+import unittest
+
+import puzzler
+from puzzler import exact_cover_x2
+from puzzler import matrix_stream
+from puzzler import puzzles
+from puzzler.puzzles.pentominoes import Pentominoes3x20, Pentominoes6x10
+from puzzler.puzzles.tetrasticks import Tetrasticks6x6
+
+
+class Collision(object):
+
+    """Hashes like `row`, but is equal to nothing."""
+
+    def __init__(self, row):
+        self.row_hash = hash(row)
+
+    def __hash__(self):
+        return self.row_hash
+
+    def __eq__(self, other):
+        return False
+
+
+class MatrixStreamTests(unittest.TestCase):
+
+    def test_stream(self):
+        puzzle = Pentominoes3x20()
+        expected = exact_cover_x2.ExactCover(puzzle.matrix)
+        solver = exact_cover_x2.ExactCover()
+        puzzle2 = Pentominoes3x20(init_puzzle=False)
+        stream = matrix_stream.MatrixStream(puzzle2, solver)
+        puzzle2.matrix = stream
+        puzzle2.init_puzzle()
+        stream.close()
+        self.assertEquals(stream[0], puzzle.matrix[0])
+        self.assertEquals(len(stream), len(puzzle.matrix))
+        self.assertEquals(stream.duplicates, [])
+        self.assertEquals(solver.rows, expected.rows)
+        self.assertEquals(solver.columns, expected.columns)
+        self.assertRaises(IndexError, stream.__getitem__, 1)
+
+    def test_duplicates(self):
+        puzzle = Pentominoes3x20(init_puzzle=False)
+        solver = exact_cover_x2.ExactCover()
+        stream = matrix_stream.MatrixStream(puzzle, solver)
+        stream.append(('A', 'B', 'C'))
+        stream.append(('A', 0, 'C'))
+        stream.append((0, 'B', 0))
+        stream.append((1, 0, 1))
+        stream.close()
+        self.assertEquals(stream.duplicates, [('A', 'C')])
+        self.assertEquals(solver.rows, [['A', 'C'], ['B']])
+
+    def test_hash_collision(self):
+        # a row with the same hash as an earlier, different row:
+        puzzle = Pentominoes3x20(init_puzzle=False)
+        solver = exact_cover_x2.ExactCover()
+        stream = matrix_stream.MatrixStream(puzzle, solver)
+        stream.append(('A', 'B', 'C'))
+        stream.rows_seen.add(Collision((0, 2)))
+        stream.append(('A', 0, 'C'))
+        stream.close()
+        self.assertEquals(stream.duplicates, [])
+        self.assertEquals(solver.rows, [['A', 'C']])
+
+    def test_secondary_columns(self):
+        # secondary columns added in build_matrix, after the header:
+        puzzle = Tetrasticks6x6()
+        expected = exact_cover_x2.ExactCover(
+            puzzle.matrix, puzzle.secondary_columns)
+        solver = exact_cover_x2.ExactCover()
+        puzzle2 = Tetrasticks6x6(init_puzzle=False)
+        stream = matrix_stream.MatrixStream(puzzle2, solver)
+        puzzle2.matrix = stream
+        puzzle2.init_puzzle()
+        stream.close()
+        self.assertEquals(solver.secondary_columns,
+                          expected.secondary_columns)
+        self.assertEquals(solver.rows, expected.rows)
+
+    def test_placement_cache(self):
+        expected = Pentominoes6x10().matrix
+        limit = puzzles.placement_cache_limit
+        puzzles.placement_cache_limit = 1000
+        try:
+            puzzles.clear_placement_cache()
+            matrix = Pentominoes6x10().matrix
+            self.assert_(0 < puzzles.placement_cache_size <= 1000)
+        finally:
+            puzzles.placement_cache_limit = limit
+        self.assertEquals(matrix, expected)
+        # released once a matrix is loaded:
+        puzzle = Pentominoes6x10(init_puzzle=False)
+        puzzler.load_puzzle_matrix(
+            puzzle, exact_cover_x2.ExactCover(), optparse.Values())
+        self.assertEquals(puzzles.placement_cache, {})
+        self.assertEquals(puzzles.placement_cache_size, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
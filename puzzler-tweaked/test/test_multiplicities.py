@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import sys
+import itertools
+import random
+import unittest
+from StringIO import StringIO
+
+import puzzler
+from puzzler import exact_cover_dlx
+from puzzler import exact_cover_x2
+from puzzler import matrix_reduction
+from puzzler.puzzles.pentominoes import Pentominoes
+
+
+def brute_force(names, rows, secondary, multiplicities):
+    """Return the set of solutions, by trying every subset of `rows`."""
+    primary = len(names) - secondary
+    solutions = set()
+    for k in range(len(rows) + 1):
+        for subset in itertools.combinations(rows, k):
+            counts = [0] * len(names)
+            for row in subset:
+                for c in row:
+                    counts[c] += 1
+            for c, name in enumerate(names):
+                if name in multiplicities:
+                    minimum, maximum = multiplicities[name]
+                    if not minimum <= counts[c] <= maximum:
+                        break
+                elif counts[c] > 1 or (c < primary and counts[c] != 1):
+                    break
+            else:
+                solutions.add(normalize(
+                    [[names[c] for c in row] for row in subset]))
+    return solutions
+
+def normalize(solution):
+    return tuple(sorted(tuple(sorted(row)) for row in solution))
+
+
+class Pentominoes2x10Doubled(Pentominoes):
+
+    height = 2
+    width = 10
+
+    piece_data = dict((name, Pentominoes.piece_data[name])
+                      for name in 'ILPU')
+    piece_multiplicities = {'I': (0, 2), 'L': (1, 2), 'P': (0, 2),
+                            'U': (0, 2)}
+
+
+class MultiplicityTests(unittest.TestCase):
+
+    def test_random_matrices(self):
+        rng = random.Random(1)
+        for trial in range(100):
+            names = (['P', 'Q'] + ['c%i' % i for i in range(rng.randint(3, 6))]
+                     + ['s'])
+            multiplicities = {'P': (rng.randint(0, 2), 3),
+                              'Q': (1, rng.randint(1, 2))}
+            rows = set()
+            for i in range(rng.randint(3, 10)):
+                row = set([rng.choice((0, 1)),
+                           rng.randrange(2, len(names) - 1)])
+                row.update(rng.sample(range(2, len(names)),
+                                      rng.randint(0, 2)))
+                rows.add(tuple(sorted(row)))
+            rows = sorted(rows)
+            expected = brute_force(names, rows, 1, multiplicities)
+            for module in (exact_cover_x2, exact_cover_dlx):
+                solver = module.ExactCover()
+                solver.load_rows(names, rows, 1, multiplicities)
+                solutions = [normalize(solution)
+                             for solution in solver.solve()]
+                self.assertEquals(len(solutions), len(set(solutions)))
+                self.assertEquals(set(solutions), expected)
+
+    def test_puzzle(self):
+        puzzle = Pentominoes2x10Doubled()
+        results = []
+        for module in (exact_cover_x2, exact_cover_dlx):
+            solver = module.ExactCover(
+                puzzle.matrix, multiplicities=puzzle.piece_multiplicities)
+            results.append(sorted(
+                normalize(solution) for solution in solver.solve()))
+        self.assertEquals(results[0], results[1])
+        self.assertEquals(len(results[0]), len(set(results[0])))
+        self.assert_(results[0])
+        for solution in results[0]:
+            self.assert_([row for row in solution if 'L' in row])
+        solver = exact_cover_x2.ExactCover()
+        reducer = matrix_reduction.MatrixReducer(solver)
+        reducer.load_rows(
+            puzzle.matrix[0],
+            ([i for (i, item) in enumerate(row) if item]
+             for row in puzzle.matrix[1:]),
+            multiplicities=puzzle.piece_multiplicities)
+        self.assertEquals(
+            sorted(normalize(solution) for solution in solver.solve()),
+            results[0])
+
+    def test_two_counted_columns(self):
+        # the search bound assumes at most one counted column per row:
+        names = ['P', 'Q', 'a', 'b']
+        rows = [(0, 2), (0, 1, 3)]
+        multiplicities = {'P': (0, 2), 'Q': (0, 1)}
+        for module in (exact_cover_x2, exact_cover_dlx):
+            solver = module.ExactCover()
+            self.assertRaises(ValueError, solver.load_rows,
+                              names, rows, 0, multiplicities)
+
+    def test_algorithm_check(self):
+        # the "c" algorithm does not support multiplicities:
+        settings, args = puzzler.option_parser().parse_args(['-N'])
+        settings.algorithm = 'c'
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            self.assertRaises(SystemExit, puzzler.solve,
+                              Pentominoes2x10Doubled, StringIO(), settings)
+            message = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+        self.assertEquals(message.splitlines(), [
+            'Pentominoes2x10Doubled has piece multiplicities, which require '
+            'the "x2" or "dlx" algorithm.'])
+
+
+if __name__ == '__main__':
+    unittest.main()
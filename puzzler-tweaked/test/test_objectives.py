@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import random
+import unittest
+from StringIO import StringIO
+
+import puzzler
+from puzzler import exact_cover_x2
+from puzzler import objectives
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class OptimizeTests(unittest.TestCase):
+
+    def check(self, make_objective, score):
+        rng = random.Random(3)
+        for trial in range(100):
+            names = ['P', 'Q', 'R'] + ['c%i' % i
+                                       for i in range(rng.randint(3, 7))]
+            multiplicities = {'P': (0, 2), 'Q': (0, 2), 'R': (0, 3)}
+            rows = set()
+            for i in range(rng.randint(4, 12)):
+                row = set([rng.choice((0, 1, 2)),
+                           rng.randrange(3, len(names))])
+                row.update(rng.sample(range(3, len(names)),
+                                      rng.randint(0, 2)))
+                rows.add(tuple(sorted(row)))
+            rows = sorted(rows)
+            solver = exact_cover_x2.ExactCover()
+            solver.load_rows(names, rows, 0, multiplicities)
+            solutions = list(solver.solve())
+            solver = exact_cover_x2.ExactCover()
+            solver.load_rows(names, rows, 0, multiplicities)
+            results = list(solver.optimize(make_objective(rng)))
+            if not solutions:
+                self.assertEquals(results, [])
+                continue
+            scores = [result[1] for result in results]
+            self.assertEquals(scores, sorted(set(scores)))
+            self.assertEquals(scores[-1],
+                              max(score(solution) for solution in solutions))
+            for solution, solution_score in results:
+                self.assertEquals(score(solution), solution_score)
+
+    def test_variety(self):
+        self.check(
+            lambda rng: objectives.PieceVariety('PQR'),
+            lambda solution: len(set(name for row in solution
+                                     for name in row if name in 'PQR')))
+
+    def test_placement_score(self):
+        weights = {}
+        def weight(row):
+            return weights.setdefault(tuple(sorted(row)), len(weights) % 7 - 2)
+        self.check(
+            lambda rng: objectives.PlacementScore(weight),
+            lambda solution: sum(weight(row) for row in solution))
+
+    def test_score_function(self):
+        parser = puzzler.option_parser()
+        settings, args = parser.parse_args(['-N', '--optimize', 'score'])
+        # no placement scores:
+        self.assertRaises(puzzler.ApplicationError,
+                          puzzler.placement_score_function,
+                          Pentominoes3x20, settings)
+        settings.score_function = 'puzzler.objectives:no_such_function'
+        self.assertRaises(puzzler.ApplicationError,
+                          puzzler.placement_score_function,
+                          Pentominoes3x20, settings)
+        # every solution covers 60 cells + 12 pieces:
+        settings.score_function = '__builtin__:len'
+        output = StringIO()
+        puzzler.solve(Pentominoes3x20, output, settings)
+        self.assertEquals(output.getvalue().count('score 72:'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
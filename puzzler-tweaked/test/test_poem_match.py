@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import codecs
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from puzzler import bead_index
+from puzzler import beads
+from puzzler import poem_match
+
+
+class PoemMatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_line_beads(self):
+        self.assertEquals(
+            poem_match.line_beads(
+                u'  Piøty the world, or  else this glutøton be--'),
+            'o-ooooooo-oo')
+        self.assertEquals(
+            poem_match.line_beads(
+                u"Feed'st thy light's flame with self-subøstanøtial fuel,"),
+            'oooooo-o-o-oo')
+
+    def test_read_sonnets(self):
+        path = os.path.join(self.directory, 'sonnets.txt')
+        sonnets_file = codecs.open(path, 'w', 'utf-8')
+        sonnets_file.write(u'1\n\n' + u'Thou that art now the world\'s '
+                           u'fresh orønaøment\n' * 14 + u'\n2\n\nA line\n')
+        sonnets_file.close()
+        sonnets = poem_match.read_sonnets(path)
+        self.assertEquals(sonnets, [(1, ['oooooooo-o-o'] * 14), (2, ['oo'])])
+        poems = poem_match.sonnet_poems(sonnets)
+        self.assertEquals(poems[0], ('1 octave', [384] * 8))
+        self.assertEquals(poems[1], ('1 sestet', [384] * 6))
+        self.assertEquals(poems[3], ('2 sestet', []))
+
+    def test_match_poems(self):
+        rng = random.Random(1)
+        solutions = [[rng.getrandbits(9) for i in range(3)]
+                     for n in range(200)]
+        bead_path = os.path.join(self.directory, 'beads.tsv')
+        writer = beads.BeadWriter(bead_path)
+        for n, masks in enumerate(solutions):
+            writer.write(n + 1, masks)
+        writer.close()
+        index_path = os.path.join(self.directory, 'index')
+        bead_index.build_index(index_path, [bead_path], block_size=16)
+        poems = [('a', [1, 0, 0]), ('b', [3, 16, 0]), ('c', [0, 0]),
+                 ('d', [0, 1 << 10, 0]), ('e', [0, 0, 0])]
+        results = poem_match.match_poems(
+            index_path, poems, processes=1, first=5)
+        for (name, query), result in zip(poems, results):
+            if len(query) != 3:
+                self.assertEquals(result, None)
+                continue
+            expected = [n + 1 for n, masks in enumerate(solutions)
+                        if all(q & m == q for (q, m) in zip(query, masks))]
+            self.assertEquals(result, (len(expected), expected[:5]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import random
+import unittest
+
+import puzzler
+from puzzler import product
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class Settings(object):
+
+    algorithm = 'x2'
+    poem = None
+    part_limit = None
+
+
+class Product3x20(product.PuzzleProduct):
+
+    parts = (Pentominoes3x20, Pentominoes3x20, Pentominoes3x20)
+
+
+class DistinctProduct3x20(Product3x20):
+
+    def joint_constraint(self, solutions):
+        records = [tuple(sorted(tuple(row) for row in solution))
+                   for solution in solutions]
+        return len(set(records)) == len(records)
+
+
+class ProductTests(unittest.TestCase):
+
+    def setUp(self):
+        # Solve the parts once; every product below shares them.
+        if not hasattr(ProductTests, 'parts'):
+            ProductTests.parts = Product3x20().solve_parts(
+                Settings(), NullStream())
+
+    def test_parts(self):
+        self.assertEqual([len(part) for part in self.parts], [2, 2, 2])
+        part = self.parts[0]
+        self.assertNotEqual(part.record(0), part.record(1))
+        self.assertEqual(len(part.hyphen_masks(0)), 3)
+        # 24 placements; the U, X, P, I & V placements are shared:
+        self.assertEqual(len(part.rows), 19)
+
+    def test_enumerate(self):
+        puzzle = Product3x20()
+        self.assertEqual(puzzle.size(self.parts), 8)
+        combinations = list(puzzle.enumerate(self.parts))
+        self.assertEqual(combinations,
+                         [puzzle.combination(self.parts, i) for i in range(8)])
+        self.assertEqual(combinations[5], (1, 0, 1))
+        for i, indexes in enumerate(combinations):
+            self.assertEqual(puzzle.combination_index(self.parts, indexes), i)
+        self.assertEqual(list(puzzle.enumerate(self.parts, start=6)),
+                         combinations[6:])
+        record = puzzle.format_solution(self.parts, (0, 1, 0))
+        self.assertEqual(len(record.split()), 9)
+
+    def test_sample(self):
+        puzzle = Product3x20()
+        sampled = list(puzzle.sample(self.parts, random.Random(1)))
+        self.assertEqual(sorted(sampled), list(puzzle.enumerate(self.parts)))
+
+    def test_joint_constraint(self):
+        puzzle = DistinctProduct3x20()
+        # Three parts, two solutions each: no combination is all distinct.
+        self.assertEqual(list(puzzle.enumerate(self.parts)), [])
+        self.assertEqual(
+            list(puzzle.sample(self.parts, random.Random(1), attempts=3)),
+            [])
+
+    def test_split_poem(self):
+        puzzle = Product3x20()
+        lines = ['o' * 20] * 9
+        self.assertEqual(puzzle.split_poem(' '.join(lines)),
+                         [' '.join(lines[:3])] * 3)
+        self.assertRaises(puzzler.ApplicationError,
+                          puzzle.split_poem, ' '.join(lines[1:]))
+
+
+class NullStream(object):
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import sys
+import subprocess
+import unittest
+
+import puzzler
+from puzzler import puzzle_index
+from puzzler import registry
+from puzzler.puzzles import pentominoes
+
+
+class RegistryTests(unittest.TestCase):
+
+    def test_index(self):
+        index = registry.build_index()
+        self.assertEqual(index['Pentominoes6x10'],
+                         'puzzler.puzzles.pentominoes')
+        self.assertEqual(index['Puzzle2D'], 'puzzler.puzzles')
+        self.assertTrue('OneSidedLowercaseMixin' not in index)
+        # "python -m puzzler index" must be run after changing puzzles:
+        self.assertEqual(index, puzzle_index.modules)
+
+    def test_load(self):
+        self.assertTrue(registry.load('Pentominoes6x10')
+                        is pentominoes.Pentominoes6x10)
+        self.assertRaises(puzzler.ApplicationError,
+                          registry.load, 'Pentominoes6x1O')
+        self.assertRaises(puzzler.ApplicationError, registry.check_solvable,
+                          pentominoes.Pentominoes)
+
+    def test_state_file(self):
+        # the default search state file is named after the puzzle:
+        state_files = []
+        def run(puzzle_class, output_stream, settings):
+            state_files.append(settings.search_state_file)
+        original_run = puzzler.run
+        puzzler.run = run
+        try:
+            registry.main(['solve', 'Pentominoes3x20'])
+            registry.main(['solve', '-N', 'Pentominoes3x20'])
+        finally:
+            puzzler.run = original_run
+        self.assertEqual(state_files, ['Pentominoes3x20.state', None])
+
+    def test_lazy_import(self):
+        # only the puzzle's own module & its base modules are imported:
+        code = ('import sys; from puzzler import registry; '
+                'registry.load("Pentominoes6x10"); '
+                'print " ".join(sorted(name for name in sys.modules '
+                'if name.startswith("puzzler.puzzles.") '
+                'and sys.modules[name]))')
+        directory = os.path.dirname(os.path.dirname(
+            os.path.abspath(puzzler.__file__)))
+        process = subprocess.Popen([sys.executable, '-c', code],
+                                   stdout=subprocess.PIPE, cwd=directory)
+        output = process.communicate()[0]
+        self.assertEqual(output.split(), ['puzzler.puzzles.pentominoes',
+                                          'puzzler.puzzles.polyominoes'])
+        # optional features are imported only when used:
+        features = ['arrow_export', 'beads', 'cutting', 'dedupe',
+                    'matrix_cache', 'matrix_reduction', 'objectives',
+                    'sampler', 'search_profile', 'solution_stats']
+        code = ('import sys; from puzzler import registry; '
+                'registry.load("Pentominoes6x10"); '
+                'print " ".join(name for name in %r '
+                'if "puzzler." + name in sys.modules)' % features)
+        process = subprocess.Popen([sys.executable, '-c', code],
+                                   stdout=subprocess.PIPE, cwd=directory)
+        output = process.communicate()[0]
+        self.assertEqual(output.split(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import random
+import unittest
+
+from puzzler import exact_cover_x2
+from puzzler import sampler
+
+
+def interval_matrix(length):
+    """
+    Return a matrix whose solutions are the tilings of a line of `length`
+    cells by intervals of 1 or 2 cells: Fibonacci(length + 1) solutions.
+    """
+    names = ['c%02i' % i for i in range(length)]
+    matrix = [names]
+    for width in (1, 2):
+        for start in range(length - width + 1):
+            matrix.append([int(start <= i < start + width)
+                           for i in range(length)])
+    return matrix
+
+
+class SamplerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.solver = exact_cover_x2.ExactCover(interval_matrix(8))
+        self.solutions = set(tuple(map(tuple, solution))
+                             for solution in self.solver.solve())
+        self.assertEqual(len(self.solutions), 34)
+
+    def check(self, solution):
+        self.assertTrue(tuple(map(tuple, sorted(solution))) in self.solutions
+                        or tuple(map(tuple, solution)) in self.solutions)
+
+    def test_exact(self):
+        sample = sampler.Sampler(self.solver, random.Random(1), probes=0)
+        counts = {}
+        samples = sample.weighted_samples()
+        for i in range(3400):
+            solution, weight = samples.next()
+            self.check(solution)
+            self.assertEqual(weight, 34)
+            key = tuple(map(tuple, solution))
+            counts[key] = counts.get(key, 0) + 1
+        self.assertEqual(len(counts), 34)
+        self.assertTrue(min(counts.values()) > 50)
+        self.assertTrue(max(counts.values()) < 150)
+
+    def test_reproducible(self):
+        first = [sampler.Sampler(self.solver, random.Random(seed),
+                                 exact_columns=0).descend()
+                 for seed in (1, 2, 3)]
+        second = [sampler.Sampler(self.solver, random.Random(seed),
+                                  exact_columns=0).descend()
+                  for seed in (1, 2, 3)]
+        self.assertEqual(first, second)
+
+    def test_estimated_weights(self):
+        # Probes only: the mean importance weight estimates the count.
+        sample = sampler.Sampler(self.solver, random.Random(1), probes=2,
+                                 exact_columns=0)
+        samples = sample.weighted_samples()
+        weights = []
+        for i in range(2000):
+            solution, weight = samples.next()
+            self.check(solution)
+            weights.append(weight)
+        mean = sum(weights) / len(weights)
+        self.assertTrue(30 < mean < 38, mean)
+        # The solver state is restored after each descent:
+        self.assertEqual(len(self.solver.columns), 8)
+
+    def test_uniform(self):
+        # Chi-square goodness of fit to the uniform distribution: with 33
+        # degrees of freedom, 63.9 is the 99.9th percentile.  (Without
+        # resampling, pool=1, the statistic is about 100 here.)
+        sample = sampler.Sampler(self.solver, random.Random(1), probes=1,
+                                 exact_columns=0)
+        samples = sample.uniform_samples(pool=10)
+        counts = dict((solution, 0) for solution in self.solutions)
+        num_samples = 3400
+        for i in range(num_samples):
+            solution = samples.next()
+            self.check(solution)
+            counts[tuple(map(tuple, solution))] += 1
+        expected = float(num_samples) / len(counts)
+        chi_square = sum((count - expected) ** 2 / expected
+                         for count in counts.values())
+        self.assertTrue(chi_square < 63.9, chi_square)
+
+
+if __name__ == '__main__':
+    unittest.main()
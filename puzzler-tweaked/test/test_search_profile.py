@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import shutil
+import tempfile
+import unittest
+import cPickle as pickle
+
+from puzzler import exact_cover_dlx
+from puzzler import exact_cover_x2
+from puzzler import search_profile
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class SearchProfileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'profile.jsonl')
+        self.puzzle = Pentominoes3x20()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def profile_search(self, module, sample=1):
+        solver = module.ExactCover(self.puzzle.matrix)
+        profile = search_profile.SearchProfile(self.path, sample)
+        profile.start('Pentominoes3x20', solver)
+        solver.profile = profile
+        solutions = list(solver.solve())
+        self.assertEqual(len(solutions), 2)
+        # (normally counted by `record_solution`)
+        solver.num_solutions = len(solutions)
+        return solver, profile
+
+    def test_counts(self):
+        for module in exact_cover_x2, exact_cover_dlx:
+            solver, profile = self.profile_search(module)
+            self.assertEqual(sum(profile.nodes), solver.num_searches)
+            # the X pentomino is chosen first, with 2 positions:
+            self.assertEqual(profile.nodes[0], 1)
+            self.assertEqual(profile.candidates[0], 2)
+            self.assertEqual(profile.columns[0], {'X': 1})
+            # every candidate row is a child node or (at the last level) a
+            # solution:
+            children = profile.nodes[1:] + [2]
+            self.assertEqual(profile.candidates, children)
+            self.assertEqual(profile.dead_ends[-1], profile.nodes[-1] - 2)
+
+    def test_sample(self):
+        solver, profile = self.profile_search(exact_cover_x2, 10)
+        self.assertEqual(sum(profile.nodes), solver.num_searches // 10)
+
+    def test_resume(self):
+        solver, profile = self.profile_search(exact_cover_x2)
+        restored = pickle.loads(pickle.dumps(profile, 2))
+        restored.start('Pentominoes3x20', solver)
+        self.assertEqual(restored.nodes, profile.nodes)
+        restored.start('Pentominoes4x15', solver)
+        self.assertEqual(restored.nodes, [])
+
+    def test_report(self):
+        solver, profile = self.profile_search(exact_cover_x2)
+        profile.write(solver)
+        profile.write(solver, final=True)
+        records = search_profile.read_profile(self.path)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['final'], True)
+        self.assertEqual(records[0]['searches'], solver.num_searches)
+        lines = search_profile.format_report(records[0], top=1)
+        self.assertEqual(lines[0], 'Pentominoes3x20: 2 solutions, %s searches'
+                         % solver.num_searches)
+        self.assertEqual(len(lines), 2 + len(profile.nodes))
+        self.assertEqual(lines[2].split(),
+                         ['0', '1', '0', '2.00', '2.00', 'X', '100%'])
+
+
+if __name__ == '__main__':
+    unittest.main()
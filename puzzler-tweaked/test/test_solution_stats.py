@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import os
+import shutil
+import tempfile
+import unittest
+import cPickle as pickle
+
+from puzzler import exact_cover_x2
+from puzzler import solution_stats
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class StatisticsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(self.puzzle.matrix)
+        self.solutions = list(solver.solve())
+        self.statistics = solution_stats.SolutionStatistics(
+            os.path.join(self.directory, 'stats'))
+        self.statistics.start(self.puzzle)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_tables(self):
+        for solution in self.solutions:
+            self.statistics.add(solution)
+        cells, pieces, heatmap, adjacency = self.statistics.tables()
+        self.assertEqual(len(cells), 60)
+        self.assertEqual(len(pieces), 12)
+        for row in heatmap:
+            self.assertEqual(sum(row), 2)
+        for p in range(12):
+            self.assertEqual(sum(row[p] for row in heatmap), 10)
+            self.assertEqual(adjacency[p][p], 0)
+            for q in range(12):
+                self.assertEqual(adjacency[p][q], adjacency[q][p])
+        # U occupies the left end in both solutions, and touches only X:
+        u = pieces.index('U')
+        self.assertEqual(heatmap[cells.index('00,0')][u], 2)
+        self.assertEqual(adjacency[u], [2 * (name == 'X') for name in pieces])
+
+    def test_resume(self):
+        self.statistics.add(self.solutions[0])
+        restored = pickle.loads(pickle.dumps(self.statistics, 2))
+        restored.start(self.puzzle)
+        restored.add(self.solutions[1])
+        for solution in self.solutions:
+            self.statistics.add(solution)
+        self.statistics.add(self.solutions[0])
+        # restored: solutions 0 & 1; original: 0, 0, 1, 0
+        self.assertEqual(restored.num_solutions, 2)
+        cells, pieces, heatmap, adjacency = restored.tables()
+        self.assertEqual([sum(row) for row in heatmap], [2] * 60)
+
+    def test_write(self):
+        self.statistics.add(self.solutions[0])
+        self.statistics.write()
+        lines = open(os.path.join(
+            self.directory, 'stats-adjacency.csv')).read().splitlines()
+        self.assertEqual(len(lines), 13)
+        self.assertEqual(lines[0], 'piece,F,I,L,N,P,T,U,V,W,X,Y,Z')
+        lines = open(os.path.join(
+            self.directory, 'stats-heatmap.csv')).read().splitlines()
+        self.assertEqual(len(lines), 61)
+        self.assertEqual(lines[1], '"00,0",0,0,0,0,0,0,1,0,0,0,0,0')
+
+
+if __name__ == '__main__':
+    unittest.main()
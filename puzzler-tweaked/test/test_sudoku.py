@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import unittest
+import StringIO
+
+from puzzler import exact_cover_x2
+from puzzler import sudoku
+
+
+class BatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.base = sudoku.BaseMatrix(sudoku.Sudoku9x9)
+
+    def test_base_matrix(self):
+        self.assertEqual(len(self.base.rows), 729)
+        # the blank puzzle's matrix is the base matrix:
+        columns, rows = self.base.derive([0] * 81)
+        self.assertEqual(columns, range(324))
+        self.assertEqual(len(rows), 729)
+
+    def test_same_solutions(self):
+        # Compare with the regular (string-built) matrix:
+        for position in sudoku.SudokuTest.start_positions_9x9[:4]:
+            puzzle = sudoku.Sudoku9x9(position)
+            solver = exact_cover_x2.ExactCover(puzzle.matrix)
+            expected = [puzzle.format_solution(solution).split()
+                        for solution in solver.solve()]
+            result = self.base.solve_line(position.replace('\n', ' '),
+                                          limit=2)
+            count, solution = result.split('\t')
+            self.assertEqual(int(count), min(2, len(expected)))
+            self.assertEqual(list(solution), expected[0])
+
+    def test_errors(self):
+        self.assertEqual(self.base.solve_line('123'),
+                         '0\terror: 3 cells found, 81 expected')
+        self.assertEqual(self.base.solve_line('11' + '.' * 79), '0\t')
+        # "none" means no solution, so errors are reported distinctly:
+        self.assertEqual(self.base.solve_line('123', unique=True),
+                         'error\t3 cells found, 81 expected')
+        self.assertEqual(self.base.solve_line('11' + '.' * 79, unique=True),
+                         'none\t')
+
+    def test_4x4(self):
+        base = sudoku.BaseMatrix(sudoku.Sudoku4x4)
+        self.assertEqual(base.solve_line(sudoku.SudokuTest.start4x4, limit=5),
+                         '1\t1234341223414123')
+
+
+class PropagationTests(unittest.TestCase):
+
+    def setUp(self):
+        puzzle = sudoku.Sudoku9x9('', init_puzzle=False)
+        puzzle.init_coordinate_blocks()
+        self.propagator = sudoku.Propagator(9, puzzle.coordinate_blocks)
+
+    def values(self, position):
+        puzzle = sudoku.Sudoku9x9(position, init_puzzle=False)
+        return puzzle.start_values()
+
+    def test_singles(self):
+        values = self.values(sudoku.SudokuTest.start_positions_9x9[0])
+        solved, candidates = self.propagator.propagate(values)
+        self.assertEqual(solved.count(0), 0)
+        self.assertEqual(candidates, [1 << (v - 1) for v in solved])
+        for value, given in zip(solved, values):
+            if given:
+                self.assertEqual(value, given)
+
+    def test_box_line(self):
+        values = self.values(sudoku.SudokuTest.magictour.splitlines()[0])
+        plain, plain_candidates = self.propagator.propagate(values)
+        reduced, candidates = self.propagator.propagate(values, box_line=True)
+        for mask, plain_mask in zip(candidates, plain_candidates):
+            self.assertEqual(mask & ~plain_mask, 0)
+        self.assertTrue(sum(bin(m).count('1') for m in candidates)
+                        < sum(bin(m).count('1') for m in plain_candidates))
+
+    def test_contradiction(self):
+        values = [0] * 81
+        values[:2] = [5, 5]
+        self.assertEqual(self.propagator.propagate(values), None)
+        puzzle = sudoku.Sudoku9x9('55' + '.' * 79, propagate=True)
+        self.assertTrue(puzzle.contradiction)
+        solver = exact_cover_x2.ExactCover(puzzle.matrix)
+        self.assertEqual(list(solver.solve()), [])
+
+    def test_same_solutions(self):
+        for position in sudoku.SudokuTest.start_positions_9x9[:3]:
+            solutions = []
+            for options in ({}, {'propagate': True},
+                            {'propagate': True, 'box_line': True}):
+                puzzle = sudoku.Sudoku9x9(position, **options)
+                solver = exact_cover_x2.ExactCover(puzzle.matrix)
+                solutions.append([puzzle.format_solution(solution)
+                                  for solution in solver.solve()])
+            self.assertEqual(solutions[1], solutions[0])
+            self.assertEqual(solutions[2], solutions[0])
+
+
+class NxNTests(unittest.TestCase):
+
+    def test_blocks(self):
+        puzzle = sudoku.Sudoku6x6('', init_puzzle=False)
+        puzzle.init_coordinate_blocks()
+        blocks = puzzle.coordinate_blocks
+        self.assertEqual([blocks[x, 0] for x in range(6)], [0, 0, 0, 1, 1, 1])
+        self.assertEqual([blocks[0, y] for y in range(6)], [0, 0, 2, 2, 4, 4])
+
+    def test_cell_values(self):
+        puzzle = sudoku.Sudoku16x16('A . 16 0' + ' .' * 252, init_puzzle=False)
+        self.assertEqual(puzzle.start_values()[:4], [10, 0, 16, 0])
+
+    def test_16x16(self):
+        for algorithm in ('propagation', 'x2'):
+            settings = sudoku.Settings(algorithm=algorithm, unique=True)
+            output = StringIO.StringIO()
+            sudoku.run(sudoku.Sudoku16x16, sudoku.SudokuTest.start16x16,
+                       output, settings)
+            lines = output.getvalue().splitlines()
+            self.assertTrue('G A C 6 D E 4 8 5 3 7 9 B 2 1 F' in lines)
+            self.assertEqual(lines[-2], 'unique')
+
+    def test_unique(self):
+        base = sudoku.BaseMatrix(sudoku.Sudoku4x4)
+        for algorithm in ('x2', 'propagation'):
+            self.assertEqual(
+                base.solve_line(sudoku.SudokuTest.start4x4, algorithm,
+                                unique=True),
+                'unique\t1234341223414123')
+            self.assertTrue(
+                base.solve_line('.' * 16, algorithm, unique=True).startswith(
+                    'multiple\t'))
+            self.assertEqual(
+                base.solve_line('11' + '.' * 14, algorithm, unique=True),
+                'none\t')
+
+    def test_propagation_search(self):
+        base = sudoku.BaseMatrix(sudoku.Sudoku9x9)
+        for line in sudoku.SudokuTest.magictour.splitlines()[:5]:
+            self.assertEqual(base.solve_line(line, 'propagation', 2),
+                             base.solve_line(line, 'x2', 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# $Id$
+
+# Author: David Goodger <goodger@python.org>
+# Copyright: (C) 1998-2015 by David J. Goodger
+# License: GPL 2 (see alltests.py)
+
+import unittest
+
+from puzzler import exact_cover_x2
+from puzzler.puzzles.pentominoes import Pentominoes3x20
+
+
+class OutlineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.puzzle = Pentominoes3x20(init_puzzle=False)
+
+    def test_square(self):
+        self.assertEqual(self.puzzle.get_outline([(3, 2)]),
+                         [[(3, 2), (4, 2), (4, 3), (3, 3)]])
+
+    def test_hole(self):
+        ring = [(x, y) for x in range(1, 4) for y in range(1, 4)
+                if (x, y) != (2, 2)]
+        self.assertEqual(self.puzzle.get_outline(ring),
+                         [[(1, 1), (4, 1), (4, 4), (1, 4)],
+                          [(2, 2), (2, 3), (3, 3), (3, 2)]])
+        svg = self.puzzle.format_svg_outline('X', ring)
+        self.assertTrue(svg.startswith('<path '))
+        self.assertEqual(svg.count('M '), 2)
+
+    def test_cache(self):
+        self.puzzle.get_outline([(1, 1), (2, 1)])
+        self.assertEqual(self.puzzle.get_outline([(5, 3), (6, 3)]),
+                         [[(5, 3), (7, 3), (7, 4), (5, 4)]])
+        self.assertEqual(len(self.puzzle.svg_outlines), 1)
+
+    def test_placements(self):
+        puzzle = Pentominoes3x20()
+        solver = exact_cover_x2.ExactCover(puzzle.matrix)
+        for solution in solver.solve():
+            s_matrix = puzzle.build_solution_matrix(solution, margin=1)
+            self.assertEqual(puzzle.format_svg(solution),
+                             puzzle.format_svg(s_matrix=s_matrix))
+
+
+if __name__ == '__main__':
+    unittest.main()